@@ -12,7 +12,8 @@ import logging
 from pathlib import Path
 from datetime import timedelta
 
-from models import db, User, Property, Phase, ConstructionDraw, Receipt, Tenant, Lease, PropertyMaintenanceRequest
+from models import db, User, Property, Phase, ConstructionDraw, Receipt, Tenant, Lease, PropertyMaintenanceRequest, Tombstone, PhaseProgress
+from models.phase_progress import refresh_stale_phase_progress
 from routes import api
 from routes.auth import auth_routes
 from routes.property import property_routes
@@ -20,6 +21,8 @@ from routes.financial import financial_routes
 from routes.tenant import tenant_routes
 from routes.maintenance import maintenance_routes
 from routes.user import user_routes
+from routes.sync import sync_routes
+from services.scraper.jobs import start_worker
 
 # Load environment variables from .env file
 load_dotenv()
@@ -45,7 +48,7 @@ def create_app():
                  "origins": ["http://localhost:5173"],
                  "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
                  "allow_headers": ["Content-Type", "Authorization"],
-                 "expose_headers": ["Content-Type", "Authorization"],
+                 "expose_headers": ["Content-Type", "Authorization", "X-Next-Cursor", "X-Total-Count"],
                  "supports_credentials": True,
                  "max_age": 120,
                  "send_wildcard": False
@@ -76,7 +79,9 @@ def create_app():
         'SESSION_COOKIE_HTTPONLY': True,
         'SESSION_COOKIE_SAMESITE': 'Lax',
         'PERMANENT_SESSION_LIFETIME': timedelta(hours=1),
-        'SESSION_REFRESH_EACH_REQUEST': True
+        'SESSION_REFRESH_EACH_REQUEST': True,
+        # Run queued scrape jobs in a background thread of this process
+        'SCRAPER_WORKER': os.getenv('FLASK_ENV') != 'testing'
     })
     
     # Initialize extensions with the app
@@ -92,6 +97,14 @@ def create_app():
     app.register_blueprint(tenant_routes, url_prefix='/api')
     app.register_blueprint(maintenance_routes, url_prefix='/api')
     app.register_blueprint(user_routes, url_prefix='/api')
+    app.register_blueprint(sync_routes, url_prefix='/api')
+
+    @app.cli.command('refresh-phase-progress')
+    def refresh_phase_progress_command():
+        """Rebuild phase progress rows that went stale as phase end dates passed (run daily)"""
+        refreshed = refresh_stale_phase_progress(db.session.connection())
+        db.session.commit()
+        print(f"[SUCCESS] Refreshed {refreshed} phase progress rows")
     
     # Create database tables
     with app.app_context():
@@ -106,6 +119,10 @@ def create_app():
             
         except Exception as e:
             print(f"[ERROR] Database connection failed: {e}")
+
+    # Run scrape jobs queued before a restart without waiting for a client to poll
+    if app.config['SCRAPER_WORKER']:
+        start_worker()
     
     # Add security headers to all responses
     @app.after_request
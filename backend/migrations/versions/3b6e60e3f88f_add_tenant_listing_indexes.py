@@ -0,0 +1,28 @@
+"""Add tenant listing indexes
+
+Revision ID: 3b6e60e3f88f
+Revises: 9de37564d2d6
+Create Date: 2026-10-19 13:05:12.481203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b6e60e3f88f'
+down_revision = '9de37564d2d6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tenant', schema=None) as batch_op:
+        batch_op.create_index('idx_tenant_manager_last_name', ['manager_id', 'lastName'], unique=False)
+        batch_op.create_index('idx_tenant_manager_credit_score', ['manager_id', 'creditScoreAtInitialApplication'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('tenant', schema=None) as batch_op:
+        batch_op.drop_index('idx_tenant_manager_credit_score')
+        batch_op.drop_index('idx_tenant_manager_last_name')
@@ -0,0 +1,38 @@
+"""Add lease unit and overlap exclusion constraint
+
+Revision ID: 5f2c8e1a7d93
+Revises: c41d7a9e2b05
+Create Date: 2026-10-19 13:41:07.215634
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5f2c8e1a7d93'
+down_revision = 'c41d7a9e2b05'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('lease', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('unit', sa.String(length=50), nullable=True))
+
+    # GiST exclusion constraint is Postgres only; SQLite relies on the API check
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+        op.execute(
+            'ALTER TABLE lease ADD CONSTRAINT excl_lease_unit_overlap EXCLUDE USING gist ('
+            '"propertyId" WITH =, (COALESCE(unit, \'\')) WITH =, '
+            'daterange("startDate", "endDate", \'[)\') WITH &&)'
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('ALTER TABLE lease DROP CONSTRAINT IF EXISTS excl_lease_unit_overlap')
+
+    with op.batch_alter_table('lease', schema=None) as batch_op:
+        batch_op.drop_column('unit')
@@ -0,0 +1,32 @@
+"""Add scraped listing unique indexes
+
+Revision ID: 9d4c7e1f2a63
+Revises: b6e2d94a1c38
+Create Date: 2026-10-19 16:12:44.208311
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d4c7e1f2a63'
+down_revision = 'b6e2d94a1c38'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Properties created by hand store '' for these; NULLs do not clash in a unique index
+    op.execute(sa.text("UPDATE property SET detail_link = NULL WHERE TRIM(detail_link) = ''"))
+    op.execute(sa.text("UPDATE property SET sheriff_number = NULL WHERE TRIM(sheriff_number) = ''"))
+
+    with op.batch_alter_table('property', schema=None) as batch_op:
+        batch_op.create_index('uq_property_owner_detail_link', ['owner_id', 'detail_link'], unique=True)
+        batch_op.create_index('uq_property_owner_sheriff_number', ['owner_id', 'county', 'sheriff_number'], unique=True)
+
+
+def downgrade():
+    with op.batch_alter_table('property', schema=None) as batch_op:
+        batch_op.drop_index('uq_property_owner_sheriff_number')
+        batch_op.drop_index('uq_property_owner_detail_link')
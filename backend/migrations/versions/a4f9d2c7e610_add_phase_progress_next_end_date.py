@@ -0,0 +1,48 @@
+"""Add phase progress last and next end dates
+
+Revision ID: a4f9d2c7e610
+Revises: e8b1c4f7a3d2
+Create Date: 2026-10-19 17:48:12.905317
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4f9d2c7e610'
+down_revision = 'e8b1c4f7a3d2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('phase_progress', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('last_end_date', sa.Date(), nullable=True))
+        batch_op.add_column(sa.Column('next_end_date', sa.Date(), nullable=True))
+
+    # Rebuild every row: phases with a future endDate were counted as completed
+    op.execute(sa.text('DELETE FROM phase_progress'))
+    op.execute(sa.text('''
+        INSERT INTO phase_progress (property_id, owner_id, current_phase, phase_count, completed_phases,
+                                    late_completed_phases, open_due_date, last_end_date, next_end_date,
+                                    updated_at)
+        SELECT p.id, p.owner_id, p.current_phase, COUNT(ph.id),
+               COALESCE(SUM(CASE WHEN ph."endDate" <= CURRENT_DATE THEN 1 ELSE 0 END), 0),
+               COALESCE(SUM(CASE WHEN ph."endDate" <= CURRENT_DATE AND ph."endDate" > ph."expectedEndDate"
+                                 THEN 1 ELSE 0 END), 0),
+               MIN(CASE WHEN ph."endDate" IS NULL OR ph."endDate" > CURRENT_DATE THEN ph."expectedEndDate" END),
+               MAX(CASE WHEN ph."endDate" <= CURRENT_DATE THEN ph."endDate" END),
+               MIN(CASE WHEN ph."endDate" > CURRENT_DATE THEN ph."endDate" END),
+               CURRENT_TIMESTAMP
+        FROM property p
+        LEFT JOIN phase ph ON ph.property_id = p.id
+        WHERE p.owner_id IS NOT NULL
+        GROUP BY p.id, p.owner_id, p.current_phase
+    '''))
+
+
+def downgrade():
+    with op.batch_alter_table('phase_progress', schema=None) as batch_op:
+        batch_op.drop_column('next_end_date')
+        batch_op.drop_column('last_end_date')
@@ -0,0 +1,58 @@
+"""Add rent ledger
+
+Revision ID: a8d3f61c9e24
+Revises: 5f2c8e1a7d93
+Create Date: 2026-10-19 14:12:40.118934
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8d3f61c9e24'
+down_revision = '5f2c8e1a7d93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('rent_charge',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('leaseId', sa.Integer(), nullable=False),
+    sa.Column('propertyId', sa.Integer(), nullable=False),
+    sa.Column('dueDate', sa.Date(), nullable=False),
+    sa.Column('amount', sa.Float(), nullable=False),
+    sa.Column('createdAt', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['leaseId'], ['lease.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['propertyId'], ['property.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('leaseId', 'dueDate', name='uq_rent_charge_lease_due_date')
+    )
+    with op.batch_alter_table('rent_charge', schema=None) as batch_op:
+        batch_op.create_index('idx_rent_charge_property_due_date', ['propertyId', 'dueDate'], unique=False)
+
+    op.create_table('rent_payment',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('leaseId', sa.Integer(), nullable=False),
+    sa.Column('paymentDate', sa.Date(), nullable=False),
+    sa.Column('amount', sa.Float(), nullable=False),
+    sa.Column('method', sa.String(length=50), nullable=True),
+    sa.Column('reference', sa.String(length=255), nullable=True),
+    sa.Column('createdAt', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['leaseId'], ['lease.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('rent_payment', schema=None) as batch_op:
+        batch_op.create_index('idx_rent_payment_lease_date', ['leaseId', 'paymentDate'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('rent_payment', schema=None) as batch_op:
+        batch_op.drop_index('idx_rent_payment_lease_date')
+
+    op.drop_table('rent_payment')
+    with op.batch_alter_table('rent_charge', schema=None) as batch_op:
+        batch_op.drop_index('idx_rent_charge_property_due_date')
+
+    op.drop_table('rent_charge')
@@ -0,0 +1,55 @@
+"""Add phase progress rollup
+
+Revision ID: b6e2d94a1c38
+Revises: f3c8a2d61b57
+Create Date: 2026-10-19 17:12:40.318554
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b6e2d94a1c38'
+down_revision = 'f3c8a2d61b57'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('phase_progress',
+    sa.Column('property_id', sa.Integer(), nullable=False),
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('current_phase', sa.String(length=50), nullable=False),
+    sa.Column('phase_count', sa.Integer(), nullable=False),
+    sa.Column('completed_phases', sa.Integer(), nullable=False),
+    sa.Column('late_completed_phases', sa.Integer(), nullable=False),
+    sa.Column('open_due_date', sa.Date(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['property_id'], ['property.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('property_id')
+    )
+    with op.batch_alter_table('phase_progress', schema=None) as batch_op:
+        batch_op.create_index('idx_phase_progress_owner_phase', ['owner_id', 'current_phase', 'open_due_date'], unique=False)
+
+    # Backfill from existing properties; listeners keep it current afterwards
+    op.execute(sa.text('''
+        INSERT INTO phase_progress (property_id, owner_id, current_phase, phase_count, completed_phases,
+                                    late_completed_phases, open_due_date, updated_at)
+        SELECT p.id, p.owner_id, p.current_phase, COUNT(ph.id),
+               COALESCE(SUM(CASE WHEN ph."endDate" IS NOT NULL THEN 1 ELSE 0 END), 0),
+               COALESCE(SUM(CASE WHEN ph."endDate" > ph."expectedEndDate" THEN 1 ELSE 0 END), 0),
+               MIN(CASE WHEN ph."endDate" IS NULL THEN ph."expectedEndDate" END),
+               CURRENT_TIMESTAMP
+        FROM property p
+        LEFT JOIN phase ph ON ph.property_id = p.id
+        WHERE p.owner_id IS NOT NULL
+        GROUP BY p.id, p.owner_id, p.current_phase
+    '''))
+
+
+def downgrade():
+    with op.batch_alter_table('phase_progress', schema=None) as batch_op:
+        batch_op.drop_index('idx_phase_progress_owner_phase')
+
+    op.drop_table('phase_progress')
@@ -0,0 +1,28 @@
+"""Add lease end date indexes
+
+Revision ID: c41d7a9e2b05
+Revises: 3b6e60e3f88f
+Create Date: 2026-10-19 13:24:40.902117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41d7a9e2b05'
+down_revision = '3b6e60e3f88f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('lease', schema=None) as batch_op:
+        batch_op.create_index('idx_lease_end_date_property', ['endDate', 'propertyId'], unique=False)
+        batch_op.create_index('idx_lease_property_end_date', ['propertyId', 'endDate'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('lease', schema=None) as batch_op:
+        batch_op.drop_index('idx_lease_property_end_date')
+        batch_op.drop_index('idx_lease_end_date_property')
@@ -0,0 +1,29 @@
+"""Match county-less sheriff numbers
+
+Revision ID: c7d2e5a9f14b
+Revises: a4f9d2c7e610
+Create Date: 2026-10-19 19:02:37.418265
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7d2e5a9f14b'
+down_revision = 'a4f9d2c7e610'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # NULL counties never clash in (owner_id, county, sheriff_number); index the county as '' instead
+    op.drop_index('uq_property_owner_sheriff_number', table_name='property')
+    op.create_index('uq_property_owner_sheriff_number', 'property',
+                    ['owner_id', sa.text("coalesce(county, '')"), 'sheriff_number'], unique=True)
+
+
+def downgrade():
+    op.drop_index('uq_property_owner_sheriff_number', table_name='property')
+    with op.batch_alter_table('property', schema=None) as batch_op:
+        batch_op.create_index('uq_property_owner_sheriff_number', ['owner_id', 'county', 'sheriff_number'], unique=True)
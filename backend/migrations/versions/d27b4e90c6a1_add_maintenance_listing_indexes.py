@@ -0,0 +1,28 @@
+"""Add maintenance listing indexes
+
+Revision ID: d27b4e90c6a1
+Revises: a8d3f61c9e24
+Create Date: 2026-10-19 14:40:03.512876
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd27b4e90c6a1'
+down_revision = 'a8d3f61c9e24'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('property_maintenance_request', schema=None) as batch_op:
+        batch_op.create_index('idx_maintenance_property_status', ['propertyId', 'status'], unique=False)
+        batch_op.create_index('idx_maintenance_created_at', ['createdAt'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('property_maintenance_request', schema=None) as batch_op:
+        batch_op.drop_index('idx_maintenance_created_at')
+        batch_op.drop_index('idx_maintenance_property_status')
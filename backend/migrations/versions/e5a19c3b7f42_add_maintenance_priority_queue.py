@@ -0,0 +1,38 @@
+"""Add maintenance priority queue
+
+Revision ID: e5a19c3b7f42
+Revises: d27b4e90c6a1
+Create Date: 2026-10-19 15:02:27.904311
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a19c3b7f42'
+down_revision = 'd27b4e90c6a1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('property_maintenance_request', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('priority', sa.Integer(), server_default='2', nullable=False))
+        batch_op.add_column(sa.Column('assignedTo', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('claimedAt', sa.DateTime(), nullable=True))
+        batch_op.create_foreign_key('fk_maintenance_assigned_to_user', 'user', ['assignedTo'], ['id'], ondelete='SET NULL')
+        batch_op.create_index(
+            'idx_maintenance_open_queue', ['priority', 'createdAt', 'propertyId'], unique=False,
+            postgresql_where=sa.text("status IN ('pending', 'in_progress')"),
+            sqlite_where=sa.text("status IN ('pending', 'in_progress')")
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('property_maintenance_request', schema=None) as batch_op:
+        batch_op.drop_index('idx_maintenance_open_queue')
+        batch_op.drop_constraint('fk_maintenance_assigned_to_user', type_='foreignkey')
+        batch_op.drop_column('claimedAt')
+        batch_op.drop_column('assignedTo')
+        batch_op.drop_column('priority')
@@ -0,0 +1,46 @@
+"""Make leases without a unit overlap every unit of the property
+
+Revision ID: e8b1c4f7a3d2
+Revises: 9d4c7e1f2a63
+Create Date: 2026-10-19 17:05:31.482913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8b1c4f7a3d2'
+down_revision = '9d4c7e1f2a63'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # GiST exclusion constraint is Postgres only; SQLite relies on the API check.
+    # A unit becomes the one-value text range [unit, unit] and a lease without
+    # a unit the unbounded range, which overlaps (&&) every unit.
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('ALTER TABLE lease DROP CONSTRAINT IF EXISTS excl_lease_unit_overlap')
+        op.execute(
+            'DO $$ BEGIN CREATE TYPE textrange AS RANGE (subtype = text); '
+            'EXCEPTION WHEN duplicate_object THEN NULL; END $$'
+        )
+        op.execute(
+            'ALTER TABLE lease ADD CONSTRAINT excl_lease_unit_overlap EXCLUDE USING gist ('
+            '"propertyId" WITH =, '
+            '(CASE WHEN COALESCE(unit, \'\') = \'\' THEN textrange(NULL, NULL) '
+            'ELSE textrange(unit, unit, \'[]\') END) WITH &&, '
+            'daterange("startDate", "endDate", \'[)\') WITH &&)'
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('ALTER TABLE lease DROP CONSTRAINT IF EXISTS excl_lease_unit_overlap')
+        op.execute('DROP TYPE IF EXISTS textrange')
+        op.execute(
+            'ALTER TABLE lease ADD CONSTRAINT excl_lease_unit_overlap EXCLUDE USING gist ('
+            '"propertyId" WITH =, (COALESCE(unit, \'\')) WITH =, '
+            'daterange("startDate", "endDate", \'[)\') WITH &&)'
+        )
@@ -0,0 +1,67 @@
+"""Add delta sync columns and tombstones
+
+Revision ID: f3c8a2d61b57
+Revises: e5a19c3b7f42
+Create Date: 2026-10-19 15:38:52.660127
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3c8a2d61b57'
+down_revision = 'e5a19c3b7f42'
+branch_labels = None
+depends_on = None
+
+# table -> (updated-at column, scope column for the composite index, index name)
+SYNC_COLUMNS = {
+    'phase': ('updated_at', 'property_id', 'idx_phase_property_updated_at'),
+    'construction_draw': ('updated_at', 'property_id', 'idx_draw_property_updated_at'),
+    'receipt': ('updated_at', 'construction_draw_id', 'idx_receipt_draw_updated_at'),
+    'tenant': ('updatedAt', 'manager_id', 'idx_tenant_manager_updated_at'),
+    'lease': ('updatedAt', 'propertyId', 'idx_lease_property_updated_at'),
+}
+
+
+def upgrade():
+    for table, (column, scope, index) in SYNC_COLUMNS.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.add_column(sa.Column(column, sa.DateTime(), nullable=True))
+        # Existing rows count as changed now so the first delta sync includes them
+        op.execute(sa.text(f'UPDATE {table} SET "{column}" = CURRENT_TIMESTAMP'))
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.create_index(index, [scope, column], unique=False)
+
+    with op.batch_alter_table('property', schema=None) as batch_op:
+        batch_op.create_index('idx_property_owner_updated_at', ['owner_id', 'updated_at'], unique=False)
+    with op.batch_alter_table('property_maintenance_request', schema=None) as batch_op:
+        batch_op.create_index('idx_maintenance_property_updated_at', ['propertyId', 'updatedAt'], unique=False)
+
+    op.create_table('tombstone',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('table_name', sa.String(length=64), nullable=False),
+    sa.Column('record_id', sa.Integer(), nullable=False),
+    sa.Column('owner_id', sa.Integer(), nullable=True),
+    sa.Column('deleted_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('tombstone', schema=None) as batch_op:
+        batch_op.create_index('idx_tombstone_owner_table_deleted_at', ['owner_id', 'table_name', 'deleted_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('tombstone', schema=None) as batch_op:
+        batch_op.drop_index('idx_tombstone_owner_table_deleted_at')
+
+    op.drop_table('tombstone')
+    with op.batch_alter_table('property_maintenance_request', schema=None) as batch_op:
+        batch_op.drop_index('idx_maintenance_property_updated_at')
+    with op.batch_alter_table('property', schema=None) as batch_op:
+        batch_op.drop_index('idx_property_owner_updated_at')
+
+    for table, (column, scope, index) in SYNC_COLUMNS.items():
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_index(index)
+            batch_op.drop_column(column)
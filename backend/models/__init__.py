@@ -3,9 +3,11 @@
 from .base import db
 from .user import User
 from .property import Property, Phase
-from .financial import ConstructionDraw, Receipt
+from .financial import ConstructionDraw, Receipt, RentCharge, RentPayment
 from .tenant import Tenant, Lease
 from .maintenance import PropertyMaintenanceRequest
+from .sync import Tombstone
+from .phase_progress import PhaseProgress
 
 __all__ = [
     'db',
@@ -14,7 +16,11 @@ __all__ = [
     'Phase',
     'ConstructionDraw',
     'Receipt',
+    'RentCharge',
+    'RentPayment',
     'Tenant',
     'Lease',
-    'PropertyMaintenanceRequest'
+    'PropertyMaintenanceRequest',
+    'Tombstone',
+    'PhaseProgress'
 ] 
\ No newline at end of file
@@ -1,5 +1,8 @@
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import DateTime
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.sql.expression import FunctionElement
 
 # Initialize SQLAlchemy with no settings
 db = SQLAlchemy()
@@ -8,4 +11,28 @@ Base = declarative_base()
 
 class ValidationError(Exception):
     """Custom validation error for model validation."""
-    pass 
\ No newline at end of file
+    pass
+
+class utcnow(FunctionElement):
+    """
+    The database's current time as naive UTC.
+
+    Used for the updated-at columns, tombstones and the sync serverTime so
+    every delta-sync high-water mark comes from one clock, not the clocks of
+    whichever app servers wrote the rows.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+@compiles(utcnow, 'postgresql')
+def _pg_utcnow(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+@compiles(utcnow, 'sqlite')
+def _sqlite_utcnow(element, compiler, **kw):
+    # CURRENT_TIMESTAMP is whole seconds; match SQLAlchemy's microsecond storage format
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    return 'CURRENT_TIMESTAMP'
@@ -1,6 +1,6 @@
-from .base import db
+from .base import db, utcnow
 from datetime import date
-from sqlalchemy import event
+from sqlalchemy import Index, UniqueConstraint, event
 from .base import ValidationError
 
 class ConstructionDraw(db.Model):
@@ -10,8 +10,11 @@ class ConstructionDraw(db.Model):
     amount = db.Column(db.Float, nullable=False)
     bank_account_number = db.Column(db.String(256), nullable=False)
     is_approved = db.Column(db.Boolean, default=False, nullable=False)
+    updated_at = db.Column(db.DateTime, default=utcnow(), onupdate=utcnow())
     receipts = db.relationship('Receipt', backref='construction_draw', lazy='dynamic')
 
+    __table_args__ = (Index('idx_draw_property_updated_at', 'property_id', 'updated_at'),)  # Delta sync
+
     def validate_property_id(self):
         """Validate property_id is present and positive"""
         if not self.property_id or not isinstance(self.property_id, int) or self.property_id <= 0:
@@ -49,7 +52,8 @@ class ConstructionDraw(db.Model):
             'release_date': self.release_date.isoformat() if self.release_date else None,
             'amount': self.amount,
             'bank_account_number': self.bank_account_number,
-            'is_approved': self.is_approved
+            'is_approved': self.is_approved,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
 
 @event.listens_for(ConstructionDraw, 'before_insert')
@@ -66,4 +70,70 @@ class Receipt(db.Model):
     amount = db.Column(db.Float, nullable=False)
     description = db.Column(db.Text, nullable=True)
     pointofcontact = db.Column(db.String(512), nullable=True)
-    ccnumber = db.Column(db.String(4), nullable=True) 
\ No newline at end of file
+    ccnumber = db.Column(db.String(4), nullable=True)
+    updated_at = db.Column(db.DateTime, default=utcnow(), onupdate=utcnow())
+
+    __table_args__ = (Index('idx_receipt_draw_updated_at', 'construction_draw_id', 'updated_at'),)  # Delta sync
+
+    def to_dict(self):
+        """Convert the model instance to a dictionary"""
+        return {
+            'id': self.id,
+            'construction_draw_id': self.construction_draw_id,
+            'date': self.date.isoformat() if self.date else None,
+            'vendor': self.vendor,
+            'amount': self.amount,
+            'description': self.description,
+            'pointofcontact': self.pointofcontact,
+            'ccnumber': self.ccnumber,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+class RentCharge(db.Model):
+    """Expected rent for one lease period, generated in bulk from the lease terms"""
+    id = db.Column(db.Integer, primary_key=True)
+    leaseId = db.Column(db.Integer, db.ForeignKey('lease.id', ondelete='CASCADE'), nullable=False)  # Many to one relationship w/Lease
+    propertyId = db.Column(db.Integer, db.ForeignKey('property.id', ondelete='CASCADE'), nullable=False)  # Denormalised for portfolio aggregates
+    dueDate = db.Column(db.Date, nullable=False)
+    amount = db.Column(db.Float, nullable=False)
+    createdAt = db.Column(db.DateTime, default=db.func.current_timestamp())
+
+    __table_args__ = (
+        UniqueConstraint('leaseId', 'dueDate', name='uq_rent_charge_lease_due_date'),  # One charge per period, makes generation idempotent
+        Index('idx_rent_charge_property_due_date', 'propertyId', 'dueDate'),  # Arrears / aging scans
+    )
+
+    def to_dict(self):
+        """Convert the model instance to a dictionary"""
+        return {
+            'id': self.id,
+            'leaseId': self.leaseId,
+            'propertyId': self.propertyId,
+            'dueDate': self.dueDate.isoformat() if self.dueDate else None,
+            'amount': self.amount
+        }
+
+class RentPayment(db.Model):
+    """Rent received against a lease"""
+    id = db.Column(db.Integer, primary_key=True)
+    leaseId = db.Column(db.Integer, db.ForeignKey('lease.id', ondelete='CASCADE'), nullable=False)  # Many to one relationship w/Lease
+    paymentDate = db.Column(db.Date, nullable=False)
+    amount = db.Column(db.Float, nullable=False)
+    method = db.Column(db.String(50), nullable=True)  # Examples: "ACH", "Check", "Cash"
+    reference = db.Column(db.String(255), nullable=True)
+    createdAt = db.Column(db.DateTime, default=db.func.current_timestamp())
+
+    __table_args__ = (
+        Index('idx_rent_payment_lease_date', 'leaseId', 'paymentDate'),  # Per-lease balance lookups
+    )
+
+    def to_dict(self):
+        """Convert the model instance to a dictionary"""
+        return {
+            'id': self.id,
+            'leaseId': self.leaseId,
+            'paymentDate': self.paymentDate.isoformat() if self.paymentDate else None,
+            'amount': self.amount,
+            'method': self.method,
+            'reference': self.reference
+        }
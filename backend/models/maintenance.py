@@ -1,4 +1,10 @@
-from .base import db
+from sqlalchemy import Index, text
+from .base import db, utcnow
+
+OPEN_STATUSES = ('pending', 'in_progress')
+# Lower value = dispatched first
+PRIORITIES = {'urgent': 0, 'high': 1, 'normal': 2, 'low': 3}
+DEFAULT_PRIORITY = PRIORITIES['normal']
 
 class PropertyMaintenanceRequest(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -7,6 +13,36 @@ class PropertyMaintenanceRequest(db.Model):
     description = db.Column(db.Text, nullable=False)
     status = db.Column(db.String(100), default='pending')
     timeToCompletion = db.Column(db.Integer)  # Time in hours
+    priority = db.Column(db.Integer, nullable=False, default=DEFAULT_PRIORITY, server_default=str(DEFAULT_PRIORITY))
+    assignedTo = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='SET NULL'), nullable=True)  # Dispatcher who claimed the request
+    claimedAt = db.Column(db.DateTime, nullable=True)
     createdAt = db.Column(db.DateTime, default=db.func.current_timestamp())
-    updatedAt = db.Column(db.DateTime, default=db.func.current_timestamp(), onupdate=db.func.current_timestamp())
-    tenant = db.relationship('Tenant', backref='maintenance_requests', lazy=True)  # Many to one relationship w/Tenant 
\ No newline at end of file
+    updatedAt = db.Column(db.DateTime, default=utcnow(), onupdate=utcnow())
+    tenant = db.relationship('Tenant', backref='maintenance_requests', lazy=True)  # Many to one relationship w/Tenant
+
+    __table_args__ = (
+        Index('idx_maintenance_property_status', 'propertyId', 'status'),  # Per-property status filters
+        Index('idx_maintenance_created_at', 'createdAt'),  # Newest-first keyset pagination
+        Index(
+            'idx_maintenance_open_queue', 'priority', 'createdAt', 'propertyId',
+            postgresql_where=text("status IN ('pending', 'in_progress')"),
+            sqlite_where=text("status IN ('pending', 'in_progress')")
+        ),  # Dispatch queue order, open requests only
+        Index('idx_maintenance_property_updated_at', 'propertyId', 'updatedAt'),  # Delta sync
+    )
+
+    def to_dict(self):
+        """Convert the model instance to a dictionary"""
+        return {
+            'id': self.id,
+            'propertyId': self.propertyId,
+            'tenantId': self.tenantId,
+            'description': self.description,
+            'status': self.status,
+            'priority': self.priority,
+            'assignedTo': self.assignedTo,
+            'claimedAt': self.claimedAt.isoformat() if self.claimedAt else None,
+            'timeToCompletion': self.timeToCompletion,
+            'createdAt': self.createdAt.isoformat(),
+            'updatedAt': self.updatedAt.isoformat()
+        }
@@ -0,0 +1,138 @@
+from sqlalchemy import DateTime, Index, and_, case, delete, event, func, inspect, insert, literal, or_, select
+from .base import db
+from datetime import date, datetime
+from .property import Property, Phase
+
+PROPERTY_PHASES = ('ACQUISITION', 'REHAB', 'SALE')
+
+class PhaseProgress(db.Model):
+    """
+    Per-property rollup of phase status, kept current by the listeners below
+
+    Lateness depends on the day it is asked, so the row stores the earliest
+    expected end of any unfinished phase and readers compare it with today.
+    A phase counts as completed once its endDate has passed, as in
+    phase_schedule, so the counts hold only between ``last_end_date`` (the
+    latest endDate already reached when the row was built) and
+    ``next_end_date`` (the earliest one still ahead); see valid_on().
+    """
+    __tablename__ = 'phase_progress'
+
+    property_id = db.Column(db.Integer, db.ForeignKey('property.id', ondelete='CASCADE'), primary_key=True)
+    owner_id = db.Column(db.Integer, nullable=False)
+    current_phase = db.Column(db.String(50), nullable=False)
+    phase_count = db.Column(db.Integer, nullable=False, default=0)
+    completed_phases = db.Column(db.Integer, nullable=False, default=0)
+    late_completed_phases = db.Column(db.Integer, nullable=False, default=0)  # Finished after their expected end
+    open_due_date = db.Column(db.Date, nullable=True)  # Earliest expectedEndDate of an unfinished phase
+    last_end_date = db.Column(db.Date, nullable=True)  # Latest endDate reached; the row is stale before it
+    next_end_date = db.Column(db.Date, nullable=True)  # Earliest future endDate; the row is stale from it on
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        # Covers the portfolio aggregate without touching the table
+        Index('idx_phase_progress_owner_phase', 'owner_id', 'current_phase', 'open_due_date'),
+    )
+
+    def to_dict(self):
+        return {
+            'propertyId': self.property_id,
+            'currentPhase': self.current_phase,
+            'phaseCount': self.phase_count,
+            'completedPhases': self.completed_phases,
+            'lateCompletedPhases': self.late_completed_phases,
+            'openDueDate': self.open_due_date.isoformat() if self.open_due_date else None,
+            'lastEndDate': self.last_end_date.isoformat() if self.last_end_date else None,
+            'nextEndDate': self.next_end_date.isoformat() if self.next_end_date else None,
+            'updatedAt': self.updated_at.isoformat() if self.updated_at else None
+        }
+
+def valid_on(as_of):
+    """Condition for rollup rows whose counts hold on ``as_of``"""
+    table = PhaseProgress.__table__
+    return and_(or_(table.c.last_end_date.is_(None), table.c.last_end_date <= as_of),
+                or_(table.c.next_end_date.is_(None), table.c.next_end_date > as_of))
+
+def phase_rollup(as_of):
+    """
+    SELECT of the rollup columns of every owned property, computed from its phases
+
+    Phases are completed when their endDate is on or before ``as_of``.
+    """
+    finished = and_(Phase.endDate.isnot(None), Phase.endDate <= as_of)
+    return (
+        select(
+            Property.id.label('property_id'),
+            Property.owner_id.label('owner_id'),
+            Property.current_phase.label('current_phase'),
+            func.count(Phase.id).label('phase_count'),
+            func.coalesce(func.sum(case((finished, 1), else_=0)), 0).label('completed_phases'),
+            func.coalesce(func.sum(case((and_(finished, Phase.endDate > Phase.expectedEndDate), 1), else_=0)),
+                          0).label('late_completed_phases'),
+            func.min(case((~finished, Phase.expectedEndDate))).label('open_due_date'),
+            func.max(case((finished, Phase.endDate))).label('last_end_date'),
+            func.min(case((Phase.endDate > as_of, Phase.endDate))).label('next_end_date')
+        )
+        .select_from(Property)
+        .outerjoin(Phase, Phase.property_id == Property.id)
+        .where(Property.owner_id.isnot(None))
+        .group_by(Property.id, Property.owner_id, Property.current_phase)
+    )
+
+def refresh_phase_progress(connection, property_ids, as_of=None):
+    """
+    Rebuild the rollup rows of the given properties with one INSERT ... SELECT
+
+    Rows are built as of ``as_of`` (default today). Bulk inserts and updates
+    issued with session.execute() skip mapper events; callers making those
+    must refresh the affected properties themselves.
+    """
+    property_ids = [property_id for property_id in set(property_ids) if property_id is not None]
+    if not property_ids:
+        return
+    table = PhaseProgress.__table__
+    rollup = phase_rollup(as_of or date.today()).where(Property.id.in_(property_ids))
+    connection.execute(delete(table).where(table.c.property_id.in_(property_ids)))
+    connection.execute(insert(table).from_select(
+        ['property_id', 'owner_id', 'current_phase', 'phase_count', 'completed_phases',
+         'late_completed_phases', 'open_due_date', 'last_end_date', 'next_end_date', 'updated_at'],
+        rollup.add_columns(literal(datetime.utcnow(), DateTime))
+    ))
+
+def refresh_stale_phase_progress(connection, as_of=None):
+    """
+    Rebuild every rollup row that no longer holds on ``as_of`` (default today)
+
+    Rows go stale as phases reach their endDate without being written, so
+    this is meant to run daily (``flask refresh-phase-progress``). Returns
+    the number of rows rebuilt.
+    """
+    as_of = as_of or date.today()
+    table = PhaseProgress.__table__
+    stale = connection.execute(select(table.c.property_id).where(~valid_on(as_of))).scalars().all()
+    refresh_phase_progress(connection, stale, as_of)
+    return len(stale)
+
+def _phase_written(mapper, connection, target):
+    property_ids = [target.property_id]
+    # A phase moved to another property changes both rollups
+    property_ids.extend(inspect(target).attrs.property_id.history.deleted or ())
+    refresh_phase_progress(connection, property_ids)
+
+def _property_inserted(mapper, connection, target):
+    refresh_phase_progress(connection, [target.id])
+
+def _property_updated(mapper, connection, target):
+    state = inspect(target)
+    if any(state.attrs[name].history.has_changes() for name in ('current_phase', 'owner_id')):
+        refresh_phase_progress(connection, [target.id])
+
+def _property_deleted(mapper, connection, target):
+    table = PhaseProgress.__table__
+    connection.execute(delete(table).where(table.c.property_id == target.id))
+
+for _event in ('after_insert', 'after_update', 'after_delete'):
+    event.listen(Phase, _event, _phase_written)
+event.listen(Property, 'after_insert', _property_inserted)
+event.listen(Property, 'after_update', _property_updated)
+event.listen(Property, 'after_delete', _property_deleted)
@@ -1,5 +1,5 @@
 from sqlalchemy import Index, event, func
-from .base import db
+from .base import db, utcnow
 from .tenant import ValidationError
 from datetime import datetime, timedelta
 from .exceptions import (
@@ -19,7 +19,7 @@ class Property(db.Model):
     purchase_price = db.Column(db.Float, nullable=False)
     current_phase = db.Column(db.String(50), nullable=False, default='ACQUISITION')
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
-    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=utcnow(), onupdate=utcnow())
 
     # Foreclosure Fields If Applicable
     detail_link = db.Column(db.String(1024))  
@@ -176,7 +176,15 @@ class Property(db.Model):
     construction_draws = db.relationship('ConstructionDraw', backref='property', lazy=True)
 
     # Indexes
-    __table_args__ = (Index('idx_user_property', 'owner_id'),)
+    __table_args__ = (
+        Index('idx_user_property', 'owner_id'),
+        Index('idx_property_owner_updated_at', 'owner_id', 'updated_at'),  # Delta sync
+        # One property per scraped listing and owner
+        Index('uq_property_owner_detail_link', 'owner_id', 'detail_link', unique=True),
+        # A missing county counts as one value, or county-less listings would never clash
+        Index('uq_property_owner_sheriff_number', 'owner_id', func.coalesce(county, ''), 'sheriff_number',
+              unique=True),
+    )
 
     def __init__(self, **kwargs):
         """Initialize a new property with any number of fields"""
@@ -283,7 +291,11 @@ class Phase(db.Model):
     expectedStartDate = db.Column(db.Date, nullable=True)
     endDate = db.Column(db.Date, nullable=True)
     expectedEndDate = db.Column(db.Date, nullable=True)
-    
+    order = db.Column(db.Integer, nullable=False, default=0)  # Position in the property's plan
+    updated_at = db.Column(db.DateTime, default=utcnow(), onupdate=utcnow())
+
+    __table_args__ = (Index('idx_phase_property_updated_at', 'property_id', 'updated_at'),)  # Delta sync
+
     def serialize(self):
         return {
             "id": self.id,
@@ -292,5 +304,7 @@ class Phase(db.Model):
             "startDate": self.startDate.isoformat() if self.startDate else None,
             "expectedStartDate": self.expectedStartDate.isoformat() if self.expectedStartDate else None,
             "endDate": self.endDate.isoformat() if self.endDate else None,
-            "expectedEndDate": self.expectedEndDate.isoformat() if self.expectedEndDate else None
+            "expectedEndDate": self.expectedEndDate.isoformat() if self.expectedEndDate else None,
+            "order": self.order,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None
         } 
\ No newline at end of file
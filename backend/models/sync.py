@@ -0,0 +1,59 @@
+from sqlalchemy import Index, event, insert, select
+from .base import db, utcnow
+from .property import Property, Phase
+from .financial import ConstructionDraw, Receipt
+from .tenant import Tenant, Lease
+from .maintenance import PropertyMaintenanceRequest
+
+class Tombstone(db.Model):
+    """Record of a deleted row so delta-sync clients can drop their copy"""
+    id = db.Column(db.Integer, primary_key=True)
+    table_name = db.Column(db.String(64), nullable=False)
+    record_id = db.Column(db.Integer, nullable=False)
+    owner_id = db.Column(db.Integer, nullable=True)  # User the row was visible to, resolved at delete time
+    deleted_at = db.Column(db.DateTime, default=utcnow(), nullable=False)
+
+    __table_args__ = (Index('idx_tombstone_owner_table_deleted_at', 'owner_id', 'table_name', 'deleted_at'),)
+
+def _property_owner(connection, property_id):
+    if property_id is None:
+        return None
+    return connection.execute(select(Property.owner_id).where(Property.id == property_id)).scalar()
+
+def _draw_owner(connection, draw_id):
+    if draw_id is None:
+        return None
+    return connection.execute(
+        select(Property.owner_id)
+        .join(ConstructionDraw, ConstructionDraw.property_id == Property.id)
+        .where(ConstructionDraw.id == draw_id)
+    ).scalar()
+
+# How to find the owning user of each synced row when it is deleted
+TOMBSTONE_OWNERS = {
+    Property: lambda connection, target: target.owner_id,
+    Phase: lambda connection, target: _property_owner(connection, target.property_id),
+    ConstructionDraw: lambda connection, target: _property_owner(connection, target.property_id),
+    Receipt: lambda connection, target: _draw_owner(connection, target.construction_draw_id),
+    Tenant: lambda connection, target: target.manager_id,
+    Lease: lambda connection, target: _property_owner(connection, target.propertyId),
+    PropertyMaintenanceRequest: lambda connection, target: _property_owner(connection, target.propertyId),
+}
+
+def record_tombstone(mapper, connection, target):
+    """
+    Write a tombstone in the same transaction as an ORM delete.
+
+    Bulk query.delete() calls and database-level ON DELETE CASCADE bypass
+    mapper events and leave no tombstone.
+    """
+    owner_id = TOMBSTONE_OWNERS[mapper.class_](connection, target)
+    connection.execute(insert(Tombstone.__table__).values(
+        table_name=mapper.local_table.name,
+        record_id=target.id,
+        owner_id=owner_id,
+        deleted_at=utcnow()
+    ))
+
+for model in TOMBSTONE_OWNERS:
+    event.listen(model, 'after_delete', record_tombstone)
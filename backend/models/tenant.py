@@ -1,8 +1,14 @@
-from sqlalchemy import Index, event
-from .base import db
+from sqlalchemy import DDL, Index, event
+from .base import db, utcnow
 import re
 from datetime import date, datetime
 
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+NAME_PATTERN = re.compile(r'^[a-zA-Z\s\'-]+$')
+NON_DIGIT_PATTERN = re.compile(r'\D')
+CREDIT_SCORE_RANGE = (300, 850)
+MINIMUM_AGE = 18
+
 class ValidationError(Exception):
     """Custom validation error class for model validation."""
     pass
@@ -23,29 +29,55 @@ class Tenant(db.Model):
     creditCheck2Complete = db.Column(db.Boolean)
     guarantor = db.Column(db.String(255), nullable=True)
     petsAllowed = db.Column(db.Boolean, default=False)
+    updatedAt = db.Column(db.DateTime, default=utcnow(), onupdate=utcnow())
     manager_id = db.Column(db.Integer, db.ForeignKey('user.id', ondelete='SET NULL'))  # Link back to the manager(user) who manages this tenant
     leases = db.relationship('Lease', backref='tenant', lazy=True)  # One to many relationship w/Lease
 
-    __table_args__ = (Index('idx_tenant_manager', 'manager_id'),)  # Index for manager queries
+    __table_args__ = (
+        Index('idx_tenant_manager', 'manager_id'),  # Index for manager queries
+        Index('idx_tenant_manager_last_name', 'manager_id', 'lastName'),  # Keyset pagination / prefix filter
+        Index('idx_tenant_manager_credit_score', 'manager_id', 'creditScoreAtInitialApplication'),  # Credit range filter
+        Index('idx_tenant_manager_updated_at', 'manager_id', 'updatedAt'),  # Delta sync
+    )
+
+    def to_dict(self):
+        """Convert the model instance to a dictionary"""
+        return {
+            'id': self.id,
+            'firstName': self.firstName,
+            'lastName': self.lastName,
+            'phoneNumber': self.phoneNumber,
+            'email': self.email,
+            'dateOfBirth': self.dateOfBirth.isoformat() if self.dateOfBirth else None,
+            'occupation': self.occupation,
+            'employerName': self.employerName,
+            'professionalTitle': self.professionalTitle,
+            'creditScoreAtInitialApplication': self.creditScoreAtInitialApplication,
+            'creditCheck1Complete': self.creditCheck1Complete,
+            'creditScoreAtLeaseRenewal': self.creditScoreAtLeaseRenewal,
+            'creditCheck2Complete': self.creditCheck2Complete,
+            'guarantor': self.guarantor,
+            'petsAllowed': self.petsAllowed,
+            'updatedAt': self.updatedAt.isoformat() if self.updatedAt else None
+        }
 
     def validate_email(self):
         """Validate email format using regex pattern."""
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, self.email):
+        if not EMAIL_PATTERN.match(self.email):
             raise ValidationError('Invalid email format')
 
     def validate_phone_number(self):
         """Validate phone number format if provided."""
         if self.phoneNumber:
             # Remove any non-digit characters for validation
-            cleaned_number = re.sub(r'\D', '', self.phoneNumber)
+            cleaned_number = NON_DIGIT_PATTERN.sub('', self.phoneNumber)
             if not (10 <= len(cleaned_number) <= 11):  # Allow for optional country code
                 raise ValidationError('Phone number must be 10-11 digits')
 
     def validate_credit_score(self):
         """Validate credit score range if provided."""
         for score in [self.creditScoreAtInitialApplication, self.creditScoreAtLeaseRenewal]:
-            if score is not None and not (300 <= score <= 850):
+            if score is not None and not (CREDIT_SCORE_RANGE[0] <= score <= CREDIT_SCORE_RANGE[1]):
                 raise ValidationError('Credit score must be between 300 and 850')
 
     def validate_date_of_birth(self):
@@ -53,13 +85,12 @@ class Tenant(db.Model):
         if self.dateOfBirth:
             today = date.today()
             age = today.year - self.dateOfBirth.year - ((today.month, today.day) < (self.dateOfBirth.month, self.dateOfBirth.day))
-            if age < 18:
+            if age < MINIMUM_AGE:
                 raise ValidationError('Tenant must be at least 18 years old')
 
     def validate_name_fields(self):
         """Validate name fields contain only letters, spaces, hyphens and apostrophes."""
-        name_pattern = r'^[a-zA-Z\s\'-]+$'
-        if not re.match(name_pattern, self.firstName) or not re.match(name_pattern, self.lastName):
+        if not NAME_PATTERN.match(self.firstName) or not NAME_PATTERN.match(self.lastName):
             raise ValidationError('Names can only contain letters, spaces, hyphens and apostrophes')
 
     def validate_tenant(self):
@@ -84,4 +115,53 @@ class Lease(db.Model):
     endDate = db.Column(db.Date, nullable=False)
     rentAmount = db.Column(db.Float, nullable=False)
     renewalCondition = db.Column(db.String(255), nullable=True)
-    typeOfLease = db.Column(db.String(100), nullable=False)  # Examples: "Fixed", "Month-to-Month", "Lease to Own", etc.
\ No newline at end of file
+    typeOfLease = db.Column(db.String(100), nullable=False)  # Examples: "Fixed", "Month-to-Month", "Lease to Own", etc.
+    unit = db.Column(db.String(50), nullable=True)  # Unit label for multi-unit properties, None = whole property
+    updatedAt = db.Column(db.DateTime, default=utcnow(), onupdate=utcnow())
+
+    __table_args__ = (
+        Index('idx_lease_end_date_property', 'endDate', 'propertyId'),  # Expiration window scans
+        Index('idx_lease_property_end_date', 'propertyId', 'endDate'),  # Per-property active / expiring lookups
+        Index('idx_lease_property_updated_at', 'propertyId', 'updatedAt'),  # Delta sync
+    )
+
+    def to_dict(self):
+        """Convert the model instance to a dictionary"""
+        return {
+            'id': self.id,
+            'tenantId': self.tenantId,
+            'propertyId': self.propertyId,
+            'startDate': self.startDate.isoformat(),
+            'endDate': self.endDate.isoformat(),
+            'rentAmount': self.rentAmount,
+            'renewalCondition': self.renewalCondition,
+            'typeOfLease': self.typeOfLease,
+            'unit': self.unit,
+            'updatedAt': self.updatedAt.isoformat() if self.updatedAt else None
+        }
+
+# Postgres enforces non-overlapping leases per (property, unit) with a GiST
+# exclusion constraint; other databases rely on the check in create_lease.
+# A unit is the one-value text range [unit, unit] and a lease without a unit
+# the unbounded range, so whole-property leases overlap every unit.
+event.listen(
+    Lease.__table__, 'after_create',
+    DDL('CREATE EXTENSION IF NOT EXISTS btree_gist').execute_if(dialect='postgresql')
+)
+event.listen(
+    Lease.__table__, 'after_create',
+    DDL(
+        'DO $$ BEGIN CREATE TYPE textrange AS RANGE (subtype = text); '
+        'EXCEPTION WHEN duplicate_object THEN NULL; END $$'
+    ).execute_if(dialect='postgresql')
+)
+event.listen(
+    Lease.__table__, 'after_create',
+    DDL(
+        'ALTER TABLE lease ADD CONSTRAINT excl_lease_unit_overlap EXCLUDE USING gist ('
+        '"propertyId" WITH =, '
+        '(CASE WHEN COALESCE(unit, \'\') = \'\' THEN textrange(NULL, NULL) '
+        'ELSE textrange(unit, unit, \'[]\') END) WITH &&, '
+        'daterange("startDate", "endDate", \'[)\') WITH &&)'
+    ).execute_if(dialect='postgresql')
+)
@@ -7,6 +7,7 @@ from .property import property_routes
 from .financial import financial_routes
 from .tenant import tenant_routes
 from .maintenance import maintenance_routes
+from .sync import sync_routes
 
 # Create a Blueprint for the API
 api = Blueprint('api', __name__)
@@ -17,4 +18,5 @@ api.register_blueprint(user_routes)
 api.register_blueprint(property_routes)
 api.register_blueprint(financial_routes)
 api.register_blueprint(tenant_routes)
-api.register_blueprint(maintenance_routes) 
\ No newline at end of file
+api.register_blueprint(maintenance_routes)
+api.register_blueprint(sync_routes)
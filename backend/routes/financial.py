@@ -1,8 +1,12 @@
 from flask import Blueprint, request, jsonify
-from models import db, ConstructionDraw, Receipt
-from flask_jwt_extended import jwt_required
-from datetime import datetime
+from models import db, ConstructionDraw, Receipt, User, Property, Lease, RentCharge, RentPayment
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from datetime import datetime, date
+import math
 from models.base import ValidationError
+from sqlalchemy import select
+from services.ledger import arrears_query, generate_charges, summarize_arrears
+from utils.pagination import parse_int
 
 financial_routes = Blueprint('financial', __name__)
 
@@ -316,4 +320,148 @@ def delete_receipt(receipt_id):
         return jsonify({"message": "Receipt deleted successfully"}), 200
     except Exception as e:
         db.session.rollback()
-        return jsonify({"error": str(e)}), 500 
\ No newline at end of file
+        return jsonify({"error": str(e)}), 500
+
+# Rent ledger routes
+
+def _parse_date_param(value, default):
+    """Parse an optional YYYY-MM-DD value, raising ValueError on bad input"""
+    if not value:
+        return default
+    try:
+        return datetime.strptime(str(value), '%Y-%m-%d').date()
+    except ValueError:
+        raise ValueError(f'Invalid date: {value}. Expected YYYY-MM-DD')
+
+def _owned_lease(lease_id, user):
+    """Return the lease if it sits on one of the user's properties"""
+    return Lease.query.join(Property, Property.id == Lease.propertyId).filter(
+        Lease.id == lease_id, Property.owner_id == user.id
+    ).first()
+
+@financial_routes.route('/rent-ledger/generate', methods=['POST'])
+@jwt_required()
+def generate_rent_charges():
+    """
+    Generate expected monthly rent charges for every lease on the user's
+    properties over [start, end). Defaults to the current calendar year;
+    charges that already exist are skipped.
+    """
+    user = User.query.filter_by(email=get_jwt_identity()).first()
+    if not user:
+        return jsonify({'error': 'User not found'}), 404
+
+    data = request.get_json(silent=True) or {}
+    if not isinstance(data, dict):
+        return jsonify({'error': 'Request body must be a JSON object'}), 400
+    today = date.today()
+    try:
+        start = _parse_date_param(data.get('start'), date(today.year, 1, 1))
+        end = _parse_date_param(data.get('end'), date(today.year + 1, 1, 1))
+        property_id = parse_int(data.get('property_id'), 'property_id')
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    if end <= start:
+        return jsonify({'error': 'end must be after start'}), 400
+
+    query = db.session.query(Property.id).filter(Property.owner_id == user.id)
+    if property_id is not None:
+        query = query.filter(Property.id == property_id)
+    property_ids = [property_id for (property_id,) in query]
+
+    try:
+        result = generate_charges(db.session, Lease, RentCharge, property_ids, start, end)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+    return jsonify(dict(result, start=start.isoformat(), end=end.isoformat())), 201
+
+@financial_routes.route('/leases/<int:lease_id>/payments', methods=['POST'])
+@jwt_required()
+def record_rent_payment(lease_id):
+    user = User.query.filter_by(email=get_jwt_identity()).first()
+    if not user:
+        return jsonify({'error': 'User not found'}), 404
+    lease = _owned_lease(lease_id, user)
+    if not lease:
+        return jsonify({'error': 'Lease not found'}), 404
+
+    data = request.get_json(silent=True) or {}
+    try:
+        amount = float(data.get('amount'))
+        if not math.isfinite(amount):
+            return jsonify({'error': 'Invalid amount format'}), 400
+        if amount <= 0:
+            return jsonify({'error': 'Amount must be greater than 0'}), 400
+    except (ValueError, TypeError):
+        return jsonify({'error': 'Invalid amount format'}), 400
+    try:
+        payment_date = _parse_date_param(data.get('paymentDate'), date.today())
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    payment = RentPayment(
+        leaseId=lease.id,
+        paymentDate=payment_date,
+        amount=amount,
+        method=data.get('method'),
+        reference=data.get('reference')
+    )
+    try:
+        db.session.add(payment)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+    return jsonify(payment.to_dict()), 201
+
+@financial_routes.route('/leases/<int:lease_id>/ledger', methods=['GET'])
+@jwt_required()
+def get_lease_ledger(lease_id):
+    """Charges and payments for one lease with the balance as of a date"""
+    user = User.query.filter_by(email=get_jwt_identity()).first()
+    if not user:
+        return jsonify({'error': 'User not found'}), 404
+    lease = _owned_lease(lease_id, user)
+    if not lease:
+        return jsonify({'error': 'Lease not found'}), 404
+    try:
+        as_of = _parse_date_param(request.args.get('as_of'), date.today())
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    charges = RentCharge.query.filter_by(leaseId=lease.id).order_by(RentCharge.dueDate).all()
+    payments = RentPayment.query.filter_by(leaseId=lease.id).order_by(RentPayment.paymentDate).all()
+    charged = sum(charge.amount for charge in charges if charge.dueDate <= as_of)
+    paid = sum(payment.amount for payment in payments if payment.paymentDate <= as_of)
+    return jsonify({
+        'leaseId': lease.id,
+        'asOf': as_of.isoformat(),
+        'charges': [charge.to_dict() for charge in charges],
+        'payments': [payment.to_dict() for payment in payments],
+        'charged': round(charged, 2),
+        'paid': round(paid, 2),
+        'balance': round(charged - paid, 2)
+    }), 200
+
+@financial_routes.route('/rent-ledger/arrears', methods=['GET'])
+@jwt_required()
+def get_rent_arrears():
+    """
+    Leases with an outstanding balance as of a date, with the unpaid amount
+    split into 0-30 / 31-60 / 61-90 / 90+ days past due, plus portfolio totals.
+    Computed in one aggregate query over the ledger tables.
+    """
+    user = User.query.filter_by(email=get_jwt_identity()).first()
+    if not user:
+        return jsonify({'error': 'User not found'}), 404
+    try:
+        as_of = _parse_date_param(request.args.get('as_of'), date.today())
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    owned = select(Property.id).where(Property.owner_id == user.id)
+    rows = db.session.execute(arrears_query(Lease, RentCharge, RentPayment, owned, as_of)).all()
+    return jsonify(dict(summarize_arrears(rows), asOf=as_of.isoformat())), 200
@@ -1,42 +1,240 @@
 from flask import Blueprint, request, jsonify
-from models import db, PropertyMaintenanceRequest, Property, Tenant
-from flask_jwt_extended import jwt_required
+from models import db, PropertyMaintenanceRequest, Property, Tenant, User
+from models.maintenance import DEFAULT_PRIORITY, OPEN_STATUSES, PRIORITIES
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from datetime import datetime
+from sqlalchemy import and_, or_
+from services.maintenance_analytics import sla_summary
+from utils.pagination import decode_cursor, encode_cursor, parse_int, parse_limit
 
 maintenance_routes = Blueprint('maintenance', __name__)
 
+VALID_STATUSES = ['pending', 'in_progress', 'completed', 'cancelled']
+
+MAX_CLAIM = 50
+
+def _parse_priority(value):
+    """Accept a priority name (urgent/high/normal/low) or its integer level"""
+    if value is None:
+        return DEFAULT_PRIORITY
+    if isinstance(value, str) and value in PRIORITIES:
+        return PRIORITIES[value]
+    try:
+        level = int(value)
+    except (ValueError, TypeError):
+        level = None
+    if level not in PRIORITIES.values():
+        raise ValueError(f"priority must be one of {', '.join(PRIORITIES)} or {sorted(PRIORITIES.values())}")
+    return level
+
+def _dispatch_order():
+    """Queue order served by idx_maintenance_open_queue: priority, then age, then property"""
+    return (
+        PropertyMaintenanceRequest.priority,
+        PropertyMaintenanceRequest.createdAt,
+        PropertyMaintenanceRequest.propertyId,
+        PropertyMaintenanceRequest.id
+    )
+
+def _parse_day(value, name):
+    """Parse an optional YYYY-MM-DD query value into a datetime at midnight"""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        raise ValueError(f'Invalid {name}. Expected YYYY-MM-DD')
+
 @maintenance_routes.route('/property-maintenance-requests', methods=['GET'])
 @jwt_required()
 def get_property_maintenance_requests():
-    property_id = request.args.get('property_id')
-    if property_id:
-        requests = PropertyMaintenanceRequest.query.filter_by(propertyId=property_id).all()
-    else:
-        requests = PropertyMaintenanceRequest.query.all()
-    return jsonify([{
-        'id': req.id,
-        'propertyId': req.propertyId,
-        'tenantId': req.tenantId,
-        'description': req.description,
-        'status': req.status,
-        'timeToCompletion': req.timeToCompletion,
-        'createdAt': req.createdAt.isoformat(),
-        'updatedAt': req.updatedAt.isoformat()
-    } for req in requests]), 200
+    """
+    List maintenance requests on the caller's properties, newest first, one
+    keyset page at a time.
+
+    Query params:
+        limit: Page size (default 100, max 500)
+        cursor: Value of the X-Next-Cursor header from the previous page
+        property_id: Only requests for this property
+        status: Comma separated statuses, e.g. pending,in_progress
+        created_after: Requests created on or after this date (YYYY-MM-DD)
+        created_before: Requests created before this date (YYYY-MM-DD)
+    """
+    current_user_email = get_jwt_identity()
+    user = User.query.filter_by(email=current_user_email).first()
+    if not user:
+        return jsonify({"error": "User not found"}), 404
+
+    try:
+        limit = parse_limit(request.args.get('limit'))
+        cursor = decode_cursor(request.args.get('cursor'))
+        property_id = parse_int(request.args.get('property_id'), 'property_id')
+        created_after = _parse_day(request.args.get('created_after'), 'created_after')
+        created_before = _parse_day(request.args.get('created_before'), 'created_before')
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    statuses = [status.strip() for status in request.args.get('status', '').split(',') if status.strip()]
+    invalid = [status for status in statuses if status not in VALID_STATUSES]
+    if invalid:
+        return jsonify({"error": "Invalid status", "valid_statuses": VALID_STATUSES}), 400
+
+    query = PropertyMaintenanceRequest.query.join(
+        Property, Property.id == PropertyMaintenanceRequest.propertyId
+    ).filter(Property.owner_id == user.id)
+
+    if property_id is not None:
+        query = query.filter(PropertyMaintenanceRequest.propertyId == property_id)
+    if statuses:
+        query = query.filter(PropertyMaintenanceRequest.status.in_(statuses))
+    if created_after:
+        query = query.filter(PropertyMaintenanceRequest.createdAt >= created_after)
+    if created_before:
+        query = query.filter(PropertyMaintenanceRequest.createdAt < created_before)
+
+    if cursor:
+        try:
+            cursor_created_at = datetime.fromisoformat(cursor['createdAt'])
+            cursor_id = int(cursor['id'])
+        except (KeyError, ValueError, TypeError):
+            return jsonify({"error": "Invalid cursor"}), 400
+        query = query.filter(or_(
+            PropertyMaintenanceRequest.createdAt < cursor_created_at,
+            and_(PropertyMaintenanceRequest.createdAt == cursor_created_at,
+                 PropertyMaintenanceRequest.id < cursor_id)
+        ))
+
+    requests = query.order_by(
+        PropertyMaintenanceRequest.createdAt.desc(),
+        PropertyMaintenanceRequest.id.desc()
+    ).limit(limit + 1).all()
+    has_more = len(requests) > limit
+    requests = requests[:limit]
+
+    response = jsonify([req.to_dict() for req in requests])
+    if has_more:
+        response.headers['X-Next-Cursor'] = encode_cursor({
+            'createdAt': requests[-1].createdAt,
+            'id': requests[-1].id
+        })
+    return response, 200
+
+@maintenance_routes.route('/property-maintenance-requests/analytics', methods=['GET'])
+@jwt_required()
+def get_maintenance_analytics():
+    """
+    SLA metrics for the caller's maintenance requests: open / pending /
+    completed counts, median and p90 timeToCompletion (hours) and aging of
+    pending requests, for the portfolio and broken down per property and per
+    tenant.
+    """
+    current_user_email = get_jwt_identity()
+    user = User.query.filter_by(email=current_user_email).first()
+    if not user:
+        return jsonify({"error": "User not found"}), 404
+
+    try:
+        return jsonify(sla_summary(db.session, PropertyMaintenanceRequest, Property, user.id)), 200
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@maintenance_routes.route('/property-maintenance-requests/queue', methods=['GET'])
+@jwt_required()
+def get_maintenance_queue():
+    """
+    Open requests on the caller's properties in dispatch order (priority,
+    then oldest first, then property).
+
+    Query params:
+        limit: Number of requests (default 100, max 500)
+        property_id: Only requests for this property
+        status: pending (default, unclaimed work) or in_progress
+    """
+    current_user_email = get_jwt_identity()
+    user = User.query.filter_by(email=current_user_email).first()
+    if not user:
+        return jsonify({"error": "User not found"}), 404
+
+    try:
+        limit = parse_limit(request.args.get('limit'))
+        property_id = parse_int(request.args.get('property_id'), 'property_id')
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    status = request.args.get('status', 'pending')
+    if status not in OPEN_STATUSES:
+        return jsonify({"error": "Invalid status", "valid_statuses": list(OPEN_STATUSES)}), 400
+
+    query = PropertyMaintenanceRequest.query.join(
+        Property, Property.id == PropertyMaintenanceRequest.propertyId
+    ).filter(Property.owner_id == user.id, PropertyMaintenanceRequest.status == status)
+    if property_id is not None:
+        query = query.filter(PropertyMaintenanceRequest.propertyId == property_id)
+
+    requests = query.order_by(*_dispatch_order()).limit(limit).all()
+    return jsonify([req.to_dict() for req in requests]), 200
+
+@maintenance_routes.route('/property-maintenance-requests/claim', methods=['POST'])
+@jwt_required()
+def claim_maintenance_requests():
+    """
+    Claim the next N pending requests in dispatch order for the caller.
+
+    On Postgres the candidate rows are selected with FOR UPDATE SKIP LOCKED, so
+    concurrent dispatchers each lock a different set of rows instead of
+    waiting on or double-claiming the same ones. Claimed requests move to
+    in_progress with assignedTo / claimedAt set.
+
+    Body:
+        count: Number of requests to claim (default 1, max 50)
+        property_id: Only claim requests for this property
+    """
+    current_user_email = get_jwt_identity()
+    user = User.query.filter_by(email=current_user_email).first()
+    if not user:
+        return jsonify({"error": "User not found"}), 404
+
+    data = request.get_json(silent=True) or {}
+    if not isinstance(data, dict):
+        return jsonify({"error": "Request body must be a JSON object"}), 400
+    try:
+        count = parse_limit(data.get('count'), default=1, maximum=MAX_CLAIM)
+    except ValueError:
+        return jsonify({"error": "count must be an integer"}), 400
+    try:
+        property_id = parse_int(data.get('property_id'), 'property_id')
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    query = PropertyMaintenanceRequest.query.join(
+        Property, Property.id == PropertyMaintenanceRequest.propertyId
+    ).filter(Property.owner_id == user.id, PropertyMaintenanceRequest.status == 'pending')
+    if property_id is not None:
+        query = query.filter(PropertyMaintenanceRequest.propertyId == property_id)
+
+    try:
+        requests = query.order_by(*_dispatch_order()).limit(count).with_for_update(
+            skip_locked=True, of=PropertyMaintenanceRequest
+        ).all()
+        claimed_at = datetime.utcnow()
+        for req in requests:
+            req.status = 'in_progress'
+            req.assignedTo = user.id
+            req.claimedAt = claimed_at
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 500
+
+    return jsonify({
+        'claimed': len(requests),
+        'requests': [req.to_dict() for req in requests]
+    }), 200
 
 @maintenance_routes.route('/property-maintenance-requests/<int:request_id>', methods=['GET'])
 @jwt_required()
 def get_property_maintenance_request(request_id):
     request = PropertyMaintenanceRequest.query.get_or_404(request_id)
-    return jsonify({
-        'id': request.id,
-        'propertyId': request.propertyId,
-        'tenantId': request.tenantId,
-        'description': request.description,
-        'status': request.status,
-        'timeToCompletion': request.timeToCompletion,
-        'createdAt': request.createdAt.isoformat(),
-        'updatedAt': request.updatedAt.isoformat()
-    }), 200
+    return jsonify(request.to_dict()), 200
 
 @maintenance_routes.route('/property-maintenance-requests', methods=['POST'])
 @jwt_required()
@@ -65,12 +263,11 @@ def add_property_maintenance_request():
             return jsonify({"error": "Tenant not found"}), 404
 
         # Validate status
-        valid_statuses = ['pending', 'in_progress', 'completed', 'cancelled']
         status = data.get('status', 'pending')
-        if status not in valid_statuses:
+        if status not in VALID_STATUSES:
             return jsonify({
                 "error": "Invalid status",
-                "valid_statuses": valid_statuses
+                "valid_statuses": VALID_STATUSES
             }), 400
 
         # Validate timeToCompletion
@@ -83,11 +280,17 @@ def add_property_maintenance_request():
             except (ValueError, TypeError):
                 return jsonify({"error": "timeToCompletion must be a positive integer"}), 400
 
+        try:
+            priority = _parse_priority(data.get('priority'))
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
         maintenance_request = PropertyMaintenanceRequest(
             propertyId=data['propertyId'],
             tenantId=data['tenantId'],
             description=data['description'],
             status=status,
+            priority=priority,
             timeToCompletion=time_to_completion
         )
 
@@ -108,6 +311,11 @@ def add_property_maintenance_request():
 def update_property_maintenance_request(request_id):
     maintenance_request = PropertyMaintenanceRequest.query.get_or_404(request_id)
     data = request.get_json()
+    if data and 'priority' in data:
+        try:
+            data['priority'] = _parse_priority(data['priority'])
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
     try:
         for key, value in data.items():
             if hasattr(maintenance_request, key):
@@ -1,11 +1,32 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
 from models import db, User, Property, Phase, ConstructionDraw, Receipt
 from models.base import ValidationError
+from models.phase_progress import PhaseProgress, PROPERTY_PHASES, phase_rollup, refresh_phase_progress, valid_on
+from sqlalchemy import case, func, select, union_all
+from sqlalchemy.exc import IntegrityError
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from datetime import datetime
-from services.scraper.main import main as run_scraper
-import pandas as pd
-import os
+from datetime import date, datetime
+from services.scraper.main import COUNTY_URLS
+from services.scraper.jobs import ALL_COUNTIES, JobQueue, job_to_dict, start_worker
+from services.scraped_listings import listing_index
+from services.scraped_import import MAX_IMPORT_LISTINGS, import_listings, map_listings
+from utils.pagination import decode_cursor, encode_cursor, parse_limit
+from services.underwriting import (
+    underwrite_properties,
+    group_draws,
+    sensitivity_grid,
+    encode_array,
+    DEFAULT_HOLD_MONTHS,
+    DEFAULT_DISCOUNT_RATE
+)
+from services.phase_timeline import phase_timeline
+from services.phase_plan import (
+    parse_phase_rows,
+    next_order,
+    create_phases,
+    reorder_phases,
+    shift_phases
+)
 from models.exceptions import (
     DrawSequenceError, 
     DrawAmountError, 
@@ -186,6 +207,12 @@ def get_properties():
         } for property in properties]), 200
     return jsonify({"message": "User not found"}), 404
 
+def _blank_listing_keys_to_null(data):
+    """Store blank detail links and sheriff numbers as NULL, which the per-owner unique indexes ignore"""
+    for field in ('detail_link', 'sheriff_number'):
+        if isinstance(data.get(field), str):
+            data[field] = data[field].strip() or None
+
 @property_routes.route('/properties', methods=['POST'])
 @jwt_required()
 def add_property():
@@ -198,6 +225,7 @@ def add_property():
         data = request.get_json()
         if not data:
             return jsonify({"error": "No data provided"}), 400
+        _blank_listing_keys_to_null(data)
 
         # Required fields
         required_fields = ['propertyName', 'address', 'city', 'state', 'zipCode']
@@ -278,6 +306,9 @@ def add_property():
     except ValidationError as e:
         db.session.rollback()
         return jsonify({"error": str(e)}), 400
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({"error": "You already have a property with this detail link or sheriff number"}), 409
     except Exception as e:
         db.session.rollback()
         return jsonify({"error": str(e)}), 500
@@ -292,6 +323,7 @@ def update_property(property_id):
         if property:
             try:
                 data = request.get_json()
+                _blank_listing_keys_to_null(data)
                 
                 # Handle date conversion
                 status_date = data.get('status_date')
@@ -345,6 +377,9 @@ def update_property(property_id):
                         
                 db.session.commit()
                 return jsonify({"message": "Property updated successfully"}), 200
+            except IntegrityError:
+                db.session.rollback()
+                return jsonify({"error": "You already have a property with this detail link or sheriff number"}), 409
             except Exception as e:
                 db.session.rollback()
                 print(f"Error updating property: {str(e)}")
@@ -370,13 +405,271 @@ def delete_property(property_id):
         return jsonify({"message": "Property not found"}), 404
     return jsonify({"message": "User not found"}), 404
 
+def _underwriting_params():
+    """Parse hold_months / discount_rate query params for the returns endpoints"""
+    try:
+        hold_months = int(request.args.get('hold_months', DEFAULT_HOLD_MONTHS))
+        discount_rate = float(request.args.get('discount_rate', DEFAULT_DISCOUNT_RATE))
+    except (ValueError, TypeError):
+        raise ValueError("hold_months must be an integer and discount_rate a number")
+    if hold_months < 1 or hold_months > 600:
+        raise ValueError("hold_months must be between 1 and 600")
+    if discount_rate <= -1:
+        raise ValueError("discount_rate must be greater than -1")
+    return hold_months, discount_rate
+
+def _underwrite(properties, hold_months, discount_rate):
+    """Load draws for all properties in one query and run the batched solver"""
+    property_ids = [p.id for p in properties]
+    draws = db.session.query(ConstructionDraw).filter(
+        ConstructionDraw.property_id.in_(property_ids)
+    ).all() if property_ids else []
+    return underwrite_properties(properties, group_draws(draws), hold_months, discount_rate)
+
+@property_routes.route('/properties/returns', methods=['GET'])
+@jwt_required()
+def get_portfolio_returns():
+    """IRR, NPV and equity multiple for every property the user owns"""
+    current_user_email = get_jwt_identity()
+    user = db.session.query(User).filter_by(email=current_user_email).first()
+    if not user:
+        return jsonify({"message": "User not found"}), 404
+
+    try:
+        hold_months, discount_rate = _underwriting_params()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    properties = db.session.query(Property).filter_by(owner_id=user.id).all()
+    results = _underwrite(properties, hold_months, discount_rate)
+    if request.args.get('include_cash_flows', 'false').lower() != 'true':
+        for result in results:
+            result.pop('cash_flows')
+
+    return jsonify({
+        'hold_months': hold_months,
+        'discount_rate': discount_rate,
+        'properties': results
+    }), 200
+
+@property_routes.route('/properties/<int:property_id>/returns', methods=['GET'])
+@jwt_required()
+def get_property_returns(property_id):
+    """IRR, NPV, equity multiple and the monthly cash flows for one property"""
+    current_user_email = get_jwt_identity()
+    user = db.session.query(User).filter_by(email=current_user_email).first()
+    if not user:
+        return jsonify({"message": "User not found"}), 404
+
+    property = db.session.query(Property).filter_by(id=property_id, owner_id=user.id).first()
+    if not property:
+        return jsonify({"message": "Property not found"}), 404
+
+    try:
+        hold_months, discount_rate = _underwriting_params()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    result = _underwrite([property], hold_months, discount_rate)[0]
+    result.update({'hold_months': hold_months, 'discount_rate': discount_rate})
+    return jsonify(result), 200
+
+@property_routes.route('/properties/<int:property_id>/sensitivity', methods=['POST'])
+@jwt_required()
+def get_property_sensitivity(property_id):
+    """Net profit / cash-on-cash grid over ARV, rehab cost, interest rate and hold months"""
+    current_user_email = get_jwt_identity()
+    user = db.session.query(User).filter_by(email=current_user_email).first()
+    if not user:
+        return jsonify({"message": "User not found"}), 404
+
+    property = db.session.query(Property).filter_by(id=property_id, owner_id=user.id).first()
+    if not property:
+        return jsonify({"message": "Property not found"}), 404
+
+    data = request.get_json(silent=True) or {}
+    if not isinstance(data, dict):
+        return jsonify({"error": "Request body must be a JSON object"}), 400
+    encoding = data.get('encoding', 'json')
+    try:
+        grid = sensitivity_grid(property, data.get('axes'))
+        return jsonify({
+            'property_id': property.id,
+            'axis_order': ['arv', 'rehab_cost', 'interest_rate', 'hold_months'],
+            'axes': {name: values.tolist() for name, values in grid['axes'].items()},
+            'net_profit': encode_array(grid['net_profit'], encoding),
+            'cash_on_cash': encode_array(grid['cash_on_cash'], encoding)
+        }), 200
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
 # Phase routes
+def _timeline_as_of():
+    """Parse the optional as_of query param for the timeline endpoints"""
+    value = request.args.get('as_of')
+    if not value:
+        return date.today()
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise ValueError(f"Invalid as_of date: {value}. Expected YYYY-MM-DD")
+
+@property_routes.route('/properties/timeline', methods=['GET'])
+@jwt_required()
+def get_portfolio_timeline():
+    """Schedule variance, slip and projected completion for every owned property"""
+    current_user_email = get_jwt_identity()
+    user = db.session.query(User).filter_by(email=current_user_email).first()
+    if not user:
+        return jsonify({"message": "User not found"}), 404
+
+    try:
+        as_of = _timeline_as_of()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify(phase_timeline(db.session, Phase, Property, user.id, as_of)), 200
+
+@property_routes.route('/properties/phase-progress', methods=['GET'])
+@jwt_required()
+def get_phase_progress():
+    """
+    Property counts per current phase and how many are late, from the rollup table
+
+    Query params:
+        as_of: Reference date (YYYY-MM-DD), defaults to today
+
+    Rollup rows whose counts do not hold on as_of (a phase reached its
+    endDate in between) are computed from their phases instead. Nothing is
+    written; `flask refresh-phase-progress` rebuilds stale rows daily.
+    """
+    current_user_email = get_jwt_identity()
+    user = db.session.query(User).filter_by(email=current_user_email).first()
+    if not user:
+        return jsonify({"message": "User not found"}), 404
+
+    try:
+        as_of = _timeline_as_of()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    table = PhaseProgress.__table__
+    columns = ['property_id', 'current_phase', 'phase_count', 'completed_phases', 'late_completed_phases',
+               'open_due_date']
+    owned = table.c.owner_id == user.id
+    fresh = select(*[table.c[name] for name in columns]).where(owned, valid_on(as_of))
+    live = phase_rollup(as_of).where(
+        Property.id.in_(select(table.c.property_id).where(owned, ~valid_on(as_of)))
+    ).subquery()
+    rollup = union_all(fresh, select(*[live.c[name] for name in columns])).subquery()
+
+    late = rollup.c.open_due_date < as_of
+    rows = db.session.query(
+        rollup.c.current_phase,
+        func.count(rollup.c.property_id).label('properties'),
+        func.sum(case((late, 1), else_=0)).label('late'),
+        func.sum(rollup.c.phase_count).label('phases'),
+        func.sum(rollup.c.completed_phases).label('completed_phases'),
+        func.sum(rollup.c.late_completed_phases).label('late_completed_phases')
+    ).group_by(rollup.c.current_phase).all()
+
+    by_phase = {phase: {'properties': 0, 'late': 0} for phase in PROPERTY_PHASES}
+    totals = {'properties': 0, 'late': 0, 'phases': 0, 'completedPhases': 0, 'lateCompletedPhases': 0}
+    for row in rows:
+        by_phase[row.current_phase] = {'properties': row.properties, 'late': int(row.late or 0)}
+        totals['properties'] += row.properties
+        totals['late'] += int(row.late or 0)
+        totals['phases'] += int(row.phases or 0)
+        totals['completedPhases'] += int(row.completed_phases or 0)
+        totals['lateCompletedPhases'] += int(row.late_completed_phases or 0)
+
+    return jsonify({'asOf': as_of.isoformat(), 'byPhase': by_phase, 'totals': totals}), 200
+
+@property_routes.route('/properties/<int:property_id>/timeline', methods=['GET'])
+@jwt_required()
+def get_property_timeline(property_id):
+    """Timeline summary for one property plus the projected schedule of each phase"""
+    current_user_email = get_jwt_identity()
+    user = db.session.query(User).filter_by(email=current_user_email).first()
+    if not user:
+        return jsonify({"message": "User not found"}), 404
+
+    property = db.session.query(Property).filter_by(id=property_id, owner_id=user.id).first()
+    if not property:
+        return jsonify({"message": "Property not found"}), 404
+
+    try:
+        as_of = _timeline_as_of()
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    timeline = phase_timeline(db.session, Phase, Property, user.id, as_of, property_id=property.id)
+    summary = timeline['properties'][0] if timeline['properties'] else None
+    return jsonify({'asOf': timeline['asOf'], 'property': summary, 'phases': timeline['phases']}), 200
+
 @property_routes.route('/phases/<int:property_id>', methods=['GET'])
 @jwt_required()
 def get_phases(property_id):
-    phases = db.session.query(Phase).filter_by(property_id=property_id).all()
+    phases = db.session.query(Phase).filter_by(property_id=property_id).order_by(Phase.order, Phase.id).all()
     return jsonify([phase.serialize() for phase in phases]), 200
 
+@property_routes.route('/properties/<int:property_id>/phases/bulk', methods=['POST'])
+@jwt_required()
+def bulk_update_phases(property_id):
+    """
+    Reorder, shift and create phases of one property in a single transaction
+
+    Body keys, all optional and applied in this order:
+        order: every phase id of the property in its new position
+        shift: {"days": N, "fromPhaseId": id} moves that phase and all later
+               ones (every phase without fromPhaseId) by N days
+        create: phase objects appended to the end of the plan
+    """
+    current_user_email = get_jwt_identity()
+    user = db.session.query(User).filter_by(email=current_user_email).first()
+    if not user:
+        return jsonify({"message": "User not found"}), 404
+
+    property = db.session.query(Property).filter_by(id=property_id, owner_id=user.id).first()
+    if not property:
+        return jsonify({"message": "Property not found"}), 404
+
+    data = request.get_json(silent=True) or {}
+    shift = data.get('shift')
+    if shift is not None and not isinstance(shift, dict):
+        return jsonify({"error": "shift must be an object"}), 400
+    try:
+        rows, errors = parse_phase_rows(data.get('create', []))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    if errors:
+        return jsonify({
+            "error": "Invalid phases",
+            "errors": [{'row': index, 'errors': messages} for index, messages in sorted(errors.items())]
+        }), 400
+
+    try:
+        summary = {'reordered': 0, 'shifted': 0, 'created': 0}
+        if 'order' in data:
+            summary['reordered'] = reorder_phases(db.session, Phase, property.id, data['order'])
+        if shift:
+            summary['shifted'] = shift_phases(db.session, Phase, property.id, shift.get('days'),
+                                              shift.get('fromPhaseId'))
+        summary['created'] = create_phases(db.session, Phase, property.id, rows)
+        # Bulk statements bypass the rollup listeners
+        refresh_phase_progress(db.session.connection(), [property.id])
+        db.session.commit()
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 500
+
+    phases = db.session.query(Phase).filter_by(property_id=property.id).order_by(Phase.order, Phase.id).all()
+    summary['phases'] = [phase.serialize() for phase in phases]
+    return jsonify(summary), 200
+
 @property_routes.route('/phases', methods=['POST'])
 @jwt_required()
 def add_phase():
@@ -401,7 +694,8 @@ def add_phase():
             startDate=date_values['startDate'],
             expectedStartDate=date_values['expectedStartDate'],
             endDate=date_values['endDate'],
-            expectedEndDate=date_values['expectedEndDate']
+            expectedEndDate=date_values['expectedEndDate'],
+            order=data.get('order', next_order(db.session, Phase, data['property_id']))
         )
         
         db.session.add(phase)
@@ -458,66 +752,123 @@ def delete_phase(phase_id):
         db.session.rollback()
         return jsonify({"error": str(e)}), 500
 
+def _scrape_worker():
+    """Make sure a process on this host runs queued scrape jobs (off under test)"""
+    if current_app.config.get('SCRAPER_WORKER', True):
+        return start_worker()
+    return None
+
+def _enqueue_scrape():
+    data = request.get_json(silent=True) or {}
+    county = data.get('county', 'Morris')  # Default to Morris County if not specified
+    if county != ALL_COUNTIES and county not in COUNTY_URLS:
+        return jsonify({
+            'status': 'error',
+            'error': f'Invalid county: {county}. Valid counties are: {", ".join(COUNTY_URLS.keys())}'
+        }), 400
+
+    try:
+        with JobQueue() as queue:
+            job, created = queue.enqueue(county, requested_by=get_jwt_identity())
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 500
+
+    worker = _scrape_worker()
+    if worker:
+        worker.wake()
+    response = jsonify({
+        'status': 'queued' if created else 'coalesced',
+        'message': f"Scrape job {job['id']} {'queued' if created else 'already pending'} for {county}",
+        'job': job_to_dict(job)
+    })
+    response.status_code = 202
+    response.headers['Location'] = f"/api/scraper/jobs/{job['id']}"
+    return response
+
 @property_routes.route('/run-scraper', methods=['POST'])
 @jwt_required()
 def run_scraper_endpoint():
-    """Run the foreclosure scraper and return results."""
+    """Queue a foreclosure scrape; poll GET /api/scraper/jobs/<id> for the result."""
+    return _enqueue_scrape()
+
+@property_routes.route('/scraper/jobs', methods=['POST'])
+@jwt_required()
+def create_scraper_job():
+    """
+    Queue a scrape of one county, or of every county with ``{"county": "all"}``.
+
+    Responds 202 with the job. A submission for a county that already has a
+    queued or running job, or that a pending 'all' job has still to reach,
+    returns that job instead of queueing another.
+    """
+    return _enqueue_scrape()
+
+@property_routes.route('/scraper/jobs/<int:job_id>', methods=['GET'])
+@jwt_required()
+def get_scraper_job(job_id):
+    """State, per-county progress, row counts and timings of a scrape job."""
     try:
-        data = request.get_json() or {}
-        county = data.get('county', 'Morris')  # Default to Morris County if not specified
-        
-        # Validate county
-        from services.scraper.main import COUNTY_URLS
-        if county not in COUNTY_URLS:
-            return jsonify({
-                'status': 'error',
-                'error': f'Invalid county: {county}. Valid counties are: {", ".join(COUNTY_URLS.keys())}'
-            }), 400
-            
-        success = run_scraper(county)
-        if success:
-            return jsonify({
-                'status': 'success',
-                'message': f'Scraper completed successfully for {county} County'
-            }), 200
-        else:
-            return jsonify({
-                'status': 'error',
-                'error': f'Scraper failed to complete for {county} County'
-            }), 500
+        with JobQueue() as queue:
+            job = queue.get(job_id)
     except Exception as e:
-        return jsonify({
-            'status': 'error',
-            'error': str(e)
-        }), 500
+        return jsonify({'status': 'error', 'error': str(e)}), 500
+    if job is None:
+        return jsonify({'status': 'error', 'error': 'Scrape job not found'}), 404
+    # Picks up jobs queued before a restart once a client polls
+    _scrape_worker()
+    return jsonify(job_to_dict(job)), 200
 
 @property_routes.route('/scraped-properties', methods=['GET'])
 @jwt_required()
 def get_scraped_properties():
-    """Get the list of scraped properties from the merged data CSV."""
+    """
+    Page through scraped listings, served from the cached listing index.
+
+    Query params:
+        limit: Page size (default 100, max 500)
+        cursor: Value of the X-Next-Cursor header from the previous page
+        county: County name, e.g. Morris or Morris County
+        status_date: Listings with this status date (YYYY-MM-DD)
+        status_from, status_to: Status date range, inclusive (YYYY-MM-DD)
+        min_price, max_price: Price range
+        q: Words that must all appear in the address, parties, sheriff
+           number or description
+
+    The number of matching listings is returned in X-Total-Count.
+    """
     try:
-        # Path to the merged data file
-        merged_data_path = os.path.join('services', 'scraper', 'downloads', 'merged_data.csv')
-        
-        if not os.path.exists(merged_data_path):
+        limit = parse_limit(request.args.get('limit'))
+        cursor = decode_cursor(request.args.get('cursor'))
+        after_id = int(cursor['id']) if cursor is not None else None
+        dates = {name: _scraped_date(request.args.get(name), name)
+                 for name in ('status_date', 'status_from', 'status_to')}
+        prices = {name: _scraped_price(request.args.get(name), name) for name in ('min_price', 'max_price')}
+    except (KeyError, TypeError):
+        return jsonify({'status': 'error', 'error': 'Invalid cursor'}), 400
+    except ValueError as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 400
+
+    try:
+        index = listing_index()
+        if index is None or not len(index):
             return jsonify({
                 'status': 'error',
                 'message': 'No scraped data available. Please run the scraper first.'
             }), 404
-            
-        # Read the CSV file
-        df = pd.read_csv(merged_data_path)
-        
-        # Convert DataFrame to list of dictionaries
-        properties = df.to_dict('records')
-        
-        if not properties:
-            return jsonify({
-                'status': 'error',
-                'message': 'No properties found in the scraped data.'
-            }), 404
-        
-        return jsonify(properties), 200
+
+        properties, total, next_id = index.search(
+            county=request.args.get('county'),
+            text=request.args.get('q'),
+            after_id=after_id,
+            limit=limit,
+            **dates,
+            **prices
+        )
+        response = jsonify(properties)
+        response.headers['X-Total-Count'] = str(total)
+        if next_id is not None:
+            response.headers['X-Next-Cursor'] = encode_cursor({'id': next_id})
+        return response, 200
         
     except Exception as e:
         return jsonify({
@@ -525,6 +876,91 @@ def get_scraped_properties():
             'error': str(e)
         }), 500
 
+def _scraped_date(value, name):
+    """Validate an optional YYYY-MM-DD filter; listings keep status dates as ISO strings"""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date().isoformat()
+    except ValueError:
+        raise ValueError(f'Invalid {name}. Expected YYYY-MM-DD')
+
+def _scraped_price(value, name):
+    if value in (None, ''):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f'{name} must be a number')
+
+@property_routes.route('/scraped-properties/import', methods=['POST'])
+@jwt_required()
+def import_scraped_properties():
+    """
+    Promote scraped listings to properties in one call.
+
+    Body (one of):
+        county: Import every current listing of a county, e.g. "Morris"
+        propertyIds: civilview property ids from the scrape store
+        listings: Listing objects as returned by GET /scraped-properties
+
+    ``county`` and ``propertyIds`` can be combined. Listings the user already
+    tracks (same detail link, or same county and sheriff number) are skipped.
+    """
+    current_user_email = get_jwt_identity()
+    user = db.session.query(User).filter_by(email=current_user_email).first()
+    if not user:
+        return jsonify({"error": "User not found"}), 404
+
+    data = request.get_json(silent=True) or {}
+    county = data.get('county')
+    property_ids = data.get('propertyIds')
+    listings = data.get('listings')
+    if listings is not None:
+        if not isinstance(listings, list):
+            return jsonify({"error": "listings must be a list"}), 400
+    elif county or property_ids:
+        if property_ids is not None and not isinstance(property_ids, list):
+            return jsonify({"error": "propertyIds must be a list"}), 400
+        index = listing_index()
+        if index is None:
+            return jsonify({"error": "No scraped data available. Please run the scraper first."}), 404
+        wanted = {str(property_id) for property_id in property_ids or []}
+        listings = [listing for listing in index.search(county=county, limit=len(index))[0]
+                    if not wanted or listing['property_id'] in wanted]
+    else:
+        return jsonify({"error": "Provide county, propertyIds or listings"}), 400
+
+    if not listings:
+        return jsonify({"error": "No scraped listings matched"}), 404
+    if len(listings) > MAX_IMPORT_LISTINGS:
+        return jsonify({"error": f"Import is limited to {MAX_IMPORT_LISTINGS} listings per request"}), 400
+
+    rows, errors, repeated = map_listings(listings, user.id)
+    report = [{'index': index, 'error': message} for index, message in sorted(errors.items())]
+    if not rows:
+        return jsonify({"error": "No valid listings to import", "invalid": len(errors), "errors": report}), 400
+
+    try:
+        created, skipped = import_listings(db.session, Property, user.id, rows)
+        refresh_phase_progress(db.session.connection(), created)
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({"error": "These listings were imported concurrently, retry the import"}), 409
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 500
+
+    return jsonify({
+        "message": "Scraped listings imported",
+        "imported": len(created),
+        "skipped": skipped + repeated,
+        "invalid": len(errors),
+        "propertyIds": created,
+        "errors": report
+    }), 201 if created else 200
+
 @property_routes.route('/construction-draws/<int:draw_id>', methods=['DELETE'])
 @jwt_required()
 def delete_construction_draw(draw_id):
@@ -0,0 +1,142 @@
+from flask import Blueprint, request, jsonify
+from models import (
+    db, User, Property, Phase, ConstructionDraw, Receipt, Tenant, Lease,
+    PropertyMaintenanceRequest, Tombstone
+)
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from datetime import datetime, timezone
+from sqlalchemy import and_, or_, select
+from models.base import utcnow
+from utils.pagination import decode_cursor, encode_cursor, parse_limit
+
+sync_routes = Blueprint('sync', __name__)
+
+def _owned_properties(user_id):
+    return select(Property.id).where(Property.owner_id == user_id)
+
+def _owned_draws(user_id):
+    return select(ConstructionDraw.id).where(ConstructionDraw.property_id.in_(_owned_properties(user_id)))
+
+# collection name -> (model, updated-at column, owner filter, serializer)
+SYNC_COLLECTIONS = {
+    'properties': (Property, Property.updated_at,
+                   lambda user_id: Property.owner_id == user_id,
+                   lambda row: row.to_dict()),
+    'phases': (Phase, Phase.updated_at,
+               lambda user_id: Phase.property_id.in_(_owned_properties(user_id)),
+               lambda row: row.serialize()),
+    'construction-draws': (ConstructionDraw, ConstructionDraw.updated_at,
+                           lambda user_id: ConstructionDraw.property_id.in_(_owned_properties(user_id)),
+                           lambda row: row.to_dict()),
+    'receipts': (Receipt, Receipt.updated_at,
+                 lambda user_id: Receipt.construction_draw_id.in_(_owned_draws(user_id)),
+                 lambda row: row.to_dict()),
+    'tenants': (Tenant, Tenant.updatedAt,
+                lambda user_id: Tenant.manager_id == user_id,
+                lambda row: row.to_dict()),
+    'leases': (Lease, Lease.updatedAt,
+               lambda user_id: Lease.propertyId.in_(_owned_properties(user_id)),
+               lambda row: row.to_dict()),
+    'maintenance-requests': (PropertyMaintenanceRequest, PropertyMaintenanceRequest.updatedAt,
+                             lambda user_id: PropertyMaintenanceRequest.propertyId.in_(_owned_properties(user_id)),
+                             lambda row: row.to_dict()),
+}
+
+def _server_time():
+    """The database clock, the same one that stamps updated-at columns and tombstones"""
+    return db.session.execute(select(utcnow())).scalar()
+
+def _parse_since(value):
+    """Parse an ISO 8601 timestamp into naive UTC, matching the stored columns"""
+    if not value:
+        return None
+    try:
+        since = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        raise ValueError('since must be an ISO 8601 timestamp')
+    if since.tzinfo is not None:
+        since = since.astimezone(timezone.utc).replace(tzinfo=None)
+    return since
+
+@sync_routes.route('/sync', methods=['GET'])
+@jwt_required()
+def get_sync_collections():
+    """List the collections available for delta sync and the current server time"""
+    return jsonify({
+        'collections': list(SYNC_COLLECTIONS),
+        'serverTime': _server_time().isoformat()
+    }), 200
+
+@sync_routes.route('/sync/<collection>', methods=['GET'])
+@jwt_required()
+def get_sync_changes(collection):
+    """
+    Rows of a collection changed since a high-water mark, plus deletions.
+
+    Query params:
+        since: ISO timestamp; omit for a full sync
+        limit: Page size (default 100, max 500)
+        cursor: Value of the X-Next-Cursor header from the previous page
+
+    Changed rows are ordered by (updated_at, id) and paged with a keyset
+    cursor; ids deleted since `since` are returned on the first page. Once the
+    last page is read, store `serverTime` and send it as `since` next time.
+    """
+    if collection not in SYNC_COLLECTIONS:
+        return jsonify({"error": "Unknown collection", "collections": list(SYNC_COLLECTIONS)}), 404
+
+    current_user_email = get_jwt_identity()
+    user = User.query.filter_by(email=current_user_email).first()
+    if not user:
+        return jsonify({"error": "User not found"}), 404
+
+    # Captured before reading so rows written during the sync are picked up next time
+    server_time = _server_time()
+    try:
+        since = _parse_since(request.args.get('since'))
+        limit = parse_limit(request.args.get('limit'))
+        cursor = decode_cursor(request.args.get('cursor'))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    model, updated_at, owner_filter, serialize = SYNC_COLLECTIONS[collection]
+    query = model.query.filter(owner_filter(user.id))
+    if since:
+        query = query.filter(updated_at > since)
+    if cursor:
+        try:
+            cursor_updated_at = datetime.fromisoformat(cursor['updatedAt'])
+            cursor_id = int(cursor['id'])
+        except (KeyError, ValueError, TypeError):
+            return jsonify({"error": "Invalid cursor"}), 400
+        query = query.filter(or_(
+            updated_at > cursor_updated_at,
+            and_(updated_at == cursor_updated_at, model.id > cursor_id)
+        ))
+
+    rows = query.order_by(updated_at, model.id).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    deleted = []
+    if since and not cursor:
+        deleted = [record_id for (record_id,) in db.session.query(Tombstone.record_id).filter(
+            Tombstone.owner_id == user.id,
+            Tombstone.table_name == model.__table__.name,
+            Tombstone.deleted_at > since
+        ).order_by(Tombstone.deleted_at)]
+
+    response = jsonify({
+        'collection': collection,
+        'since': since.isoformat() if since else None,
+        'serverTime': server_time.isoformat(),
+        'changes': [serialize(row) for row in rows],
+        'deleted': deleted
+    })
+    if has_more:
+        last_updated_at = getattr(rows[-1], updated_at.key)
+        response.headers['X-Next-Cursor'] = encode_cursor({
+            'updatedAt': last_updated_at,
+            'id': rows[-1].id
+        })
+    return response, 200
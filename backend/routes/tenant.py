@@ -2,35 +2,105 @@ from flask import Blueprint, request, jsonify
 from models import db, User, Tenant, Lease, Property
 from models.exceptions import ValidationError
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from datetime import datetime
+from datetime import datetime, date, timedelta
+from sqlalchemy import and_, insert, or_
+from sqlalchemy.exc import IntegrityError
+from services.leasing import find_conflicting_lease, find_overlaps, unit_key
+from services.tenant_import import (
+    INSERT_BATCH_SIZE, MAX_IMPORT_ROWS, read_tenant_file, tenant_frame, validate_tenant_frame
+)
+from utils.pagination import (
+    decode_cursor,
+    encode_cursor,
+    escape_like,
+    parse_bool,
+    parse_fields,
+    parse_int,
+    parse_limit
+)
 
 tenant_routes = Blueprint('tenant', __name__)
 
+# Columns exposed by the tenant listing, in response order
+TENANT_FIELDS = [
+    'id', 'firstName', 'lastName', 'phoneNumber', 'email', 'dateOfBirth',
+    'occupation', 'employerName', 'professionalTitle',
+    'creditScoreAtInitialApplication', 'creditCheck1Complete',
+    'creditScoreAtLeaseRenewal', 'creditCheck2Complete', 'guarantor', 'petsAllowed'
+]
+
 @tenant_routes.route('/tenants', methods=['GET'])
 @jwt_required()
 def get_all_tenants():
+    """
+    List the manager's tenants ordered by lastName, one keyset page at a time.
+
+    Query params:
+        limit: Page size (default 100, max 500)
+        cursor: Value of the X-Next-Cursor header from the previous page
+        fields: Comma separated projection (id and lastName are always returned)
+        last_name: Case-sensitive lastName prefix
+        min_credit_score / max_credit_score: creditScoreAtInitialApplication range
+        pets: true/false filter on petsAllowed
+    """
     current_user_email = get_jwt_identity()
     user = User.query.filter_by(email=current_user_email).first()
-    if user:
-        tenants = Tenant.query.filter_by(manager_id=user.id).all()
-        return jsonify([{
-            'id': tenant.id,
-            'firstName': tenant.firstName,
-            'lastName': tenant.lastName,
-            'phoneNumber': tenant.phoneNumber,
-            'email': tenant.email,
-            'dateOfBirth': tenant.dateOfBirth.isoformat() if tenant.dateOfBirth else None,
-            'occupation': tenant.occupation,
-            'employerName': tenant.employerName,
-            'professionalTitle': tenant.professionalTitle,
-            'creditScoreAtInitialApplication': tenant.creditScoreAtInitialApplication,
-            'creditCheck1Complete': tenant.creditCheck1Complete,
-            'creditScoreAtLeaseRenewal': tenant.creditScoreAtLeaseRenewal,
-            'creditCheck2Complete': tenant.creditCheck2Complete,
-            'guarantor': tenant.guarantor,
-            'petsAllowed': tenant.petsAllowed
-        } for tenant in tenants]), 200
-    return jsonify({"message": "User not found"}), 404
+    if not user:
+        return jsonify({"message": "User not found"}), 404
+
+    try:
+        limit = parse_limit(request.args.get('limit'))
+        cursor = decode_cursor(request.args.get('cursor'))
+        fields = parse_fields(request.args.get('fields'), TENANT_FIELDS, ['id', 'lastName'])
+        pets = parse_bool(request.args.get('pets'))
+        min_score = parse_int(request.args.get('min_credit_score'), 'min_credit_score')
+        max_score = parse_int(request.args.get('max_credit_score'), 'max_credit_score')
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # Select only the projected columns so no Tenant objects are built
+    query = db.session.query(*[getattr(Tenant, field) for field in fields]).filter(
+        Tenant.manager_id == user.id
+    )
+
+    last_name = request.args.get('last_name')
+    if last_name:
+        query = query.filter(Tenant.lastName.like(f'{escape_like(last_name)}%', escape='\\'))
+    if min_score is not None:
+        query = query.filter(Tenant.creditScoreAtInitialApplication >= min_score)
+    if max_score is not None:
+        query = query.filter(Tenant.creditScoreAtInitialApplication <= max_score)
+    if pets is not None:
+        query = query.filter(Tenant.petsAllowed == pets)
+
+    if cursor:
+        try:
+            cursor_last_name, cursor_id = cursor['lastName'], int(cursor['id'])
+        except (KeyError, ValueError, TypeError):
+            return jsonify({"error": "Invalid cursor"}), 400
+        query = query.filter(or_(
+            Tenant.lastName > cursor_last_name,
+            and_(Tenant.lastName == cursor_last_name, Tenant.id > cursor_id)
+        ))
+
+    rows = query.order_by(Tenant.lastName, Tenant.id).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    tenants = []
+    for row in rows:
+        tenant = dict(zip(fields, row))
+        if tenant.get('dateOfBirth'):
+            tenant['dateOfBirth'] = tenant['dateOfBirth'].isoformat()
+        tenants.append(tenant)
+
+    response = jsonify(tenants)
+    if has_more:
+        response.headers['X-Next-Cursor'] = encode_cursor({
+            'lastName': tenants[-1]['lastName'],
+            'id': tenants[-1]['id']
+        })
+    return response, 200
 
 @tenant_routes.route('/tenants/<int:tenant_id>', methods=['GET'])
 @jwt_required()
@@ -145,6 +215,83 @@ def add_tenant():
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
+@tenant_routes.route('/tenants/import', methods=['POST'])
+@jwt_required()
+def import_tenants():
+    """
+    Bulk import tenants from an uploaded CSV / JSON file or a JSON body.
+
+    Accepts multipart `file` (.csv or .json) or `{"tenants": [...]}`. Rows are
+    validated column-wise and emails are checked against stored tenants with a
+    single IN query. Valid rows are inserted in batches; invalid rows are
+    skipped and returned in a per-row error report. Send dry_run=true to only
+    validate.
+    """
+    current_user_email = get_jwt_identity()
+    user = User.query.filter_by(email=current_user_email).first()
+    if not user:
+        return jsonify({'error': 'User not found'}), 404
+
+    try:
+        upload = request.files.get('file')
+        if upload:
+            frame = read_tenant_file(upload.read(), upload.filename)
+            dry_run = parse_bool(request.form.get('dry_run') or request.args.get('dry_run'))
+        else:
+            data = request.get_json(silent=True) or {}
+            frame = tenant_frame(data.get('tenants'))
+            dry_run = parse_bool(data.get('dry_run') or request.args.get('dry_run'))
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    if frame.empty:
+        return jsonify({'error': 'No tenants provided'}), 400
+    if len(frame) > MAX_IMPORT_ROWS:
+        return jsonify({'error': f'Import is limited to {MAX_IMPORT_ROWS} tenants per request'}), 400
+
+    emails = set(frame['email'].dropna().astype(str).str.strip()) if 'email' in frame else set()
+    existing_emails = {email for (email,) in db.session.query(Tenant.email).filter(
+        Tenant.email.in_(emails))} if emails else set()
+
+    rows, errors = validate_tenant_frame(frame, existing_emails)
+    report = [{'row': index, 'errors': messages} for index, messages in sorted(errors.items())]
+
+    if not rows:
+        return jsonify({
+            'error': 'No valid tenants to import',
+            'imported': 0,
+            'invalid': len(errors),
+            'errors': report
+        }), 400
+
+    if dry_run:
+        return jsonify({'message': 'Tenant import validated', 'valid': len(rows),
+                        'invalid': len(errors), 'errors': report}), 200
+
+    for row in rows:
+        del row['row']
+        row['manager_id'] = user.id
+
+    try:
+        # Core executemany in batches; validation already ran column-wise so the
+        # per-object before_insert validator is intentionally not involved
+        for start in range(0, len(rows), INSERT_BATCH_SIZE):
+            db.session.execute(insert(Tenant), rows[start:start + INSERT_BATCH_SIZE])
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        return jsonify({'error': 'Tenant emails were created concurrently, retry the import'}), 409
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+    return jsonify({
+        'message': 'Tenants imported successfully',
+        'imported': len(rows),
+        'invalid': len(errors),
+        'errors': report
+    }), 201
+
 @tenant_routes.route('/tenants/<int:tenant_id>', methods=['PUT'])
 @jwt_required()
 def update_tenant(tenant_id):
@@ -184,6 +331,100 @@ def delete_tenant(tenant_id):
         return jsonify({"message": "Tenant not found"}), 404
     return jsonify({"message": "User not found"}), 404
 
+@tenant_routes.route('/rent-roll', methods=['GET'])
+@jwt_required()
+def get_rent_roll():
+    """
+    Rent roll for every property the user owns, built from a single query.
+
+    Property is LEFT JOINed to its active leases (and their tenants) so vacant
+    properties still appear with zero occupancy.
+
+    Query params:
+        as_of: Date (YYYY-MM-DD) the lease must be active on, defaults to today.
+            Leases run [startDate, endDate), so on a turnover day only the
+            incoming lease counts.
+    """
+    current_user_email = get_jwt_identity()
+    user = User.query.filter_by(email=current_user_email).first()
+    if not user:
+        return jsonify({"message": "User not found"}), 404
+
+    as_of = request.args.get('as_of')
+    try:
+        as_of = datetime.strptime(as_of, '%Y-%m-%d').date() if as_of else date.today()
+    except ValueError:
+        return jsonify({'error': 'Invalid date format for as_of. Expected YYYY-MM-DD'}), 400
+
+    active_lease = and_(
+        Lease.propertyId == Property.id,
+        Lease.startDate <= as_of,
+        Lease.endDate > as_of
+    )
+    rows = db.session.query(
+        Property.id, Property.address, Property.city, Property.state, Property.numUnits,
+        Lease.id, Lease.unit, Lease.startDate, Lease.endDate, Lease.rentAmount, Lease.typeOfLease,
+        Tenant.id, Tenant.firstName, Tenant.lastName
+    ).select_from(Property).outerjoin(
+        Lease, active_lease
+    ).outerjoin(
+        Tenant, Tenant.id == Lease.tenantId
+    ).filter(
+        Property.owner_id == user.id
+    ).order_by(Property.id, Lease.startDate).all()
+
+    properties = {}
+    for (property_id, address, city, state, num_units,
+         lease_id, unit, start_date, end_date, rent_amount, lease_type,
+         tenant_id, first_name, last_name) in rows:
+        entry = properties.get(property_id)
+        if entry is None:
+            entry = properties[property_id] = {
+                'propertyId': property_id,
+                'address': address,
+                'city': city,
+                'state': state,
+                'numUnits': num_units,
+                'activeLeases': 0,
+                'occupancyRate': None,
+                'scheduledMonthlyRent': 0.0,
+                'leases': []
+            }
+        if lease_id is None:
+            continue
+        entry['activeLeases'] += 1
+        entry['scheduledMonthlyRent'] += rent_amount or 0.0
+        entry['leases'].append({
+            'leaseId': lease_id,
+            'tenantId': tenant_id,
+            'tenantName': f'{first_name} {last_name}' if tenant_id else None,
+            'unit': unit,
+            'startDate': start_date.isoformat(),
+            'endDate': end_date.isoformat(),
+            'rentAmount': rent_amount,
+            'typeOfLease': lease_type
+        })
+
+    for entry in properties.values():
+        units = entry['numUnits'] or 1
+        entry['occupancyRate'] = round(min(entry['activeLeases'] / units, 1.0), 4)
+
+    rent_roll = list(properties.values())
+    total_units = sum(entry['numUnits'] or 1 for entry in rent_roll)
+    occupied = sum(min(entry['activeLeases'], entry['numUnits'] or 1) for entry in rent_roll)
+    return jsonify({
+        'asOf': as_of.isoformat(),
+        'properties': rent_roll,
+        'totals': {
+            'properties': len(rent_roll),
+            'units': total_units,
+            'occupiedUnits': occupied,
+            'occupancyRate': round(occupied / total_units, 4) if total_units else None,
+            'activeLeases': sum(entry['activeLeases'] for entry in rent_roll),
+            'scheduledMonthlyRent': sum(entry['scheduledMonthlyRent'] for entry in rent_roll)
+        }
+    }), 200
+
 # Lease routes
 @tenant_routes.route('/leases/<int:property_id>', methods=['GET'])
 @jwt_required()
@@ -197,9 +438,93 @@ def get_property_leases(property_id):
         'endDate': lease.endDate.isoformat(),
         'rentAmount': lease.rentAmount,
         'renewalCondition': lease.renewalCondition,
-        'typeOfLease': lease.typeOfLease
+        'typeOfLease': lease.typeOfLease,
+        'unit': lease.unit
     } for lease in leases]), 200
 
+@tenant_routes.route('/leases/expirations', methods=['GET'])
+@jwt_required()
+def get_lease_expirations():
+    """
+    Leases on the user's properties ending within the requested windows.
+
+    endDate is exclusive (the lease has ended on that day, see the rent roll),
+    so a lease ending today has already expired and is not listed.
+
+    Only the endDate range is scanned (idx_lease_end_date_property), so the
+    cost tracks the number of expiring leases rather than the lease table.
+
+    Query params:
+        windows: Comma separated day windows, defaults to 30,60,90
+    """
+    current_user_email = get_jwt_identity()
+    user = User.query.filter_by(email=current_user_email).first()
+    if not user:
+        return jsonify({"message": "User not found"}), 404
+
+    try:
+        windows = sorted({int(w) for w in request.args.get('windows', '30,60,90').split(',') if w.strip()})
+    except ValueError:
+        return jsonify({'error': 'windows must be a comma separated list of day counts'}), 400
+    if not windows or windows[0] < 1 or windows[-1] > 730:
+        return jsonify({'error': 'windows must be between 1 and 730 days'}), 400
+
+    today = date.today()
+    rows = db.session.query(
+        Lease.id, Lease.propertyId, Lease.endDate, Lease.rentAmount, Lease.typeOfLease,
+        Lease.renewalCondition, Property.address,
+        Tenant.id, Tenant.firstName, Tenant.lastName,
+        Tenant.creditCheck2Complete, Tenant.creditScoreAtLeaseRenewal
+    ).join(
+        Property, Property.id == Lease.propertyId
+    ).join(
+        Tenant, Tenant.id == Lease.tenantId
+    ).filter(
+        Lease.endDate > today,
+        Lease.endDate <= today + timedelta(days=windows[-1]),
+        Property.owner_id == user.id
+    ).order_by(Lease.endDate, Lease.id).all()
+
+    labels = []
+    lower = 0
+    for window in windows:
+        labels.append(f'{lower}-{window}')
+        lower = window + 1
+    buckets = {label: [] for label in labels}
+
+    for (lease_id, property_id, end_date, rent_amount, lease_type, renewal_condition,
+         address, tenant_id, first_name, last_name, credit_check_done, renewal_score) in rows:
+        days_remaining = (end_date - today).days
+        label = next(labels[i] for i, window in enumerate(windows) if days_remaining <= window)
+        buckets[label].append({
+            'leaseId': lease_id,
+            'propertyId': property_id,
+            'address': address,
+            'tenantId': tenant_id,
+            'tenantName': f'{first_name} {last_name}',
+            'endDate': end_date.isoformat(),
+            'daysRemaining': days_remaining,
+            'rentAmount': rent_amount,
+            'typeOfLease': lease_type,
+            'renewalCondition': renewal_condition,
+            'creditCheck2Complete': bool(credit_check_done),
+            'creditScoreAtLeaseRenewal': renewal_score
+        })
+
+    return jsonify({
+        'asOf': today.isoformat(),
+        'windows': windows,
+        'buckets': buckets,
+        'summary': {
+            label: {
+                'count': len(leases),
+                'rentAtRisk': sum(l['rentAmount'] or 0 for l in leases),
+                'renewalCreditChecksComplete': sum(1 for l in leases if l['creditCheck2Complete']),
+                'renewalCreditChecksPending': sum(1 for l in leases if not l['creditCheck2Complete'])
+            } for label, leases in buckets.items()
+        }
+    }), 200
+
 @tenant_routes.route('/leases/<int:lease_id>', methods=['GET'])
 @jwt_required()
 def get_lease(lease_id):
@@ -212,7 +537,8 @@ def get_lease(lease_id):
         'endDate': lease.endDate.isoformat(),
         'rentAmount': lease.rentAmount,
         'renewalCondition': lease.renewalCondition,
-        'typeOfLease': lease.typeOfLease
+        'typeOfLease': lease.typeOfLease,
+        'unit': lease.unit
     }), 200
 
 @tenant_routes.route('/leases', methods=['POST'])
@@ -275,6 +601,18 @@ def create_lease():
                 'valid_types': valid_lease_types
             }), 400
 
+        # Reject leases that overlap another lease on the same unit
+        try:
+            unit = _parse_unit(data.get('unit'))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        conflict = find_conflicting_lease(db.session, Lease, data['propertyId'], unit, start_date, end_date)
+        if conflict:
+            return jsonify({
+                'error': 'Lease overlaps an existing lease for this unit',
+                'conflicting_lease_id': conflict.id
+            }), 409
+
         lease = Lease(
             tenantId=data['tenantId'],
             propertyId=data['propertyId'],
@@ -282,7 +620,8 @@ def create_lease():
             endDate=end_date,
             rentAmount=rent_amount,
             renewalCondition=data.get('renewalCondition'),
-            typeOfLease=data['typeOfLease']
+            typeOfLease=data['typeOfLease'],
+            unit=unit
         )
 
         db.session.add(lease)
@@ -293,24 +632,209 @@ def create_lease():
             'id': lease.id,
             'startDate': lease.startDate.isoformat(),
             'endDate': lease.endDate.isoformat(),
-            'rentAmount': lease.rentAmount
+            'rentAmount': lease.rentAmount,
+            'unit': lease.unit
         }), 201
 
+    except IntegrityError as e:
+        # Raised by excl_lease_unit_overlap when a concurrent insert won the race
+        db.session.rollback()
+        if 'excl_lease_unit_overlap' in str(e.orig):
+            return jsonify({'error': 'Lease overlaps an existing lease for this unit'}), 409
+        return jsonify({'error': str(e)}), 500
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
+VALID_LEASE_TYPES = ['Fixed', 'Month-to-Month', 'Lease to Own']
+
+def _parse_unit(value):
+    """Normalise a lease unit from a request; None means the whole property"""
+    if value is not None and not isinstance(value, str):
+        raise ValueError('unit must be a string')
+    return unit_key(value) or None
+
+def _parse_import_row(row):
+    """Validate one imported lease row, returning (lease_fields, errors)"""
+    errors = []
+    required_fields = ['tenantId', 'propertyId', 'startDate', 'endDate', 'rentAmount', 'typeOfLease']
+    missing_fields = [field for field in required_fields if not row.get(field)]
+    if missing_fields:
+        return None, [f"Missing required fields: {', '.join(missing_fields)}"]
+
+    fields = {
+        'tenantId': row['tenantId'],
+        'propertyId': row['propertyId'],
+        'renewalCondition': row.get('renewalCondition'),
+        'typeOfLease': row['typeOfLease']
+    }
+    try:
+        fields['unit'] = _parse_unit(row.get('unit'))
+    except ValueError as e:
+        errors.append(str(e))
+    try:
+        fields['tenantId'] = int(row['tenantId'])
+        fields['propertyId'] = int(row['propertyId'])
+    except (ValueError, TypeError):
+        errors.append('tenantId and propertyId must be integers')
+    try:
+        fields['startDate'] = datetime.strptime(str(row['startDate']), '%Y-%m-%d').date()
+        fields['endDate'] = datetime.strptime(str(row['endDate']), '%Y-%m-%d').date()
+        if fields['startDate'] >= fields['endDate']:
+            errors.append('End date must be after start date')
+    except ValueError:
+        errors.append('Invalid date format. Expected YYYY-MM-DD')
+    try:
+        fields['rentAmount'] = float(row['rentAmount'])
+        if fields['rentAmount'] <= 0:
+            errors.append('Rent amount must be greater than 0')
+    except (ValueError, TypeError):
+        errors.append('Invalid rent amount. Must be a positive number')
+    if row['typeOfLease'] not in VALID_LEASE_TYPES:
+        errors.append('Invalid lease type')
+    return fields, errors
+
+@tenant_routes.route('/leases/import', methods=['POST'])
+@jwt_required()
+def import_leases():
+    """
+    Validate and insert a batch of leases.
+
+    Rows are checked field by field, against the caller's properties and
+    tenants, and for overlaps with each other and with stored leases using one
+    O(n log n) sort-and-sweep. The batch is all-or-nothing: any error returns a
+    per-row report and nothing is written. Send dry_run=true to only validate.
+    """
+    current_user_email = get_jwt_identity()
+    user = User.query.filter_by(email=current_user_email).first()
+    if not user:
+        return jsonify({'error': 'User not found'}), 404
+
+    data = request.get_json(silent=True) or {}
+    rows = data.get('leases')
+    if not isinstance(rows, list) or not rows:
+        return jsonify({'error': 'leases must be a non-empty list'}), 400
+
+    errors = {}
+    parsed = {}
+    for index, row in enumerate(rows):
+        if not isinstance(row, dict):
+            errors[index] = ['Row must be an object']
+            continue
+        fields, row_errors = _parse_import_row(row)
+        if row_errors:
+            errors[index] = row_errors
+        else:
+            parsed[index] = fields
+
+    # Ownership checks with one IN query per table
+    property_ids = {fields['propertyId'] for fields in parsed.values()}
+    tenant_ids = {fields['tenantId'] for fields in parsed.values()}
+    owned_properties = {pid for (pid,) in db.session.query(Property.id).filter(
+        Property.id.in_(property_ids), Property.owner_id == user.id)} if property_ids else set()
+    managed_tenants = {tid for (tid,) in db.session.query(Tenant.id).filter(
+        Tenant.id.in_(tenant_ids), Tenant.manager_id == user.id)} if tenant_ids else set()
+    for index, fields in list(parsed.items()):
+        if fields['propertyId'] not in owned_properties:
+            errors.setdefault(index, []).append('Property not found')
+        if fields['tenantId'] not in managed_tenants:
+            errors.setdefault(index, []).append('Tenant not found')
+        if index in errors:
+            del parsed[index]
+
+    # Stored leases that could overlap the batch: same properties, not ended before it starts
+    intervals = [dict(fields, ref=index) for index, fields in parsed.items()]
+    if intervals:
+        earliest_start = min(item['startDate'] for item in intervals)
+        existing = db.session.query(
+            Lease.id, Lease.propertyId, Lease.unit, Lease.startDate, Lease.endDate
+        ).filter(
+            Lease.propertyId.in_({item['propertyId'] for item in intervals}),
+            Lease.endDate > earliest_start
+        ).all()
+        intervals.extend({
+            'ref': f'lease:{lease_id}', 'propertyId': property_id, 'unit': unit,
+            'startDate': start_date, 'endDate': end_date, 'existing': True
+        } for lease_id, property_id, unit, start_date, end_date in existing)
+
+    conflicts = find_overlaps(intervals)
+    for conflict in conflicts:
+        # Report against the batch row; sweep order may put the existing lease second
+        row, other = conflict['ref'], conflict['conflictsWith']
+        if isinstance(row, str):
+            row, other = other, row
+        if isinstance(other, str):
+            message = f"Overlaps existing lease {other.split(':')[1]}"
+        else:
+            message = f'Overlaps row {other}'
+        errors.setdefault(row, []).append(message)
+
+    if errors:
+        return jsonify({
+            'error': 'Lease import failed validation',
+            'valid': len(rows) - len(errors),
+            'invalid': len(errors),
+            'errors': [{'row': index, 'errors': messages} for index, messages in sorted(errors.items())]
+        }), 409 if conflicts else 400
+
+    if data.get('dry_run'):
+        return jsonify({'message': 'Lease batch is valid', 'valid': len(parsed)}), 200
+
+    try:
+        db.session.execute(insert(Lease), [parsed[index] for index in sorted(parsed)])
+        db.session.commit()
+    except IntegrityError as e:
+        db.session.rollback()
+        if 'excl_lease_unit_overlap' in str(e.orig):
+            return jsonify({'error': 'Lease batch overlaps leases created concurrently'}), 409
+        return jsonify({'error': str(e)}), 500
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+    return jsonify({'message': 'Leases imported successfully', 'imported': len(parsed)}), 201
+
 @tenant_routes.route('/leases/<int:lease_id>', methods=['PUT'])
 @jwt_required()
 def update_lease(lease_id):
     lease = Lease.query.get_or_404(lease_id)
-    data = request.get_json()
+    data = request.get_json() or {}
     try:
+        try:
+            start_date = datetime.strptime(data['startDate'], '%Y-%m-%d').date() \
+                if 'startDate' in data else lease.startDate
+            end_date = datetime.strptime(data['endDate'], '%Y-%m-%d').date() \
+                if 'endDate' in data else lease.endDate
+        except (ValueError, TypeError):
+            return jsonify({'error': 'Invalid date format. Expected YYYY-MM-DD'}), 400
+        if start_date >= end_date:
+            return jsonify({'error': 'End date must be after start date'}), 400
+
+        # The edited lease must not overlap another lease on its (new) unit
+        property_id = data.get('propertyId', lease.propertyId)
+        try:
+            unit = _parse_unit(data['unit']) if 'unit' in data else lease.unit
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        conflict = find_conflicting_lease(db.session, Lease, property_id, unit, start_date, end_date,
+                                          exclude_id=lease.id)
+        if conflict:
+            return jsonify({
+                'error': 'Lease overlaps an existing lease for this unit',
+                'conflicting_lease_id': conflict.id
+            }), 409
+
         for key, value in data.items():
             if hasattr(lease, key):
                 setattr(lease, key, value)
+        lease.startDate, lease.endDate, lease.unit = start_date, end_date, unit
         db.session.commit()
         return jsonify({"message": "Lease updated successfully"}), 200
+    except IntegrityError as e:
+        db.session.rollback()
+        if 'excl_lease_unit_overlap' in str(e.orig):
+            return jsonify({'error': 'Lease overlaps an existing lease for this unit'}), 409
+        return jsonify({'error': str(e)}), 500
     except Exception as e:
         db.session.rollback()
         return jsonify({"error": str(e)}), 500
@@ -0,0 +1,97 @@
+"""
+Lease scheduling helpers
+
+Leases occupy the half-open interval [startDate, endDate): a new lease may
+start on the day the previous one ends. The same rule backs the Postgres
+``excl_lease_unit_overlap`` exclusion constraint, so application checks and
+the database agree on what counts as an overlap.
+"""
+import logging
+from datetime import date
+from itertools import groupby
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+def unit_key(unit: Optional[str]) -> str:
+    """Normalise a unit label; '' (no unit) means the lease covers the whole property."""
+    return (unit or '').strip()
+
+def find_overlaps(intervals: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Find overlapping leases with a sort-and-sweep in O(n log n)
+
+    Each interval is a dict with ``propertyId``, ``unit``, ``startDate``,
+    ``endDate`` and a ``ref`` identifying it (batch row index or lease id).
+    Intervals flagged ``existing`` are already stored; overlaps between two
+    existing leases are not reported. A lease without a unit covers the whole
+    property and so overlaps a lease on any of its units.
+
+    For every property the intervals are sorted by start and swept once while
+    tracking, per unit and across the property, the interval that reaches
+    furthest (and the furthest-reaching new one, which is what an existing
+    interval is checked against); any interval starting before such an end
+    overlaps it.
+
+    Args:
+        intervals (Iterable[Dict[str, Any]]): Lease intervals to check
+
+    Returns:
+        List[Dict[str, Any]]: One entry per conflicting interval
+    """
+    ordered = sorted(intervals, key=lambda item: (item['propertyId'], item['startDate'], item['endDate']))
+    conflicts = []
+    for property_id, group in groupby(ordered, key=lambda item: item['propertyId']):
+        # (unit, new only) -> the interval reaching furthest. Unit '' holds
+        # whole-property leases and None every lease on the property.
+        reach = {}
+        for item in group:
+            unit = unit_key(item.get('unit'))
+            existing = bool(item.get('existing'))
+            # A unit lease meets that unit and whole-property leases, a
+            # whole-property lease meets everything; stored leases are only
+            # checked against new ones
+            for key in ([unit, ''] if unit else [None]):
+                other = reach.get((key, existing))
+                if other is not None and item['startDate'] < other['endDate']:
+                    conflicts.append({
+                        'ref': item['ref'],
+                        'conflictsWith': other['ref'],
+                        'existing': bool(other.get('existing')),
+                        'propertyId': property_id,
+                        'unit': unit or None
+                    })
+                    break
+            for key in (unit, None):
+                for new_only in ((False,) if existing else (False, True)):
+                    current = reach.get((key, new_only))
+                    if current is None or item['endDate'] > current['endDate']:
+                        reach[(key, new_only)] = item
+    return conflicts
+
+def find_conflicting_lease(session, lease_model, property_id: int, unit: Optional[str],
+                           start_date: date, end_date: date,
+                           exclude_id: Optional[int] = None):
+    """
+    Return the first stored lease on the same unit that overlaps [start, end)
+
+    A lease without a unit covers the whole property, so it conflicts with
+    every lease on the property and every unit lease conflicts with it.
+
+    The endDate > start predicate is answered from idx_lease_property_end_date,
+    so only leases that have not ended before the new one starts are visited.
+    """
+    query = session.query(lease_model).filter(
+        lease_model.propertyId == property_id,
+        lease_model.endDate > start_date,
+        lease_model.startDate < end_date
+    )
+    key = unit_key(unit)
+    if key:
+        # The same unit, or a lease on the whole property
+        query = query.filter(
+            (lease_model.unit == key) | (lease_model.unit.is_(None)) | (lease_model.unit == '')
+        )
+    if exclude_id is not None:
+        query = query.filter(lease_model.id != exclude_id)
+    return query.order_by(lease_model.endDate).first()
@@ -0,0 +1,205 @@
+"""
+Rent ledger
+
+Expected rent is materialised as RentCharge rows, one per lease per month,
+due on the lease's start day-of-month (clamped to the month length, so a lease
+starting on the 31st is due on the 30th in April). Charges are generated for
+every lease in a window at once with NumPy month arithmetic and written with a
+single executemany insert; payments are recorded as RentPayment rows.
+
+Arrears and aging are computed in SQL. Payments are applied to the oldest
+charges first, so the outstanding part of each charge is the amount by which
+the running total of charges exceeds everything paid so far.
+"""
+import logging
+from datetime import date, timedelta
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+from sqlalchemy import and_, case, func, insert, select
+
+logger = logging.getLogger(__name__)
+
+AGING_BUCKETS = ('0-30', '31-60', '61-90', '90+')
+
+def monthly_due_dates(start_dates: Sequence[date], end_dates: Sequence[date],
+                      period_start: date, period_end: date):
+    """
+    Expand lease terms into monthly due dates inside [period_start, period_end)
+
+    Leases are half-open [startDate, endDate); the first charge falls on the
+    start date and a charge is only due while the lease is still running.
+
+    Args:
+        start_dates (Sequence[date]): Lease start dates
+        end_dates (Sequence[date]): Lease end dates (exclusive)
+        period_start (date): First day of the generation window
+        period_end (date): Day after the generation window
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Index of the lease each charge belongs
+        to, and the charge due dates as datetime64[D]
+    """
+    starts = np.asarray(start_dates, dtype='datetime64[D]')
+    ends = np.asarray(end_dates, dtype='datetime64[D]')
+    if starts.size == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype='datetime64[D]')
+
+    window_start = np.datetime64(period_start, 'D')
+    window_end = np.datetime64(period_end, 'D')
+    first = np.maximum(starts, window_start).astype('datetime64[M]')
+    last = (np.minimum(ends, window_end) - 1).astype('datetime64[M]')
+    counts = np.maximum((last - first).astype(np.int64) + 1, 0)
+
+    lease_index = np.repeat(np.arange(starts.size), counts)
+    offsets = np.arange(lease_index.size) - np.repeat(np.cumsum(counts) - counts, counts)
+    months = first[lease_index] + offsets
+
+    day_offset = (starts - starts.astype('datetime64[M]')).astype(np.int64)[lease_index]
+    month_length = ((months + 1).astype('datetime64[D]') - months.astype('datetime64[D]')).astype(np.int64)
+    due = months.astype('datetime64[D]') + np.minimum(day_offset, month_length - 1)
+
+    keep = (due >= starts[lease_index]) & (due < ends[lease_index]) & \
+           (due >= window_start) & (due < window_end)
+    return lease_index[keep], due[keep]
+
+def generate_charges(session, lease_model, charge_model, property_ids: List[int],
+                     period_start: date, period_end: date) -> Dict[str, int]:
+    """
+    Create any missing RentCharge rows for leases on the given properties
+
+    Existing charges in the window are read with one query and skipped, so
+    re-running a window only fills gaps. New rows go out in one executemany.
+
+    Returns:
+        Dict[str, int]: Number of leases considered, charges created and skipped
+    """
+    if not property_ids:
+        return {'leases': 0, 'generated': 0, 'skipped': 0}
+
+    leases = session.execute(
+        select(lease_model.id, lease_model.propertyId, lease_model.startDate,
+               lease_model.endDate, lease_model.rentAmount)
+        .where(lease_model.propertyId.in_(property_ids),
+               lease_model.startDate < period_end,
+               lease_model.endDate > period_start)
+    ).all()
+    if not leases:
+        return {'leases': 0, 'generated': 0, 'skipped': 0}
+
+    lease_ids, lease_properties, starts, ends, rents = (np.asarray(column) for column in zip(*leases))
+    lease_index, due = monthly_due_dates(starts, ends, period_start, period_end)
+
+    existing = set(map(tuple, session.execute(
+        select(charge_model.leaseId, charge_model.dueDate)
+        .where(charge_model.propertyId.in_(property_ids),
+               charge_model.dueDate >= period_start,
+               charge_model.dueDate < period_end)
+    ).all()))
+
+    due_dates = due.tolist()
+    charge_leases = lease_ids[lease_index].tolist()
+    charge_properties = lease_properties[lease_index].tolist()
+    amounts = rents[lease_index].astype(float).tolist()
+    rows = [
+        {'leaseId': lease_id, 'propertyId': property_id, 'dueDate': due_date, 'amount': amount}
+        for lease_id, property_id, due_date, amount in zip(charge_leases, charge_properties, due_dates, amounts)
+        if (lease_id, due_date) not in existing
+    ]
+    if rows:
+        session.execute(insert(charge_model), rows)
+    logger.info(f'Generated {len(rows)} rent charges for {len(leases)} leases')
+    return {'leases': len(leases), 'generated': len(rows), 'skipped': len(due_dates) - len(rows)}
+
+def arrears_query(lease_model, charge_model, payment_model, property_ids, as_of: date):
+    """
+    Build the per-lease arrears and aging query
+
+    Charges due on or before ``as_of`` get a running total per lease from a
+    window function; subtracting total payments gives what is still owed on
+    each charge, which is summed into aging buckets by due date.
+
+    Returns:
+        Select: Rows of leaseId, propertyId, tenantId, charged, paid, balance
+        and one column per AGING_BUCKETS entry
+    """
+    paid = (
+        select(payment_model.leaseId, func.sum(payment_model.amount).label('paid'))
+        .join(lease_model, lease_model.id == payment_model.leaseId)
+        .where(lease_model.propertyId.in_(property_ids), payment_model.paymentDate <= as_of)
+        .group_by(payment_model.leaseId)
+        .subquery()
+    )
+    charges = (
+        select(
+            charge_model.leaseId,
+            charge_model.dueDate,
+            charge_model.amount,
+            func.sum(charge_model.amount).over(
+                partition_by=charge_model.leaseId,
+                order_by=(charge_model.dueDate, charge_model.id)
+            ).label('running')
+        )
+        .where(charge_model.propertyId.in_(property_ids), charge_model.dueDate <= as_of)
+        .subquery()
+    )
+
+    paid_total = func.coalesce(paid.c.paid, 0)
+    uncovered = charges.c.running - paid_total
+    outstanding = case(
+        (uncovered <= 0, 0),
+        (uncovered >= charges.c.amount, charges.c.amount),
+        else_=uncovered
+    )
+    bounds = [as_of - timedelta(days=days) for days in (30, 60, 90)]
+    bucket_filters = [
+        charges.c.dueDate >= bounds[0],
+        and_(charges.c.dueDate < bounds[0], charges.c.dueDate >= bounds[1]),
+        and_(charges.c.dueDate < bounds[1], charges.c.dueDate >= bounds[2]),
+        charges.c.dueDate < bounds[2]
+    ]
+    charged = func.sum(charges.c.amount)
+    return (
+        select(
+            charges.c.leaseId,
+            lease_model.propertyId,
+            lease_model.tenantId,
+            charged.label('charged'),
+            func.max(paid_total).label('paid'),
+            (charged - func.max(paid_total)).label('balance'),
+            *[func.sum(case((condition, outstanding), else_=0)).label(bucket)
+              for bucket, condition in zip(AGING_BUCKETS, bucket_filters)]
+        )
+        .join(lease_model, lease_model.id == charges.c.leaseId)
+        .outerjoin(paid, paid.c.leaseId == charges.c.leaseId)
+        .group_by(charges.c.leaseId, lease_model.propertyId, lease_model.tenantId)
+        .order_by(lease_model.propertyId, charges.c.leaseId)
+    )
+
+def summarize_arrears(rows) -> Dict[str, Any]:
+    """Shape arrears rows into per-lease entries and portfolio totals"""
+    leases = []
+    totals = {'charged': 0.0, 'paid': 0.0, 'balance': 0.0, 'aging': {bucket: 0.0 for bucket in AGING_BUCKETS}}
+    for row in rows:
+        aging = {bucket: round(float(getattr(row, bucket) or 0), 2) for bucket in AGING_BUCKETS}
+        entry = {
+            'leaseId': row.leaseId,
+            'propertyId': row.propertyId,
+            'tenantId': row.tenantId,
+            'charged': round(float(row.charged), 2),
+            'paid': round(float(row.paid), 2),
+            'balance': round(float(row.balance), 2),
+            'aging': aging
+        }
+        totals['charged'] += entry['charged']
+        totals['paid'] += entry['paid']
+        totals['balance'] += entry['balance']
+        for bucket in AGING_BUCKETS:
+            totals['aging'][bucket] += aging[bucket]
+        if entry['balance'] > 0:
+            leases.append(entry)
+    totals['charged'] = round(totals['charged'], 2)
+    totals['paid'] = round(totals['paid'], 2)
+    totals['balance'] = round(totals['balance'], 2)
+    totals['aging'] = {bucket: round(value, 2) for bucket, value in totals['aging'].items()}
+    return {'leases': leases, 'totals': totals}
@@ -0,0 +1,168 @@
+"""
+Maintenance SLA analytics
+
+Open counts, turnaround percentiles and pending-request aging per property,
+per tenant and for the whole portfolio. On Postgres everything is computed in
+the database with percentile_cont and a row_number window; other dialects
+(SQLite in development and tests) fetch one projection of the owner's requests
+and aggregate it with pandas groupby, which produces the same numbers
+(pandas quantiles interpolate linearly, like percentile_cont).
+"""
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+from sqlalchemy import and_, case, func, literal, select
+
+from models.maintenance import OPEN_STATUSES
+
+logger = logging.getLogger(__name__)
+
+AGING_BUCKETS = (('0-7d', 0, 7 * 24), ('8-30d', 7 * 24, 30 * 24), ('30d+', 30 * 24, None))
+
+def _entry(key_name: Optional[str], key, values: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape one aggregate row into the response structure"""
+    def number(value, digits=1):
+        return None if value is None or pd.isna(value) else round(float(value), digits)
+
+    entry = {key_name: key} if key_name else {}
+    entry.update({
+        'openCount': int(values['open']),
+        'pendingCount': int(values['pending']),
+        'completedCount': int(values['completed']),
+        'medianTimeToCompletion': number(values['median']),
+        'p90TimeToCompletion': number(values['p90']),
+        'pendingAge': {
+            'averageHours': number(values['avg_age']),
+            'oldestHours': number(values['max_age']),
+            'oldestRequestId': None if pd.isna(values['oldest_id']) else int(values['oldest_id']),
+            'buckets': {name: int(values[name]) for name, _, _ in AGING_BUCKETS}
+        }
+    })
+    return entry
+
+def _postgres_summary(session, request_model, property_model, owner_id: int,
+                      key_name: Optional[str], now: datetime) -> List[Dict[str, Any]]:
+    key = getattr(request_model, key_name) if key_name else None
+    is_pending = request_model.status == 'pending'
+    age = func.extract('epoch', literal(now) - request_model.createdAt) / 3600
+    base = (
+        select(
+            request_model.id,
+            *([key.label('key')] if key_name else []),
+            request_model.status,
+            request_model.timeToCompletion,
+            age.label('age'),
+            # Oldest pending request first within each group
+            func.row_number().over(
+                partition_by=key,
+                order_by=(case((is_pending, 0), else_=1), request_model.createdAt, request_model.id)
+            ).label('rank')
+        )
+        .join(property_model, property_model.id == request_model.propertyId)
+        .where(property_model.owner_id == owner_id)
+        .subquery()
+    )
+
+    pending = base.c.status == 'pending'
+    completed_hours = case((base.c.status == 'completed', base.c.timeToCompletion))
+    pending_age = case((pending, base.c.age))
+
+    def count(condition):
+        return func.sum(case((condition, 1), else_=0))
+
+    def bucket(low, high):
+        condition = and_(pending, base.c.age >= low)
+        return count(condition if high is None else and_(condition, base.c.age < high))
+
+    query = select(
+        *([base.c.key] if key_name else []),
+        count(base.c.status.in_(OPEN_STATUSES)).label('open'),
+        count(pending).label('pending'),
+        count(base.c.status == 'completed').label('completed'),
+        func.percentile_cont(0.5).within_group(completed_hours).label('median'),
+        func.percentile_cont(0.9).within_group(completed_hours).label('p90'),
+        func.avg(pending_age).label('avg_age'),
+        func.max(pending_age).label('max_age'),
+        func.max(case((and_(pending, base.c.rank == 1), base.c.id))).label('oldest_id'),
+        *[bucket(low, high).label(name) for name, low, high in AGING_BUCKETS]
+    )
+    if key_name:
+        query = query.group_by(base.c.key).order_by(base.c.key)
+    else:
+        # A bare aggregate always yields one row; drop it when there are no requests
+        query = query.having(func.count(base.c.id) > 0)
+
+    return [_entry(key_name, row.key if key_name else None, row._mapping)
+            for row in session.execute(query)]
+
+def _frame_summary(frame: pd.DataFrame, key_name: Optional[str], now: datetime) -> List[Dict[str, Any]]:
+    if frame.empty:
+        return []
+    key = frame[key_name] if key_name else pd.Series(0, index=frame.index)
+    pending = frame['status'] == 'pending'
+    age = (pd.Timestamp(now) - pd.to_datetime(frame['createdAt'])).dt.total_seconds() / 3600
+    columns = {
+        'open': frame['status'].isin(OPEN_STATUSES),
+        'pending': pending,
+        'completed': frame['status'] == 'completed',
+        'completed_hours': frame['timeToCompletion'].where(frame['status'] == 'completed').astype(float),
+        'pending_age': age.where(pending)
+    }
+    for name, low, high in AGING_BUCKETS:
+        in_bucket = pending & (age >= low)
+        columns[name] = in_bucket if high is None else in_bucket & (age < high)
+    grouped = pd.DataFrame(columns).groupby(key)
+
+    summary = grouped[['open', 'pending', 'completed'] + [name for name, _, _ in AGING_BUCKETS]].sum()
+    summary['median'] = grouped['completed_hours'].median()
+    summary['p90'] = grouped['completed_hours'].quantile(0.9)
+    summary['avg_age'] = grouped['pending_age'].mean()
+    summary['max_age'] = grouped['pending_age'].max()
+
+    oldest = frame.assign(_key=key)[pending].sort_values(['createdAt', 'id']).groupby('_key')['id'].first()
+    summary['oldest_id'] = oldest.reindex(summary.index)
+
+    return [_entry(key_name, int(group) if key_name else None, values)
+            for group, values in summary.sort_index().to_dict('index').items()]
+
+def sla_summary(session, request_model, property_model, owner_id: int,
+                now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    SLA metrics for an owner's maintenance requests
+
+    Args:
+        session: SQLAlchemy session
+        request_model: PropertyMaintenanceRequest model
+        property_model: Property model, used to scope requests to the owner
+        owner_id (int): Owner whose properties are included
+        now (datetime): Reference time for pending-request ages (UTC)
+
+    Returns:
+        Dict[str, Any]: ``portfolio`` totals plus ``byProperty`` and ``byTenant`` lists
+    """
+    now = now or datetime.utcnow()
+    if session.get_bind().dialect.name == 'postgresql':
+        def summarize(key_name):
+            return _postgres_summary(session, request_model, property_model, owner_id, key_name, now)
+    else:
+        rows = session.execute(
+            select(request_model.id, request_model.propertyId, request_model.tenantId,
+                   request_model.status, request_model.timeToCompletion, request_model.createdAt)
+            .join(property_model, property_model.id == request_model.propertyId)
+            .where(property_model.owner_id == owner_id)
+        ).all()
+        frame = pd.DataFrame(rows, columns=['id', 'propertyId', 'tenantId', 'status',
+                                            'timeToCompletion', 'createdAt'])
+
+        def summarize(key_name):
+            return _frame_summary(frame, key_name, now)
+
+    portfolio = summarize(None)
+    return {
+        'asOf': now.isoformat(),
+        'portfolio': portfolio[0] if portfolio else None,
+        'byProperty': summarize('propertyId'),
+        'byTenant': summarize('tenantId')
+    }
@@ -0,0 +1,162 @@
+"""
+Bulk phase planning
+
+Creating a plan, reordering it and rescheduling downstream phases are applied
+to all affected rows at once: new phases go out in one executemany insert, a
+reorder is one UPDATE with a CASE over the phase ids, and a shift is one
+UPDATE that moves every date in the database. The caller commits, so a
+request that combines several operations is a single transaction.
+
+Shifting moves the expected dates of the selected phases. Actual start and
+end dates are history and only move while they still lie in the future,
+i.e. when they were entered as a scheduled date.
+"""
+import logging
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import case, func, insert, select, update
+
+logger = logging.getLogger(__name__)
+
+MAX_BULK_PHASES = 200
+DATE_FIELDS = ('startDate', 'expectedStartDate', 'endDate', 'expectedEndDate')
+ACTUAL_DATE_FIELDS = ('startDate', 'endDate')
+
+def parse_phase_rows(rows: Any) -> Tuple[List[Dict[str, Any]], Dict[int, List[str]]]:
+    """
+    Validate phase objects for a bulk create
+
+    Returns:
+        Tuple[List[Dict[str, Any]], Dict[int, List[str]]]: Parsed rows and
+        errors keyed by row index
+    """
+    if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+        raise ValueError('create must be a list of objects')
+    if len(rows) > MAX_BULK_PHASES:
+        raise ValueError(f'At most {MAX_BULK_PHASES} phases can be created at once')
+
+    parsed, errors = [], {}
+    for index, row in enumerate(rows):
+        row_errors = []
+        name = str(row.get('name') or '').strip()
+        if not name:
+            row_errors.append('Missing required field: name')
+        fields = {'name': name}
+        for field in DATE_FIELDS:
+            value = row.get(field)
+            try:
+                fields[field] = datetime.fromisoformat(value).date() if value else None
+            except (TypeError, ValueError):
+                row_errors.append(f'Invalid date format for {field}')
+        if row_errors:
+            errors[index] = row_errors
+        else:
+            parsed.append(fields)
+    return parsed, errors
+
+def next_order(session, phase_model, property_id: int) -> int:
+    """Position after the last phase of a property"""
+    last = session.execute(
+        select(func.max(phase_model.order)).where(phase_model.property_id == property_id)
+    ).scalar()
+    return 0 if last is None else last + 1
+
+def create_phases(session, phase_model, property_id: int, rows: List[Dict[str, Any]]) -> int:
+    """Append phases to the end of a property's plan with one insert"""
+    if not rows:
+        return 0
+    start = next_order(session, phase_model, property_id)
+    session.execute(insert(phase_model), [
+        dict(row, property_id=property_id, order=start + offset) for offset, row in enumerate(rows)
+    ])
+    return len(rows)
+
+def reorder_phases(session, phase_model, property_id: int, phase_ids: Sequence[int]) -> int:
+    """
+    Renumber a property's phases in the given order with one UPDATE
+
+    Raises:
+        ValueError: If phase_ids is not exactly the property's phases
+    """
+    if not isinstance(phase_ids, list) or not all(isinstance(i, int) for i in phase_ids):
+        raise ValueError('order must be a list of phase ids')
+    existing = set(session.execute(
+        select(phase_model.id).where(phase_model.property_id == property_id)
+    ).scalars())
+    if len(set(phase_ids)) != len(phase_ids) or set(phase_ids) != existing:
+        raise ValueError("order must list each of the property's phases exactly once")
+    if not phase_ids:
+        return 0
+
+    session.execute(
+        update(phase_model)
+        .where(phase_model.property_id == property_id, phase_model.id.in_(phase_ids))
+        .values(order=case({phase_id: position for position, phase_id in enumerate(phase_ids)},
+                           value=phase_model.id))
+        .execution_options(synchronize_session=False)
+    )
+    return len(phase_ids)
+
+def _add_days(column, days: int, dialect: str):
+    if dialect == 'postgresql':
+        return column + days
+    # SQLite stores dates as ISO strings, which date() returns
+    return func.date(column, f'{days:+d} days')
+
+def shift_phases(session, phase_model, property_id: int, days: int,
+                 from_phase_id: Optional[int] = None, today: Optional[date] = None) -> int:
+    """
+    Move the phases from ``from_phase_id`` onwards (all phases if None) by N days
+
+    Raises:
+        ValueError: If days is not an integer or the anchor phase is not on the property
+    """
+    if isinstance(days, bool) or not isinstance(days, int):
+        raise ValueError('shift.days must be an integer')
+    today = today or date.today()
+    conditions = [phase_model.property_id == property_id]
+    if from_phase_id is not None:
+        anchor = session.execute(
+            select(phase_model.order)
+            .where(phase_model.id == from_phase_id, phase_model.property_id == property_id)
+        ).scalar()
+        if anchor is None:
+            raise ValueError('shift.fromPhaseId is not a phase of this property')
+        conditions.append(phase_model.order >= anchor)
+    if days == 0:
+        return 0
+
+    dialect = session.get_bind().dialect.name
+    if dialect not in ('postgresql', 'sqlite'):
+        # No portable date arithmetic: shift in Python and write back in one executemany
+        phases = session.execute(
+            select(phase_model.id, *[getattr(phase_model, f) for f in DATE_FIELDS])
+            .where(*conditions)
+        ).all()
+        session.execute(update(phase_model), [
+            {'id': phase.id, **{
+                field: _shift_value(getattr(phase, field), days, today, field in ACTUAL_DATE_FIELDS)
+                for field in DATE_FIELDS
+            }} for phase in phases
+        ])
+        return len(phases)
+
+    values = {}
+    for field in DATE_FIELDS:
+        column = getattr(phase_model, field)
+        shifted = _add_days(column, days, dialect)
+        values[field] = case((column > today, shifted), else_=column) if field in ACTUAL_DATE_FIELDS else shifted
+    result = session.execute(
+        update(phase_model)
+        .where(*conditions)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    logger.info(f'Shifted {result.rowcount} phases of property {property_id} by {days} days')
+    return result.rowcount
+
+def _shift_value(value: Optional[date], days: int, today: date, actual: bool) -> Optional[date]:
+    if value is None or (actual and value <= today):
+        return value
+    return value + timedelta(days=days)
@@ -0,0 +1,224 @@
+"""
+Phase timeline
+
+Schedule status for every phase of an owner's properties, computed from one
+projection query with pandas/NumPy date arithmetic instead of one phase fetch
+per property.
+
+A phase is completed once its endDate has passed, in progress once it has
+started, and otherwise not started. Projected end dates follow the actual
+dates where they exist:
+
+- completed phases end on their endDate;
+- in-progress phases run for their planned duration from the actual start,
+  but never end before today;
+- phases that have not started keep their planned dates, pushed back by the
+  delay already accumulated on the property (the largest finish slip of its
+  started phases, or their own late start), since later phases cannot start
+  until the earlier ones are done.
+
+The critical phase of a property is the unfinished phase with the latest
+projected end: it is the one the projected completion date depends on.
+"""
+import logging
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import select
+
+logger = logging.getLogger(__name__)
+
+PHASE_COLUMNS = ['id', 'propertyId', 'address', 'name', 'startDate', 'expectedStartDate',
+                 'endDate', 'expectedEndDate']
+DATE_COLUMNS = ['startDate', 'expectedStartDate', 'endDate', 'expectedEndDate']
+
+def _days(delta: pd.Series) -> pd.Series:
+    return delta / np.timedelta64(1, 'D')
+
+def phase_schedule(frame: pd.DataFrame, as_of: date) -> pd.DataFrame:
+    """
+    Add status, slip and projection columns to a frame of phase rows
+
+    Args:
+        frame (pd.DataFrame): One row per phase with PHASE_COLUMNS
+        as_of (date): Reference date
+
+    Returns:
+        pd.DataFrame: The phases with ``status``, ``startSlipDays``,
+        ``projectedEndDate``, ``finishSlipDays``, ``percentComplete`` and
+        ``plannedPercent`` columns
+    """
+    frame = frame.copy()
+    today = np.datetime64(as_of, 'D')
+    for column in DATE_COLUMNS:
+        frame[column] = pd.to_datetime(frame[column]).astype('datetime64[s]')
+    start, expected_start = frame['startDate'], frame['expectedStartDate']
+    end, expected_end = frame['endDate'], frame['expectedEndDate']
+
+    completed = end.notna() & (end <= today)
+    started = ~completed & start.notna() & (start <= today)
+    frame['status'] = np.select([completed, started], ['completed', 'in_progress'], 'not_started')
+
+    planned = expected_end - expected_start
+    # Late start: actual start, or today for a phase that should already have started
+    late_start = start.where(completed | started, pd.Timestamp(today))
+    frame['startSlipDays'] = _days(late_start - expected_start).where(
+        completed | started | (expected_start < today))
+
+    projected = pd.Series(pd.NaT, index=frame.index, dtype='datetime64[s]')
+    projected[completed] = end[completed]
+    running = (start + planned).fillna(expected_end).fillna(end)
+    projected[started] = running[started].where(running[started] > today, pd.Timestamp(today))
+
+    # Delay carried into phases that have not started yet
+    own_slip = _days(projected - expected_end).where(completed | started)
+    carried = pd.concat([own_slip, frame['startSlipDays'].where(completed | started)], axis=1).max(axis=1)
+    property_slip = carried.groupby(frame['propertyId']).transform('max').fillna(0).clip(lower=0)
+    waiting = ~(completed | started)
+    pending_slip = np.maximum(property_slip, frame['startSlipDays'].fillna(0))
+    projected[waiting] = (expected_end + pd.to_timedelta(pending_slip, unit='D'))[waiting]
+    frame['projectedEndDate'] = projected
+    frame['finishSlipDays'] = _days(projected - expected_end)
+
+    elapsed = _days(pd.Timestamp(today) - start)
+    span = _days(projected - start)
+    progress = (elapsed / span.where(span > 0)).clip(0, 1).fillna(0)
+    # A running phase with no expected dates or end date has nothing to measure progress against
+    progress = progress.where(running.notna())
+    frame['percentComplete'] = np.select([completed, started], [1.0, progress], 0.0) * 100
+
+    planned_progress = (_days(pd.Timestamp(today) - expected_start) /
+                        _days(planned).where(_days(planned) > 0)).clip(0, 1)
+    # Zero-length or undated plans count as due once their expected end passes
+    planned_progress = planned_progress.fillna((expected_end <= today).astype(float).where(expected_end.notna()))
+    frame['plannedPercent'] = planned_progress * 100
+    return frame
+
+def _date(value) -> Optional[str]:
+    return None if pd.isna(value) else pd.Timestamp(value).date().isoformat()
+
+def _number(value, digits=1) -> Optional[float]:
+    return None if value is None or pd.isna(value) else round(float(value), digits)
+
+def _property_summaries(schedule: pd.DataFrame) -> List[Dict[str, Any]]:
+    key = schedule['propertyId']
+    grouped = schedule.groupby(key, sort=True)
+    summary = pd.DataFrame({
+        'address': grouped['address'].first(),
+        'phaseCount': grouped.size(),
+        'completed': (schedule['status'] == 'completed').groupby(key).sum(),
+        'inProgress': (schedule['status'] == 'in_progress').groupby(key).sum(),
+        'latePhases': (schedule['finishSlipDays'] > 0).groupby(key).sum(),
+        'percentComplete': grouped['percentComplete'].mean(),
+        'plannedPercent': grouped['plannedPercent'].mean(),
+        'plannedCompletion': grouped['expectedEndDate'].max(),
+        'projectedCompletion': grouped['projectedEndDate'].max(),
+        'startDate': grouped['startDate'].min()
+    })
+    summary['slipDays'] = _days(summary['projectedCompletion'] - summary['plannedCompletion'])
+
+    unfinished = schedule[schedule['status'] != 'completed']
+    critical = unfinished.sort_values(['projectedEndDate', 'expectedStartDate', 'id'], na_position='first') \
+                         .drop_duplicates('propertyId', keep='last').set_index('propertyId')
+
+    results = []
+    for property_id, row in summary.iterrows():
+        slip = _number(row['slipDays'], 0)
+        critical_row = critical.loc[property_id] if property_id in critical.index else None
+        results.append({
+            'propertyId': int(property_id),
+            'address': row['address'],
+            'phaseCount': int(row['phaseCount']),
+            'completedPhases': int(row['completed']),
+            'inProgressPhases': int(row['inProgress']),
+            'latePhases': int(row['latePhases']),
+            'percentComplete': _number(row['percentComplete']),
+            'plannedPercentComplete': _number(row['plannedPercent']),
+            # Percentage points ahead (+) or behind (-) the plan as of today
+            'scheduleVariance': None if pd.isna(row['plannedPercent'])
+                                else _number(row['percentComplete'] - row['plannedPercent']),
+            'slipDays': None if slip is None else int(slip),
+            'startDate': _date(row['startDate']),
+            'plannedCompletion': _date(row['plannedCompletion']),
+            'projectedCompletion': _date(row['projectedCompletion']),
+            'isComplete': int(row['completed']) == int(row['phaseCount']),
+            'criticalPhase': None if critical_row is None else {
+                'id': int(critical_row['id']),
+                'name': critical_row['name'],
+                'projectedEndDate': _date(critical_row['projectedEndDate'])
+            }
+        })
+    return results
+
+def _portfolio_summary(properties: List[Dict[str, Any]]) -> Dict[str, Any]:
+    slips = [p['slipDays'] for p in properties if p['slipDays'] is not None]
+    active = [p for p in properties if not p['isComplete']]
+    projected = [p['projectedCompletion'] for p in active if p['projectedCompletion']]
+    measured = [p['percentComplete'] for p in properties if p['percentComplete'] is not None]
+    return {
+        'properties': len(properties),
+        'activeProperties': len(active),
+        'completedProperties': len(properties) - len(active),
+        'lateProperties': sum(1 for slip in slips if slip > 0),
+        'onScheduleProperties': sum(1 for slip in slips if slip <= 0),
+        'averageSlipDays': round(float(np.mean(slips)), 1) if slips else None,
+        'maxSlipDays': max(slips) if slips else None,
+        'percentComplete': round(float(np.mean(measured)), 1) if measured else None,
+        'latestProjectedCompletion': max(projected) if projected else None
+    }
+
+def _phase_entries(schedule: pd.DataFrame) -> List[Dict[str, Any]]:
+    return [{
+        'id': int(row['id']),
+        'name': row['name'],
+        'status': row['status'],
+        **{column: _date(row[column]) for column in DATE_COLUMNS},
+        'projectedEndDate': _date(row['projectedEndDate']),
+        'startSlipDays': _number(row['startSlipDays'], 0),
+        'finishSlipDays': _number(row['finishSlipDays'], 0),
+        'percentComplete': _number(row['percentComplete'])
+    } for _, row in schedule.iterrows()]
+
+def phase_timeline(session, phase_model, property_model, owner_id: int, as_of: date,
+                   property_id: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Timeline summary for an owner's properties
+
+    Args:
+        session: SQLAlchemy session
+        phase_model: Phase model
+        property_model: Property model, used to scope phases to the owner
+        owner_id (int): Owner whose properties are included
+        as_of (date): Reference date for status and slip
+        property_id (int): Restrict to one property and include its phases
+
+    Returns:
+        Dict[str, Any]: ``portfolio`` totals and a ``properties`` list; with
+        ``property_id`` also a ``phases`` list for that property
+    """
+    query = (
+        select(phase_model.id, phase_model.property_id, property_model.address, phase_model.name,
+               phase_model.startDate, phase_model.expectedStartDate,
+               phase_model.endDate, phase_model.expectedEndDate)
+        .join(property_model, property_model.id == phase_model.property_id)
+        .where(property_model.owner_id == owner_id)
+        .order_by(phase_model.property_id, phase_model.order, phase_model.id)
+    )
+    if property_id is not None:
+        query = query.where(phase_model.property_id == property_id)
+    frame = pd.DataFrame(session.execute(query).all(), columns=PHASE_COLUMNS)
+
+    result = {'asOf': as_of.isoformat()}
+    if frame.empty:
+        properties = []
+        schedule = frame
+    else:
+        schedule = phase_schedule(frame, as_of)
+        properties = _property_summaries(schedule)
+    result.update({'portfolio': _portfolio_summary(properties), 'properties': properties})
+    if property_id is not None:
+        result['phases'] = _phase_entries(schedule)
+    logger.info(f'Computed timeline for {len(properties)} properties ({len(frame)} phases)')
+    return result
@@ -0,0 +1,178 @@
+"""
+Bulk promotion of scraped listings into properties
+
+Maps scraped sheriff-sale listings onto ``Property`` rows and inserts them in
+batches. A listing is skipped when the owner already tracks it, matched by
+detail link or by county and sheriff number: existing keys are looked up with
+one IN query per batch, and the unique indexes on those columns back this up
+for imports racing each other (PostgreSQL and SQLite insert with ON CONFLICT
+DO NOTHING).
+
+The inserts bypass mapper events, so the caller refreshes the phase progress
+rollup for the returned ids before committing.
+"""
+import logging
+import re
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, func, insert, or_, select, tuple_
+
+logger = logging.getLogger(__name__)
+
+MAX_IMPORT_LISTINGS = 5000
+INSERT_BATCH_SIZE = 500
+
+# Trailing "NJ 07307" of a civilview address
+_STATE_ZIP = re.compile(r'\b([A-Z]{2})\s+(\d{5})(?:-\d{4})?\s*$')
+
+def county_name(county: Optional[str]) -> Optional[str]:
+    """'Morris' -> 'Morris County', the form used on properties"""
+    if not county or not str(county).strip():
+        return None
+    county = str(county).strip()
+    return county if county.lower().endswith(' county') else f'{county} County'
+
+def _status_date(value: Any) -> Optional[date]:
+    if isinstance(value, date):
+        return value
+    for fmt in ('%Y-%m-%d', '%m/%d/%Y'):
+        try:
+            return datetime.strptime(str(value), fmt).date()
+        except (TypeError, ValueError):
+            continue
+    return None
+
+def _price(value: Any) -> float:
+    if isinstance(value, str):
+        value = value.replace('$', '').replace(',', '').strip()
+    try:
+        return float(value) if value not in (None, '') else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+
+def _text(value: Any) -> Optional[str]:
+    return str(value).strip() or None if value is not None else None
+
+def listing_to_property(listing: Dict[str, Any], owner_id: int) -> Dict[str, Any]:
+    """
+    Property columns for one scraped listing
+
+    Raises:
+        ValueError: If the listing has no address or no detail link / sheriff number
+    """
+    address = _text(listing.get('address'))
+    if not address:
+        raise ValueError('Missing address')
+    detail_link = _text(listing.get('detail_link'))
+    sheriff_number = _text(listing.get('sheriff_number'))
+    if not detail_link and not sheriff_number:
+        raise ValueError('Missing detail_link and sheriff_number')
+
+    price = _price(listing.get('price'))
+    match = _STATE_ZIP.search(address)
+    return {
+        'owner_id': owner_id,
+        'address': address,
+        'propertyName': address,
+        'purchase_price': price,
+        'purchaseCost': price,
+        'current_phase': 'ACQUISITION',
+        'county': county_name(listing.get('county')),
+        'state': match.group(1) if match else None,
+        'zipCode': match.group(2) if match else None,
+        'detail_link': detail_link,
+        'property_id': _text(listing.get('property_id')),
+        'sheriff_number': sheriff_number,
+        'status_date': _status_date(listing.get('status_date')),
+        'plaintiff': _text(listing.get('plaintiff')),
+        'defendant': _text(listing.get('defendant')),
+        'zillow_url': _text(listing.get('Zillow URL') or listing.get('zillow_url'))
+    }
+
+def map_listings(listings: List[Dict[str, Any]], owner_id: int
+                 ) -> Tuple[List[Dict[str, Any]], Dict[int, str], int]:
+    """
+    Map listings to property rows, dropping repeats within the request
+
+    Returns:
+        Tuple: Property rows, errors keyed by listing index and the number of
+        listings that repeated an earlier one
+    """
+    rows, errors, repeated = [], {}, 0
+    links, sheriff_numbers = set(), set()
+    for index, listing in enumerate(listings):
+        if not isinstance(listing, dict):
+            errors[index] = 'Listing must be an object'
+            continue
+        try:
+            row = listing_to_property(listing, owner_id)
+        except ValueError as e:
+            errors[index] = str(e)
+            continue
+        sheriff_key = (row['county'], row['sheriff_number'])
+        if (row['detail_link'] and row['detail_link'] in links) or \
+                (row['sheriff_number'] and sheriff_key in sheriff_numbers):
+            repeated += 1
+            continue
+        if row['detail_link']:
+            links.add(row['detail_link'])
+        if row['sheriff_number']:
+            sheriff_numbers.add(sheriff_key)
+        rows.append(row)
+    return rows, errors, repeated
+
+def _tracked(session, property_model, owner_id: int, rows: List[Dict[str, Any]]) -> set:
+    """Indexes of rows the owner already has, by detail link or county + sheriff number"""
+    links = [row['detail_link'] for row in rows if row['detail_link']]
+    # No county matches no county, as in uq_property_owner_sheriff_number
+    county = func.coalesce(property_model.county, '')
+    sheriff_keys = [(row['county'] or '', row['sheriff_number']) for row in rows if row['sheriff_number']]
+    conditions = []
+    if links:
+        conditions.append(property_model.detail_link.in_(links))
+    if sheriff_keys:
+        conditions.append(tuple_(county, property_model.sheriff_number).in_(sheriff_keys))
+    existing = session.execute(
+        select(property_model.detail_link, county, property_model.sheriff_number)
+        .where(property_model.owner_id == owner_id, or_(*conditions))
+    ).all()
+    existing_links = {link for link, _, _ in existing if link}
+    existing_sheriff = {(county, number) for _, county, number in existing if number}
+    return {
+        index for index, row in enumerate(rows)
+        if row['detail_link'] in existing_links or (row['county'] or '', row['sheriff_number']) in existing_sheriff
+    }
+
+def _insert_statement(session, property_model):
+    dialect = session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        # The lookup above already skipped tracked listings; a concurrent
+        # import surfaces as an IntegrityError
+        return insert(property_model).returning(property_model.id)
+    return dialect_insert(property_model).on_conflict_do_nothing().returning(property_model.id)
+
+def import_listings(session, property_model, owner_id: int, rows: List[Dict[str, Any]],
+                    batch_size: int = INSERT_BATCH_SIZE) -> Tuple[List[int], int]:
+    """
+    Insert property rows the owner does not track yet, one batch at a time
+
+    Returns:
+        Tuple[List[int], int]: Ids of the new properties and the number of
+        rows skipped as already tracked
+    """
+    created, skipped = [], 0
+    statement = _insert_statement(session, property_model)
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start:start + batch_size]
+        tracked = _tracked(session, property_model, owner_id, batch)
+        batch = [row for index, row in enumerate(batch) if index not in tracked]
+        ids = list(session.scalars(statement, batch)) if batch else []
+        created.extend(ids)
+        skipped += len(tracked) + len(batch) - len(ids)
+    logger.info(f'Imported {len(created)} scraped listings for owner {owner_id}, {skipped} already tracked')
+    return created, skipped
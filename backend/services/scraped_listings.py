@@ -0,0 +1,119 @@
+"""
+In-memory index of scraped listings for the API
+
+Scraped listings only change when the scraper runs, so the API does not read
+and serialize the whole scrape store per request. The listings are loaded
+once into a DataFrame together with lower-cased search text and the row
+positions of each county, and reused until the store's signature (mtime and
+size of the database and its WAL file) changes. Filters are NumPy masks over
+the cached columns; pages are keyset pages on the store id.
+"""
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from services.scraper import scrape_store
+from services.scraper.scrape_store import ScrapeStore, store_signature
+
+logger = logging.getLogger(__name__)
+
+TEXT_FIELDS = ('address', 'plaintiff', 'defendant', 'sheriff_number', 'description')
+
+def normalize_county(county: str) -> str:
+    """'Morris County', 'morris' and 'Morris' all name the same county"""
+    county = county.strip().lower()
+    return county[:-len(' county')] if county.endswith(' county') else county
+
+class ListingIndex:
+    """Listings held in memory with the columns the filters need precomputed"""
+
+    def __init__(self, frame: pd.DataFrame):
+        frame = frame.reset_index(drop=True)
+        self.ids = frame['id'].to_numpy()
+        listings = frame.drop(columns='id').astype(object)
+        self.records = listings.where(listings.notna(), None).to_dict('records')
+        self.prices = pd.to_numeric(frame['price'], errors='coerce').to_numpy(dtype=float)
+        self.status_dates = frame['status_date'].fillna('').astype(str).to_numpy()
+        text = frame[list(TEXT_FIELDS)].fillna('').astype(str)
+        self.text = np.array([' '.join(values).lower() for values in text.itertuples(index=False)], dtype=str)
+        counties = frame['county'].fillna('').astype(str).map(normalize_county)
+        self.counties = {county: positions.to_numpy() for county, positions in counties.groupby(counties).groups.items()}
+
+    def __len__(self):
+        return len(self.records)
+
+    def search(self, county: Optional[str] = None, status_date: Optional[str] = None,
+               status_from: Optional[str] = None, status_to: Optional[str] = None,
+               min_price: Optional[float] = None, max_price: Optional[float] = None,
+               text: Optional[str] = None, after_id: Optional[int] = None,
+               limit: int = 100) -> Tuple[List[Dict[str, Any]], int, Optional[int]]:
+        """
+        Filter and page the listings
+
+        Dates are YYYY-MM-DD strings; ``status_from``/``status_to`` are
+        inclusive. Every word of ``text`` must appear in the address, parties,
+        sheriff number or description.
+
+        Returns:
+            Tuple: The page of records, the number of matching listings and the
+            id to continue after (None on the last page)
+        """
+        if county:
+            positions = self.counties.get(normalize_county(county), np.empty(0, dtype=np.int64))
+        else:
+            positions = np.arange(len(self.records))
+
+        mask = np.ones(len(positions), dtype=bool)
+        dates = self.status_dates[positions]
+        if status_date:
+            mask &= dates == status_date
+        if status_from:
+            mask &= (dates != '') & (dates >= status_from)
+        if status_to:
+            mask &= (dates != '') & (dates <= status_to)
+        prices = self.prices[positions]
+        if min_price is not None:
+            mask &= prices >= min_price
+        if max_price is not None:
+            mask &= prices <= max_price
+        if text:
+            haystack = self.text[positions].astype(str)
+            for word in text.lower().split():
+                mask &= np.char.find(haystack, word) >= 0
+
+        matched = positions[mask]
+        total = len(matched)
+        if after_id is not None:
+            matched = matched[self.ids[matched] > after_id]
+        page = matched[:limit]
+        next_id = int(self.ids[page[-1]]) if len(matched) > limit else None
+        return [self.records[position] for position in page], total, next_id
+
+_cache: Dict[str, Any] = {'path': None, 'signature': None, 'index': None}
+_cache_lock = threading.Lock()
+
+def listing_index(path: Optional[str] = None) -> Optional[ListingIndex]:
+    """
+    The cached index of the scrape store, rebuilt when the store has changed
+
+    Returns:
+        Optional[ListingIndex]: None if the scraper has not written a store yet
+    """
+    path = path or scrape_store.STORE_FILE
+    signature = store_signature(path)
+    if signature is None:
+        return None
+    with _cache_lock:
+        if _cache['index'] is None or _cache['path'] != path or _cache['signature'] != signature:
+            with ScrapeStore(path) as store:
+                index = ListingIndex(store.frame())
+            # A write that landed while loading changes the signature again,
+            # so the next request reloads instead of serving a stale index
+            if store_signature(path) != signature:
+                signature = None
+            _cache.update(path=path, signature=signature, index=index)
+            logger.info(f'Loaded {len(index)} scraped listings into the API index')
+        return _cache['index']
@@ -0,0 +1,117 @@
+"""
+Plain-HTTP page fetcher
+
+The civilview SalesSearch and SaleDetails pages are rendered on the server,
+so they can be fetched without a browser. HttpFetcher keeps one aiohttp
+session (pooled keep-alive connections, shared cookies) for a batch of URLs
+and throttles each host with its own AsyncLimiter. Transient failures
+(connection errors, timeouts, 429 and 5xx responses) are retried with
+exponential backoff; anything else yields None so the caller can fall back
+to Selenium.
+"""
+import asyncio
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+from aiolimiter import AsyncLimiter
+
+from .utils.logger import setup_logger
+
+logger = setup_logger(__name__, 'logs/scraper.log')
+
+REQUESTS_PER_SECOND = 2  # Per host
+CONNECTIONS_PER_HOST = 4
+TIMEOUT_SECONDS = 20
+RETRIES = 2
+BACKOFF_SECONDS = 0.5
+
+HEADERS = {
+    'User-Agent': ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                   '(KHTML, like Gecko) Chrome/120.0 Safari/537.36'),
+    'Accept': 'text/html,application/xhtml+xml'
+}
+
+class HttpFetcher:
+    """
+    Async context manager fetching pages over one pooled aiohttp session
+
+    Args:
+        rate (float): Requests per second allowed for each host
+        connections_per_host (int): Open connections allowed for each host
+        timeout (float): Total seconds allowed per request
+        retries (int): Extra attempts after a transient failure
+    """
+
+    def __init__(self, rate: float = REQUESTS_PER_SECOND, connections_per_host: int = CONNECTIONS_PER_HOST,
+                 timeout: float = TIMEOUT_SECONDS, retries: int = RETRIES):
+        self.rate = rate
+        self.connections_per_host = connections_per_host
+        self.timeout = timeout
+        self.retries = retries
+        self._limiters: Dict[str, AsyncLimiter] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self):
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=self.connections_per_host),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers=HEADERS
+        )
+        return self
+
+    async def __aexit__(self, *exc):
+        await self._session.close()
+
+    def _limiter(self, url: str) -> AsyncLimiter:
+        host = urlsplit(url).netloc
+        if host not in self._limiters:
+            self._limiters[host] = AsyncLimiter(self.rate, 1)
+        return self._limiters[host]
+
+    async def fetch(self, url: str) -> Optional[str]:
+        """Return the page body, or None if it could not be fetched"""
+        for attempt in range(self.retries + 1):
+            try:
+                async with self._limiter(url):
+                    async with self._session.get(url) as response:
+                        if response.status == 200:
+                            # A mislabelled charset should not cost the whole page
+                            return await response.text(errors='replace')
+                        if response.status != 429 and response.status < 500:
+                            logger.warning(f"HTTP {response.status} fetching {url}")
+                            return None
+                        error = f"HTTP {response.status}"
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = str(e) or type(e).__name__
+            except Exception as e:
+                # Not transient; keep it from failing the other pages of fetch_all
+                logger.warning(f"Error fetching {url}: {e}")
+                return None
+            if attempt < self.retries:
+                await asyncio.sleep(BACKOFF_SECONDS * 2 ** attempt)
+        logger.warning(f"Giving up on {url} after {self.retries + 1} attempts: {error}")
+        return None
+
+    async def fetch_all(self, urls: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Fetch several pages concurrently, keyed by URL"""
+        urls = list(dict.fromkeys(urls))
+        pages = await asyncio.gather(*(self.fetch(url) for url in urls))
+        return dict(zip(urls, pages))
+
+async def _fetch_pages(urls, options):
+    async with HttpFetcher(**options) as fetcher:
+        return await fetcher.fetch_all(urls)
+
+def fetch_pages(urls: Iterable[str], **options) -> Dict[str, Optional[str]]:
+    """
+    Fetch pages over HTTP from synchronous code
+
+    Args:
+        urls (Iterable[str]): Pages to fetch
+        **options: HttpFetcher arguments (rate, connections_per_host, timeout, retries)
+
+    Returns:
+        Dict[str, Optional[str]]: Page body per URL, None where fetching failed
+    """
+    return asyncio.run(_fetch_pages(urls, options))
@@ -0,0 +1,68 @@
+"""
+SaleDetails scraper
+
+Follows each listing's ``detail_link`` over HTTP and reads the auction
+details the listing table does not show: court case, sale date, description,
+upset amount and attorney. Pages are fetched concurrently through
+HttpFetcher, which throttles the civilview host, and written to the scrape
+state one batch at a time. A listing whose content hash matches the hash its
+details were scraped for is not fetched again.
+"""
+from typing import Any, Dict, List
+
+from .async_fetcher import fetch_pages
+from .parsers import parse_detail_page
+from .scrape_state import ScrapeState, listing_hash
+from .utils.logger import setup_logger
+
+logger = setup_logger(__name__, 'logs/scraper.log')
+
+DETAIL_BATCH_SIZE = 100
+DETAIL_REQUESTS_PER_SECOND = 4
+
+def stale_listings(rows: List[Dict[str, Any]], state: ScrapeState) -> List[Dict[str, Any]]:
+    """Listings with a detail link whose details are missing or older than the listing"""
+    rows = {str(row['property_id']): row for row in rows if row.get('property_id') and row.get('detail_link')}
+    scraped = state.detail_hashes(rows)
+    return [row for property_id, row in rows.items() if scraped.get(property_id) != listing_hash(row)]
+
+def scrape_details(rows: List[Dict[str, Any]], state: ScrapeState, batch_size: int = DETAIL_BATCH_SIZE,
+                   rate: float = DETAIL_REQUESTS_PER_SECOND, **fetch_options) -> Dict[str, Dict[str, Any]]:
+    """
+    Scrape the SaleDetails pages of listings whose details are stale
+
+    Args:
+        rows (list): Listing rows with ``property_id`` and ``detail_link``
+        state (ScrapeState): Where details and their listing hashes are stored
+        batch_size (int): Pages fetched concurrently and written together
+        rate (float): Requests per second allowed against the civilview host
+        **fetch_options: Other HttpFetcher arguments (connections_per_host, timeout, retries)
+
+    Returns:
+        dict: Detail fields per property_id for the pages scraped in this call.
+        Pages that failed are left stale and retried on the next run.
+    """
+    pending = stale_listings(rows, state)
+    if not pending:
+        return {}
+    logger.info(f"🔎 Scraping {len(pending)} detail pages ({len(rows) - len(pending)} up to date)")
+
+    scraped, failed = {}, 0
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start:start + batch_size]
+        pages = fetch_pages([row['detail_link'] for row in batch], rate=rate, **fetch_options)
+        details, hashes = {}, {}
+        for row in batch:
+            property_id = str(row['property_id'])
+            fields = parse_detail_page(pages.get(row['detail_link']))
+            if fields is None:
+                failed += 1
+                logger.warning(f"⚠️ No details found at {row['detail_link']}")
+                continue
+            details[property_id] = fields
+            hashes[property_id] = listing_hash(row)
+        state.record_details(details, hashes)
+        scraped.update(details)
+
+    logger.info(f"✅ Scraped {len(scraped)} detail pages, {failed} failed")
+    return scraped
@@ -0,0 +1,239 @@
+"""
+Shared pool of headless Chrome browsers
+
+Starting Chrome and resolving chromedriver through ChromeDriverManager takes
+several seconds and a network round trip per fetch. The pool resolves the
+driver binary once (and remembers the path on disk for later runs), keeps up
+to ``size`` browsers warm and hands them out through a context manager:
+
+    with get_pool().driver() as driver:
+        driver.get(url)
+        wait_for(driver, 'table.table-striped')
+        html = driver.page_source
+
+A browser is quit and replaced after ``max_pages`` uses, or as soon as it
+stops responding. Callers wait for the element they need with explicit
+WebDriverWait conditions instead of fixed sleeps.
+"""
+import atexit
+import json
+import os
+import queue
+import sys
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Optional
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from .utils.logger import setup_logger
+
+logger = setup_logger(__name__, 'logs/scraper.log')
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_PAGES = 50
+DEFAULT_WAIT_SECONDS = 15
+
+# Where a resolved chromedriver path is remembered between runs
+DRIVER_CACHE_FILE = Path(os.path.dirname(__file__)) / 'downloads' / 'chromedriver_path.json'
+# Binary dropped next to the scraper, as the Zillow and Morris scrapers used to expect
+LOCAL_DRIVER = Path(os.path.dirname(__file__)) / ('chromedriver.exe' if sys.platform == 'win32' else 'chromedriver')
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+def resolve_driver_path() -> str:
+    """
+    Locate chromedriver once per process
+
+    Checked in order: the CHROMEDRIVER_PATH environment variable, a binary next
+    to the scraper, the path cached by an earlier run, and finally
+    ChromeDriverManager (which may download it). The result is cached on disk
+    so later runs work offline.
+    """
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path:
+            return _driver_path
+
+        candidates = [os.environ.get('CHROMEDRIVER_PATH'), str(LOCAL_DRIVER)]
+        try:
+            candidates.append(json.loads(DRIVER_CACHE_FILE.read_text()).get('path'))
+        except (OSError, ValueError):
+            pass
+        path = next((candidate for candidate in candidates if candidate and os.path.isfile(candidate)), None)
+
+        if not path:
+            from webdriver_manager.chrome import ChromeDriverManager
+            path = ChromeDriverManager().install()
+            try:
+                DRIVER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                DRIVER_CACHE_FILE.write_text(json.dumps({'path': path}))
+            except OSError as e:
+                logger.warning(f"⚠️ Could not cache chromedriver path: {e}")
+
+        logger.info(f"Using chromedriver at {path}")
+        _driver_path = path
+        return path
+
+def chrome_options(headless: bool = True) -> Options:
+    """Chrome options shared by every scraper"""
+    options = Options()
+    if headless:
+        options.add_argument("--headless")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    return options
+
+def create_driver(headless: bool = True):
+    """Start one Chrome instance with the resolved driver binary"""
+    return webdriver.Chrome(service=ChromeService(resolve_driver_path()), options=chrome_options(headless))
+
+def wait_for(driver, css_selector: str, timeout: float = DEFAULT_WAIT_SECONDS, clickable: bool = False):
+    """
+    Block until an element matching css_selector is present (or clickable)
+
+    Raises:
+        TimeoutException: If the element does not appear within timeout seconds
+    """
+    condition = EC.element_to_be_clickable if clickable else EC.presence_of_element_located
+    return WebDriverWait(driver, timeout).until(condition((By.CSS_SELECTOR, css_selector)))
+
+def wait_for_ready(driver, timeout: float = DEFAULT_WAIT_SECONDS):
+    """Block until the document has finished loading"""
+    WebDriverWait(driver, timeout).until(
+        lambda d: d.execute_script('return document.readyState') == 'complete'
+    )
+
+def _is_alive(driver) -> bool:
+    try:
+        driver.execute_script('return 1')
+        return True
+    except Exception:
+        return False
+
+class DriverPool:
+    """
+    Bounded pool of reusable WebDriver instances
+
+    Browsers are started lazily up to ``size``; callers beyond that block
+    until one is released. Safe to share between threads.
+    """
+
+    def __init__(self, size: int = DEFAULT_POOL_SIZE, max_pages: int = DEFAULT_MAX_PAGES,
+                 factory: Optional[Callable] = None):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+        self.max_pages = max_pages
+        self._factory = factory or create_driver
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._uses = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def warm(self, count: Optional[int] = None):
+        """Start browsers ahead of time so the first fetches do not pay for it"""
+        count = min(count or self.size, self.size)
+        acquired = []
+        try:
+            for _ in range(count):
+                acquired.append(self._acquire())
+        finally:
+            for driver in acquired:
+                self._release(driver, used=False)
+
+    @contextmanager
+    def driver(self):
+        """Borrow a browser; it goes back to the pool (or is replaced) on exit"""
+        driver = self._acquire()
+        healthy = True
+        try:
+            yield driver
+        except Exception:
+            healthy = _is_alive(driver)
+            raise
+        finally:
+            self._release(driver, healthy)
+
+    def _acquire(self):
+        if self._closed:
+            raise RuntimeError("Driver pool is closed")
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            driver = self._factory()
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._uses[id(driver)] = 0
+        return driver
+
+    def _release(self, driver, healthy: bool = True, used: bool = True):
+        try:
+            with self._lock:
+                uses = self._uses.get(id(driver), 0) + int(used)
+                self._uses[id(driver)] = uses
+            if self._closed or not healthy or uses >= self.max_pages:
+                reason = 'crashed' if not healthy else 'recycled'
+                logger.info(f"Browser {reason} after {uses} pages")
+                self._quit(driver)
+            else:
+                self._idle.put(driver)
+        finally:
+            self._slots.release()
+
+    def _quit(self, driver):
+        with self._lock:
+            self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.error(f"Error closing browser: {e}")
+
+    def close(self):
+        """Quit every idle browser; browsers still borrowed are quit on release"""
+        self._closed = True
+        while True:
+            try:
+                self._quit(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+def get_pool() -> DriverPool:
+    """Process-wide pool used when a scraper is not given one explicitly"""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None or _shared_pool._closed:
+            _shared_pool = DriverPool(size=int(os.environ.get('SCRAPER_BROWSER_POOL_SIZE', DEFAULT_POOL_SIZE)))
+        return _shared_pool
+
+@atexit.register
+def shutdown_pool():
+    """Quit the shared pool's browsers"""
+    with _shared_pool_lock:
+        if _shared_pool is not None:
+            _shared_pool.close()
+
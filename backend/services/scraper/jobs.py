@@ -0,0 +1,444 @@
+"""
+Scrape jobs: a durable local queue and the worker that runs it
+
+A scrape takes minutes, so the API does not run it inside the request. It
+queues a job in a local SQLite table (downloads/scrape_jobs.db) and returns
+its id; a background worker thread claims queued jobs one at a time and runs
+them through main_all, writing per-county progress, row counts and timings
+back to the job for clients to poll.
+
+Only one job per county can be queued or running (a partial unique index),
+so a duplicate submission is coalesced onto the job already waiting or in
+progress. An 'all' job covers every county: a county submission joins an
+'all' job that has not scraped that county yet, and queued county jobs are
+folded into a new 'all' job. Jobs are rows on disk, so they survive a
+restart: queued jobs are picked up by the next worker, and jobs left running
+by a process that died are queued again, up to MAX_ATTEMPTS times.
+
+One worker runs per host, holding a lock file next to the queue, so a
+server with several processes still scrapes one job at a time.
+
+    with JobQueue() as queue:
+        job, created = queue.enqueue('Morris')
+    start_worker().wake()
+"""
+import json
+import os
+import socket
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: no per-host lock, every process runs a worker
+    fcntl = None
+
+from .main import COUNTY_URLS, main_all
+from .utils.logger import setup_logger
+
+logger = setup_logger(__name__, 'logs/scraper.log')
+
+JOBS_FILE = os.path.join(os.path.dirname(__file__), 'downloads', 'scrape_jobs.db')
+
+QUEUED, RUNNING, SUCCEEDED, FAILED = 'queued', 'running', 'succeeded', 'failed'
+# A queued county job folded into an 'all' job (see merged_into)
+COALESCED = 'coalesced'
+ALL_COUNTIES = 'all'
+
+# Runs of one job before a job that keeps killing its worker is failed
+MAX_ATTEMPTS = 3
+# Seconds an idle worker waits before looking at the queue again
+POLL_SECONDS = 5
+
+# host:pid:token of this process; the token tells a restarted process apart
+# from the one that claimed a job when both got the same pid (e.g. pid 1 in
+# a container)
+WORKER_ID = f'{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}'
+
+SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS scrape_jobs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        county TEXT NOT NULL,
+        status TEXT NOT NULL,
+        requested_by TEXT,
+        submissions INTEGER NOT NULL DEFAULT 1,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        worker TEXT,
+        counties_total INTEGER NOT NULL,
+        counties_done INTEGER NOT NULL DEFAULT 0,
+        records INTEGER NOT NULL DEFAULT 0,
+        counties TEXT,
+        error TEXT,
+        merged_into INTEGER,
+        queued_at TEXT NOT NULL,
+        started_at TEXT,
+        finished_at TEXT,
+        updated_at TEXT NOT NULL
+    );
+    CREATE UNIQUE INDEX IF NOT EXISTS uq_scrape_jobs_active_county
+        ON scrape_jobs (county) WHERE status IN ('queued', 'running');
+    CREATE INDEX IF NOT EXISTS idx_scrape_jobs_status ON scrape_jobs (status, id);
+'''
+
+def job_counties(county: str) -> list:
+    """Counties a job scrapes: every county for 'all', else the one named"""
+    return list(COUNTY_URLS) if county == ALL_COUNTIES else [county]
+
+def _now() -> str:
+    return datetime.utcnow().isoformat(timespec='seconds')
+
+def _seconds(start: Optional[str], end: Optional[str]) -> Optional[float]:
+    if not start or not end:
+        return None
+    return (datetime.fromisoformat(end) - datetime.fromisoformat(start)).total_seconds()
+
+def _interrupted(worker: Optional[str]) -> bool:
+    """Whether the process that claimed a job on this host is gone"""
+    try:
+        host, pid, token = worker.split(':')
+        pid = int(pid)
+    except (AttributeError, ValueError):
+        return True
+    if host != socket.gethostname():
+        return False  # Cannot tell from here
+    if pid == os.getpid():
+        return worker != WORKER_ID
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        pass
+    return False
+
+class JobQueue:
+    """
+    SQLite-backed queue of scrape jobs
+
+    Args:
+        path (str): Database file. Defaults to downloads/scrape_jobs.db.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or JOBS_FILE
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        # Autocommit mode; writes take the lock up front in _write()
+        self.conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(SCHEMA)
+        columns = {row['name'] for row in self.conn.execute('PRAGMA table_info(scrape_jobs)')}
+        if 'merged_into' not in columns:  # Queues created before jobs were folded into 'all'
+            self.conn.execute('ALTER TABLE scrape_jobs ADD COLUMN merged_into INTEGER')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    @contextmanager
+    def _write(self):
+        """One transaction holding the write lock from the start, so a read
+        followed by a write (coalescing, claiming) cannot interleave"""
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield
+        except BaseException:
+            self.conn.execute('ROLLBACK')
+            raise
+        self.conn.execute('COMMIT')
+
+    def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """A job as stored, with ``counties`` decoded; None if there is no such job"""
+        row = self.conn.execute('SELECT * FROM scrape_jobs WHERE id = ?', (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job['counties'] = json.loads(job['counties']) if job['counties'] else {}
+        return job
+
+    def enqueue(self, county: str, requested_by: Optional[str] = None) -> Tuple[Dict[str, Any], bool]:
+        """
+        Queue a scrape of one county (or 'all')
+
+        A county is coalesced onto a queued or running job for that county,
+        or onto an 'all' job that has not reached it yet. A new 'all' job
+        takes over the queued county jobs, which are marked coalesced.
+
+        Returns:
+            Tuple: The job and whether it was created; False when the
+            submission was coalesced onto a queued or running job
+        """
+        now = _now()
+        with self._write():
+            active = self._active_job(county)
+            if active:
+                self.conn.execute(
+                    'UPDATE scrape_jobs SET submissions = submissions + 1, updated_at = ? WHERE id = ?',
+                    (now, active['id'])
+                )
+                job_id, created = active['id'], False
+            else:
+                cursor = self.conn.execute('''
+                    INSERT INTO scrape_jobs (county, status, requested_by, counties_total, queued_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', (county, QUEUED, requested_by, len(job_counties(county)), now, now))
+                job_id, created = cursor.lastrowid, True
+                if county == ALL_COUNTIES:
+                    self._merge_queued_counties(job_id, now)
+        if created:
+            logger.info(f"📥 Queued scrape job {job_id} for {county}")
+        return self.get(job_id), created
+
+    def _active_job(self, county: str) -> Optional[sqlite3.Row]:
+        """The queued or running job a submission for ``county`` joins, if any"""
+        active = self.conn.execute(
+            'SELECT id FROM scrape_jobs WHERE county = ? AND status IN (?, ?)', (county, QUEUED, RUNNING)
+        ).fetchone()
+        if active or county == ALL_COUNTIES:
+            return active
+        every = self.conn.execute(
+            'SELECT id, counties FROM scrape_jobs WHERE county = ? AND status IN (?, ?)',
+            (ALL_COUNTIES, QUEUED, RUNNING)
+        ).fetchone()
+        # A running 'all' job that has already scraped the county would hand back stale data
+        if every and county not in json.loads(every['counties'] or '{}'):
+            return every
+        return None
+
+    def _merge_queued_counties(self, job_id: int, now: str) -> None:
+        """Fold the queued county jobs into the new 'all' job ``job_id``"""
+        merged = self.conn.execute(
+            'SELECT id, submissions FROM scrape_jobs WHERE status = ? AND id != ?', (QUEUED, job_id)
+        ).fetchall()
+        if not merged:
+            return
+        self.conn.executemany(
+            'UPDATE scrape_jobs SET status = ?, merged_into = ?, finished_at = ?, updated_at = ? WHERE id = ?',
+            [(COALESCED, job_id, now, now, job['id']) for job in merged]
+        )
+        self.conn.execute(
+            'UPDATE scrape_jobs SET submissions = submissions + ? WHERE id = ?',
+            (sum(job['submissions'] for job in merged), job_id)
+        )
+        logger.info(f"📥 Folded {len(merged)} queued county scrape jobs into job {job_id}")
+
+    def claim(self, worker: str = WORKER_ID) -> Optional[Dict[str, Any]]:
+        """Mark the oldest queued job running for ``worker``; None if the queue is empty"""
+        now = _now()
+        with self._write():
+            queued = self.conn.execute(
+                'SELECT id FROM scrape_jobs WHERE status = ? ORDER BY id LIMIT 1', (QUEUED,)
+            ).fetchone()
+            if queued is None:
+                return None
+            self.conn.execute('''
+                UPDATE scrape_jobs
+                SET status = ?, worker = ?, attempts = attempts + 1, started_at = ?, updated_at = ?
+                WHERE id = ?
+            ''', (RUNNING, worker, now, now, queued['id']))
+        return self.get(queued['id'])
+
+    def progress(self, job_id: int, county: str, result: Dict[str, Any]) -> None:
+        """Record one finished county of a running job"""
+        with self._write():
+            row = self.conn.execute('SELECT counties FROM scrape_jobs WHERE id = ?', (job_id,)).fetchone()
+            counties = json.loads(row['counties']) if row and row['counties'] else {}
+            counties[county] = result
+            self.conn.execute('''
+                UPDATE scrape_jobs
+                SET counties = ?, counties_done = ?, records = ?, updated_at = ?
+                WHERE id = ?
+            ''', (json.dumps(counties), len(counties), sum(entry['records'] for entry in counties.values()),
+                  _now(), job_id))
+
+    def finish(self, job_id: int, report: Optional[Dict[str, Any]] = None, error: Optional[str] = None) -> None:
+        """Close a job with main_all's report, failed if there is an ``error``"""
+        now = _now()
+        with self._write():
+            if report is not None:
+                self.conn.execute('''
+                    UPDATE scrape_jobs SET counties = ?, counties_done = ?, records = ? WHERE id = ?
+                ''', (json.dumps(report['counties']), len(report['counties']), report['records'], job_id))
+            self.conn.execute(
+                'UPDATE scrape_jobs SET status = ?, error = ?, finished_at = ?, updated_at = ? WHERE id = ?',
+                (FAILED if error else SUCCEEDED, error, now, now, job_id)
+            )
+
+    def requeue_interrupted(self) -> int:
+        """
+        Queue again the running jobs whose worker process is gone; a job that
+        has already been tried MAX_ATTEMPTS times is failed instead
+
+        Returns:
+            int: Number of jobs recovered
+        """
+        now = _now()
+        with self._write():
+            running = self.conn.execute(
+                'SELECT id, worker, attempts FROM scrape_jobs WHERE status = ?', (RUNNING,)
+            ).fetchall()
+            stale = [job for job in running if _interrupted(job['worker'])]
+            for job in stale:
+                if job['attempts'] >= MAX_ATTEMPTS:
+                    self.conn.execute('''
+                        UPDATE scrape_jobs SET status = ?, error = ?, finished_at = ?, updated_at = ? WHERE id = ?
+                    ''', (FAILED, f"Interrupted {job['attempts']} times", now, now, job['id']))
+                else:
+                    self.conn.execute('''
+                        UPDATE scrape_jobs
+                        SET status = ?, worker = NULL, started_at = NULL, counties = NULL,
+                            counties_done = 0, records = 0, updated_at = ?
+                        WHERE id = ?
+                    ''', (QUEUED, now, job['id']))
+        if stale:
+            logger.warning(f"⚠️ Recovered {len(stale)} scrape jobs interrupted by a restart")
+        return len(stale)
+
+def job_to_dict(job: Dict[str, Any]) -> Dict[str, Any]:
+    """A stored job as returned by the API"""
+    now = _now()
+    total = job['counties_total']
+    return {
+        'id': job['id'],
+        'county': job['county'],
+        'status': job['status'],
+        'submissions': job['submissions'],
+        'attempts': job['attempts'],
+        'progress': {
+            'countiesDone': job['counties_done'],
+            'countiesTotal': total,
+            'percent': round(100 * job['counties_done'] / total) if total else 0
+        },
+        'records': job['records'],
+        'counties': job['counties'],
+        'error': job['error'],
+        'mergedInto': job['merged_into'],
+        'queuedAt': job['queued_at'],
+        'startedAt': job['started_at'],
+        'finishedAt': job['finished_at'],
+        'waitSeconds': _seconds(job['queued_at'], job['started_at'] or now),
+        'runSeconds': _seconds(job['started_at'], job['finished_at'] or now)
+    }
+
+def run_job(queue: JobQueue, job: Dict[str, Any], scrape: Callable[..., dict] = None) -> Dict[str, Any]:
+    """Run a claimed job through main_all (or ``scrape``) and record the outcome"""
+    scrape = scrape or main_all
+    logger.info(f"🚀 Running scrape job {job['id']} for {job['county']}")
+    try:
+        report = scrape(job_counties(job['county']),
+                        progress=lambda county, result: queue.progress(job['id'], county, result))
+    except Exception as e:
+        logger.error(f"❌ Scrape job {job['id']} failed: {e}")
+        queue.finish(job['id'], error=str(e))
+        return queue.get(job['id'])
+
+    error = None
+    if not report['success']:
+        failed = {county: entry['error'] for county, entry in report['counties'].items() if entry['error']}
+        error = '; '.join(f'{county}: {message}' for county, message in failed.items()) \
+            or 'Scraped data could not be merged'
+    queue.finish(job['id'], report, error)
+    logger.info(f"{'❌' if error else '✅'} Scrape job {job['id']} finished: "
+                f"{report['records']} records in {report['seconds']}s")
+    return queue.get(job['id'])
+
+def run_next_job(queue: JobQueue, worker: str = WORKER_ID,
+                 scrape: Callable[..., dict] = None) -> Optional[Dict[str, Any]]:
+    """Claim and run the oldest queued job; None if there was nothing to run"""
+    job = queue.claim(worker)
+    return run_job(queue, job, scrape) if job else None
+
+class ScrapeWorker(threading.Thread):
+    """
+    Daemon thread that runs queued scrape jobs one after another
+
+    Args:
+        path (str): Queue database file. Defaults to downloads/scrape_jobs.db.
+        poll_seconds (float): How long to sleep when the queue is empty,
+            unless woken by wake()
+    """
+
+    def __init__(self, path: Optional[str] = None, poll_seconds: float = POLL_SECONDS):
+        super().__init__(name='scrape-worker', daemon=True)
+        self.path = path
+        self.poll_seconds = poll_seconds
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+
+    def wake(self):
+        """Look at the queue now instead of after the poll interval"""
+        self._wake.set()
+
+    def stop(self):
+        self._stopping.set()
+        self._wake.set()
+
+    def run(self):
+        with JobQueue(self.path) as queue:
+            queue.requeue_interrupted()
+            while not self._stopping.is_set():
+                try:
+                    if run_next_job(queue):
+                        continue
+                except Exception as e:
+                    logger.error(f"❌ Scrape worker error: {e}")
+                self._wake.wait(self.poll_seconds)
+                self._wake.clear()
+
+_worker: Optional[ScrapeWorker] = None
+_worker_lock = threading.Lock()
+# Open lock file while this process is the host's worker; closing it releases the lock
+_host_lock = None
+
+def _lock_host(path: str) -> bool:
+    """Take the per-host worker lock next to the queue file; False if another process holds it"""
+    global _host_lock
+    if _host_lock is not None or fcntl is None:
+        return True
+    lock = open(path + '.lock', 'a')
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        lock.close()
+        return False
+    _host_lock = lock
+    return True
+
+def start_worker(path: Optional[str] = None) -> Optional[ScrapeWorker]:
+    """
+    The process's scrape worker, started if it is not running
+
+    Returns:
+        ScrapeWorker: The worker, or None when another process on this host
+        runs it; that worker still picks up new jobs within POLL_SECONDS
+    """
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            path = path or JOBS_FILE
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            if not _lock_host(path):
+                return None
+            _worker = ScrapeWorker(path)
+            _worker.start()
+            logger.info("🧵 Started scrape worker")
+        return _worker
+
+if __name__ == "__main__":
+    # Standalone worker, e.g. when the API runs with several processes
+    worker = start_worker()
+    if worker is None:
+        raise SystemExit("Another process on this host is running the scrape worker")
+    try:
+        worker.join()
+    except KeyboardInterrupt:
+        worker.stop()
@@ -3,12 +3,19 @@ import os
 import logging
 import pandas as pd
 import json
-from .scraper import parse_page_selenium
+from .scraper import parse_page
+from .async_fetcher import fetch_pages
+from .driver_pool import DriverPool
 from .database import connect_db, create_table, insert_data, close_db
 from .merge_csv import merge_csv_files
+from .scrape_state import ScrapeState, summarize
+from .scrape_store import ScrapeStore
+from .detail_scraper import scrape_details
 from .utils.logger import setup_logger
 from .utils.exceptions import ScraperException, DatabaseException, NetworkException
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 logger = setup_logger(__name__, 'logs/scraper.log')
 
@@ -21,6 +28,9 @@ COUNTY_URLS = {
     'Hudson': {'id': 10, 'url': 'https://salesweb.civilview.com/Sales/SalesSearch?countyId=10'}
 }
 
+# Upper bound on headless browsers running at once in main_all
+MAX_BROWSERS = len(COUNTY_URLS)
+
 def format_zillow_url(address):
     """Convert the address to a Zillow URL format."""
     try:
@@ -71,12 +81,111 @@ def export_formatted_data(formatted_data, output_file):
     except Exception as e:
         logging.error(f"Error exporting frontend data: {e}")
 
-def main(county='Morris') -> bool:
+def scrape_county(county, pool=None, pages=None):
+    """
+    Scrape the sale listings of one county
+
+    Args:
+        county (str): A key of COUNTY_URLS
+        pool (DriverPool): Browsers for the Selenium fallback. Defaults to the shared pool.
+        pages (dict): Listing pages already fetched over HTTP, keyed by URL
+
+    Returns:
+        list: Scraped records tagged with the county
+
+    Raises:
+        ScraperException: If the county is unknown or nothing was scraped
+    """
+    if county not in COUNTY_URLS:
+        raise ScraperException(f"Invalid county: {county}")
+
+    url = COUNTY_URLS[county]['url']
+    logger.info(f"🔄 Starting page scrape for {county} County: {url}")
+
+    data = parse_page(url, pool=pool, pages=pages)
+    if not data:
+        raise ScraperException(f"No data returned from scraping {county} County")
+
+    # Add county information to each record
+    for item in data:
+        item['county'] = county
+    return data
+
+def merge_results(data, removed=()):
+    """
+    Upsert scraped records into the scrape store
+
+    Args:
+        data (list): Records from one or more counties
+        removed (list): property_ids no longer listed by their county
+
+    Returns:
+        str: Path of the scrape store
+    """
+    # Generate Zillow URLs for the records being written
+    logger.info("🏠 Generating Zillow URLs")
+    for item in data:
+        if not item.get('Zillow URL'):
+            try:
+                item['Zillow URL'] = format_zillow_url(item['address'])
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to generate Zillow URL for address {item.get('address')}: {e}")
+
+    logger.info("💾 Saving merged data")
+    with ScrapeStore() as store:
+        written = store.upsert(data)
+        if removed:
+            store.mark_removed(removed)
+    logger.info(f"✅ {written} listings saved to {store.path}")
+    return store.path
+
+def process_changes(changes, state, rows=(), details=True):
+    """
+    Send the new and changed listings of one or more diffs downstream
+
+    When ``details`` is set the SaleDetails pages of the scraped ``rows`` are
+    scraped first, skipping listings whose details are up to date. A listing
+    that gained details is merged even if its row did not change, so details
+    that failed on an earlier run are filled in later.
+
+    Args:
+        changes (list): Change reports from ScrapeState.diff
+        state (ScrapeState): Scrape state holding the stored details
+        rows (list): Every row scraped in this run
+        details (bool): Scrape detail pages
+
+    Returns:
+        int: Number of listings processed
+    """
+    downstream = {id(row): row for report in changes for row in report['added'] + report['updated']}
+    if details:
+        scraped = scrape_details(list(rows), state)
+        for row in rows:
+            if str(row.get('property_id')) in scraped:
+                downstream[id(row)] = row
+
+    changed = list(downstream.values())
+    stored = state.details(str(row['property_id']) for row in changed if row.get('property_id'))
+    for row in changed:
+        row.update(stored.get(str(row.get('property_id')), {}))
+
+    removed = [property_id for report in changes for property_id in report['removed']]
+    if changed or removed:
+        merge_results(changed, removed)
+    else:
+        logger.info("✅ No new, changed or removed listings; scrape store left as is")
+    return len(changed)
+
+def main(county='Morris', details=True) -> bool:
     """
     Main scraper execution function
+
+    Only listings that are new or changed since the last run are merged; the
+    change report is logged and kept in the scrape state.
     
     Args:
         county (str): The county to scrape data from. Defaults to 'Morris'.
+        details (bool): Also scrape the SaleDetails pages of new and changed listings
         
     Returns:
         bool: True if scraping completed successfully, False otherwise
@@ -86,67 +195,12 @@ def main(county='Morris') -> bool:
         if county not in COUNTY_URLS:
             logger.error(f"❌ Invalid county: {county}")
             return False
-            
-        # Get county URL
-        url = COUNTY_URLS[county]['url']
-        county_id = COUNTY_URLS[county]['id']
-        
-        # Ensure downloads folder exists
-        downloads_folder = os.path.join(os.path.dirname(__file__), 'downloads')
-        os.makedirs(downloads_folder, exist_ok=True)
-        
-        # Step 1: Scrape auction data
-        logger.info(f"🔄 Starting page scrape for {county} County: {url}")
-        
-        data = parse_page_selenium(url)
-        if not data:
-            raise ScraperException(f"No data returned from scraping {county} County")
-
-        # Add county information to each record
-        for item in data:
-            item['county'] = county
-
-        # Step 2: Load existing data from merged_data.csv if it exists
-        output_file = os.path.join(downloads_folder, 'merged_data.csv')
-        existing_data = []
-        if os.path.exists(output_file):
-            try:
-                existing_df = pd.read_csv(output_file)
-                existing_data = existing_df.to_dict('records')
-            except Exception as e:
-                logger.warning(f"⚠️ Could not read existing merged_data.csv: {e}")
 
-        # Step 3: Update existing data with new data
-        # Create a dictionary of existing data keyed by address for quick lookup
-        existing_data_dict = {item['address']: item for item in existing_data}
-        
-        # Update or add new data
-        for item in data:
-            if item['address'] in existing_data_dict:
-                # Update existing entry
-                existing_data_dict[item['address']].update(item)
-            else:
-                # Add new entry
-                existing_data_dict[item['address']] = item
-
-        # Convert back to list
-        merged_data = list(existing_data_dict.values())
-
-        # Step 4: Generate Zillow URLs for new entries
-        logger.info("🏠 Generating Zillow URLs")
-        for item in merged_data:
-            if 'Zillow URL' not in item or not item['Zillow URL']:
-                try:
-                    item['Zillow URL'] = format_zillow_url(item['address'])
-                except Exception as e:
-                    logger.warning(f"⚠️ Failed to generate Zillow URL for address {item['address']}: {e}")
-
-        # Step 5: Save merged data
-        logger.info("💾 Saving merged data")
-        df = pd.DataFrame(merged_data)
-        df.to_csv(output_file, index=False)
-        logger.info(f"✅ Data saved successfully to {output_file}")
-            
+        data = scrape_county(county)
+        with ScrapeState() as state:
+            changes = state.diff(county, data)
+            process_changes([changes], state, data, details)
+            state.record(changes)
         return True
             
     except Exception as e:
@@ -154,15 +208,113 @@ def main(county='Morris') -> bool:
         traceback.print_exc()
         return False
 
+def _timed_scrape(county, pool, pages):
+    started = time.perf_counter()
+    data = scrape_county(county, pool, pages)
+    return data, time.perf_counter() - started
+
+def main_all(counties=None, max_browsers=MAX_BROWSERS, details=True, progress=None) -> dict:
+    """
+    Scrape several counties concurrently and merge the results once
+
+    The listing pages of every county are fetched over HTTP in one batch, so
+    they share one pooled session and the per-host rate limit. Each county is
+    then parsed in its own worker; a county that needs the Selenium fallback
+    borrows a browser from a DriverPool of ``max_browsers``, so at most that
+    many run at once. A county that fails is reported and the others are
+    still merged. Only new and changed listings are merged.
+
+    Args:
+        counties (list): Counties to scrape. Defaults to every county in COUNTY_URLS.
+        max_browsers (int): Upper bound on concurrently running browsers
+        details (bool): Also scrape the SaleDetails pages of new and changed listings
+        progress (callable): Called with ``(county, result)`` as each county
+            finishes scraping, before the results are merged
+
+    Returns:
+        dict: ``success`` (every county scraped and merged), total ``records``
+        and ``seconds``, the ``fetch_seconds`` spent on the shared HTTP fetch,
+        and per-county ``records``/``seconds``/``error`` and ``changes``
+        (added/updated/removed/unchanged counts)
+    """
+    counties = list(counties or COUNTY_URLS)
+    started = time.perf_counter()
+    report = {'success': False, 'records': 0, 'seconds': 0.0, 'fetch_seconds': 0.0, 'counties': {}}
+    results = {}
+
+    pages = fetch_pages(COUNTY_URLS[county]['url'] for county in counties if county in COUNTY_URLS)
+    report['fetch_seconds'] = round(time.perf_counter() - started, 2)
+
+    workers = max(1, min(max_browsers, len(counties)))
+    logger.info(f"🔄 Scraping {len(counties)} counties with up to {workers} browsers")
+    with DriverPool(size=workers) as browsers, \
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix='county-scraper') as pool:
+        futures = {pool.submit(_timed_scrape, county, browsers, pages): county for county in counties}
+        for future in as_completed(futures):
+            county = futures[future]
+            try:
+                data, seconds = future.result()
+                results[county] = data
+                report['counties'][county] = {'records': len(data), 'seconds': round(seconds, 2), 'error': None,
+                                              'changes': None}
+                logger.info(f"✅ {county} County: {len(data)} records in {seconds:.1f}s")
+            except Exception as e:
+                report['counties'][county] = {'records': 0, 'seconds': None, 'error': str(e), 'changes': None}
+                logger.error(f"❌ {county} County failed: {e}")
+            if progress:
+                progress(county, report['counties'][county])
+
+    merged = False
+    records = sum(len(data) for data in results.values())
+    if results:
+        try:
+            with ScrapeState() as state:
+                changes = [state.diff(county, data) for county, data in results.items()]
+                process_changes(changes, state, [row for data in results.values() for row in data], details)
+                for county_changes in changes:
+                    state.record(county_changes)
+                    report['counties'][county_changes['county']]['changes'] = summarize(county_changes)
+            merged = True
+        except Exception as e:
+            logger.error(f"❌ Error merging scraped data: {e}")
+            traceback.print_exc()
+
+    report['records'] = records
+    report['seconds'] = round(time.perf_counter() - started, 2)
+    report['success'] = merged and all(entry['error'] is None for entry in report['counties'].values())
+    logger.info(f"⏱️ Scraped {records} records from {len(counties)} counties in {report['seconds']}s")
+    return report
+
 if __name__ == "__main__":
     import argparse
     parser = argparse.ArgumentParser(description='Run the foreclosure scraper')
     parser.add_argument('--county', type=str, default='Morris', 
-                        choices=list(COUNTY_URLS.keys()),
-                        help='County to scrape data from')
+                        choices=list(COUNTY_URLS.keys()) + ['all'],
+                        help='County to scrape data from, or "all" to scrape every county concurrently')
+    parser.add_argument('--browsers', type=int, default=MAX_BROWSERS,
+                        help='Maximum number of concurrent browsers when scraping all counties')
+    parser.add_argument('--skip-details', action='store_true',
+                        help='Do not scrape the SaleDetails page of new and changed listings')
+    parser.add_argument('--export-csv', nargs='?', const='', default=None, metavar='PATH',
+                        help='Export the scrape store to CSV afterwards (downloads/scraped_listings.csv by default)')
+    parser.add_argument('--parquet', action='store_true',
+                        help='Write a Parquet snapshot of the scrape store afterwards')
     args = parser.parse_args()
     
-    success = main(args.county)
+    if args.county == 'all':
+        report = main_all(max_browsers=args.browsers, details=not args.skip_details)
+        for county, result in report['counties'].items():
+            logger.info(f"   {county}: {result['records']} records, {result['seconds']}s, "
+                        f"changes={result['changes']}, error={result['error']}")
+        success = report['success']
+    else:
+        success = main(args.county, details=not args.skip_details)
+    if args.export_csv is not None or args.parquet:
+        with ScrapeStore() as store:
+            if args.export_csv is not None:
+                store.export_csv(args.export_csv or None)
+            if args.parquet:
+                store.snapshot_parquet()
     if success:
         logger.info(f"✅ Script completed successfully for {args.county} County")
         sys.exit(0)
@@ -171,6 +323,8 @@ if __name__ == "__main__":
         sys.exit(1)
         
 # In order to start the scraper you will need to run the following command:
-# 1. `python main.py --county Morris`
-# 2. `viewer.py` to view the data in the frontend and add extra data from the Details
-#    links that you will have to manually click on.
\ No newline at end of file
+# 1. `python -m services.scraper.main --county Morris` from backend/ (or `--county all` to
+#    scrape every county at once). Listings are kept in downloads/scrape_store.db; add
+#    `--export-csv` for a CSV copy.
+# 2. `python -m services.scraper.viewer` to review the listings and correct the details
+#    scraped from the Details links.
\ No newline at end of file
@@ -1,12 +1,9 @@
-from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
 import logging
 import pandas as pd
-import time
+from .driver_pool import get_pool, wait_for, TimeoutException
+from .parsers import parse_ag_grid_rows
+from .scrape_store import ScrapeStore
 
 # Configure logging
 logging.basicConfig(
@@ -33,61 +30,37 @@ def extract_primary_name(defendant):
         logging.error(f"Error extracting primary name: {e}")
         return defendant.strip()
 
-def fetch_page_selenium(search_query):
-    """Fetch the search results page using Selenium."""
-    # Set up Chrome options
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")  # Run in headless mode
-    chrome_options.add_argument("--disable-gpu")  # Disable GPU
-    chrome_options.add_argument("--no-sandbox")  # Bypass OS security model
-    
-    # Update the path to ChromeDriver
-    service = Service(executable_path='services\\scraper\\chromedriver.exe')
-    # service = Service(executable_path='/Users/jchee/Downloads/chromedriver-mac-x64/chromedriver')  # Update this path as needed
-
-    # Initialize WebDriver
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-
+def fetch_page_selenium(search_query, pool=None):
+    """Fetch the search results page with a browser from the shared driver pool."""
     try:
-        # Open the website
-        url = "https://mcclerksng.co.morris.nj.us/publicsearch/"
-        driver.get(url)
-        logging.info(f"Opened URL: {url}")
-        time.sleep(3)  # Wait for the page to load
-
-        # Locate the search bar and enter the defendant's name
-        search_box = driver.find_element(By.CSS_SELECTOR, "input[name='partyName']")  # Match provided selector
-        search_box.send_keys(search_query)
-        search_box.send_keys(Keys.RETURN)
-        logging.info(f"Performed search with query: {search_query}")
-        time.sleep(5)  # Wait for search results to load
-
-        # Return the page source
-        return driver.page_source
+        with (pool or get_pool()).driver() as driver:
+            # Open the website
+            url = "https://mcclerksng.co.morris.nj.us/publicsearch/"
+            driver.get(url)
+            logging.info(f"Opened URL: {url}")
+
+            # Locate the search bar once it is usable and enter the defendant's name
+            search_box = wait_for(driver, "input[name='partyName']", clickable=True)
+            search_box.send_keys(search_query)
+            search_box.send_keys(Keys.RETURN)
+            logging.info(f"Performed search with query: {search_query}")
+            try:
+                wait_for(driver, "div.ag-row")  # Wait for search results to load
+            except TimeoutException:
+                logging.info(f"No result rows appeared for query: {search_query}")
+
+            # Return the page source
+            return driver.page_source
 
     except Exception as e:
         logging.error(f"Error fetching page for query '{search_query}': {e}")
         return None
-    finally:
-        driver.quit()
 
 def parse_table(html):
     """Parse the HTML and extract table data."""
     data = []
     try:
-        soup = BeautifulSoup(html, "html.parser")
-        rows = soup.find_all("div", class_="ag-row")
-
-        for row in rows:
-            row_data = {}
-            cells = row.find_all("div", class_="ag-cell")
-            for cell in cells:
-                colid = cell.get("colid")  # Extract colid
-                value = cell.text.strip()  # Extract cell text
-                if colid:
-                    row_data[colid] = value
-            if row_data:
-                data.append(row_data)
+        data = parse_ag_grid_rows(html)
         logging.info(f"Extracted {len(data)} rows from the table.")
     except Exception as e:
         logging.error(f"Error parsing table: {e}")
@@ -111,12 +84,13 @@ def retry_prompt(defendant):
 
 def main():
     """Main function to run the scraper."""
-    # Load merged_data.csv
+    # Load the Morris listings from the scrape store
     try:
-        merged_data = pd.read_csv("merged_data.csv")
+        with ScrapeStore() as store:
+            merged_data = pd.DataFrame(store.listings(county='Morris'), columns=['defendant'])
     except Exception as e:
-        logging.error(f"Failed to load merged_data.csv: {e}")
-        print("Failed to load merged_data.csv.")
+        logging.error(f"Failed to load the scrape store: {e}")
+        print("Failed to load the scrape store.")
         return
 
     # Iterate through defendants and search for each
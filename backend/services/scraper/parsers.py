@@ -0,0 +1,262 @@
+"""
+HTML parsers for the scraped pages
+
+Only a small part of each page matters: the ``table.table-striped`` listing
+on civilview SalesSearch pages, the label/value table on SaleDetails pages
+and the ``div.ag-row`` grid rows on the Morris clerk search. With lxml available the page is parsed by libxml2 and the rows
+are picked out with XPath; otherwise BeautifulSoup builds a tree of just the
+target elements through a SoupStrainer instead of the whole document. Both
+engines return the same rows.
+"""
+import re
+from datetime import datetime
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from .utils.logger import setup_logger
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:  # Optional: fall back to html.parser
+    lxml = None
+
+logger = setup_logger(__name__, 'logs/scraper.log')
+
+# BeautifulSoup tree builder for pages that are parsed in full
+HTML_PARSER = 'lxml' if lxml else 'html.parser'
+
+CIVILVIEW_URL = 'https://salesweb.civilview.com'
+
+COUNTY_NAMES = {
+    'countyId=7': 'Bergen County',
+    'countyId=10': 'Hudson County',
+    'countyId=2': 'Essex County',
+    'countyId=9': 'Morris County',
+    'countyId=15': 'Union County',
+    'countyId=19': 'Sussex County',
+    'countyId=21': 'Warren County'
+}
+
+# Listing columns after the detail link; Hudson County lists the address before the parties
+STANDARD_COLUMNS = ('sheriff_number', 'status_date', 'plaintiff', 'defendant', 'address', 'price')
+HUDSON_COLUMNS = ('sheriff_number', 'status_date', 'address', 'plaintiff', 'defendant', 'price')
+
+# SaleDetails labels (lower case, without the trailing colon) and the auctions column each fills
+DETAIL_LABELS = {
+    'court case #': 'court_case',
+    'sales date': 'sale_date',
+    'sale date': 'sale_date',
+    'description': 'description',
+    'approx. upset*': 'upset_amount',
+    'approx. upset': 'upset_amount',
+    'attorney': 'attorney'
+}
+DETAIL_FIELDS = ('court_case', 'sale_date', 'description', 'upset_amount', 'attorney')
+
+_LISTING_TABLE_XPATH = '//table[contains(concat(" ", normalize-space(@class), " "), " table-striped ")]'
+_AG_ROW_XPATH = '//div[contains(concat(" ", normalize-space(@class), " "), " ag-row ")]'
+_AG_CELL_XPATH = './/div[contains(concat(" ", normalize-space(@class), " "), " ag-cell ")]'
+
+def _has_class(name):
+    """Strainer matcher for one class token (strainers may see the raw class attribute)"""
+    return re.compile(rf'(^|\s){re.escape(name)}(\s|$)')
+
+def convert_date_format(date_str):
+    """Convert date string from 'MM/DD/YYYY' to 'YYYY-MM-DD' if needed."""
+    try:
+        return datetime.strptime(date_str, '%m/%d/%Y').strftime('%Y-%m-%d')
+    except ValueError:
+        logger.error(f"Date conversion error for date: {date_str}")
+        return date_str  # Return original if error occurs
+
+def county_for_url(url):
+    """County name for a civilview URL, or None"""
+    for county_id, county_name in COUNTY_NAMES.items():
+        if county_id in url:
+            return county_name
+    return None
+
+def listing_columns(url):
+    """Column order of the listing table behind a civilview URL"""
+    return HUDSON_COLUMNS if 'countyId=10' in url else STANDARD_COLUMNS
+
+def build_listing_row(href, texts, columns, county):
+    """
+    Turn one listing row into a record
+
+    Args:
+        href (str): Detail link from the first cell
+        texts (list): Stripped text of the remaining cells
+        columns (tuple): Field name of each remaining cell
+        county (str): County name for the record
+
+    Raises:
+        ValueError: If the detail link has no PropertyId or the price is not a number
+    """
+    if not href or "PropertyId=" not in href:
+        raise ValueError("Invalid detail link: Missing 'PropertyId'")
+
+    row = {
+        'detail_link': f"{CIVILVIEW_URL}{href}",
+        'property_id': href.split("PropertyId=")[-1]
+    }
+    for index, field in enumerate(columns):
+        value = texts[index] if index < len(texts) else None
+        if field == 'price':
+            value = int(value.replace('$', '').replace(',', '')) if value else 0
+        elif field == 'status_date' and value is not None:
+            value = convert_date_format(value)
+        row[field] = value
+    row['county'] = county
+    return row
+
+def _lxml_document(html):
+    """
+    Parse a page with lxml, or return None where BeautifulSoup finds nothing
+
+    lxml refuses a str that carries an XML encoding declaration, so such a
+    page is parsed from its UTF-8 bytes; an empty or whitespace-only page
+    raises ParserError.
+    """
+    try:
+        try:
+            return lxml.html.fromstring(html)
+        except ValueError:
+            return lxml.html.fromstring(html.encode('utf-8'), parser=lxml.html.HTMLParser(encoding='utf-8'))
+    except (etree.ParserError, ValueError) as e:
+        logger.warning(f"lxml could not parse page: {e}")
+        return None
+
+def _lxml_listing_cells(html):
+    document = _lxml_document(html)
+    if document is None:
+        return None
+    tables = document.xpath(_LISTING_TABLE_XPATH)
+    if not tables:
+        return None
+    return [
+        (next(iter(cells[0].xpath('.//a/@href')), None) if cells else None,
+         [cell.text_content().strip() for cell in cells[1:]])
+        for cells in (row.xpath('./td') for row in tables[0].xpath('./tbody/tr'))
+    ]
+
+def _soup_listing_cells(html):
+    strainer = SoupStrainer('table', class_=_has_class('table-striped'))
+    table = BeautifulSoup(html, 'html.parser', parse_only=strainer).find('table')
+    if not table:
+        return None
+    tbody = table.find('tbody')
+    rows = []
+    for row in (tbody.find_all('tr') if tbody else []):
+        cells = row.find_all('td')
+        link = cells[0].find('a', href=True) if cells else None
+        rows.append((link['href'] if link else None, [cell.text.strip() for cell in cells[1:]]))
+    return rows
+
+def parse_listing_table(html, url, engine=None):
+    """
+    Extract listing rows from a civilview SalesSearch page
+
+    Args:
+        html (str): Page source
+        url (str): Page URL; selects the county and its column order
+        engine (str): 'lxml' or 'soup'. Defaults to lxml when installed.
+
+    Returns:
+        list: Row dicts, or None if the page has no listing table
+    """
+    if not html:
+        return None
+    engine = engine or ('lxml' if lxml else 'soup')
+    cells = _lxml_listing_cells(html) if engine == 'lxml' else _soup_listing_cells(html)
+    if cells is None:
+        return None
+
+    columns = listing_columns(url)
+    county = county_for_url(url)
+    data = []
+    for href, texts in cells:
+        try:
+            data.append(build_listing_row(href, texts, columns, county))
+        except Exception as e:
+            logger.error(f"Error parsing row: {e}")
+    return data
+
+def _detail_label(text):
+    return re.sub(r'\s+', ' ', text).strip().rstrip(':').strip().lower()
+
+def _lxml_detail_pairs(html):
+    document = _lxml_document(html)
+    if document is None:
+        return
+    for table in document.xpath(_LISTING_TABLE_XPATH):
+        for row in table.xpath('.//tr[count(td) = 2]'):
+            label, value = row.xpath('./td')
+            yield label.text_content(), value.text_content()
+
+def _soup_detail_pairs(html):
+    strainer = SoupStrainer('table', class_=_has_class('table-striped'))
+    for row in BeautifulSoup(html, 'html.parser', parse_only=strainer).find_all('tr'):
+        cells = row.find_all('td', recursive=False)
+        if len(cells) == 2:
+            yield cells[0].text, cells[1].text
+
+def parse_detail_page(html, engine=None):
+    """
+    Extract the auction details from a civilview SaleDetails page
+
+    Args:
+        html (str): Page source
+        engine (str): 'lxml' or 'soup'. Defaults to lxml when installed.
+
+    Returns:
+        dict: DETAIL_FIELDS found on the page (sale_date as YYYY-MM-DD), or
+        None if the page has no details table
+    """
+    if not html:
+        return None
+    engine = engine or ('lxml' if lxml else 'soup')
+    pairs = list(_lxml_detail_pairs(html) if engine == 'lxml' else _soup_detail_pairs(html))
+    if not pairs:
+        return None
+
+    details = dict.fromkeys(DETAIL_FIELDS)
+    for label, value in pairs:
+        field = DETAIL_LABELS.get(_detail_label(label))
+        if field and details[field] is None:
+            value = re.sub(r'\s+', ' ', value).strip()
+            details[field] = convert_date_format(value) if field == 'sale_date' and value else value or None
+    return details
+
+def parse_ag_grid_rows(html, engine=None):
+    """
+    Extract ag-grid rows as dicts of colid -> cell text
+
+    Args:
+        html (str): Page source
+        engine (str): 'lxml' or 'soup'. Defaults to lxml when installed.
+
+    Returns:
+        list: One dict per row that has at least one cell with a colid
+    """
+    if not html:
+        return []
+    engine = engine or ('lxml' if lxml else 'soup')
+    data = []
+    if engine == 'lxml':
+        document = _lxml_document(html)
+        for row in (document.xpath(_AG_ROW_XPATH) if document is not None else []):
+            row_data = {cell.get('colid'): cell.text_content().strip()
+                        for cell in row.xpath(_AG_CELL_XPATH) if cell.get('colid')}
+            if row_data:
+                data.append(row_data)
+        return data
+
+    soup = BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer('div', class_=_has_class('ag-row')))
+    for row in soup.find_all('div', class_='ag-row'):
+        row_data = {cell.get('colid'): cell.text.strip()
+                    for cell in row.find_all('div', class_='ag-cell') if cell.get('colid')}
+        if row_data:
+            data.append(row_data)
+    return data
@@ -0,0 +1,237 @@
+"""
+Scrape state for incremental runs
+
+Every listing seen on a civilview SalesSearch page is remembered by its
+``property_id`` with a hash of the listing's content and its ``status_date``.
+Comparing a fresh scrape with that state splits it into added, updated and
+unchanged listings, plus the listings that disappeared from the county's
+page. Only added and updated rows need to go downstream (detail pages, Zillow
+enrichment, import); the state is recorded once they have been processed, so
+a failed run is simply redone next time. Details scraped from SaleDetails
+pages are kept alongside, with the hash of the listing they were read for.
+
+    with ScrapeState() as state:
+        changes = state.diff('Morris', rows)
+        process(changes['added'] + changes['updated'])
+        state.record(changes)
+"""
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from .parsers import DETAIL_FIELDS, STANDARD_COLUMNS
+from .utils.logger import setup_logger
+
+logger = setup_logger(__name__, 'logs/scraper.log')
+
+STATE_FILE = os.path.join(os.path.dirname(__file__), 'downloads', 'scrape_state.db')
+
+# Listing fields that make up a row's content hash
+LISTING_FIELDS = ('detail_link',) + STANDARD_COLUMNS
+
+SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS listing_state (
+        property_id TEXT PRIMARY KEY,
+        county TEXT NOT NULL,
+        content_hash TEXT NOT NULL,
+        status_date TEXT,
+        first_seen TEXT NOT NULL,
+        last_seen TEXT NOT NULL,
+        removed_at TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_listing_state_county ON listing_state (county, removed_at);
+    CREATE TABLE IF NOT EXISTS scrape_runs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        county TEXT NOT NULL,
+        run_at TEXT NOT NULL,
+        added INTEGER NOT NULL,
+        updated INTEGER NOT NULL,
+        removed INTEGER NOT NULL,
+        unchanged INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS listing_details (
+        property_id TEXT PRIMARY KEY,
+        listing_hash TEXT NOT NULL,
+        court_case TEXT,
+        sale_date TEXT,
+        description TEXT,
+        upset_amount TEXT,
+        attorney TEXT,
+        scraped_at TEXT NOT NULL
+    );
+'''
+
+def listing_hash(row: Dict[str, Any]) -> str:
+    """Stable hash of a listing's scraped content"""
+    content = json.dumps([row.get(field) for field in LISTING_FIELDS], default=str)
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+def summarize(changes: Dict[str, Any]) -> Dict[str, int]:
+    """Counts of a change report, as stored in scrape_runs"""
+    return {
+        'added': len(changes['added']),
+        'updated': len(changes['updated']),
+        'removed': len(changes['removed']),
+        'unchanged': changes['unchanged']
+    }
+
+class ScrapeState:
+    """
+    SQLite-backed record of the listings seen by earlier runs
+
+    Args:
+        path (str): Database file. Defaults to downloads/scrape_state.db.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or STATE_FILE
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def _select(self, columns: str, table: str, property_ids: Optional[Iterable[str]]) -> List[tuple]:
+        if property_ids is None:
+            return self.conn.execute(f'SELECT property_id, {columns} FROM {table}').fetchall()
+        property_ids = list(property_ids)
+        rows = []
+        # Stay below SQLite's bound-parameter limit
+        for start in range(0, len(property_ids), 500):
+            chunk = property_ids[start:start + 500]
+            placeholders = ','.join('?' * len(chunk))
+            rows.extend(self.conn.execute(
+                f'SELECT property_id, {columns} FROM {table} WHERE property_id IN ({placeholders})', chunk
+            ))
+        return rows
+
+    def hashes(self, property_ids: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """Recorded content hash per property_id (all listings if None)"""
+        return dict(self._select('content_hash', 'listing_state', property_ids))
+
+    def detail_hashes(self, property_ids: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """Hash of the listing each stored detail record was scraped for"""
+        return dict(self._select('listing_hash', 'listing_details', property_ids))
+
+    def details(self, property_ids: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Stored SaleDetails fields per property_id"""
+        return {
+            row[0]: dict(zip(DETAIL_FIELDS, row[1:]))
+            for row in self._select(', '.join(DETAIL_FIELDS), 'listing_details', property_ids)
+        }
+
+    def record_details(self, details: Dict[str, Dict[str, Any]], listing_hashes: Dict[str, str]) -> None:
+        """Upsert a batch of scraped details with one executemany"""
+        now = datetime.utcnow().isoformat(timespec='seconds')
+        columns = ', '.join(DETAIL_FIELDS)
+        with self.conn:
+            self.conn.executemany(f'''
+                INSERT OR REPLACE INTO listing_details (property_id, listing_hash, {columns}, scraped_at)
+                VALUES (?, ?, {', '.join('?' * len(DETAIL_FIELDS))}, ?)
+            ''', [
+                (property_id, listing_hashes[property_id], *(fields.get(f) for f in DETAIL_FIELDS), now)
+                for property_id, fields in details.items()
+            ])
+
+    def edit_details(self, property_id: str, details: Dict[str, Any]) -> None:
+        """
+        Store a manual correction of a listing's details
+
+        The edit keeps the listing hash of the details it replaces (or of the
+        listing as last scraped), so it is not scraped over until the listing
+        itself changes, and process_changes merges it like scraped details.
+        """
+        fields = [field for field in DETAIL_FIELDS if field in details]
+        if not fields:
+            return
+        property_id = str(property_id)
+        with self.conn:
+            self.conn.execute(f'''
+                INSERT INTO listing_details (property_id, listing_hash, {', '.join(fields)}, scraped_at)
+                VALUES (?, COALESCE((SELECT content_hash FROM listing_state WHERE property_id = ?), ''),
+                        {', '.join('?' * len(fields))}, ?)
+                ON CONFLICT (property_id) DO UPDATE SET
+                    {', '.join(f'{field} = excluded.{field}' for field in fields)},
+                    scraped_at = excluded.scraped_at
+            ''', [property_id, property_id] + [details[field] for field in fields]
+                   + [datetime.utcnow().isoformat(timespec='seconds')])
+
+    def diff(self, county: str, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Compare one county's scrape with the recorded state
+
+        Rows without a property_id cannot be tracked and are always reported
+        as added. Nothing is written until record() is called.
+
+        Returns:
+            dict: ``county``, ``added`` and ``updated`` rows, ``removed``
+            property_ids, the ``unchanged`` count and the ``hashes`` of the
+            tracked rows
+        """
+        changes = {'county': county, 'added': [], 'updated': [], 'removed': [], 'unchanged': 0, 'hashes': {}}
+        tracked = {}
+        for row in rows:
+            if row.get('property_id'):
+                tracked[str(row['property_id'])] = row  # A repeated listing keeps its last row
+            else:
+                changes['added'].append(row)
+
+        known = self.hashes(tracked)
+        for property_id, row in tracked.items():
+            content_hash = listing_hash(row)
+            changes['hashes'][property_id] = content_hash
+            if property_id not in known:
+                changes['added'].append(row)
+            elif known[property_id] != content_hash:
+                changes['updated'].append(row)
+            else:
+                changes['unchanged'] += 1
+
+        listed = self.conn.execute(
+            'SELECT property_id FROM listing_state WHERE county = ? AND removed_at IS NULL', (county,)
+        )
+        changes['removed'] = [property_id for (property_id,) in listed if property_id not in tracked]
+        return changes
+
+    def record(self, changes: Dict[str, Any]) -> None:
+        """Store the hashes of a processed diff and log it as a run"""
+        now = datetime.utcnow().isoformat(timespec='seconds')
+        status_dates = {
+            str(row['property_id']): row.get('status_date')
+            for row in changes['added'] + changes['updated'] if row.get('property_id')
+        }
+        with self.conn:
+            self.conn.executemany('''
+                INSERT INTO listing_state (property_id, county, content_hash, status_date, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (property_id) DO UPDATE SET
+                    county = excluded.county,
+                    content_hash = excluded.content_hash,
+                    status_date = COALESCE(excluded.status_date, listing_state.status_date),
+                    last_seen = excluded.last_seen,
+                    removed_at = NULL
+            ''', [
+                (property_id, changes['county'], content_hash, status_dates.get(property_id), now, now)
+                for property_id, content_hash in changes['hashes'].items()
+            ])
+            self.conn.executemany(
+                'UPDATE listing_state SET removed_at = ? WHERE property_id = ?',
+                [(now, property_id) for property_id in changes['removed']]
+            )
+            counts = summarize(changes)
+            self.conn.execute(
+                'INSERT INTO scrape_runs (county, run_at, added, updated, removed, unchanged) VALUES (?, ?, ?, ?, ?, ?)',
+                (changes['county'], now, counts['added'], counts['updated'], counts['removed'], counts['unchanged'])
+            )
+        logger.info(f"📊 {changes['county']}: {counts['added']} added, {counts['updated']} updated, "
+                    f"{counts['removed']} removed, {counts['unchanged']} unchanged")
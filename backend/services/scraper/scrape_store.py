@@ -0,0 +1,267 @@
+"""
+Scrape store: the system of record for scraped listings
+
+Listings live in one SQLite table in WAL mode (readers such as the API are
+not blocked while a run writes) with unique keys on ``property_id`` and
+``detail_link``. A run upserts only the rows it changed with one executemany,
+so its cost follows the number of changed listings rather than the size of
+the data. Listings can be exported to scraped_listings.csv, and a Parquet
+snapshot can be taken when pyarrow or fastparquet is installed.
+
+A merged_data.csv left by the CSV-based scraper is imported the first time
+the store is opened empty. Exports go to a different file so they are never
+read back as that legacy data.
+"""
+import os
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from .parsers import DETAIL_FIELDS, STANDARD_COLUMNS
+from .utils.logger import setup_logger
+
+logger = setup_logger(__name__, 'logs/scraper.log')
+
+DOWNLOADS_DIR = os.path.join(os.path.dirname(__file__), 'downloads')
+STORE_FILE = os.path.join(DOWNLOADS_DIR, 'scrape_store.db')
+CSV_EXPORT = os.path.join(DOWNLOADS_DIR, 'scraped_listings.csv')
+LEGACY_CSV = os.path.join(DOWNLOADS_DIR, 'merged_data.csv')  # Written by the scraper before the store
+PARQUET_SNAPSHOT = os.path.join(DOWNLOADS_DIR, 'scraped_listings.parquet')
+
+# Overwritten by every scrape of the listing table
+LISTING_COLUMNS = ('detail_link', 'property_id') + STANDARD_COLUMNS + ('county',)
+# Filled in later; a row that lacks them keeps the stored values
+ENRICHMENT_COLUMNS = ('zillow_url',) + DETAIL_FIELDS
+COLUMNS = LISTING_COLUMNS + ENRICHMENT_COLUMNS
+
+# Record keys that differ from the column names (as used by merged_data.csv and the frontend)
+RECORD_KEYS = {'zillow_url': 'Zillow URL'}
+
+SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS listings (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        property_id TEXT NOT NULL UNIQUE,
+        detail_link TEXT UNIQUE,
+        sheriff_number TEXT,
+        status_date TEXT,
+        plaintiff TEXT,
+        defendant TEXT,
+        address TEXT,
+        price INTEGER,
+        county TEXT,
+        zillow_url TEXT,
+        court_case TEXT,
+        sale_date TEXT,
+        description TEXT,
+        upset_amount TEXT,
+        attorney TEXT,
+        removed_at TEXT,
+        updated_at TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_listings_county_status ON listings (county, status_date);
+    CREATE INDEX IF NOT EXISTS idx_listings_address ON listings (address);
+'''
+
+def store_exists(path: Optional[str] = None) -> bool:
+    """Whether a scrape store has been written yet"""
+    return os.path.exists(path or STORE_FILE)
+
+def store_signature(path: Optional[str] = None) -> Optional[tuple]:
+    """
+    Modification time and size of the store and its WAL file, or None if
+    there is no store. Changes whenever a write is committed, so readers can
+    cache what they loaded without opening the database.
+    """
+    path = path or STORE_FILE
+    signature = []
+    for name in (path, f'{path}-wal'):
+        try:
+            stat = os.stat(name)
+        except OSError:
+            if name == path:
+                return None
+            stat = None
+        signature.append((stat.st_mtime_ns, stat.st_size) if stat else None)
+    return tuple(signature)
+
+def _value(value):
+    # pandas hands back NaN for empty CSV cells
+    return None if value is None or (isinstance(value, float) and pd.isna(value)) else value
+
+def listing_key(row: Dict[str, Any]) -> Optional[str]:
+    """
+    property_id of a row, preferring the one in its detail link
+
+    A CSV column with gaps comes back from pandas as floats (12.0, NaN), so
+    integral floats are read as the integer and NaN as missing.
+    """
+    link = _value(row.get('detail_link'))
+    if isinstance(link, str) and 'PropertyId=' in link:
+        key = link.split('PropertyId=')[-1].strip()
+        if key:
+            return key
+    value = _value(row.get('property_id'))
+    if isinstance(value, float):
+        return str(int(value)) if value.is_integer() else None
+    value = str(value).strip() if value is not None else ''
+    return value or None
+
+class ScrapeStore:
+    """
+    Indexed SQLite store of scraped listings
+
+    Args:
+        path (str): Database file. Defaults to downloads/scrape_store.db.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or STORE_FILE
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+        if self.path == STORE_FILE and os.path.exists(LEGACY_CSV) and not self.count():
+            self.import_csv(LEGACY_CSV)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def count(self) -> int:
+        return self.conn.execute('SELECT COUNT(*) FROM listings').fetchone()[0]
+
+    def upsert(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert or update listings with one executemany
+
+        Listing columns are overwritten; enrichment columns (Zillow URL and
+        SaleDetails fields) keep their stored value when the row has none.
+        A listing that is upserted again is no longer marked removed. A
+        detail link belongs to one listing: the last row written with it
+        keeps it, so a clash cannot abort the batch.
+
+        Returns:
+            int: Number of rows written; rows without a property_id are skipped
+        """
+        now = datetime.utcnow().isoformat(timespec='seconds')
+        latest, skipped = {}, 0
+        for row in rows:
+            key = listing_key(row)
+            if key is None:
+                skipped += 1
+                continue
+            values = {column: _value(row.get(RECORD_KEYS.get(column, column), row.get(column)))
+                      for column in COLUMNS}
+            values['property_id'] = key
+            latest.pop(key, None)  # A repeated listing keeps its last row
+            latest[key] = values
+        if skipped:
+            logger.warning(f"⚠️ Skipped {skipped} rows without a property_id")
+        if not latest:
+            return 0
+
+        owners = {values['detail_link']: key for key, values in latest.items() if values['detail_link']}
+        for key, values in latest.items():
+            if values['detail_link'] and owners[values['detail_link']] != key:
+                logger.warning(f"⚠️ Dropped detail link of {key}, also used by {owners[values['detail_link']]}")
+                values['detail_link'] = None
+        params = [tuple(values[column] for column in COLUMNS) + (now,) for values in latest.values()]
+
+        updates = [f'{column} = excluded.{column}' for column in LISTING_COLUMNS if column != 'property_id']
+        updates += [f'{column} = COALESCE(excluded.{column}, listings.{column})' for column in ENRICHMENT_COLUMNS]
+        with self.conn:
+            # Stored listings lose a detail link that now belongs to another one
+            self.conn.executemany(
+                'UPDATE listings SET detail_link = NULL WHERE detail_link = ? AND property_id != ?',
+                list(owners.items())
+            )
+            self.conn.executemany(f'''
+                INSERT INTO listings ({', '.join(COLUMNS)}, updated_at)
+                VALUES ({', '.join('?' * (len(COLUMNS) + 1))})
+                ON CONFLICT (property_id) DO UPDATE SET
+                    {', '.join(updates)},
+                    removed_at = NULL,
+                    updated_at = excluded.updated_at
+            ''', params)
+        return len(params)
+
+    def mark_removed(self, property_ids: Iterable[str]) -> int:
+        """Flag listings that disappeared from their county's page"""
+        now = datetime.utcnow().isoformat(timespec='seconds')
+        with self.conn:
+            cursor = self.conn.executemany(
+                'UPDATE listings SET removed_at = ?, updated_at = ? WHERE property_id = ? AND removed_at IS NULL',
+                [(now, now, str(property_id)) for property_id in property_ids]
+            )
+        return cursor.rowcount
+
+    def update_details(self, detail_link: str, details: Dict[str, Any]) -> bool:
+        """Overwrite the SaleDetails fields of one listing, e.g. after a manual edit"""
+        fields = [field for field in DETAIL_FIELDS if field in details]
+        if not fields:
+            return False
+        with self.conn:
+            cursor = self.conn.execute(
+                f"UPDATE listings SET {', '.join(f'{field} = ?' for field in fields)}, updated_at = ? "
+                f"WHERE detail_link = ?",
+                [details[field] for field in fields] + [datetime.utcnow().isoformat(timespec='seconds'), detail_link]
+            )
+        return cursor.rowcount > 0
+
+    def listings(self, county: Optional[str] = None, include_removed: bool = False) -> List[Dict[str, Any]]:
+        """Stored listings as records keyed like merged_data.csv"""
+        conditions, params = [], []
+        if not include_removed:
+            conditions.append('removed_at IS NULL')
+        if county:
+            conditions.append('county = ?')
+            params.append(county)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        cursor = self.conn.execute(f"SELECT {', '.join(COLUMNS)} FROM listings {where} ORDER BY id", params)
+        keys = [RECORD_KEYS.get(column, column) for column in COLUMNS]
+        return [dict(zip(keys, row)) for row in cursor]
+
+    def frame(self) -> pd.DataFrame:
+        """Listed (not removed) listings as a DataFrame with the store ``id`` first"""
+        keys = [f'{column} AS "{RECORD_KEYS[column]}"' if column in RECORD_KEYS else column for column in COLUMNS]
+        return pd.read_sql_query(
+            f"SELECT id, {', '.join(keys)} FROM listings WHERE removed_at IS NULL ORDER BY id", self.conn
+        )
+
+    def export_csv(self, path: Optional[str] = None) -> str:
+        """Write the current listings to a CSV file (scraped_listings.csv by default)"""
+        path = path or CSV_EXPORT
+        pd.DataFrame(self.listings(), columns=[RECORD_KEYS.get(c, c) for c in COLUMNS]).to_csv(path, index=False)
+        logger.info(f"✅ Exported listings to {path}")
+        return path
+
+    def snapshot_parquet(self, path: Optional[str] = None) -> Optional[str]:
+        """Write a Parquet snapshot of every listing; None if no Parquet engine is installed"""
+        path = path or PARQUET_SNAPSHOT
+        frame = pd.read_sql_query('SELECT * FROM listings ORDER BY id', self.conn)
+        try:
+            frame.to_parquet(path, index=False)
+        except ImportError as e:
+            logger.warning(f"⚠️ Parquet snapshot skipped: {e}")
+            return None
+        logger.info(f"✅ Wrote Parquet snapshot to {path}")
+        return path
+
+    def import_csv(self, path: str) -> int:
+        """Load a merged_data.csv written before the store existed"""
+        try:
+            records = pd.read_csv(path).to_dict('records')
+        except Exception as e:
+            logger.warning(f"⚠️ Could not import {path}: {e}")
+            return 0
+        count = self.upsert(records)
+        logger.info(f"✅ Imported {count} listings from {path}")
+        return count
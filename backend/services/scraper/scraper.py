@@ -1,140 +1,72 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
-from datetime import datetime
-import time
+from .async_fetcher import fetch_pages
+from .parsers import parse_listing_table, convert_date_format
+from .driver_pool import get_pool, wait_for, TimeoutException
 from .utils.logger import setup_logger
 
 # Configure logging
 logger = setup_logger(__name__, 'logs/scraper.log')
 
-def fetch_page_selenium(url):
-    """Fetch page content using Selenium."""
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")  # Add this option
-    
-    driver = None  # Initialize driver variable
+def fetch_page_selenium(url, pool=None):
+    """Fetch page content with a browser from the shared driver pool."""
     try:
-        # Initialize ChromeDriver using ChromeDriverManager
-        driver = webdriver.Chrome(
-            service=ChromeService(ChromeDriverManager().install()),
-            options=chrome_options
-        )
-        
-        logger.info(f"Attempting to fetch URL: {url}")
-        driver.get(url)
-        time.sleep(5)  # Increased wait time
-        
-        html_content = driver.page_source
-        logger.info("Successfully fetched page content")
-        return html_content
+        with (pool or get_pool()).driver() as driver:
+            logger.info(f"Attempting to fetch URL: {url}")
+            driver.get(url)
+            try:
+                # The listing table is rendered once the search results arrive
+                wait_for(driver, 'table.table-striped')
+            except TimeoutException:
+                logger.warning(f"Timed out waiting for the listing table at {url}")
+
+            html_content = driver.page_source
+            logger.info("Successfully fetched page content")
+            return html_content
 
     except Exception as e:
         logger.error(f"Error fetching {url} with Selenium: {e}")
         return None
 
-    finally:
-        if driver:  # Only quit if driver was successfully initialized
-            try:
-                driver.quit()
-                logger.info("Browser closed successfully")
-            except Exception as e:
-                logger.error(f"Error closing browser: {e}")
+def parse_listing_html(html, url):
+    """
+    Extract listing rows from a SalesSearch page
 
-def parse_page_selenium(url):
-    """Parse page content to extract required data."""
-    html = fetch_page_selenium(url)
-    if html:
-        soup = BeautifulSoup(html, 'html.parser')
-        table = soup.find('table', class_='table table-striped')
-        if not table:
-            logger.error(f"Failed to find the table on the page at URL: {url}")
-            return []
+    Returns:
+        list: Row dicts, or None if the page has no listing table
+    """
+    return parse_listing_table(html, url)
 
-        data = []
-        rows = table.find('tbody').find_all('tr') if table.find('tbody') else []
-        
-        # Determine county based on URL
-        county_mapping = {
-            'countyId=7': 'Bergen County',
-            'countyId=10': 'Hudson County',
-            'countyId=2': 'Essex County',
-            'countyId=9': 'Morris County',
-            'countyId=15': 'Union County',
-            'countyId=19': 'Sussex County',
-            'countyId=21': 'Warren County'
-        }
-        
-        county = None
-        for county_id, county_name in county_mapping.items():
-            if county_id in url:
-                county = county_name
-                break
-        
-        # Determine if it's Hudson County by checking the URL
-        is_hudson_county = 'countyId=10' in url
-        
-        for row in rows:
-            cells = row.find_all('td')
-            try:
-                # Extract the PropertyId and construct the full detail link
-                detail_link = cells[0].find('a', href=True)['href']
-                if "PropertyId=" not in detail_link:
-                    raise ValueError("Invalid detail link: Missing 'PropertyId'")
-                
-                property_id = detail_link.split("PropertyId=")[-1]
-                full_detail_link = f"https://salesweb.civilview.com{detail_link}"
-
-                # Extract other data for the row - handle Hudson County differently
-                if is_hudson_county:
-                    # Hudson County has Address before Plaintiff/Defendant
-                    row_data = {
-                        'detail_link': full_detail_link,
-                        'property_id': property_id,
-                        'sheriff_number': cells[1].text.strip() if len(cells) > 1 else None,
-                        'status_date': convert_date_format(cells[2].text.strip()) if len(cells) > 2 else None,
-                        'address': cells[3].text.strip() if len(cells) > 3 else None,
-                        'plaintiff': cells[4].text.strip() if len(cells) > 4 else None,
-                        'defendant': cells[5].text.strip() if len(cells) > 5 else None,
-                        'price': int(cells[6].text.strip().replace('$', '').replace(',', '')) if len(cells) > 6 and cells[6].text.strip() else 0,
-                        'county': county
-                    }
-                else:
-                    # Standard column order for other counties
-                    row_data = {
-                        'detail_link': full_detail_link,
-                        'property_id': property_id,
-                        'sheriff_number': cells[1].text.strip() if len(cells) > 1 else None,
-                        'status_date': convert_date_format(cells[2].text.strip()) if len(cells) > 2 else None,
-                        'plaintiff': cells[3].text.strip() if len(cells) > 3 else None,
-                        'defendant': cells[4].text.strip() if len(cells) > 4 else None,
-                        'address': cells[5].text.strip() if len(cells) > 5 else None,
-                        'price': int(cells[6].text.strip().replace('$', '').replace(',', '')) if len(cells) > 6 and cells[6].text.strip() else 0,
-                        'county': county
-                    }
+def parse_page_selenium(url, pool=None):
+    """Parse page content to extract required data."""
+    html = fetch_page_selenium(url, pool)
+    if not html:
+        logger.error("No HTML content returned")
+        return []
+    data = parse_listing_html(html, url)
+    if data is None:
+        logger.error(f"Failed to find the table on the page at URL: {url}")
+        return []
+    return data
 
-                data.append(row_data)
+def parse_page(url, pool=None, pages=None):
+    """
+    Scrape a listing page over plain HTTP, using Selenium only as a fallback
 
-            except Exception as e:
-                logger.error(f"Error parsing row: {e}")
-                continue
+    The browser is started only when the HTTP response has no listing table
+    (for example a script-rendered or blocked page) or could not be fetched.
 
-        return data
+    Args:
+        url (str): SalesSearch page
+        pool (DriverPool): Browsers for the Selenium fallback
+        pages (dict): Bodies already fetched for this run, keyed by URL (as
+            from fetch_pages); the page is fetched here if it is not among them
+    """
+    if pages is not None and url in pages:
+        html = pages[url]
     else:
-        logger.error("No HTML content returned")
-        return []
-
-def convert_date_format(date_str):
-    """Convert date string from 'MM/DD/YYYY' to 'YYYY-MM-DD' if needed."""
-    try:
-        return datetime.strptime(date_str, '%m/%d/%Y').strftime('%Y-%m-%d')
-    except ValueError:
-        logger.error(f"Date conversion error for date: {date_str}")
-        return date_str  # Return original if error occurs
\ No newline at end of file
+        html = fetch_pages([url]).get(url)
+    data = parse_listing_html(html, url)
+    if data is None:
+        logger.info(f"No listing table in the HTTP response for {url}; falling back to Selenium")
+        return parse_page_selenium(url, pool)
+    logger.info(f"Fetched {len(data)} listings over HTTP from {url}")
+    return data
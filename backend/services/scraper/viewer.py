@@ -8,6 +8,8 @@ import sqlite3
 import sys
 import logging
 import os
+from .scrape_state import ScrapeState
+from .scrape_store import ScrapeStore
 
 class EditDialog(QDialog):
     def __init__(self, entry_data, parent=None):
@@ -82,42 +84,18 @@ class AuctionViewer(QMainWindow):
     
     def load_data(self):
         try:
-            # Use the correct path to merged_data.csv
-            csv_path = os.path.join(self.downloads_dir, "merged_data.csv")
-            if not os.path.exists(csv_path):
-                raise FileNotFoundError(f"Could not find merged_data.csv at {csv_path}")
-            
-            self.data = pd.read_csv(csv_path)
-            logging.info(f"Successfully loaded data from {csv_path}")
-            
-            # Initialize database connection
-            self.conn = sqlite3.connect('auction_data.db')
-            self.cursor = self.conn.cursor()
-            
-            # Ensure all records from merged_data.csv are in the database
-            for _, row in self.data.iterrows():
-                self.cursor.execute('''
-                    INSERT OR IGNORE INTO auctions 
-                    (detail_link, sheriff_number, status_date, plaintiff, defendant, address, price)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    row['detail_link'],
-                    row['sheriff_number'],
-                    row['status_date'],
-                    row['plaintiff'],
-                    row['defendant'],
-                    row['address'],
-                    row['price']
-                ))
-            self.conn.commit()
+            self.store = ScrapeStore()
+            self.data = pd.DataFrame(self.store.listings())
+            if self.data.empty:
+                raise FileNotFoundError(f"No listings in {self.store.path}")
+            logging.info(f"Successfully loaded {len(self.data)} listings from {self.store.path}")
             
         except FileNotFoundError as e:
-            QMessageBox.critical(self, "File Error", 
-                f"Could not find merged_data.csv. Please run main.py first.\nDetails: {str(e)}")
+            QMessageBox.critical(self, "No Data", 
+                f"No scraped listings found. Please run main.py first.\nDetails: {str(e)}")
             raise SystemExit(1)
-        except sqlite3.OperationalError as e:
-            QMessageBox.critical(self, "Database Error", 
-                "Database schema is not initialized. Please run 'python migrate_db.py' first.")
+        except sqlite3.Error as e:
+            QMessageBox.critical(self, "Database Error", f"Could not open the scrape store: {str(e)}")
             raise SystemExit(1)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load data: {str(e)}")
@@ -127,40 +105,17 @@ class AuctionViewer(QMainWindow):
         # Set up table columns
         columns = ['Address', 'Sheriff Number', 'Status Date', 'Court Case #',
                   'Sales Date', 'Description', 'Approx. Upset*', 'Attorney']
+        fields = ['address', 'sheriff_number', 'status_date', 'court_case',
+                  'sale_date', 'description', 'upset_amount', 'attorney']
         self.table.setColumnCount(len(columns))
         self.table.setHorizontalHeaderLabels(columns)
         
         # Populate table
         self.table.setRowCount(len(self.data))
-        for i, row in self.data.iterrows():
-            self.table.setItem(i, 0, QTableWidgetItem(str(row['address'])))
-            self.table.setItem(i, 1, QTableWidgetItem(str(row['sheriff_number'])))
-            self.table.setItem(i, 2, QTableWidgetItem(str(row['status_date'])))
-            
-            # Initialize empty cells for additional columns
-            for col in range(3, len(columns)):
-                self.table.setItem(i, col, QTableWidgetItem(''))
-            
-            try:
-                # Get additional details from database
-                self.cursor.execute('''
-                    SELECT court_case, sale_date, description, upset_amount, attorney
-                    FROM auctions WHERE detail_link = ?
-                ''', (row['detail_link'],))
-                result = self.cursor.fetchone()
-                
-                if result:
-                    self.table.setItem(i, 3, QTableWidgetItem(str(result[0] or '')))
-                    self.table.setItem(i, 4, QTableWidgetItem(str(result[1] or '')))
-                    self.table.setItem(i, 5, QTableWidgetItem(str(result[2] or '')))
-                    self.table.setItem(i, 6, QTableWidgetItem(str(result[3] or '')))
-                    self.table.setItem(i, 7, QTableWidgetItem(str(result[4] or '')))
-            except sqlite3.OperationalError as e:
-                logging.error(f"Database error: {e}")
-                QMessageBox.warning(self, "Database Error", 
-                    "The database schema needs to be updated. Please run migrate_db.py first.")
-                self.close()
-                return
+        for i, row in enumerate(self.data.to_dict('records')):
+            for col, field in enumerate(fields):
+                value = row.get(field)
+                self.table.setItem(i, col, QTableWidgetItem('' if value is None or pd.isna(value) else str(value)))
         
         # Adjust column widths
         self.table.resizeColumnsToContents()
@@ -185,31 +140,19 @@ class AuctionViewer(QMainWindow):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             try:
                 new_values = dialog.get_values()
-                detail_link = self.data.iloc[current_row]['detail_link']
+                listing = self.data.iloc[current_row]
+                details = {
+                    'court_case': new_values['Court Case #:'],
+                    'sale_date': new_values['Sales Date:'],
+                    'description': new_values['Description:'],
+                    'upset_amount': new_values['Approx. Upset*:'],
+                    'attorney': new_values['Attorney:']
+                }
                 
-                # Update database
-                self.cursor.execute('''
-                    UPDATE auctions
-                    SET court_case = ?,
-                        sale_date = ?,
-                        description = ?,
-                        upset_amount = ?,
-                        attorney = ?,
-                        last_updated = CURRENT_TIMESTAMP
-                    WHERE detail_link = ?
-                ''', (
-                    new_values['Court Case #:'],
-                    new_values['Sales Date:'],
-                    new_values['Description:'],
-                    new_values['Approx. Upset*:'],
-                    new_values['Attorney:'],
-                    detail_link
-                ))
-                self.conn.commit()
-
-                # Update CSV file
-                from database import sync_db_to_csv
-                sync_db_to_csv(self.conn)
+                # Update the scrape store, and the scrape state whose details later runs merge back in
+                self.store.update_details(listing['detail_link'], details)
+                with ScrapeState() as state:
+                    state.edit_details(listing['property_id'], details)
                 
                 # Update table display
                 self.table.item(current_row, 3).setText(new_values['Court Case #:'])
@@ -218,18 +161,17 @@ class AuctionViewer(QMainWindow):
                 self.table.item(current_row, 6).setText(new_values['Approx. Upset*:'])
                 self.table.item(current_row, 7).setText(new_values['Attorney:'])
 
-                # Reload data from updated CSV
-                self.data = pd.read_csv("merged_data.csv")
+                # Reload data from the store
+                self.data = pd.DataFrame(self.store.listings())
                 
                 QMessageBox.information(self, "Success", "Entry updated successfully!")
                 
             except Exception as e:
-                self.conn.rollback()
                 QMessageBox.critical(self, "Error", f"Failed to save changes: {str(e)}")
                 logging.error(f"Error saving changes: {e}")
 
     def closeEvent(self, event):
-        self.conn.close()
+        self.store.close()
         event.accept()
 
 def main():
@@ -1,27 +1,21 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service, Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.options import Options
 from bs4 import BeautifulSoup
 import pandas as pd
 import logging
 import sys
 import re
 from typing import Optional
+from .driver_pool import get_pool, wait_for_ready
+from .parsers import HTML_PARSER
 
 # Configure logging
 
-def fetch_page_selenium_headless(url):
-    """Fetch page content using Selenium in headless mode."""
+def fetch_page_selenium_headless(url, pool=None):
+    """Fetch page content with a headless browser from the shared driver pool."""
     try:
-        options = Options()
-        options.headless = True
-        service = Service(executable_path='services\\scraper\\chromedriver.exe')
-        driver = webdriver.Chrome(service=service, options=options)
-        driver.get(url)
-        html = driver.page_source
-        driver.quit()
-        return html
+        with (pool or get_pool()).driver() as driver:
+            driver.get(url)
+            wait_for_ready(driver)
+            return driver.page_source
     except Exception as e:
         logging.error(f"Error fetching {url} with Selenium headless: {e}")
         return None
@@ -29,7 +23,7 @@ def fetch_page_selenium_headless(url):
 def parse_zillow_page(url):
     html = fetch_page_selenium_headless(url)
     if html:
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, HTML_PARSER)
         return {
             'url': url,
             'zillow_details': parse_zillow_details(soup),
@@ -129,4 +123,4 @@ if __name__ == "__main__":
         logging.error("No URLs provided. Usage: python zillow_scraper.py <url1> <url2> ...")
         sys.exit("Usage: python zillow_scraper.py <url1> <url2> ...")
 
-#   Run this script: `python src/zillow_scraper.py ZillowURL`
\ No newline at end of file
+#   Run this script from backend/: `python -m services.scraper.zillow_scraper ZillowURL`
\ No newline at end of file
@@ -0,0 +1,173 @@
+"""
+Bulk tenant import
+
+Validates a whole batch of tenant rows column by column over pandas Series
+instead of instantiating one Tenant per row and running the model validators
+from the before_insert listener. The rules and messages mirror
+``Tenant.validate_tenant`` and share its precompiled patterns, so a row that
+passes here would also pass the per-object checks.
+"""
+import io
+import json
+import logging
+from datetime import date
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from models.tenant import (
+    CREDIT_SCORE_RANGE, EMAIL_PATTERN, MINIMUM_AGE, NAME_PATTERN, NON_DIGIT_PATTERN
+)
+
+logger = logging.getLogger(__name__)
+
+MAX_IMPORT_ROWS = 25000
+INSERT_BATCH_SIZE = 1000
+
+REQUIRED_COLUMNS = ['firstName', 'lastName', 'email', 'dateOfBirth']
+TEXT_COLUMNS = ['phoneNumber', 'occupation', 'employerName', 'professionalTitle', 'guarantor']
+CREDIT_SCORE_COLUMNS = ['creditScoreAtInitialApplication', 'creditScoreAtLeaseRenewal']
+BOOLEAN_COLUMNS = ['creditCheck1Complete', 'creditCheck2Complete', 'petsAllowed']
+IMPORT_COLUMNS = REQUIRED_COLUMNS + TEXT_COLUMNS + CREDIT_SCORE_COLUMNS + BOOLEAN_COLUMNS
+
+_BOOLEAN_VALUES = {
+    'true': True, '1': True, 'yes': True, 'y': True,
+    'false': False, '0': False, 'no': False, 'n': False
+}
+
+def read_tenant_file(content: bytes, filename: str) -> pd.DataFrame:
+    """
+    Load an uploaded CSV or JSON file into a frame of raw values
+
+    CSV cells are read as strings so that validation, not the parser, decides
+    what counts as a valid score or date.
+
+    Raises:
+        ValueError: If the file type is unsupported or the file cannot be parsed
+    """
+    name = (filename or '').lower()
+    try:
+        if name.endswith('.csv'):
+            return pd.read_csv(io.BytesIO(content), dtype=str, keep_default_na=False)
+        if name.endswith('.json'):
+            records = json.loads(content)
+            if isinstance(records, dict):
+                records = records.get('tenants')
+            return tenant_frame(records)
+    except (ValueError, pd.errors.ParserError) as e:
+        raise ValueError(f'Could not parse {filename}: {e}')
+    raise ValueError('File must be .csv or .json')
+
+def tenant_frame(records: Any) -> pd.DataFrame:
+    """
+    Build a frame from a list of JSON tenant objects
+
+    Raises:
+        ValueError: If records is not a list of objects
+    """
+    if not isinstance(records, list) or not all(isinstance(row, dict) for row in records):
+        raise ValueError('tenants must be a list of objects')
+    return pd.DataFrame.from_records(records)
+
+def _text(frame: pd.DataFrame, column: str) -> pd.Series:
+    """Column as stripped strings with blanks and missing values as None"""
+    if column not in frame:
+        return pd.Series(None, index=frame.index, dtype=object)
+    values = frame[column].astype(object)
+    present = values.notna()
+    values = values.where(~present, values.astype(str).str.strip())
+    return values.where(present & (values != ''), None)
+
+def _minimum_birth_date(today: date) -> date:
+    """Latest date of birth that is at least MINIMUM_AGE years old today"""
+    try:
+        return today.replace(year=today.year - MINIMUM_AGE)
+    except ValueError:  # 29 February
+        return today.replace(year=today.year - MINIMUM_AGE, day=28)
+
+def validate_tenant_frame(frame: pd.DataFrame, existing_emails=(), today: date | None = None
+                          ) -> Tuple[List[Dict[str, Any]], Dict[int, List[str]]]:
+    """
+    Validate a frame of tenant rows column-wise
+
+    Args:
+        frame (pd.DataFrame): Raw rows, one column per Tenant field
+        existing_emails (Iterable[str]): Emails already stored
+        today (date): Reference date for the age check
+
+    Returns:
+        Tuple[List[Dict[str, Any]], Dict[int, List[str]]]: Insertable rows
+        (each carrying its source ``row`` index) and errors keyed by row
+    """
+    frame = frame.reset_index(drop=True)
+    today = today or date.today()
+    columns = {column: _text(frame, column) for column in IMPORT_COLUMNS}
+    checks = []
+
+    missing = pd.DataFrame({column: columns[column].isna() for column in REQUIRED_COLUMNS})
+    checks.append((missing.any(axis=1), None))
+
+    email = columns['email']
+    checks.append((email.notna() & ~email.str.match(EMAIL_PATTERN).fillna(False).astype(bool),
+                   'Invalid email format'))
+    checks.append((email.notna() & email.duplicated(keep='first'), 'Duplicate email in import'))
+    checks.append((email.isin(set(existing_emails)), 'Email already exists'))
+
+    phone = columns['phoneNumber']
+    digits = phone.str.replace(NON_DIGIT_PATTERN, '', regex=True).str.len()
+    checks.append((phone.notna() & ~digits.between(10, 11), 'Phone number must be 10-11 digits'))
+
+    scores = {}
+    low, high = CREDIT_SCORE_RANGE
+    for column in CREDIT_SCORE_COLUMNS:
+        raw = columns[column]
+        numeric = pd.to_numeric(raw, errors='coerce')
+        not_integer = raw.notna() & (numeric.isna() | (numeric % 1 != 0))
+        checks.append((not_integer, f'Invalid value for {column}. Must be an integer'))
+        checks.append((~not_integer & numeric.notna() & ~numeric.between(low, high),
+                       'Credit score must be between 300 and 850'))
+        scores[column] = numeric.where(~not_integer)
+
+    raw_dob = columns['dateOfBirth']
+    dob = pd.to_datetime(raw_dob, format='%Y-%m-%d', errors='coerce')
+    checks.append((raw_dob.notna() & dob.isna(),
+                   'Invalid date format for dateOfBirth. Expected YYYY-MM-DD'))
+    checks.append((dob > pd.Timestamp(_minimum_birth_date(today)), 'Tenant must be at least 18 years old'))
+
+    first, last = columns['firstName'], columns['lastName']
+    bad_name = (first.notna() & ~first.str.match(NAME_PATTERN).fillna(False).astype(bool)) | \
+               (last.notna() & ~last.str.match(NAME_PATTERN).fillna(False).astype(bool))
+    checks.append((bad_name, 'Names can only contain letters, spaces, hyphens and apostrophes'))
+
+    booleans = {}
+    for column in BOOLEAN_COLUMNS:
+        raw = columns[column]
+        parsed = raw.astype(str).str.lower().map(_BOOLEAN_VALUES).where(raw.notna(), False)
+        checks.append((raw.notna() & parsed.isna(), f'Invalid value for {column}. Must be true or false'))
+        booleans[column] = parsed
+
+    # Only rows with at least one failed check are visited to build messages
+    errors: Dict[int, List[str]] = {}
+    missing_rows = np.flatnonzero(checks[0][0].to_numpy())
+    for index in missing_rows:
+        fields = [column for column in REQUIRED_COLUMNS if missing.at[index, column]]
+        errors[int(index)] = [f"Missing required fields: {', '.join(fields)}"]
+    for mask, message in checks[1:]:
+        for index in np.flatnonzero(mask.fillna(False).to_numpy(dtype=bool)):
+            errors.setdefault(int(index), []).append(message)
+
+    valid = ~frame.index.isin(list(errors))
+    rows = pd.DataFrame({
+        'row': frame.index,
+        'firstName': first,
+        'lastName': last,
+        'email': email,
+        'dateOfBirth': dob.dt.date,
+        **{column: columns[column] for column in TEXT_COLUMNS},
+        **scores,
+        **{column: booleans[column].astype(bool) for column in BOOLEAN_COLUMNS}
+    })[valid]
+    # Cast after filtering: out-of-range scores such as 1e20 cannot be held as integers
+    rows = rows.astype({column: 'Int64' for column in CREDIT_SCORE_COLUMNS}).astype(object)
+    return rows.where(rows.notna(), None).to_dict('records'), errors
@@ -0,0 +1,411 @@
+"""
+Underwriting engine for property return metrics (IRR, NPV, equity multiple)
+
+Cash flows are modelled monthly from the acquisition date (month 0) to the
+projected sale (month ``hold_months``) and stacked into one matrix so every
+metric is computed for the whole portfolio in a single NumPy pass.
+"""
+import logging
+import sys
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOLD_MONTHS = 12
+DEFAULT_DISCOUNT_RATE = 0.10  # Annual
+
+# Fields deducted from the ARV to get net sale proceeds
+SALE_DEDUCTION_FIELDS = [
+    'realtorFees', 'payOffStatement', 'propTaxtillEndOfYear',
+    'attorneyFees', 'miscFees', 'utilities'
+]
+
+def _value(obj: Any, field: str) -> float:
+    """Read a numeric field from a model/dict, treating None as 0."""
+    value = obj.get(field) if isinstance(obj, dict) else getattr(obj, field, None)
+    try:
+        return float(value) if value is not None else 0.0
+    except (ValueError, TypeError):
+        return 0.0
+
+def _to_date(value: Any) -> Optional[date]:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return None
+
+def _months_between(start: date, end: date) -> int:
+    return (end.year - start.year) * 12 + (end.month - start.month)
+
+def build_cash_flows(properties: List[Any],
+                     draws_by_property: Optional[Dict[int, List[Any]]] = None,
+                     hold_months: int = DEFAULT_HOLD_MONTHS) -> np.ndarray:
+    """
+    Build the monthly equity cash-flow matrix for a list of properties
+
+    Month 0 carries the cash invested at purchase (``cash2closeFromPurchase``,
+    falling back to ``purchaseCost``/``purchase_price``) plus ``totalRehabCost``.
+    Construction draws come back in as inflows in the month they were released,
+    rent (``expectedYearlyRent`` / 12) arrives every month after purchase, and
+    the final month adds the net sale: ``arvSalePrice`` minus the sale fees and
+    the lender payoff.
+
+    Args:
+        properties (List[Any]): Property models or dicts
+        draws_by_property (Optional[Dict[int, List[Any]]]): Construction draws keyed by property id
+        hold_months (int): Months between acquisition and sale
+
+    Returns:
+        np.ndarray: Array of shape (len(properties), hold_months + 1)
+    """
+    if hold_months < 1:
+        raise ValueError('hold_months must be at least 1')
+
+    draws_by_property = draws_by_property or {}
+    n = len(properties)
+    flows = np.zeros((n, hold_months + 1))
+
+    def column(field):
+        return np.fromiter((_value(p, field) for p in properties), dtype=float, count=n)
+
+    equity_in = column('cash2closeFromPurchase')
+    purchase = column('purchaseCost')
+    purchase = np.where(purchase > 0, purchase, column('purchase_price'))
+    equity_in = np.where(equity_in > 0, equity_in, purchase)
+
+    sale = column('arvSalePrice')
+    for field in SALE_DEDUCTION_FIELDS:
+        sale -= column(field)
+
+    flows[:, 0] -= equity_in + column('totalRehabCost')
+    flows[:, 1:] += (column('expectedYearlyRent') / 12.0)[:, None]
+    flows[:, -1] += sale
+
+    # Draws are scattered into their release month in one np.add.at call
+    rows, months, amounts = [], [], []
+    for i, prop in enumerate(properties):
+        prop_id = prop.get('id') if isinstance(prop, dict) else getattr(prop, 'id', None)
+        acquired = _to_date(prop.get('created_at') if isinstance(prop, dict) else getattr(prop, 'created_at', None))
+        for draw in draws_by_property.get(prop_id, []):
+            released = _to_date(draw.get('release_date') if isinstance(draw, dict) else draw.release_date)
+            offset = _months_between(acquired, released) if acquired and released else 0
+            rows.append(i)
+            months.append(min(max(offset, 0), hold_months))
+            amounts.append(_value(draw, 'amount'))
+    if rows:
+        np.add.at(flows, (np.array(rows), np.array(months)), np.array(amounts))
+
+    return flows
+
+def npv(cash_flows: np.ndarray, rate: Any) -> np.ndarray:
+    """
+    Net present value of each row of cash flows at a per-period rate
+
+    Args:
+        cash_flows (np.ndarray): Array of shape (n, periods)
+        rate (Any): Scalar or array of shape (n,) per-period discount rates
+
+    Returns:
+        np.ndarray: NPV for each row
+    """
+    cf = np.atleast_2d(np.asarray(cash_flows, dtype=float))
+    rate = np.broadcast_to(np.asarray(rate, dtype=float), (cf.shape[0],))
+    periods = np.arange(cf.shape[1])
+    discount = (1.0 + rate)[:, None] ** -periods
+    return (cf * discount).sum(axis=1)
+
+def irr(cash_flows: np.ndarray, tol: float = 1e-10, max_iter: int = 50,
+        guess: float = 0.01) -> np.ndarray:
+    """
+    Solve the per-period IRR of every row at once
+
+    Newton's method runs on the whole batch; rows that fail to converge (or
+    step outside the valid domain) are finished with a vectorized bisection.
+    Rows without both an inflow and an outflow have no IRR and return NaN.
+
+    Args:
+        cash_flows (np.ndarray): Array of shape (n, periods)
+        tol (float): Convergence tolerance on the rate
+        max_iter (int): Maximum Newton iterations
+        guess (float): Initial per-period rate
+
+    Returns:
+        np.ndarray: Per-period IRR for each row (NaN where undefined)
+    """
+    cf = np.atleast_2d(np.asarray(cash_flows, dtype=float))
+    n, t = cf.shape
+    periods = np.arange(t)
+    solvable = (cf > 0).any(axis=1) & (cf < 0).any(axis=1)
+
+    rate = np.full(n, guess)
+    done = ~solvable
+    with np.errstate(all='ignore'):
+        for _ in range(max_iter):
+            active = ~done
+            if not active.any():
+                break
+            base = 1.0 + rate[active]
+            discount = base[:, None] ** -periods
+            value = (cf[active] * discount).sum(axis=1)
+            slope = (-periods * cf[active] * discount / base[:, None]).sum(axis=1)
+            step = value / slope
+            rate[active] -= step
+            done[active] = np.abs(step) < tol
+
+        failed = solvable & (~done | ~np.isfinite(rate) | (rate <= -1.0))
+        if failed.any():
+            rate[failed] = _bisect(cf[failed], periods, tol)
+
+    rate[~solvable] = np.nan
+    return rate
+
+def _bisect(cf: np.ndarray, periods: np.ndarray, tol: float,
+            low: float = -0.9999, high: float = 10.0, max_iter: int = 200) -> np.ndarray:
+    """Vectorized bisection fallback for rows Newton could not solve."""
+    lo = np.full(cf.shape[0], low)
+    hi = np.full(cf.shape[0], high)
+    f_lo = (cf * (1.0 + lo)[:, None] ** -periods).sum(axis=1)
+    f_hi = (cf * (1.0 + hi)[:, None] ** -periods).sum(axis=1)
+    bracketed = np.sign(f_lo) != np.sign(f_hi)
+
+    for _ in range(max_iter):
+        mid = (lo + hi) / 2.0
+        f_mid = (cf * (1.0 + mid)[:, None] ** -periods).sum(axis=1)
+        same = np.sign(f_mid) == np.sign(f_lo)
+        lo = np.where(same, mid, lo)
+        f_lo = np.where(same, f_mid, f_lo)
+        hi = np.where(same, hi, mid)
+        if np.all(hi - lo < tol):
+            break
+
+    return np.where(bracketed, (lo + hi) / 2.0, np.nan)
+
+def equity_multiple(cash_flows: np.ndarray) -> np.ndarray:
+    """Total distributions divided by total equity invested for each row."""
+    cf = np.atleast_2d(np.asarray(cash_flows, dtype=float))
+    invested = -np.where(cf < 0, cf, 0.0).sum(axis=1)
+    returned = np.where(cf > 0, cf, 0.0).sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(invested > 0, returned / invested, np.nan)
+
+def annualize(monthly_rate: np.ndarray) -> np.ndarray:
+    """Convert per-month rates to effective annual rates."""
+    return (1.0 + np.asarray(monthly_rate, dtype=float)) ** 12 - 1.0
+
+def _clean(value: float) -> Optional[float]:
+    return None if not np.isfinite(value) else round(float(value), 6)
+
+def underwrite_properties(properties: List[Any],
+                          draws_by_property: Optional[Dict[int, List[Any]]] = None,
+                          hold_months: int = DEFAULT_HOLD_MONTHS,
+                          discount_rate: float = DEFAULT_DISCOUNT_RATE) -> List[Dict[str, Any]]:
+    """
+    Compute IRR, NPV and equity multiple for a batch of properties
+
+    Args:
+        properties (List[Any]): Property models or dicts
+        draws_by_property (Optional[Dict[int, List[Any]]]): Construction draws keyed by property id
+        hold_months (int): Months between acquisition and sale
+        discount_rate (float): Annual discount rate used for NPV
+
+    Returns:
+        List[Dict[str, Any]]: One result per property, in input order
+    """
+    if not properties:
+        return []
+
+    flows = build_cash_flows(properties, draws_by_property, hold_months)
+    monthly_discount = (1.0 + discount_rate) ** (1.0 / 12.0) - 1.0
+
+    monthly_irr = irr(flows)
+    annual_irr = annualize(monthly_irr)
+    npvs = npv(flows, monthly_discount)
+    multiples = equity_multiple(flows)
+
+    results = []
+    for i, prop in enumerate(properties):
+        prop_id = prop.get('id') if isinstance(prop, dict) else getattr(prop, 'id', None)
+        results.append({
+            'property_id': prop_id,
+            'irr': _clean(annual_irr[i]),
+            'monthly_irr': _clean(monthly_irr[i]),
+            'npv': _clean(npvs[i]),
+            'equity_multiple': _clean(multiples[i]),
+            'cash_flows': [round(float(v), 2) for v in flows[i]]
+        })
+    return results
+
+SENSITIVITY_AXES = ['arv', 'rehab_cost', 'interest_rate', 'hold_months']
+MAX_SENSITIVITY_CELLS = 2_000_000
+
+def _axis(spec: Any, default: Optional[float]) -> np.ndarray:
+    """Turn a list of values or a {start, stop, num} range into a 1-D axis."""
+    if spec is None:
+        return np.array([default if default is not None else 0.0], dtype=float)
+    if isinstance(spec, dict):
+        try:
+            start, stop, num = float(spec['start']), float(spec['stop']), int(spec.get('num', 10))
+        except (KeyError, ValueError, TypeError, OverflowError):
+            raise ValueError('Range axes need numeric start, stop and num')
+        # Checked before allocating so a huge num cannot exhaust memory
+        if not 1 <= num <= MAX_SENSITIVITY_CELLS:
+            raise ValueError(f'num must be between 1 and {MAX_SENSITIVITY_CELLS}')
+        return np.linspace(start, stop, num)
+    try:
+        axis = np.asarray(spec, dtype=float).ravel()
+    except (ValueError, TypeError):
+        raise ValueError('Axis values must be numbers')
+    if axis.size == 0:
+        raise ValueError('Axis values cannot be empty')
+    return axis
+
+def sensitivity_grid(prop: Any, axes: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Net profit and cash-on-cash over ARV x rehab cost x interest rate x hold months
+
+    Every axis is broadcast against the others so the whole grid is computed
+    with array arithmetic. Axes that are not supplied collapse to the value
+    stored on the property. Interest rates are annual percentages, matching
+    ``loanInterestRate``.
+
+    Args:
+        prop (Any): Property model or dict supplying the fixed cost fields
+        axes (Optional[Dict[str, Any]]): Values or {start, stop, num} per axis
+
+    Returns:
+        Dict[str, Any]: The axis values and the ``net_profit``/``cash_on_cash`` grids
+    """
+    axes = axes or {}
+    if not isinstance(axes, dict):
+        raise ValueError('axes must be an object')
+    unknown = set(axes) - set(SENSITIVITY_AXES)
+    if unknown:
+        raise ValueError(f"Unknown axes: {', '.join(sorted(unknown))}")
+
+    arv_stored = _value(prop, 'arvSalePrice')
+    arv = _axis(axes.get('arv'), arv_stored)
+    rehab = _axis(axes.get('rehab_cost'), _value(prop, 'totalRehabCost'))
+    rate = _axis(axes.get('interest_rate'), _value(prop, 'loanInterestRate'))
+    hold = _axis(axes.get('hold_months'), DEFAULT_HOLD_MONTHS)
+
+    cells = arv.size * rehab.size * rate.size * hold.size
+    if cells > MAX_SENSITIVITY_CELLS:
+        raise ValueError(f'Grid too large ({cells} cells, max {MAX_SENSITIVITY_CELLS})')
+    if (hold < 0).any():
+        raise ValueError('hold_months cannot be negative')
+
+    purchase = _value(prop, 'purchaseCost') or _value(prop, 'purchase_price')
+    loan = _value(prop, 'financeAmount')
+    if loan <= 0 and _value(prop, 'downPaymentPercentage') > 0:
+        loan = purchase * (1.0 - _value(prop, 'downPaymentPercentage') / 100.0)
+    if loan <= 0:
+        loan = _value(prop, 'lenderLoanBalance')
+
+    # Realtor fees scale with the sale price; other closing costs are fixed
+    fee_rate = _value(prop, 'realtorFees') / arv_stored if arv_stored > 0 else 0.0
+    fixed_costs = sum(_value(prop, f) for f in ['attorneyFees', 'miscFees', 'otherFees', 'lenderPointsAmount'])
+    monthly_carry = (_value(prop, 'yearlyPropertyTaxes') + _value(prop, 'homeownersInsurance')) / 12.0
+    monthly_rent = _value(prop, 'expectedYearlyRent') / 12.0
+
+    a = arv[:, None, None, None]
+    r = rehab[None, :, None, None]
+    i = rate[None, None, :, None] / 100.0
+    h = hold[None, None, None, :]
+
+    net_profit = (a * (1.0 - fee_rate) - purchase - r - fixed_costs
+                  - loan * i / 12.0 * h + (monthly_rent - monthly_carry) * h)
+    invested = np.broadcast_to(purchase - loan + r + fixed_costs, net_profit.shape)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cash_on_cash = np.where(invested > 0, net_profit / invested, np.nan)
+
+    return {
+        'axes': {
+            'arv': arv,
+            'rehab_cost': rehab,
+            'interest_rate': rate,
+            'hold_months': hold
+        },
+        'net_profit': net_profit,
+        'cash_on_cash': cash_on_cash
+    }
+
+def encode_array(values: np.ndarray, encoding: str = 'json') -> Dict[str, Any]:
+    """
+    Encode an N-d array for a JSON response
+
+    ``json`` returns nested lists (NaN as null); ``base64`` returns the raw
+    little-endian float32 buffer, which is roughly 4x smaller on the wire.
+    """
+    values = np.asarray(values, dtype=float)
+    if encoding == 'base64':
+        import base64
+        buffer = values.astype('<f4').tobytes()
+        return {
+            'shape': list(values.shape),
+            'dtype': 'float32',
+            'encoding': 'base64',
+            'data': base64.b64encode(buffer).decode('ascii')
+        }
+    if encoding != 'json':
+        raise ValueError("encoding must be 'json' or 'base64'")
+    rounded = np.round(values, 4).astype(object)
+    rounded[~np.isfinite(values)] = None
+    return {'shape': list(values.shape), 'encoding': 'json', 'data': rounded.tolist()}
+
+def group_draws(draws: Iterable[Any]) -> Dict[int, List[Any]]:
+    """Group construction draws by property id."""
+    grouped: Dict[int, List[Any]] = {}
+    for draw in draws:
+        grouped.setdefault(draw.property_id, []).append(draw)
+    return grouped
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point: print return metrics for an owner's properties."""
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description='Compute IRR / NPV / equity multiple for properties')
+    parser.add_argument('--owner-email', type=str, help='Only include properties owned by this user')
+    parser.add_argument('--property-id', type=int, action='append', help='Property id (repeatable)')
+    parser.add_argument('--hold-months', type=int, default=DEFAULT_HOLD_MONTHS,
+                        help='Months between acquisition and sale')
+    parser.add_argument('--discount-rate', type=float, default=DEFAULT_DISCOUNT_RATE,
+                        help='Annual discount rate for NPV (e.g. 0.10)')
+    args = parser.parse_args(argv)
+
+    from app import app
+    from models import db, User, Property, ConstructionDraw
+
+    with app.app_context():
+        query = db.session.query(Property)
+        if args.owner_email:
+            user = db.session.query(User).filter_by(email=args.owner_email).first()
+            if not user:
+                logger.error(f"❌ User not found: {args.owner_email}")
+                return 1
+            query = query.filter_by(owner_id=user.id)
+        if args.property_id:
+            query = query.filter(Property.id.in_(args.property_id))
+
+        properties = query.all()
+        draws = db.session.query(ConstructionDraw).filter(
+            ConstructionDraw.property_id.in_([p.id for p in properties])
+        ).all() if properties else []
+
+        results = underwrite_properties(properties, group_draws(draws),
+                                        args.hold_months, args.discount_rate)
+
+    for result in results:
+        result.pop('cash_flows')
+    print(json.dumps(results, indent=2))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+# Run from the backend directory:
+#   python -m services.underwriting --owner-email you@example.com --hold-months 12
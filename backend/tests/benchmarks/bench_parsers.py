@@ -0,0 +1,91 @@
+"""
+Listing parser benchmark
+
+Compares the original full-document parse (BeautifulSoup with html.parser,
+then a search for the listing table) with the table-scoped parsers in
+services.scraper.parsers on the saved fixture page of every county layout,
+including Hudson's column order, and on the Morris clerk ag-grid page.
+Fixture rows are repeated to reach a realistic page size.
+
+Run from backend/:
+    python -m tests.benchmarks.bench_parsers [--rows 400] [--repeat 5]
+"""
+import argparse
+import re
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from services.scraper.parsers import lxml, parse_ag_grid_rows, parse_listing_table
+
+FIXTURES = Path(__file__).resolve().parent.parent / 'fixtures'
+COUNTIES = {'Morris': 9, 'Bergen': 7, 'Essex': 2, 'Union': 15, 'Hudson': 10}
+
+def full_document_listing(html, url):
+    """The original approach: parse everything, then find the table"""
+    soup = BeautifulSoup(html, 'html.parser')
+    table = soup.find('table', class_='table table-striped')
+    rows = table.find('tbody').find_all('tr')
+    return [[cell.text.strip() for cell in row.find_all('td')] for row in rows]
+
+def full_document_ag_grid(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    rows = [{cell.get('colid'): cell.text.strip() for cell in row.find_all('div', class_='ag-cell') if cell.get('colid')}
+            for row in soup.find_all('div', class_='ag-row')]
+    return [row for row in rows if row]
+
+def inflate(html, row_pattern, rows):
+    """Repeat the fixture's rows until the page holds about ``rows`` of them"""
+    found = re.findall(row_pattern, html, flags=re.S)
+    if not found:
+        return html
+    block = ''.join(found)
+    body = block * max(1, rows // len(found))
+    return html.replace(block, body, 1)
+
+def timed(function, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=400, help='Listing rows per page')
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per parser; the best is reported')
+    args = parser.parse_args()
+
+    cases = []
+    for county, county_id in COUNTIES.items():
+        html = (FIXTURES / 'civilview' / f'{county.lower()}_listing.html').read_text()
+        html = inflate(html, r'\s*<tr>\s*<td><a href=.*?</tr>', args.rows)
+        url = f'https://salesweb.civilview.com/Sales/SalesSearch?countyId={county_id}'
+        cases.append((county, html,
+                      lambda html=html, url=url: full_document_listing(html, url),
+                      {'lxml': lambda html=html, url=url: parse_listing_table(html, url, 'lxml'),
+                       'soup': lambda html=html, url=url: parse_listing_table(html, url, 'soup')}))
+    html = (FIXTURES / 'morris_clerk' / 'search_results.html').read_text()
+    html = inflate(html, r'\s*<div role="row".*?colid="bookPage".*?</div>\s*</div>', args.rows)
+    cases.append(('Morris clerk (ag-grid)', html, lambda html=html: full_document_ag_grid(html),
+                  {'lxml': lambda html=html: parse_ag_grid_rows(html, 'lxml'),
+                   'soup': lambda html=html: parse_ag_grid_rows(html, 'soup')}))
+
+    engines = ['lxml', 'soup'] if lxml else ['soup']
+    header = f"{'page':<24}{'rows':>6}{'before rows/s':>16}" + ''.join(f'{e + " rows/s":>16}{"x":>7}' for e in engines)
+    print(header)
+    print('-' * len(header))
+    for name, html, before, after in cases:
+        before_time, before_rows = timed(before, args.repeat)
+        line = f'{name:<24}{len(before_rows):>6}{len(before_rows) / before_time:>16,.0f}'
+        for engine in engines:
+            engine_time, rows = timed(after[engine], args.repeat)
+            assert len(rows) == len(before_rows), f'{name}: {engine} parsed {len(rows)} rows'
+            line += f'{len(rows) / engine_time:>16,.0f}{before_time / engine_time:>7.1f}'
+        print(line)
+
+if __name__ == '__main__':
+    main()
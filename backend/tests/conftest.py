@@ -10,6 +10,10 @@ from flask_jwt_extended import JWTManager, create_access_token
 from flask_cors import CORS
 import uuid
 from dotenv import load_dotenv
+
+# Before app is imported: its module-level app must not start the scrape worker
+os.environ['FLASK_ENV'] = 'testing'
+
 from app import create_app
 from models import db as _db
 
@@ -0,0 +1,259 @@
+import pytest
+from datetime import date, timedelta
+from models import Tenant, Property, Lease
+import logging
+
+logger = logging.getLogger(__name__)
+
+@pytest.fixture
+def portfolio(db_session, test_user):
+    """Two owned properties, two tenants and a mix of active / expired leases"""
+    today = date.today()
+    duplex = Property(owner_id=test_user.id, address='1 Duplex Rd', purchase_price=300000, numUnits=2)
+    house = Property(owner_id=test_user.id, address='2 Vacant Ln', purchase_price=200000, numUnits=1)
+    db_session.add_all([duplex, house])
+    db_session.flush()
+
+    alice = Tenant(firstName='Alice', lastName='Lane', email=f'alice_{test_user.id}@example.com',
+                   dateOfBirth=date(1988, 5, 1), manager_id=test_user.id, creditCheck2Complete=True)
+    bob = Tenant(firstName='Bob', lastName='Moss', email=f'bob_{test_user.id}@example.com',
+                 dateOfBirth=date(1979, 2, 3), manager_id=test_user.id)
+    db_session.add_all([alice, bob])
+    db_session.flush()
+
+    leases = [
+        Lease(tenantId=alice.id, propertyId=duplex.id, startDate=today - timedelta(days=300),
+              endDate=today + timedelta(days=45), rentAmount=1500, typeOfLease='Fixed', unit='A'),
+        Lease(tenantId=bob.id, propertyId=duplex.id, startDate=today - timedelta(days=100),
+              endDate=today + timedelta(days=80), rentAmount=1200, typeOfLease='Fixed', unit='B'),
+        Lease(tenantId=bob.id, propertyId=house.id, startDate=today - timedelta(days=800),
+              endDate=today - timedelta(days=435), rentAmount=900, typeOfLease='Fixed')
+    ]
+    db_session.add_all(leases)
+    db_session.commit()
+    return {'duplex': duplex, 'house': house, 'alice': alice, 'bob': bob, 'leases': leases}
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_rent_roll(client, auth_headers, portfolio):
+    """Test rent roll returns active leases with tenant names and per-property totals"""
+    logger.info('🏘️ Testing rent roll endpoint')
+    response = client.get('/api/rent-roll', headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json
+    by_id = {p['propertyId']: p for p in data['properties']}
+
+    duplex = by_id[portfolio['duplex'].id]
+    assert duplex['activeLeases'] == 2
+    assert duplex['occupancyRate'] == 1.0
+    assert duplex['scheduledMonthlyRent'] == 2700
+    assert {l['tenantName'] for l in duplex['leases']} == {'Alice Lane', 'Bob Moss'}
+
+    vacant = by_id[portfolio['house'].id]
+    assert vacant['activeLeases'] == 0
+    assert vacant['occupancyRate'] == 0.0
+    assert vacant['leases'] == []
+
+    assert data['totals']['units'] == 3
+    assert data['totals']['occupiedUnits'] == 2
+    assert data['totals']['scheduledMonthlyRent'] == 2700
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_rent_roll_as_of(client, auth_headers, portfolio):
+    """Test the as_of parameter selects leases active on that date"""
+    as_of = (date.today() - timedelta(days=500)).isoformat()
+    response = client.get(f'/api/rent-roll?as_of={as_of}', headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json['totals']['activeLeases'] == 1
+    assert response.json['totals']['scheduledMonthlyRent'] == 900
+
+    response = client.get('/api/rent-roll?as_of=yesterday', headers=auth_headers)
+    assert response.status_code == 400
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_rent_roll_turnover_day(client, auth_headers, portfolio, db_session):
+    """Test only the incoming lease counts on the day a unit turns over"""
+    outgoing = portfolio['leases'][0]
+    db_session.add(Lease(tenantId=portfolio['bob'].id, propertyId=portfolio['duplex'].id,
+                         startDate=outgoing.endDate, endDate=outgoing.endDate + timedelta(days=365),
+                         rentAmount=1600, typeOfLease='Fixed', unit='A'))
+    db_session.commit()
+
+    response = client.get(f'/api/rent-roll?as_of={outgoing.endDate.isoformat()}', headers=auth_headers)
+
+    duplex = {p['propertyId']: p for p in response.json['properties']}[portfolio['duplex'].id]
+    assert duplex['activeLeases'] == 2
+    assert duplex['scheduledMonthlyRent'] == 2800
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_lease_expirations(client, auth_headers, portfolio):
+    """Test upcoming expirations are bucketed by window with renewal check status"""
+    logger.info('📅 Testing lease expirations endpoint')
+    response = client.get('/api/leases/expirations?windows=30,60,90', headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json
+    assert data['buckets']['0-30'] == []
+    assert [l['tenantName'] for l in data['buckets']['31-60']] == ['Alice Lane']
+    assert [l['tenantName'] for l in data['buckets']['61-90']] == ['Bob Moss']
+    assert data['buckets']['31-60'][0]['creditCheck2Complete'] is True
+    assert data['summary']['61-90']['renewalCreditChecksPending'] == 1
+    assert data['summary']['31-60']['rentAtRisk'] == 1500
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_lease_expirations_excludes_lease_ending_today(client, auth_headers, portfolio, db_session):
+    """Test a lease ending today has already expired and is not listed"""
+    db_session.add(Lease(tenantId=portfolio['alice'].id, propertyId=portfolio['house'].id,
+                         startDate=date.today() - timedelta(days=365), endDate=date.today(),
+                         rentAmount=900, typeOfLease='Fixed'))
+    db_session.commit()
+
+    response = client.get('/api/leases/expirations?windows=30', headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json['buckets']['0-30'] == []
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_lease_expirations_invalid_windows(client, auth_headers):
+    """Test invalid windows are rejected"""
+    assert client.get('/api/leases/expirations?windows=abc', headers=auth_headers).status_code == 400
+    assert client.get('/api/leases/expirations?windows=0', headers=auth_headers).status_code == 400
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_create_lease_rejects_overlap(client, auth_headers, portfolio):
+    """Test a lease overlapping the same unit is rejected, other units are allowed"""
+    today = date.today()
+    data = {
+        'tenantId': portfolio['alice'].id,
+        'propertyId': portfolio['duplex'].id,
+        'startDate': (today + timedelta(days=10)).isoformat(),
+        'endDate': (today + timedelta(days=375)).isoformat(),
+        'rentAmount': 1550,
+        'typeOfLease': 'Fixed',
+        'unit': 'A'
+    }
+    response = client.post('/api/leases', json=data, headers=auth_headers)
+    assert response.status_code == 409
+    assert response.json['conflicting_lease_id'] == portfolio['leases'][0].id
+
+    # Starting on the day the current lease ends is not an overlap
+    data['startDate'] = (today + timedelta(days=45)).isoformat()
+    response = client.post('/api/leases', json=data, headers=auth_headers)
+    assert response.status_code == 201
+    assert response.json['unit'] == 'A'
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_create_lease_whole_property_overlaps_units(client, auth_headers, portfolio):
+    """Test a lease without a unit conflicts with the leases on every unit"""
+    today = date.today()
+    data = {
+        'tenantId': portfolio['alice'].id,
+        'propertyId': portfolio['duplex'].id,
+        'startDate': (today + timedelta(days=60)).isoformat(),
+        'endDate': (today + timedelta(days=400)).isoformat(),
+        'rentAmount': 2600,
+        'typeOfLease': 'Fixed'
+    }
+    response = client.post('/api/leases', json=data, headers=auth_headers)
+    assert response.status_code == 409
+    assert response.json['conflicting_lease_id'] == portfolio['leases'][1].id
+
+    # Once both units are free the whole property can be let
+    data['startDate'] = (today + timedelta(days=80)).isoformat()
+    response = client.post('/api/leases', json=data, headers=auth_headers)
+    assert response.status_code == 201
+
+    data.update(unit='A', startDate=(today + timedelta(days=500)).isoformat(),
+                endDate=(today + timedelta(days=600)).isoformat())
+    assert client.post('/api/leases', json=data, headers=auth_headers).status_code == 201
+    data.update(startDate=(today + timedelta(days=300)).isoformat())
+    assert client.post('/api/leases', json=data, headers=auth_headers).status_code == 409
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_update_lease_rejects_overlap(client, auth_headers, portfolio):
+    """Test moving a lease onto an occupied unit or period is rejected"""
+    alice, bob, _ = portfolio['leases']
+    today = date.today()
+
+    response = client.put(f'/api/leases/{bob.id}', json={'unit': 'A'}, headers=auth_headers)
+    assert response.status_code == 409
+    assert response.json['conflicting_lease_id'] == alice.id
+
+    response = client.put(f'/api/leases/{alice.id}', json={'unit': None}, headers=auth_headers)
+    assert response.status_code == 409
+    assert response.json['conflicting_lease_id'] == bob.id
+
+    # Changing only its own dates is not a conflict with itself
+    end = (today + timedelta(days=90)).isoformat()
+    response = client.put(f'/api/leases/{alice.id}', json={'endDate': end}, headers=auth_headers)
+    assert response.status_code == 200
+    assert Lease.query.get(alice.id).endDate.isoformat() == end
+
+    response = client.put(f'/api/leases/{bob.id}', json={'endDate': 'later'}, headers=auth_headers)
+    assert response.status_code == 400
+
+    response = client.put(f'/api/leases/{bob.id}', json={'unit': ['A']}, headers=auth_headers)
+    assert response.status_code == 400
+    assert response.json['error'] == 'unit must be a string'
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_import_leases_reports_conflicts(client, auth_headers, portfolio):
+    """Test batch import reports in-batch and stored-lease overlaps without writing"""
+    today = date.today()
+    base = {
+        'tenantId': portfolio['bob'].id,
+        'propertyId': portfolio['house'].id,
+        'rentAmount': 1000,
+        'typeOfLease': 'Fixed'
+    }
+    rows = [
+        dict(base, startDate=today.isoformat(), endDate=(today + timedelta(days=200)).isoformat()),
+        dict(base, startDate=(today + timedelta(days=100)).isoformat(), endDate=(today + timedelta(days=300)).isoformat()),
+        dict(base, propertyId=portfolio['duplex'].id, unit='B',
+             startDate=today.isoformat(), endDate=(today + timedelta(days=30)).isoformat()),
+        dict(base, rentAmount=-5, startDate=today.isoformat(), endDate=(today + timedelta(days=30)).isoformat())
+    ]
+
+    response = client.post('/api/leases/import', json={'leases': rows}, headers=auth_headers)
+
+    assert response.status_code == 409
+    errors = {e['row']: e['errors'] for e in response.json['errors']}
+    assert errors[1] == ['Overlaps row 0']
+    assert errors[2] == [f"Overlaps existing lease {portfolio['leases'][1].id}"]
+    assert errors[3] == ['Rent amount must be greater than 0']
+    assert 0 not in errors
+    assert Lease.query.filter_by(propertyId=portfolio['house'].id).count() == 1
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_import_leases_inserts_valid_batch(client, auth_headers, portfolio):
+    """Test a clean batch validates on dry run and then inserts in one call"""
+    today = date.today()
+    rows = [{
+        'tenantId': portfolio['bob'].id,
+        'propertyId': portfolio['house'].id,
+        'startDate': (today + timedelta(days=365 * i)).isoformat(),
+        'endDate': (today + timedelta(days=365 * (i + 1))).isoformat(),
+        'rentAmount': 1000 + i,
+        'typeOfLease': 'Fixed'
+    } for i in range(3)]
+
+    response = client.post('/api/leases/import', json={'leases': rows, 'dry_run': True}, headers=auth_headers)
+    assert response.status_code == 200
+    assert Lease.query.filter_by(propertyId=portfolio['house'].id).count() == 1
+
+    response = client.post('/api/leases/import', json={'leases': rows}, headers=auth_headers)
+    assert response.status_code == 201
+    assert response.json['imported'] == 3
+    assert Lease.query.filter_by(propertyId=portfolio['house'].id).count() == 4
@@ -211,4 +211,146 @@ def test_detailed_validation(client, test_property, test_tenant, auth_headers, l
                          headers=auth_headers)
     assert response.status_code == 400
     
-    logger.info("✅ Detailed validation test completed") 
\ No newline at end of file
+    logger.info("✅ Detailed validation test completed") 
+@pytest.fixture
+def maintenance_book(db_session, test_user, test_tenant):
+    """Requests on an owned property and on someone else's property"""
+    from datetime import datetime
+    other = User(first_name='Other', last_name='Owner', email=f'other_{test_user.id}@example.com')
+    other.set_password('password123')
+    db_session.add(other)
+    db_session.flush()
+    mine = Property(owner_id=test_user.id, address='5 Owned Way', purchase_price=150000)
+    theirs = Property(owner_id=other.id, address='6 Other Way', purchase_price=150000)
+    db_session.add_all([mine, theirs])
+    db_session.flush()
+
+    statuses = ['pending', 'in_progress', 'completed', 'pending', 'cancelled']
+    requests = []
+    for day, status in enumerate(statuses, start=1):
+        requests.append(PropertyMaintenanceRequest(
+            propertyId=mine.id, tenantId=test_tenant.id, description=f'Request {day}',
+            status=status, createdAt=datetime(2024, 3, day, 9, 0)
+        ))
+    requests.append(PropertyMaintenanceRequest(
+        propertyId=theirs.id, tenantId=test_tenant.id, description='Not yours',
+        status='pending', createdAt=datetime(2024, 3, 3, 9, 0)
+    ))
+    db_session.add_all(requests)
+    db_session.commit()
+    return {'mine': mine, 'theirs': theirs, 'requests': requests}
+
+@pytest.mark.integration
+def test_list_maintenance_requests_scoped_and_paginated(client, auth_headers, maintenance_book, logger):
+    """Test listing only returns the caller's requests, newest first, by keyset pages"""
+    logger.info('🔧 Starting maintenance pagination test...')
+
+    seen = []
+    cursor = None
+    while True:
+        url = '/api/property-maintenance-requests?limit=2' + (f'&cursor={cursor}' if cursor else '')
+        response = client.get(url, headers=auth_headers)
+        assert response.status_code == 200
+        seen.extend(r['description'] for r in response.json)
+        cursor = response.headers.get('X-Next-Cursor')
+        if not cursor:
+            break
+
+    assert seen == ['Request 5', 'Request 4', 'Request 3', 'Request 2', 'Request 1']
+
+    response = client.get(f"/api/property-maintenance-requests?property_id={maintenance_book['theirs'].id}",
+                          headers=auth_headers)
+    assert response.json == []
+
+@pytest.mark.integration
+def test_list_maintenance_requests_filters(client, auth_headers, maintenance_book, logger):
+    """Test status and created date filters"""
+    response = client.get('/api/property-maintenance-requests?status=pending,in_progress',
+                          headers=auth_headers)
+    assert [r['description'] for r in response.json] == ['Request 4', 'Request 2', 'Request 1']
+
+    response = client.get('/api/property-maintenance-requests?created_after=2024-03-02&created_before=2024-03-04',
+                          headers=auth_headers)
+    assert [r['description'] for r in response.json] == ['Request 3', 'Request 2']
+
+    assert client.get('/api/property-maintenance-requests?status=lost',
+                      headers=auth_headers).status_code == 400
+    assert client.get('/api/property-maintenance-requests?created_after=March',
+                      headers=auth_headers).status_code == 400
+    assert client.get('/api/property-maintenance-requests?cursor=bogus',
+                      headers=auth_headers).status_code == 400
+    response = client.get('/api/property-maintenance-requests?property_id=abc', headers=auth_headers)
+    assert response.status_code == 400
+    assert response.json['error'] == 'property_id must be an integer'
+
+@pytest.mark.integration
+def test_maintenance_analytics(client, auth_headers, maintenance_book, db_session, logger):
+    """Test SLA counts, turnaround percentiles and pending aging"""
+    logger.info('🔧 Starting maintenance analytics test...')
+    for req, hours in zip(maintenance_book['requests'], [None, None, 10, None, None]):
+        req.timeToCompletion = hours
+    extra = [
+        PropertyMaintenanceRequest(propertyId=maintenance_book['mine'].id, tenantId=req.tenantId,
+                                   description='Done', status='completed', timeToCompletion=hours)
+        for req, hours in zip(maintenance_book['requests'], [20, 30, 40])
+    ]
+    db_session.add_all(extra)
+    db_session.commit()
+
+    response = client.get('/api/property-maintenance-requests/analytics', headers=auth_headers)
+
+    assert response.status_code == 200
+    portfolio = response.json['portfolio']
+    assert portfolio['openCount'] == 3
+    assert portfolio['pendingCount'] == 2
+    assert portfolio['completedCount'] == 4
+    assert portfolio['medianTimeToCompletion'] == 25.0
+    assert portfolio['p90TimeToCompletion'] == 37.0
+    assert portfolio['pendingAge']['oldestRequestId'] == maintenance_book['requests'][0].id
+    assert portfolio['pendingAge']['buckets']['30d+'] == 2
+
+    assert [p['propertyId'] for p in response.json['byProperty']] == [maintenance_book['mine'].id]
+    assert response.json['byTenant'][0]['openCount'] == 3
+
+@pytest.mark.integration
+def test_maintenance_queue_and_claim(client, auth_headers, maintenance_book, db_session, test_user, logger):
+    """Test the dispatch queue order and that claims never hand out the same request twice"""
+    logger.info('🔧 Starting maintenance dispatch test...')
+    first, _, _, fourth, _ = maintenance_book['requests'][:5]
+    fourth.priority = 0  # urgent jumps the queue despite being newer
+    db_session.commit()
+
+    response = client.get('/api/property-maintenance-requests/queue', headers=auth_headers)
+    assert response.status_code == 200
+    assert [r['id'] for r in response.json] == [fourth.id, first.id]
+
+    response = client.post('/api/property-maintenance-requests/claim', json={'count': 1}, headers=auth_headers)
+    assert response.status_code == 200
+    assert [r['id'] for r in response.json['requests']] == [fourth.id]
+    assert response.json['requests'][0]['status'] == 'in_progress'
+    assert response.json['requests'][0]['assignedTo'] == test_user.id
+
+    response = client.post('/api/property-maintenance-requests/claim', json={'count': 5}, headers=auth_headers)
+    assert [r['id'] for r in response.json['requests']] == [first.id]
+
+    response = client.post('/api/property-maintenance-requests/claim', json={}, headers=auth_headers)
+    assert response.json['claimed'] == 0
+
+    assert client.get('/api/property-maintenance-requests/queue?property_id=abc',
+                      headers=auth_headers).status_code == 400
+    assert client.post('/api/property-maintenance-requests/claim', json={'property_id': 'abc'},
+                       headers=auth_headers).status_code == 400
+
+@pytest.mark.integration
+def test_maintenance_priority_validation(client, auth_headers, maintenance_book, test_tenant, logger):
+    """Test priority accepts names or levels and rejects anything else"""
+    body = {'propertyId': maintenance_book['mine'].id, 'tenantId': test_tenant.id, 'description': 'Leak'}
+    response = client.post('/api/property-maintenance-requests', json=dict(body, priority='urgent'),
+                           headers=auth_headers)
+    assert response.status_code == 201
+    assert PropertyMaintenanceRequest.query.get(response.json['id']).priority == 0
+
+    assert client.post('/api/property-maintenance-requests', json=dict(body, priority='asap'),
+                       headers=auth_headers).status_code == 400
+    assert client.get('/api/property-maintenance-requests/queue?status=completed',
+                      headers=auth_headers).status_code == 400
@@ -0,0 +1,100 @@
+import pytest
+from datetime import date, timedelta
+from models import Property, Phase
+import logging
+
+logger = logging.getLogger(__name__)
+
+@pytest.fixture
+def plan(db_session, test_user):
+    """A property with three planned phases, the first one already finished"""
+    today = date.today()
+    property = Property(owner_id=test_user.id, address='3 Plan Pl', purchase_price=180000)
+    db_session.add(property)
+    db_session.flush()
+    phases = [
+        Phase(property_id=property.id, name='Closing', order=0,
+              startDate=today - timedelta(days=30), endDate=today - timedelta(days=10),
+              expectedStartDate=today - timedelta(days=30), expectedEndDate=today - timedelta(days=10)),
+        Phase(property_id=property.id, name='Demolition', order=1,
+              startDate=today + timedelta(days=5),
+              expectedStartDate=today + timedelta(days=5), expectedEndDate=today + timedelta(days=20)),
+        Phase(property_id=property.id, name='Framing', order=2,
+              expectedStartDate=today + timedelta(days=20), expectedEndDate=today + timedelta(days=50))
+    ]
+    db_session.add_all(phases)
+    db_session.commit()
+    return {'property': property, 'phases': phases}
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_bulk_create_appends_plan(client, auth_headers, plan):
+    """Test a batch of phases is appended after the existing ones"""
+    logger.info('🧱 Testing bulk phase create')
+    today = date.today()
+    response = client.post(f"/api/properties/{plan['property'].id}/phases/bulk", json={
+        'create': [
+            {'name': 'Electrical', 'expectedStartDate': (today + timedelta(days=50)).isoformat()},
+            {'name': 'Listing', 'expectedEndDate': (today + timedelta(days=90)).isoformat()}
+        ]
+    }, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json['created'] == 2
+    phases = response.json['phases']
+    assert [p['name'] for p in phases] == ['Closing', 'Demolition', 'Framing', 'Electrical', 'Listing']
+    assert [p['order'] for p in phases] == [0, 1, 2, 3, 4]
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_bulk_reorder(client, auth_headers, plan):
+    """Test reordering renumbers every phase"""
+    closing, demolition, framing = (p.id for p in plan['phases'])
+    response = client.post(f"/api/properties/{plan['property'].id}/phases/bulk",
+                           json={'order': [closing, framing, demolition]}, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert [p['name'] for p in response.json['phases']] == ['Closing', 'Framing', 'Demolition']
+
+    response = client.post(f"/api/properties/{plan['property'].id}/phases/bulk",
+                           json={'order': [closing, framing]}, headers=auth_headers)
+    assert response.status_code == 400
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_bulk_shift_downstream(client, auth_headers, plan):
+    """Test shifting from a phase moves it and later phases, leaving past dates alone"""
+    today = date.today()
+    closing, demolition, framing = plan['phases']
+    response = client.post(f"/api/properties/{plan['property'].id}/phases/bulk",
+                           json={'shift': {'days': 7, 'fromPhaseId': demolition.id}}, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json['shifted'] == 2
+    by_name = {p['name']: p for p in response.json['phases']}
+    assert by_name['Closing']['expectedEndDate'] == (today - timedelta(days=10)).isoformat()
+    assert by_name['Demolition']['startDate'] == (today + timedelta(days=12)).isoformat()
+    assert by_name['Demolition']['expectedEndDate'] == (today + timedelta(days=27)).isoformat()
+    assert by_name['Framing']['expectedStartDate'] == (today + timedelta(days=27)).isoformat()
+    assert by_name['Framing']['startDate'] is None
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_bulk_rejects_invalid_requests(client, auth_headers, plan):
+    """Test invalid rows are reported before anything is written"""
+    response = client.post(f"/api/properties/{plan['property'].id}/phases/bulk",
+                           json={'create': [{'name': ''}, {'name': 'Roof', 'endDate': 'soon'}]},
+                           headers=auth_headers)
+    assert response.status_code == 400
+    assert [e['row'] for e in response.json['errors']] == [0, 1]
+    phases = Phase.query.filter_by(property_id=plan['property'].id).order_by(Phase.order).all()
+    assert [p.name for p in phases] == ['Closing', 'Demolition', 'Framing']
+
+    # A bad shift anchor rolls back the reorder sent with it
+    closing, demolition, framing = (p.id for p in plan['phases'])
+    response = client.post(f"/api/properties/{plan['property'].id}/phases/bulk", json={
+        'order': [framing, demolition, closing],
+        'shift': {'days': 3, 'fromPhaseId': 999999}
+    }, headers=auth_headers)
+    assert response.status_code == 400
+    assert 'fromPhaseId' in response.json['error']
@@ -0,0 +1,134 @@
+import pytest
+from datetime import date, timedelta
+from models import Property, Phase, PhaseProgress
+from models.phase_progress import refresh_phase_progress, refresh_stale_phase_progress
+import logging
+
+logger = logging.getLogger(__name__)
+
+@pytest.fixture
+def pipeline(db_session, test_user):
+    """One property per stage; the rehab has an overdue phase"""
+    today = date.today()
+    buying = Property(owner_id=test_user.id, address='1 Offer St', purchase_price=100000)
+    rehab = Property(owner_id=test_user.id, address='2 Gut Job Ave', purchase_price=120000,
+                     current_phase='REHAB')
+    selling = Property(owner_id=test_user.id, address='3 Listing Ln', purchase_price=140000,
+                       current_phase='SALE')
+    db_session.add_all([buying, rehab, selling])
+    db_session.flush()
+    overdue = Phase(property_id=rehab.id, name='Renovation', startDate=today - timedelta(days=60),
+                    expectedEndDate=today - timedelta(days=5))
+    db_session.add_all([
+        overdue,
+        Phase(property_id=rehab.id, name='Closing', endDate=today - timedelta(days=70),
+              expectedEndDate=today - timedelta(days=75)),
+        Phase(property_id=selling.id, name='Listing', expectedEndDate=today + timedelta(days=30))
+    ])
+    db_session.commit()
+    return {'buying': buying, 'rehab': rehab, 'selling': selling, 'overdue': overdue}
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_phase_progress_counts(client, auth_headers, pipeline):
+    """Test counts per stage and late properties come from the rollup"""
+    logger.info('📊 Testing phase progress rollup endpoint')
+    response = client.get('/api/properties/phase-progress', headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json
+    assert data['byPhase'] == {
+        'ACQUISITION': {'properties': 1, 'late': 0},
+        'REHAB': {'properties': 1, 'late': 1},
+        'SALE': {'properties': 1, 'late': 0}
+    }
+    assert data['totals']['phases'] == 3
+    assert data['totals']['completedPhases'] == 1
+    assert data['totals']['lateCompletedPhases'] == 1
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_phase_progress_follows_writes(client, auth_headers, pipeline, db_session):
+    """Test phase and property writes keep the rollup current"""
+    pipeline['overdue'].endDate = date.today()
+    pipeline['buying'].current_phase = 'REHAB'
+    db_session.commit()
+
+    rollup = db_session.get(PhaseProgress, pipeline['rehab'].id)
+    assert (rollup.completed_phases, rollup.open_due_date) == (2, None)
+
+    data = client.get('/api/properties/phase-progress', headers=auth_headers).json
+    assert data['byPhase']['REHAB'] == {'properties': 2, 'late': 0}
+    assert data['byPhase']['ACQUISITION']['properties'] == 0
+
+    db_session.delete(pipeline['selling'].phases[0])
+    db_session.delete(pipeline['selling'])
+    db_session.commit()
+    assert db_session.get(PhaseProgress, pipeline['selling'].id) is None
+    assert client.get('/api/properties/phase-progress', headers=auth_headers).json['totals']['properties'] == 2
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_bulk_phase_changes_refresh_rollup(client, auth_headers, pipeline, db_session):
+    """Test the bulk phase endpoint refreshes the rollup it bypasses"""
+    response = client.post(f"/api/properties/{pipeline['buying'].id}/phases/bulk", json={
+        'create': [{'name': 'Inspection', 'expectedEndDate': (date.today() - timedelta(days=1)).isoformat()}]
+    }, headers=auth_headers)
+    assert response.status_code == 200
+
+    data = client.get('/api/properties/phase-progress', headers=auth_headers).json
+    assert data['byPhase']['ACQUISITION'] == {'properties': 1, 'late': 1}
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_future_end_date_is_not_completed(client, auth_headers, pipeline, db_session):
+    """Test a phase scheduled to end later stays open and late against its expected end"""
+    pipeline['overdue'].endDate = date.today() + timedelta(days=10)
+    db_session.commit()
+
+    rollup = db_session.get(PhaseProgress, pipeline['rehab'].id)
+    assert rollup.completed_phases == 1
+    assert rollup.open_due_date == date.today() - timedelta(days=5)
+    assert rollup.next_end_date == date.today() + timedelta(days=10)
+
+    data = client.get('/api/properties/phase-progress', headers=auth_headers).json
+    assert data['byPhase']['REHAB'] == {'properties': 1, 'late': 1}
+    assert data['totals']['completedPhases'] == 1
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_stale_rollup_is_read_from_phases(client, auth_headers, pipeline, db_session):
+    """Test rows built before a phase's endDate are recomputed on read, without writing"""
+    pipeline['overdue'].endDate = date.today() - timedelta(days=1)
+    db_session.commit()
+    # As if the row was last built a week ago, before the phase ended
+    refresh_phase_progress(db_session.connection(), [pipeline['rehab'].id],
+                           as_of=date.today() - timedelta(days=7))
+    db_session.commit()
+    assert db_session.get(PhaseProgress, pipeline['rehab'].id).completed_phases == 1
+
+    data = client.get('/api/properties/phase-progress', headers=auth_headers).json
+
+    assert data['byPhase']['REHAB'] == {'properties': 1, 'late': 0}
+    assert data['totals']['completedPhases'] == 2
+    db_session.expire_all()
+    assert db_session.get(PhaseProgress, pipeline['rehab'].id).completed_phases == 1
+
+    assert refresh_stale_phase_progress(db_session.connection()) == 1
+    db_session.commit()
+    rollup = db_session.get(PhaseProgress, pipeline['rehab'].id)
+    assert (rollup.completed_phases, rollup.next_end_date) == (2, None)
+    assert refresh_stale_phase_progress(db_session.connection()) == 0
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_phase_progress_as_of(client, auth_headers, pipeline):
+    """Test completed counts and lateness both follow as_of"""
+    as_of = (date.today() - timedelta(days=72)).isoformat()
+    data = client.get(f'/api/properties/phase-progress?as_of={as_of}', headers=auth_headers).json
+
+    assert data['asOf'] == as_of
+    # The closing phase ended 70 days ago, so it was still open and already past its expected end
+    assert data['totals']['completedPhases'] == 0
+    assert data['totals']['lateCompletedPhases'] == 0
+    assert data['byPhase']['REHAB'] == {'properties': 1, 'late': 1}
@@ -0,0 +1,70 @@
+import pytest
+from datetime import date, timedelta
+from models import Property, Phase
+import logging
+
+logger = logging.getLogger(__name__)
+
+@pytest.fixture
+def rehabs(db_session, test_user):
+    """One rehab running two weeks late and one finished on schedule"""
+    today = date.today()
+    late = Property(owner_id=test_user.id, address='1 Late Ln', purchase_price=200000)
+    done = Property(owner_id=test_user.id, address='2 Done Dr', purchase_price=150000)
+    db_session.add_all([late, done])
+    db_session.flush()
+    db_session.add_all([
+        Phase(property_id=late.id, name='Closing', expectedStartDate=today - timedelta(days=100),
+              startDate=today - timedelta(days=100), expectedEndDate=today - timedelta(days=80),
+              endDate=today - timedelta(days=66)),
+        Phase(property_id=late.id, name='Renovation', expectedStartDate=today - timedelta(days=80),
+              startDate=today - timedelta(days=66), expectedEndDate=today + timedelta(days=20)),
+        Phase(property_id=late.id, name='Sale', expectedStartDate=today + timedelta(days=20),
+              expectedEndDate=today + timedelta(days=50)),
+        Phase(property_id=done.id, name='Closing', expectedStartDate=today - timedelta(days=60),
+              startDate=today - timedelta(days=60), expectedEndDate=today - timedelta(days=30),
+              endDate=today - timedelta(days=30))
+    ])
+    db_session.commit()
+    return {'late': late, 'done': done}
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_portfolio_timeline(client, auth_headers, rehabs):
+    """Test per-property slip and portfolio totals come back from one call"""
+    logger.info('🗓️ Testing portfolio timeline endpoint')
+    response = client.get('/api/properties/timeline', headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json
+    by_id = {p['propertyId']: p for p in data['properties']}
+
+    late = by_id[rehabs['late'].id]
+    assert late['slipDays'] == 14
+    assert late['criticalPhase']['name'] == 'Sale'
+    assert late['projectedCompletion'] == (date.today() + timedelta(days=64)).isoformat()
+    assert by_id[rehabs['done'].id]['isComplete'] is True
+
+    portfolio = data['portfolio']
+    assert portfolio['properties'] == 2
+    assert portfolio['lateProperties'] == 1
+    assert portfolio['onScheduleProperties'] == 1
+    assert portfolio['maxSlipDays'] == 14
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_property_timeline(client, auth_headers, rehabs):
+    """Test the single-property timeline lists phases in planned order"""
+    response = client.get(f"/api/properties/{rehabs['late'].id}/timeline", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert response.json['property']['phaseCount'] == 3
+    assert [p['name'] for p in response.json['phases']] == ['Closing', 'Renovation', 'Sale']
+    assert [p['status'] for p in response.json['phases']] == ['completed', 'in_progress', 'not_started']
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_timeline_invalid_requests(client, auth_headers, rehabs):
+    """Test a bad as_of and an unknown property are rejected"""
+    assert client.get('/api/properties/timeline?as_of=soon', headers=auth_headers).status_code == 400
+    assert client.get('/api/properties/999999/timeline', headers=auth_headers).status_code == 404
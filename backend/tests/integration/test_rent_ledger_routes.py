@@ -0,0 +1,90 @@
+import pytest
+from datetime import date
+from models import Tenant, Property, Lease, RentCharge, RentPayment
+import logging
+
+logger = logging.getLogger(__name__)
+
+@pytest.fixture
+def leased_property(db_session, test_user):
+    """One owned property with a lease running through 2024"""
+    property = Property(owner_id=test_user.id, address='9 Ledger Ave', purchase_price=250000)
+    tenant = Tenant(firstName='Rae', lastName='Stone', email=f'rae_{test_user.id}@example.com',
+                    dateOfBirth=date(1985, 7, 7), manager_id=test_user.id)
+    db_session.add_all([property, tenant])
+    db_session.flush()
+    lease = Lease(tenantId=tenant.id, propertyId=property.id, startDate=date(2024, 1, 5),
+                  endDate=date(2025, 1, 5), rentAmount=1000, typeOfLease='Fixed')
+    db_session.add(lease)
+    db_session.commit()
+    return {'property': property, 'tenant': tenant, 'lease': lease}
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_generate_rent_charges(client, auth_headers, leased_property):
+    """Test charges are generated once per month and re-runs are idempotent"""
+    logger.info('🧾 Testing rent charge generation')
+    body = {'start': '2024-01-01', 'end': '2025-01-01'}
+    response = client.post('/api/rent-ledger/generate', json=body, headers=auth_headers)
+
+    assert response.status_code == 201
+    assert response.json['generated'] == 12
+    charges = RentCharge.query.filter_by(leaseId=leased_property['lease'].id).order_by(RentCharge.dueDate).all()
+    assert [c.dueDate for c in charges][:2] == [date(2024, 1, 5), date(2024, 2, 5)]
+
+    response = client.post('/api/rent-ledger/generate', json=body, headers=auth_headers)
+    assert response.json['generated'] == 0
+    assert response.json['skipped'] == 12
+
+    response = client.post('/api/rent-ledger/generate', json={'start': '2024-02-01', 'end': '2024-01-01'},
+                           headers=auth_headers)
+    assert response.status_code == 400
+
+    response = client.post('/api/rent-ledger/generate', json={'property_id': 'abc'}, headers=auth_headers)
+    assert response.status_code == 400
+    assert response.json['error'] == 'property_id must be an integer'
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_rent_arrears_aging(client, auth_headers, leased_property):
+    """Test payments settle the oldest charges and the remainder is aged"""
+    lease_id = leased_property['lease'].id
+    client.post('/api/rent-ledger/generate', json={'start': '2024-01-01', 'end': '2025-01-01'},
+                headers=auth_headers)
+    for amount, paid_on in ((1000, '2024-01-05'), (1500, '2024-03-01')):
+        response = client.post(f'/api/leases/{lease_id}/payments',
+                               json={'amount': amount, 'paymentDate': paid_on, 'method': 'ACH'},
+                               headers=auth_headers)
+        assert response.status_code == 201
+
+    # Charged Jan-Jun = 6000, paid 2500: Mar (97 days late) half paid, Apr-Jun unpaid
+    response = client.get('/api/rent-ledger/arrears?as_of=2024-06-10', headers=auth_headers)
+
+    assert response.status_code == 200
+    [entry] = response.json['leases']
+    assert entry['charged'] == 6000
+    assert entry['paid'] == 2500
+    assert entry['balance'] == 3500
+    assert entry['aging'] == {'0-30': 1000.0, '31-60': 1000.0, '61-90': 1000.0, '90+': 500.0}
+    assert response.json['totals']['balance'] == 3500
+
+    response = client.get(f'/api/leases/{lease_id}/ledger?as_of=2024-06-10', headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json['balance'] == 3500
+    assert len(response.json['payments']) == 2
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_record_payment_validation(client, auth_headers, leased_property):
+    """Test invalid payments and unknown leases are rejected"""
+    lease_id = leased_property['lease'].id
+    assert client.post(f'/api/leases/{lease_id}/payments', json={'amount': -1},
+                       headers=auth_headers).status_code == 400
+    for amount in ('nan', 'inf', '-inf'):
+        assert client.post(f'/api/leases/{lease_id}/payments', json={'amount': amount},
+                           headers=auth_headers).status_code == 400
+    assert client.post(f'/api/leases/{lease_id}/payments', json={'amount': 10, 'paymentDate': 'soon'},
+                       headers=auth_headers).status_code == 400
+    assert client.post('/api/leases/999999/payments', json={'amount': 10},
+                       headers=auth_headers).status_code == 404
+    assert RentPayment.query.count() == 0
@@ -0,0 +1,114 @@
+import pytest
+from datetime import date
+from models import Property, ConstructionDraw
+import logging
+
+logger = logging.getLogger(__name__)
+
+@pytest.fixture
+def owned_property(db_session, test_user):
+    """Create a property owned by the authenticated test user"""
+    property = Property(
+        owner_id=test_user.id,
+        address='123 Returns St',
+        purchase_price=100000,
+        purchaseCost=100000,
+        arvSalePrice=150000,
+        realtorFees=5000,
+        expectedYearlyRent=12000
+    )
+    db_session.add(property)
+    db_session.commit()
+    return property
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_get_property_returns(client, auth_headers, owned_property, db_session):
+    """Test IRR / NPV / equity multiple for one property"""
+    logger.info('📈 Testing property returns endpoint')
+    draw = ConstructionDraw(
+        property_id=owned_property.id,
+        release_date=date.today(),
+        amount=10000,
+        bank_account_number='123456'
+    )
+    db_session.add(draw)
+    db_session.commit()
+
+    response = client.get(f'/api/properties/{owned_property.id}/returns?hold_months=6',
+                          headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json
+    assert data['property_id'] == owned_property.id
+    assert data['hold_months'] == 6
+    assert len(data['cash_flows']) == 7
+    assert data['irr'] > 0
+    assert data['equity_multiple'] > 1
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_get_portfolio_returns(client, auth_headers, owned_property):
+    """Test batch returns for every property the user owns"""
+    response = client.get('/api/properties/returns?discount_rate=0.08', headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json
+    assert data['discount_rate'] == 0.08
+    assert [p['property_id'] for p in data['properties']] == [owned_property.id]
+    assert 'cash_flows' not in data['properties'][0]
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_returns_invalid_params(client, auth_headers, owned_property):
+    """Test invalid hold period is rejected"""
+    response = client.get(f'/api/properties/{owned_property.id}/returns?hold_months=abc',
+                          headers=auth_headers)
+    assert response.status_code == 400
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_returns_property_not_found(client, auth_headers):
+    """Test returns for a property the user does not own"""
+    response = client.get('/api/properties/999999/returns', headers=auth_headers)
+    assert response.status_code == 404
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_property_sensitivity(client, auth_headers, owned_property):
+    """Test sensitivity grid endpoint returns the broadcast grid"""
+    response = client.post(f'/api/properties/{owned_property.id}/sensitivity', json={
+        'axes': {
+            'arv': {'start': 120000, 'stop': 180000, 'num': 4},
+            'rehab_cost': [10000, 20000],
+            'hold_months': [6, 12]
+        },
+        'encoding': 'base64'
+    }, headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.json
+    assert data['axis_order'] == ['arv', 'rehab_cost', 'interest_rate', 'hold_months']
+    assert data['net_profit']['shape'] == [4, 2, 1, 2]
+    assert data['cash_on_cash']['encoding'] == 'base64'
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_property_sensitivity_invalid_axis(client, auth_headers, owned_property):
+    """Test unknown axes are rejected"""
+    response = client.post(f'/api/properties/{owned_property.id}/sensitivity',
+                           json={'axes': {'bogus': [1]}}, headers=auth_headers)
+    assert response.status_code == 400
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_property_sensitivity_invalid_range(client, auth_headers, owned_property):
+    """Test malformed axes and oversized ranges are rejected before computing"""
+    response = client.post(f'/api/properties/{owned_property.id}/sensitivity', json=[1],
+                           headers=auth_headers)
+    assert response.status_code == 400
+    for axes in ('arv', [1, 2], {'arv': {'start': 1, 'stop': 2, 'num': 10**12}},
+                 {'arv': {'start': 1, 'stop': 2, 'num': 0}}):
+        response = client.post(f'/api/properties/{owned_property.id}/sensitivity',
+                               json={'axes': axes}, headers=auth_headers)
+        assert response.status_code == 400
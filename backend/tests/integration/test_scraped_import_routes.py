@@ -0,0 +1,133 @@
+import pytest
+from unittest.mock import patch
+from models import Property
+from models.phase_progress import PhaseProgress
+from services.scraper.scrape_store import ScrapeStore
+import logging
+
+logger = logging.getLogger(__name__)
+
+def listing(property_id, county='Morris', **fields):
+    row = {'property_id': str(property_id),
+           'detail_link': f'https://salesweb.civilview.com/Sales/SaleDetails?PropertyId={property_id}',
+           'sheriff_number': f'CH-{property_id}', 'status_date': '2026-11-14', 'plaintiff': 'US BANK',
+           'defendant': f'OWNER {property_id}', 'address': f'{property_id} Main Street Dover NJ 07801',
+           'price': 250000, 'county': county, 'Zillow URL': f'https://www.zillow.com/homes/{property_id}_rb/'}
+    row.update(fields)
+    return row
+
+@pytest.fixture
+def scrape_store(tmp_path):
+    """Three Morris listings and one Bergen listing"""
+    path = str(tmp_path / 'scrape_store.db')
+    with patch('services.scraper.scrape_store.STORE_FILE', path), \
+         patch('services.scraper.scrape_store.LEGACY_CSV', str(tmp_path / 'merged_data.csv')):
+        with ScrapeStore(path) as store:
+            store.upsert([listing(1), listing(2), listing(3), listing(4, county='Bergen')])
+        yield path
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_import_county(client, auth_headers, test_user, db_session, scrape_store):
+    """Test a whole county is promoted in one call and mapped onto Property"""
+    logger.info('🏚️ Testing scraped listing import')
+    response = client.post('/api/scraped-properties/import', json={'county': 'Morris'}, headers=auth_headers)
+
+    assert response.status_code == 201
+    assert response.json['imported'] == 3
+    assert response.json['skipped'] == 0
+
+    imported = db_session.query(Property).filter(Property.id.in_(response.json['propertyIds'])).all()
+    first = next(p for p in imported if p.property_id == '1')
+    assert first.owner_id == test_user.id
+    assert first.sheriff_number == 'CH-1'
+    assert first.status_date.isoformat() == '2026-11-14'
+    assert first.purchase_price == 250000
+    assert first.county == 'Morris County'
+    assert (first.state, first.zipCode) == ('NJ', '07801')
+    assert first.zillow_url == 'https://www.zillow.com/homes/1_rb/'
+    assert db_session.query(PhaseProgress).filter(
+        PhaseProgress.property_id.in_(response.json['propertyIds'])).count() == 3
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_import_skips_tracked_listings(client, auth_headers, test_user, db_session, scrape_store):
+    """Test listings already tracked by detail link or sheriff number are not duplicated"""
+    db_session.add(Property(owner_id=test_user.id, address='Manual entry', purchase_price=1,
+                            county='Morris County', sheriff_number='CH-2'))
+    db_session.commit()
+    client.post('/api/scraped-properties/import', json={'propertyIds': ['1']}, headers=auth_headers)
+
+    response = client.post('/api/scraped-properties/import', json={'county': 'Morris County'},
+                           headers=auth_headers)
+
+    assert response.status_code == 201
+    assert response.json['imported'] == 1
+    assert response.json['skipped'] == 2
+    assert db_session.query(Property).filter_by(owner_id=test_user.id, detail_link=listing(1)['detail_link']).count() == 1
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_import_posted_listings(client, auth_headers, db_session):
+    """Test listings can be posted directly and bad rows are reported"""
+    response = client.post('/api/scraped-properties/import', json={'listings': [
+        listing(7), listing(7), {'property_id': '8', 'price': 1}, listing(9, price='$125,000.00')
+    ]}, headers=auth_headers)
+
+    assert response.status_code == 201
+    assert response.json['imported'] == 2
+    assert response.json['skipped'] == 1
+    assert response.json['errors'] == [{'index': 2, 'error': 'Missing address'}]
+    assert db_session.get(Property, response.json['propertyIds'][1]).purchase_price == 125000
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_import_listings_without_detail_links(client, auth_headers, db_session):
+    """Test listings without a detail link are told apart by sheriff number"""
+    response = client.post('/api/scraped-properties/import', json={'listings': [
+        listing(11, detail_link=None, sheriff_number='F-1'),
+        listing(12, detail_link=None, sheriff_number='F-2'),
+        listing(13, detail_link=None, sheriff_number='F-1')
+    ]}, headers=auth_headers)
+
+    assert response.status_code == 201
+    assert response.json['imported'] == 2
+    assert response.json['skipped'] == 1
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_import_requires_a_source(client, auth_headers, scrape_store):
+    """Test the request must name what to import"""
+    assert client.post('/api/scraped-properties/import', json={}, headers=auth_headers).status_code == 400
+    assert client.post('/api/scraped-properties/import', json={'county': 'Essex'},
+                       headers=auth_headers).status_code == 404
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_import_matches_county_less_sheriff_numbers(client, auth_headers, db_session):
+    """Test a listing without a county is still recognised on a second import"""
+    body = {'listings': [listing(21, county=None, detail_link=None, sheriff_number='F-21')]}
+    assert client.post('/api/scraped-properties/import', json=body, headers=auth_headers).json['imported'] == 1
+
+    response = client.post('/api/scraped-properties/import', json=body, headers=auth_headers)
+
+    assert response.json['imported'] == 0
+    assert response.json['skipped'] == 1
+    assert db_session.query(Property).filter_by(sheriff_number='F-21').count() == 1
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_manual_properties_with_blank_listing_keys(client, auth_headers, db_session):
+    """Test hand-entered properties store blank keys as NULL and a real duplicate is a 409"""
+    body = {'propertyName': 'Hand Entered', 'address': '5 Oak St', 'city': 'Dover', 'state': 'NJ',
+            'zipCode': '07801', 'detail_link': '', 'sheriff_number': ''}
+    first = client.post('/api/properties', json=body, headers=auth_headers)
+    second = client.post('/api/properties', json=body, headers=auth_headers)
+
+    assert (first.status_code, second.status_code) == (201, 201)
+    assert db_session.get(Property, first.json['id']).detail_link is None
+
+    duplicate = dict(body, detail_link=listing(1)['detail_link'])
+    assert client.post('/api/properties', json=duplicate, headers=auth_headers).status_code == 201
+    response = client.post('/api/properties', json=duplicate, headers=auth_headers)
+    assert response.status_code == 409
@@ -0,0 +1,93 @@
+import pytest
+from unittest.mock import patch
+from services.scraper.scrape_store import ScrapeStore
+import logging
+
+logger = logging.getLogger(__name__)
+
+def listing(property_id, county, status_date, price, **fields):
+    row = {'property_id': str(property_id),
+           'detail_link': f'https://salesweb.civilview.com/Sales/SaleDetails?PropertyId={property_id}',
+           'sheriff_number': f'F-{property_id}', 'status_date': status_date, 'plaintiff': 'US BANK',
+           'defendant': f'OWNER {property_id}', 'address': f'{property_id} Main St', 'price': price,
+           'county': county}
+    row.update(fields)
+    return row
+
+@pytest.fixture
+def scrape_store(tmp_path):
+    """A scrape store with three Morris and two Bergen listings"""
+    path = str(tmp_path / 'scrape_store.db')
+    with patch('services.scraper.scrape_store.STORE_FILE', path), \
+         patch('services.scraper.scrape_store.LEGACY_CSV', str(tmp_path / 'merged_data.csv')):
+        with ScrapeStore(path) as store:
+            store.upsert([
+                listing(1, 'Morris', '2026-11-01', 100000, address='12 Elm Street Dover'),
+                listing(2, 'Morris', '2026-11-15', 250000),
+                listing(3, 'Morris', '2026-12-01', 400000, description='Colonial near Elm Street'),
+                listing(4, 'Bergen', '2026-11-01', 300000),
+                listing(5, 'Bergen', None, 150000)
+            ])
+        yield path
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_scraped_properties_pages(client, auth_headers, scrape_store):
+    """Test listings are paged with a cursor and counted"""
+    logger.info('🏚️ Testing scraped listings paging')
+    first = client.get('/api/scraped-properties?limit=2', headers=auth_headers)
+
+    assert first.status_code == 200
+    assert [p['property_id'] for p in first.json] == ['1', '2']
+    assert first.headers['X-Total-Count'] == '5'
+    assert 'Zillow URL' in first.json[0]
+
+    rest = client.get(f"/api/scraped-properties?limit=3&cursor={first.headers['X-Next-Cursor']}",
+                      headers=auth_headers)
+    assert [p['property_id'] for p in rest.json] == ['3', '4', '5']
+    assert 'X-Next-Cursor' not in rest.headers
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_scraped_properties_filters(client, auth_headers, scrape_store):
+    """Test county, status date, price and text filters combine"""
+    def ids(query):
+        response = client.get(f'/api/scraped-properties?{query}', headers=auth_headers)
+        assert response.status_code == 200
+        return [p['property_id'] for p in response.json]
+
+    assert ids('county=Morris County') == ['1', '2', '3']
+    assert ids('county=bergen&status_date=2026-11-01') == ['4']
+    assert ids('status_from=2026-11-10&status_to=2026-12-31') == ['2', '3']
+    assert ids('min_price=150000&max_price=300000') == ['2', '4', '5']
+    assert ids('q=elm street') == ['1', '3']
+    assert ids('county=Essex') == []
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_scraped_properties_cache_follows_store(client, auth_headers, scrape_store):
+    """Test the cached index is reused until the store is written"""
+    with patch('services.scraped_listings.ListingIndex', wraps=__import__(
+            'services.scraped_listings', fromlist=['ListingIndex']).ListingIndex) as index:
+        client.get('/api/scraped-properties', headers=auth_headers)
+        client.get('/api/scraped-properties?county=Morris', headers=auth_headers)
+        loads = index.call_count
+
+        with ScrapeStore(scrape_store) as store:
+            store.upsert([listing(6, 'Morris', '2026-12-05', 90000)])
+        response = client.get('/api/scraped-properties?county=Morris', headers=auth_headers)
+
+    assert loads <= 1
+    assert index.call_count == loads + 1
+    assert response.headers['X-Total-Count'] == '4'
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_scraped_properties_errors(client, auth_headers, tmp_path):
+    """Test a missing store is a 404 and bad filters are rejected"""
+    with patch('services.scraper.scrape_store.STORE_FILE', str(tmp_path / 'missing.db')):
+        assert client.get('/api/scraped-properties', headers=auth_headers).status_code == 404
+        assert client.get('/api/scraped-properties?status_from=11/01/2026',
+                          headers=auth_headers).status_code == 400
+        assert client.get('/api/scraped-properties?min_price=cheap', headers=auth_headers).status_code == 400
+        assert client.get('/api/scraped-properties?cursor=e30', headers=auth_headers).status_code == 400
@@ -0,0 +1,80 @@
+import pytest
+from unittest.mock import patch
+from services.scraper.jobs import JobQueue, run_next_job
+import logging
+
+logger = logging.getLogger(__name__)
+
+@pytest.fixture
+def jobs_file(tmp_path):
+    """An empty scrape job queue"""
+    path = str(tmp_path / 'scrape_jobs.db')
+    with patch('services.scraper.jobs.JOBS_FILE', path):
+        yield path
+
+def scrape(counties, progress=None):
+    counties_report = {county: {'records': 3, 'seconds': 0.5, 'error': None,
+                                'changes': {'added': 3, 'updated': 0, 'removed': 0, 'unchanged': 0}}
+                       for county in counties}
+    for county, entry in counties_report.items():
+        progress(county, entry)
+    return {'success': True, 'records': 3 * len(counties), 'seconds': 0.5, 'counties': counties_report}
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_create_scraper_job_queues_and_coalesces(client, auth_headers, jobs_file):
+    """Test a scrape is queued, not run, and duplicates share the job"""
+    logger.info('🧵 Testing scrape job submission')
+    with patch('services.scraper.jobs.main_all') as main_all:
+        first = client.post('/api/scraper/jobs', json={'county': 'Morris'}, headers=auth_headers)
+        second = client.post('/api/run-scraper', json={'county': 'Morris'}, headers=auth_headers)
+
+    main_all.assert_not_called()
+    assert first.status_code == 202
+    assert first.json['status'] == 'queued'
+    assert first.json['job']['status'] == 'queued'
+    assert first.headers['Location'] == f"/api/scraper/jobs/{first.json['job']['id']}"
+    assert second.status_code == 202
+    assert second.json['status'] == 'coalesced'
+    assert second.json['job']['id'] == first.json['job']['id']
+    assert second.json['job']['submissions'] == 2
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_create_scraper_job_rejects_unknown_county(client, auth_headers, jobs_file):
+    """Test an unknown county is rejected before anything is queued"""
+    response = client.post('/api/scraper/jobs', json={'county': 'Atlantis'}, headers=auth_headers)
+
+    assert response.status_code == 400
+    assert 'Invalid county' in response.json['error']
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_get_scraper_job_reports_progress(client, auth_headers, jobs_file):
+    """Test a job is polled from queued to succeeded with counts and timings"""
+    logger.info('🧵 Testing scrape job polling')
+    job_id = client.post('/api/scraper/jobs', json={'county': 'all'}, headers=auth_headers).json['job']['id']
+
+    queued = client.get(f'/api/scraper/jobs/{job_id}', headers=auth_headers)
+    assert queued.status_code == 200
+    assert queued.json['status'] == 'queued'
+    assert queued.json['progress']['countiesDone'] == 0
+
+    with JobQueue() as queue:
+        run_next_job(queue, scrape=scrape)
+    done = client.get(f'/api/scraper/jobs/{job_id}', headers=auth_headers).json
+
+    assert done['status'] == 'succeeded'
+    assert done['progress']['percent'] == 100
+    assert done['records'] == 3 * done['progress']['countiesTotal']
+    assert done['counties']['Morris']['changes']['added'] == 3
+    assert done['finishedAt'] is not None
+    assert done['runSeconds'] is not None
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_get_scraper_job_not_found(client, auth_headers, jobs_file):
+    """Test polling an unknown job"""
+    response = client.get('/api/scraper/jobs/999', headers=auth_headers)
+
+    assert response.status_code == 404
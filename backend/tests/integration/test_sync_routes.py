@@ -0,0 +1,80 @@
+import pytest
+from datetime import date, datetime, timedelta
+from models import Property, Phase, Tenant, Tombstone
+import logging
+
+logger = logging.getLogger(__name__)
+
+@pytest.fixture
+def synced_property(db_session, test_user):
+    """An owned property with two phases"""
+    property = Property(owner_id=test_user.id, address='7 Sync St', purchase_price=120000)
+    db_session.add(property)
+    db_session.flush()
+    phases = [Phase(property_id=property.id, name=name) for name in ('Demo', 'Framing')]
+    db_session.add_all(phases)
+    db_session.commit()
+    return {'property': property, 'phases': phases}
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_sync_full_then_delta(client, auth_headers, synced_property, db_session):
+    """Test a full sync followed by a delta with one update and one delete"""
+    logger.info('🔄 Testing delta sync')
+    response = client.get('/api/sync/phases', headers=auth_headers)
+    assert response.status_code == 200
+    assert {p['name'] for p in response.json['changes']} == {'Demo', 'Framing'}
+    assert response.json['deleted'] == []
+    since = response.json['serverTime']
+
+    demo, framing = synced_property['phases']
+    framing_id = framing.id
+    demo.name = 'Demolition'
+    db_session.delete(framing)
+    db_session.commit()
+
+    response = client.get(f'/api/sync/phases?since={since}', headers=auth_headers)
+    assert response.status_code == 200
+    assert [p['name'] for p in response.json['changes']] == ['Demolition']
+    assert response.json['deleted'] == [framing_id]
+    assert Tombstone.query.filter_by(table_name='phase', record_id=framing_id).one().owner_id == \
+        synced_property['property'].owner_id
+
+    response = client.get(f"/api/sync/phases?since={response.json['serverTime']}", headers=auth_headers)
+    assert response.json['changes'] == []
+    assert response.json['deleted'] == []
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_sync_pagination_and_scope(client, auth_headers, db_session, test_user):
+    """Test changes are paged by cursor and only the caller's rows are returned"""
+    base = datetime(2024, 1, 1)
+    for i in range(5):
+        db_session.add(Tenant(firstName='Syd', lastName=f'Sync', email=f'sync_{i}_{test_user.id}@example.com',
+                              dateOfBirth=date(1980, 1, 1), manager_id=test_user.id,
+                              updatedAt=base + timedelta(minutes=i)))
+    db_session.add(Tenant(firstName='Not', lastName='Mine', email=f'other_sync_{test_user.id}@example.com',
+                          dateOfBirth=date(1980, 1, 1), manager_id=None))
+    db_session.commit()
+
+    seen = []
+    cursor = None
+    while True:
+        url = '/api/sync/tenants?since=2023-12-31T00:00:00Z&limit=2' + (f'&cursor={cursor}' if cursor else '')
+        response = client.get(url, headers=auth_headers)
+        assert response.status_code == 200
+        seen.extend(t['email'] for t in response.json['changes'])
+        cursor = response.headers.get('X-Next-Cursor')
+        if not cursor:
+            break
+
+    assert seen == [f'sync_{i}_{test_user.id}@example.com' for i in range(5)]
+
+@pytest.mark.api
+@pytest.mark.integration
+def test_sync_invalid_requests(client, auth_headers):
+    """Test unknown collections and malformed timestamps are rejected"""
+    assert client.get('/api/sync/widgets', headers=auth_headers).status_code == 404
+    assert client.get('/api/sync/leases?since=yesterday', headers=auth_headers).status_code == 400
+    response = client.get('/api/sync', headers=auth_headers)
+    assert 'maintenance-requests' in response.json['collections']
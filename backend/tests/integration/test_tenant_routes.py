@@ -126,4 +126,139 @@ def test_tenant_lease_association(client, auth_headers, test_tenant, test_proper
                          json=lease_data,
                          headers=auth_headers)
     
-    assert response.status_code == 201 
\ No newline at end of file
+    assert response.status_code == 201 
+@pytest.fixture
+def managed_tenants(db_session, test_user):
+    """Create a small book of tenants for listing tests"""
+    rows = [
+        ('Amy', 'Adams', 720, True),
+        ('Bob', 'Baker', 650, False),
+        ('Cal', 'Barnes', 580, True),
+        ('Dee', 'Carter', 800, False),
+        ('Eve', 'Bagley', None, False)
+    ]
+    tenants = []
+    for i, (first, last, score, pets) in enumerate(rows):
+        tenant = Tenant(
+            firstName=first,
+            lastName=last,
+            email=f'listing_{i}_{test_user.id}@example.com',
+            dateOfBirth=date(1985, 1, 1),
+            creditScoreAtInitialApplication=score,
+            petsAllowed=pets,
+            manager_id=test_user.id
+        )
+        db_session.add(tenant)
+        tenants.append(tenant)
+    db_session.commit()
+    return tenants
+
+@pytest.mark.integration
+def test_list_tenants_keyset_pagination(client, auth_headers, managed_tenants, logger):
+    """Test tenants are paged by lastName using the X-Next-Cursor header"""
+    logger.info('👥 Starting tenant pagination test...')
+
+    seen = []
+    cursor = None
+    while True:
+        url = '/api/tenants?limit=2' + (f'&cursor={cursor}' if cursor else '')
+        response = client.get(url, headers=auth_headers)
+        assert response.status_code == 200
+        assert len(response.json) <= 2
+        seen.extend(t['lastName'] for t in response.json)
+        cursor = response.headers.get('X-Next-Cursor')
+        if not cursor:
+            break
+
+    assert seen == ['Adams', 'Bagley', 'Baker', 'Barnes', 'Carter']
+
+@pytest.mark.integration
+def test_list_tenants_filters_and_projection(client, auth_headers, managed_tenants, logger):
+    """Test lastName prefix, credit range, pets filters and fields projection"""
+    logger.info('👥 Starting tenant filter test...')
+
+    response = client.get('/api/tenants?last_name=Ba&fields=firstName', headers=auth_headers)
+    assert response.status_code == 200
+    assert [t['lastName'] for t in response.json] == ['Bagley', 'Baker', 'Barnes']
+    assert set(response.json[0].keys()) == {'id', 'firstName', 'lastName'}
+
+    response = client.get('/api/tenants?min_credit_score=600&max_credit_score=750', headers=auth_headers)
+    assert [t['lastName'] for t in response.json] == ['Adams', 'Baker']
+
+    response = client.get('/api/tenants?pets=true', headers=auth_headers)
+    assert [t['lastName'] for t in response.json] == ['Adams', 'Barnes']
+
+@pytest.mark.integration
+def test_list_tenants_invalid_params(client, auth_headers, logger):
+    """Test unknown projection fields and bad cursors are rejected"""
+    logger.info('👥 Starting tenant invalid params test...')
+
+    assert client.get('/api/tenants?fields=ssn', headers=auth_headers).status_code == 400
+    assert client.get('/api/tenants?cursor=not-a-cursor', headers=auth_headers).status_code == 400
+    assert client.get('/api/tenants?pets=maybe', headers=auth_headers).status_code == 400
+    assert client.get('/api/tenants?min_credit_score=high', headers=auth_headers).status_code == 400
+    assert client.get('/api/tenants?max_credit_score=7.5', headers=auth_headers).status_code == 400
+
+@pytest.mark.integration
+def test_import_tenants_json(client, auth_headers, managed_tenants, test_user, logger):
+    """Test bulk JSON import inserts valid rows and reports invalid ones"""
+    logger.info('👥 Starting tenant import test...')
+
+    tenants = [
+        {'firstName': 'Gus', 'lastName': 'Hale', 'email': f'gus_{test_user.id}@example.com',
+         'dateOfBirth': '1990-04-02', 'phoneNumber': '555-123-4567', 'creditScoreAtInitialApplication': 710},
+        {'firstName': 'Ivy', 'lastName': 'Hale', 'email': managed_tenants[0].email,
+         'dateOfBirth': '1991-05-06'},
+        {'firstName': 'Jo3', 'lastName': 'Kim', 'email': 'not-an-email',
+         'dateOfBirth': '1992-01-01', 'creditScoreAtInitialApplication': 200}
+    ]
+
+    response = client.post('/api/tenants/import', json={'tenants': tenants, 'dry_run': True},
+                           headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json['valid'] == 1
+    assert Tenant.query.filter_by(lastName='Hale').count() == 0
+
+    response = client.post('/api/tenants/import', json={'tenants': tenants}, headers=auth_headers)
+    assert response.status_code == 201
+    assert response.json['imported'] == 1
+    errors = {e['row']: e['errors'] for e in response.json['errors']}
+    assert errors[1] == ['Email already exists']
+    assert set(errors[2]) == {
+        'Invalid email format',
+        'Credit score must be between 300 and 850',
+        'Names can only contain letters, spaces, hyphens and apostrophes'
+    }
+
+    imported = Tenant.query.filter_by(email=f'gus_{test_user.id}@example.com').one()
+    assert imported.manager_id == test_user.id
+    assert imported.creditScoreAtInitialApplication == 710
+    assert imported.dateOfBirth == date(1990, 4, 2)
+
+@pytest.mark.integration
+def test_import_tenants_csv(client, auth_headers, test_user, logger):
+    """Test bulk CSV upload"""
+    import io
+    csv = (
+        'firstName,lastName,email,dateOfBirth,petsAllowed\n'
+        f'Lou,Reed,lou_{test_user.id}@example.com,1980-03-02,yes\n'
+        f'Mia,Reed,mia_{test_user.id}@example.com,{date.today().isoformat()},no\n'
+    )
+    response = client.post('/api/tenants/import',
+                           data={'file': (io.BytesIO(csv.encode()), 'tenants.csv')},
+                           content_type='multipart/form-data', headers=auth_headers)
+
+    assert response.status_code == 201
+    assert response.json['imported'] == 1
+    assert response.json['errors'] == [{'row': 1, 'errors': ['Tenant must be at least 18 years old']}]
+    assert Tenant.query.filter_by(email=f'lou_{test_user.id}@example.com').one().petsAllowed is True
+
+@pytest.mark.integration
+def test_import_tenants_invalid_payload(client, auth_headers, logger):
+    """Test malformed imports are rejected"""
+    assert client.post('/api/tenants/import', json={'tenants': 'nope'},
+                       headers=auth_headers).status_code == 400
+    response = client.post('/api/tenants/import', json={'tenants': [{'firstName': 'Solo'}]},
+                           headers=auth_headers)
+    assert response.status_code == 400
+    assert response.json['errors'][0]['errors'] == ['Missing required fields: lastName, email, dateOfBirth']
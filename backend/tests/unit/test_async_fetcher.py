@@ -0,0 +1,116 @@
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from services.scraper.async_fetcher import fetch_pages
+from services.scraper.scraper import parse_page
+
+FIXTURES = Path(__file__).resolve().parent.parent / 'fixtures' / 'civilview'
+
+class FixtureHandler(SimpleHTTPRequestHandler):
+    """Serves saved civilview pages; /Sales/SalesSearch?countyId=N maps to a fixture file"""
+    pages = {'9': 'morris_listing.html', '10': 'hudson_listing.html', '99': 'no_table.html'}
+    requests = []
+
+    def translate_path(self, path):
+        FixtureHandler.requests.append(path)
+        county = path.split('countyId=')[-1] if 'countyId=' in path else ''
+        return str(FIXTURES / self.pages.get(county, 'missing.html'))
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def stub_server():
+    FixtureHandler.requests = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), partial(FixtureHandler, directory=str(FIXTURES)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+@pytest.mark.unit
+def test_fetch_pages_over_one_session(stub_server):
+    """Test pages are fetched concurrently and failures come back as None"""
+    urls = [f'{stub_server}/Sales/SalesSearch?countyId=9',
+            f'{stub_server}/Sales/SalesSearch?countyId=10',
+            f'{stub_server}/Sales/SalesSearch?countyId=404']
+    pages = fetch_pages(urls, rate=50, retries=0)
+
+    assert 'Morris County' in pages[urls[0]]
+    assert 'Hudson County' in pages[urls[1]]
+    assert pages[urls[2]] is None
+
+@pytest.mark.unit
+def test_parse_page_uses_http_without_browser(stub_server):
+    """Test a server-rendered listing is parsed without starting Selenium"""
+    with patch('services.scraper.scraper.fetch_page_selenium') as selenium:
+        data = parse_page(f'{stub_server}/Sales/SalesSearch?countyId=10')
+
+    selenium.assert_not_called()
+    assert [row['property_id'] for row in data] == ['1000501', '1000502']
+    # Hudson lists the address before plaintiff and defendant
+    assert data[0]['address'] == '301 Palisade Avenue Jersey City NJ 07307'
+    assert data[0]['plaintiff'] == 'DEUTSCHE BANK NATIONAL TRUST COMPANY'
+    assert data[0]['status_date'] == '2026-10-30'
+    assert data[1]['price'] == 455250
+
+@pytest.mark.unit
+def test_parse_page_falls_back_to_selenium(stub_server):
+    """Test Selenium is used only when the HTTP response has no listing table"""
+    rendered = (FIXTURES / 'morris_listing.html').read_text()
+    url = f'{stub_server}/Sales/SalesSearch?countyId=99'
+    with patch('services.scraper.scraper.fetch_page_selenium', return_value=rendered) as selenium:
+        data = parse_page(url)
+
+    selenium.assert_called_once()
+    assert len(data) == 3
+    assert data[2]['price'] == 0
+
+@pytest.mark.unit
+def test_parse_page_uses_prefetched_page():
+    """Test a page fetched earlier in the run is parsed without another request"""
+    url = 'https://salesweb.civilview.com/Sales/SalesSearch?countyId=9'
+    pages = {url: (FIXTURES / 'morris_listing.html').read_text()}
+    with patch('services.scraper.scraper.fetch_pages') as fetch, \
+         patch('services.scraper.scraper.fetch_page_selenium') as selenium:
+        data = parse_page(url, pages=pages)
+
+    fetch.assert_not_called()
+    selenium.assert_not_called()
+    assert len(data) == 3
+
+@pytest.mark.unit
+def test_fetch_retries_transient_errors():
+    """Test connection failures are retried and then reported as None"""
+    with patch('services.scraper.async_fetcher.BACKOFF_SECONDS', 0):
+        pages = fetch_pages(['http://127.0.0.1:9/unreachable'], retries=1, timeout=2)
+    assert pages == {'http://127.0.0.1:9/unreachable': None}
+
+class MislabelledHandler(FixtureHandler):
+    """Serves a page that is not valid in the charset it declares"""
+    def do_GET(self):
+        body = b'<html><body>Caf\xe9 Sale</body></html>'
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+@pytest.mark.unit
+def test_fetch_replaces_undecodable_bytes():
+    """Test a page with bytes invalid in its declared charset is still returned"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), MislabelledHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_address[1]}/page'
+    try:
+        pages = fetch_pages([url], retries=0)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert 'Caf\ufffd Sale' in pages[url]
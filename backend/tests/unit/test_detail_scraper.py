@@ -0,0 +1,82 @@
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+from services.scraper.detail_scraper import scrape_details
+from services.scraper.scrape_state import ScrapeState
+
+FIXTURES = Path(__file__).resolve().parent.parent / 'fixtures' / 'civilview'
+
+class DetailHandler(SimpleHTTPRequestHandler):
+    """Serves the saved SaleDetails page for every PropertyId except 404"""
+    requests = []
+
+    def translate_path(self, path):
+        DetailHandler.requests.append(path.split('PropertyId=')[-1])
+        page = 'missing.html' if path.endswith('PropertyId=404') else 'sale_details.html'
+        return str(FIXTURES / page)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def detail_server():
+    DetailHandler.requests = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), partial(DetailHandler, directory=str(FIXTURES)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def state(tmp_path):
+    with ScrapeState(str(tmp_path / 'state.db')) as store:
+        yield store
+
+def listing(base_url, property_id, **fields):
+    row = {'property_id': property_id, 'detail_link': f'{base_url}/Sales/SaleDetails?PropertyId={property_id}',
+           'address': f'{property_id} Main St', 'price': 100000}
+    row.update(fields)
+    return row
+
+@pytest.mark.unit
+def test_scrape_details_in_batches(detail_server, state):
+    """Test detail pages are fetched concurrently and stored batch by batch"""
+    rows = [listing(detail_server, str(i)) for i in range(1, 6)]
+
+    details = scrape_details(rows, state, batch_size=2, rate=100, retries=0)
+
+    assert sorted(details) == ['1', '2', '3', '4', '5']
+    assert details['3']['court_case'] == 'F-004512-23'
+    assert state.details(['5'])['5']['upset_amount'] == '$312,456.78'
+
+@pytest.mark.unit
+def test_scrape_details_skips_unchanged_listings(detail_server, state):
+    """Test only listings whose hash changed (or whose page failed) are fetched again"""
+    rows = [listing(detail_server, '1'), listing(detail_server, '2'), listing(detail_server, '404')]
+    first = scrape_details(rows, state, rate=100, retries=0)
+    assert sorted(first) == ['1', '2']
+
+    DetailHandler.requests = []
+    rows[1]['price'] = 90000
+    second = scrape_details(rows, state, rate=100, retries=0)
+
+    assert sorted(DetailHandler.requests) == ['2', '404']
+    assert list(second) == ['2']
+
+@pytest.mark.unit
+def test_manual_edit_is_not_scraped_over(detail_server, state):
+    """Test an edited detail stands and is returned with the scraped fields until the listing changes"""
+    rows = [listing(detail_server, '1')]
+    scrape_details(rows, state, rate=100, retries=0)
+    state.edit_details('1', {'attorney': 'CORRECTED LAW LLP'})
+
+    DetailHandler.requests = []
+    assert scrape_details(rows, state, rate=100, retries=0) == {}
+
+    assert DetailHandler.requests == []
+    assert state.details(['1'])['1']['attorney'] == 'CORRECTED LAW LLP'
+    assert state.details(['1'])['1']['court_case'] == 'F-004512-23'
@@ -0,0 +1,116 @@
+import json
+import threading
+import pytest
+from unittest.mock import patch
+from services.scraper import driver_pool
+from services.scraper.driver_pool import DriverPool
+
+class FakeDriver:
+    """Stands in for a Chrome WebDriver"""
+    def __init__(self):
+        self.alive = True
+        self.quit_called = False
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise RuntimeError('browser is gone')
+        return 1
+
+    def quit(self):
+        self.quit_called = True
+
+@pytest.fixture
+def started():
+    return []
+
+@pytest.fixture
+def pool(started):
+    def factory():
+        driver = FakeDriver()
+        started.append(driver)
+        return driver
+    pool = DriverPool(size=2, max_pages=3, factory=factory)
+    yield pool
+    pool.close()
+
+@pytest.mark.unit
+def test_pool_reuses_warm_browsers(pool, started):
+    """Test sequential fetches share one browser and warm() pre-starts them"""
+    for _ in range(2):
+        with pool.driver() as driver:
+            assert isinstance(driver, FakeDriver)
+    assert len(started) == 1
+
+    pool.warm()
+    assert len(started) == 2
+
+@pytest.mark.unit
+def test_pool_recycles_after_max_pages(pool, started):
+    """Test a browser is quit once it has served max_pages fetches"""
+    for _ in range(3):
+        with pool.driver():
+            pass
+    assert started[0].quit_called
+    with pool.driver() as driver:
+        assert driver is started[1]
+
+@pytest.mark.unit
+def test_pool_replaces_crashed_browser(pool, started):
+    """Test a browser that stops responding is dropped, a live one is kept"""
+    with pytest.raises(ValueError):
+        with pool.driver():
+            raise ValueError('parse error')
+    assert not started[0].quit_called
+
+    with pytest.raises(RuntimeError):
+        with pool.driver() as driver:
+            driver.alive = False
+            raise RuntimeError('chrome not reachable')
+    assert started[0].quit_called
+
+    with pool.driver() as driver:
+        assert driver is started[1]
+
+@pytest.mark.unit
+def test_pool_is_bounded(pool, started):
+    """Test callers beyond the pool size wait for a browser to be released"""
+    first = pool._acquire()
+    second = pool._acquire()
+    acquired = threading.Event()
+
+    def borrow():
+        with pool.driver():
+            acquired.set()
+
+    worker = threading.Thread(target=borrow)
+    worker.start()
+    assert not acquired.wait(0.1)
+    pool._release(first)
+    assert acquired.wait(1)
+    worker.join()
+    pool._release(second)
+    assert len(started) == 2
+
+@pytest.mark.unit
+def test_driver_path_resolved_once_and_cached(tmp_path, monkeypatch):
+    """Test ChromeDriverManager runs once and its path is reused from the cache file"""
+    binary = tmp_path / 'chromedriver'
+    binary.write_text('')
+    cache = tmp_path / 'chromedriver_path.json'
+    monkeypatch.setattr(driver_pool, 'DRIVER_CACHE_FILE', cache)
+    monkeypatch.setattr(driver_pool, 'LOCAL_DRIVER', tmp_path / 'missing')
+    monkeypatch.setattr(driver_pool, '_driver_path', None)
+    monkeypatch.delenv('CHROMEDRIVER_PATH', raising=False)
+
+    with patch('webdriver_manager.chrome.ChromeDriverManager') as manager:
+        manager.return_value.install.return_value = str(binary)
+        assert driver_pool.resolve_driver_path() == str(binary)
+        assert driver_pool.resolve_driver_path() == str(binary)
+        assert manager.return_value.install.call_count == 1
+    assert json.loads(cache.read_text()) == {'path': str(binary)}
+
+    # A new process finds the cached path without calling the manager
+    monkeypatch.setattr(driver_pool, '_driver_path', None)
+    with patch('webdriver_manager.chrome.ChromeDriverManager') as manager:
+        assert driver_pool.resolve_driver_path() == str(binary)
+        manager.assert_not_called()
@@ -0,0 +1,114 @@
+import pytest
+import random
+from datetime import date, timedelta
+from services.leasing import find_overlaps, unit_key
+
+def interval(ref, start, end, property_id=1, unit=None, existing=False):
+    return {
+        'ref': ref,
+        'propertyId': property_id,
+        'unit': unit,
+        'startDate': date(2025, 1, 1) + timedelta(days=start),
+        'endDate': date(2025, 1, 1) + timedelta(days=end),
+        'existing': existing
+    }
+
+@pytest.mark.unit
+def test_unit_key_normalises_blank_units():
+    """Test missing and blank units share the whole-property key"""
+    assert unit_key(None) == unit_key('') == unit_key('  ') == ''
+    assert unit_key(' 2B ') == '2B'
+
+@pytest.mark.unit
+def test_find_overlaps_detects_conflict():
+    """Test overlapping leases on the same unit are reported"""
+    conflicts = find_overlaps([interval(0, 0, 100), interval(1, 50, 150)])
+    assert [(c['ref'], c['conflictsWith']) for c in conflicts] == [(1, 0)]
+
+@pytest.mark.unit
+def test_find_overlaps_allows_back_to_back_and_other_units():
+    """Test touching intervals, different units and different properties do not conflict"""
+    conflicts = find_overlaps([
+        interval(0, 0, 100, unit='A'),
+        interval(1, 100, 200, unit='A'),
+        interval(2, 0, 100, unit='B'),
+        interval(3, 0, 100, property_id=2)
+    ])
+    assert conflicts == []
+
+@pytest.mark.unit
+def test_find_overlaps_tracks_longest_reach():
+    """Test a short lease nested after a long one is still caught"""
+    conflicts = find_overlaps([interval(0, 0, 300), interval(1, 10, 20), interval(2, 200, 250)])
+    assert sorted(c['ref'] for c in conflicts) == [1, 2]
+    assert all(c['conflictsWith'] == 0 for c in conflicts)
+
+@pytest.mark.unit
+def test_find_overlaps_ignores_existing_pairs():
+    """Test overlaps between two stored leases are not reported"""
+    conflicts = find_overlaps([
+        interval('lease:1', 0, 100, existing=True),
+        interval('lease:2', 50, 150, existing=True),
+        interval(0, 120, 200)
+    ])
+    assert [(c['ref'], c['conflictsWith'], c['existing']) for c in conflicts] == [(0, 'lease:2', True)]
+
+@pytest.mark.unit
+def test_find_overlaps_matches_pairwise_check():
+    """Test the sweep flags exactly the intervals a brute-force check flags"""
+    rng = random.Random(7)
+    items = []
+    for ref in range(300):
+        start = rng.randint(0, 2000)
+        items.append(interval(ref, start, start + rng.randint(1, 60), property_id=rng.randint(1, 5)))
+
+    flagged = {c['ref'] for c in find_overlaps(items)}
+    ordered = sorted(items, key=lambda i: (i['propertyId'], i['startDate'], i['endDate']))
+    expected = {
+        b['ref'] for i, b in enumerate(ordered) for a in ordered[:i]
+        if a['propertyId'] == b['propertyId'] and a['startDate'] < b['endDate'] and b['startDate'] < a['endDate']
+    }
+    assert flagged == expected
+
+@pytest.mark.unit
+def test_find_overlaps_whole_property_lease_covers_units():
+    """Test a lease without a unit conflicts with every unit of its property"""
+    conflicts = find_overlaps([
+        interval(0, 0, 100, unit='A'),
+        interval(1, 50, 150),
+        interval(2, 120, 200, unit='B'),
+        interval(3, 0, 300, unit='C', property_id=2)
+    ])
+    assert [(c['ref'], c['conflictsWith']) for c in conflicts] == [(1, 0), (2, 1)]
+
+@pytest.mark.unit
+def test_find_overlaps_checks_stored_leases_against_new_ones():
+    """Test a stored lease is caught even when another stored lease reaches further"""
+    conflicts = find_overlaps([
+        interval('lease:1', 0, 300, unit='A', existing=True),
+        interval(0, 10, 100, unit='B'),
+        interval('lease:2', 50, 60, existing=True)
+    ])
+    assert [(c['ref'], c['conflictsWith']) for c in conflicts] == [('lease:2', 0)]
+
+@pytest.mark.unit
+def test_find_overlaps_with_units_matches_pairwise_check():
+    """Test the sweep matches a brute-force check across units, whole-property and stored leases"""
+    rng = random.Random(11)
+    items = []
+    for ref in range(400):
+        start = rng.randint(0, 2000)
+        items.append(interval(ref, start, start + rng.randint(1, 60), property_id=rng.randint(1, 3),
+                              unit=rng.choice([None, '', 'A', 'B', 'C']), existing=rng.random() < 0.3))
+
+    def shares_space(a, b):
+        return not unit_key(a['unit']) or not unit_key(b['unit']) or unit_key(a['unit']) == unit_key(b['unit'])
+
+    flagged = {c['ref'] for c in find_overlaps(items)}
+    ordered = sorted(items, key=lambda i: (i['propertyId'], i['startDate'], i['endDate']))
+    expected = {
+        b['ref'] for i, b in enumerate(ordered) for a in ordered[:i]
+        if a['propertyId'] == b['propertyId'] and shares_space(a, b) and not (a['existing'] and b['existing'])
+        and a['startDate'] < b['endDate'] and b['startDate'] < a['endDate']
+    }
+    assert flagged == expected
@@ -0,0 +1,52 @@
+import pytest
+import numpy as np
+from datetime import date
+from services.ledger import monthly_due_dates
+
+def dates(values):
+    return [np.datetime64(value, 'D') for value in values]
+
+@pytest.mark.unit
+def test_due_dates_follow_start_day():
+    """Test charges fall on the start day-of-month while the lease runs"""
+    index, due = monthly_due_dates([date(2024, 1, 15)], [date(2024, 4, 15)],
+                                   date(2024, 1, 1), date(2025, 1, 1))
+    assert index.tolist() == [0, 0, 0]
+    assert due.tolist() == [date(2024, 1, 15), date(2024, 2, 15), date(2024, 3, 15)]
+
+@pytest.mark.unit
+def test_due_dates_clamp_to_month_end():
+    """Test a lease starting on the 31st is due on the last day of short months"""
+    _, due = monthly_due_dates([date(2024, 1, 31)], [date(2024, 5, 1)],
+                               date(2024, 1, 1), date(2025, 1, 1))
+    assert due.tolist() == [date(2024, 1, 31), date(2024, 2, 29), date(2024, 3, 31), date(2024, 4, 30)]
+
+@pytest.mark.unit
+def test_due_dates_respect_window():
+    """Test only charges inside [period_start, period_end) are produced"""
+    index, due = monthly_due_dates(
+        [date(2023, 6, 10), date(2024, 11, 1), date(2026, 1, 1)],
+        [date(2024, 3, 1), date(2025, 11, 1), date(2027, 1, 1)],
+        date(2024, 1, 1), date(2025, 1, 1)
+    )
+    assert list(zip(index.tolist(), due.tolist())) == [
+        (0, date(2024, 1, 10)), (0, date(2024, 2, 10)),
+        (1, date(2024, 11, 1)), (1, date(2024, 12, 1))
+    ]
+
+@pytest.mark.unit
+def test_due_dates_bulk_year():
+    """Test a year of charges for many twelve-month leases"""
+    n = 5000
+    starts = np.datetime64('2024-01-01') + np.arange(n) % 28
+    ends = starts.astype('datetime64[M]') + 12
+    index, due = monthly_due_dates(starts, ends.astype('datetime64[D]') + (np.arange(n) % 28),
+                                   date(2024, 1, 1), date(2025, 1, 1))
+    assert len(due) == n * 12
+    assert np.bincount(index).tolist() == [12] * n
+
+@pytest.mark.unit
+def test_due_dates_empty():
+    """Test no leases produce no charges"""
+    index, due = monthly_due_dates([], [], date(2024, 1, 1), date(2025, 1, 1))
+    assert index.size == 0 and due.size == 0
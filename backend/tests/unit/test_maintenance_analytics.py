@@ -0,0 +1,56 @@
+import pytest
+import pandas as pd
+from datetime import datetime
+from sqlalchemy.dialects import postgresql
+from models import PropertyMaintenanceRequest, Property
+from services.maintenance_analytics import _frame_summary, _postgres_summary
+
+NOW = datetime(2024, 6, 1, 12, 0)
+
+def frame(rows):
+    return pd.DataFrame(rows, columns=['id', 'propertyId', 'tenantId', 'status', 'timeToCompletion', 'createdAt'])
+
+@pytest.mark.unit
+def test_frame_summary_per_property():
+    """Test counts, percentiles and aging for each property"""
+    summary = _frame_summary(frame([
+        (1, 1, 7, 'pending', None, datetime(2024, 5, 31, 12, 0)),
+        (2, 1, 7, 'pending', None, datetime(2024, 4, 1, 12, 0)),
+        (3, 1, 8, 'in_progress', None, datetime(2024, 5, 1)),
+        (4, 1, 8, 'completed', 10, datetime(2024, 5, 1)),
+        (5, 1, 8, 'completed', 30, datetime(2024, 5, 1)),
+        (6, 2, 9, 'cancelled', 5, datetime(2024, 5, 1))
+    ]), 'propertyId', NOW)
+
+    first, second = summary
+    assert first['propertyId'] == 1
+    assert (first['openCount'], first['pendingCount'], first['completedCount']) == (3, 2, 2)
+    assert first['medianTimeToCompletion'] == 20.0
+    assert first['p90TimeToCompletion'] == 28.0
+    assert first['pendingAge']['oldestRequestId'] == 2
+    assert first['pendingAge']['oldestHours'] == 61 * 24
+    assert first['pendingAge']['buckets'] == {'0-7d': 1, '8-30d': 0, '30d+': 1}
+
+    assert second['openCount'] == 0
+    assert second['medianTimeToCompletion'] is None
+    assert second['pendingAge']['oldestRequestId'] is None
+
+@pytest.mark.unit
+def test_frame_summary_empty():
+    """Test no requests yield no groups"""
+    assert _frame_summary(frame([]), None, NOW) == []
+
+@pytest.mark.unit
+def test_postgres_summary_uses_percentile_and_window():
+    """Test the Postgres path compiles to percentile_cont and row_number"""
+    captured = {}
+
+    class Session:
+        def execute(self, query):
+            captured['sql'] = str(query.compile(dialect=postgresql.dialect()))
+            return []
+
+    assert _postgres_summary(Session(), PropertyMaintenanceRequest, Property, 1, 'tenantId', NOW) == []
+    assert 'percentile_cont' in captured['sql'] and 'WITHIN GROUP' in captured['sql']
+    assert 'row_number() OVER (PARTITION BY' in captured['sql']
+    assert 'GROUP BY' in captured['sql']
@@ -0,0 +1,52 @@
+import pytest
+from datetime import date
+from utils.pagination import (
+    encode_cursor,
+    decode_cursor,
+    parse_limit,
+    parse_fields,
+    parse_bool,
+    escape_like
+)
+
+@pytest.mark.unit
+def test_cursor_round_trip():
+    """Test cursors decode back to the encoded sort keys"""
+    cursor = encode_cursor({'lastName': "O'Neil", 'id': 42, 'createdAt': date(2024, 1, 2)})
+    assert decode_cursor(cursor) == {'lastName': "O'Neil", 'id': 42, 'createdAt': '2024-01-02'}
+    assert decode_cursor(None) is None
+
+@pytest.mark.unit
+@pytest.mark.parametrize("cursor", ['not-a-cursor', 'W10'])
+def test_decode_cursor_rejects_garbage(cursor):
+    """Test malformed cursors raise ValueError"""
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+@pytest.mark.unit
+def test_parse_limit_clamps():
+    """Test page size defaults and clamps to the allowed range"""
+    assert parse_limit(None) == 100
+    assert parse_limit('0') == 1
+    assert parse_limit('10000') == 500
+    with pytest.raises(ValueError):
+        parse_limit('ten')
+
+@pytest.mark.unit
+def test_parse_fields_keeps_required_columns():
+    """Test projections always include the key columns in declared order"""
+    allowed = ['id', 'firstName', 'lastName', 'email']
+    assert parse_fields('email', allowed, ['id', 'lastName']) == ['id', 'lastName', 'email']
+    assert parse_fields(None, allowed, ['id']) == allowed
+    with pytest.raises(ValueError):
+        parse_fields('password_hash', allowed, ['id'])
+
+@pytest.mark.unit
+def test_parse_bool_and_escape_like():
+    """Test boolean parsing and LIKE escaping"""
+    assert parse_bool('true') is True
+    assert parse_bool('0') is False
+    assert parse_bool(None) is None
+    with pytest.raises(ValueError):
+        parse_bool('maybe')
+    assert escape_like('50%_off') == '50\\%\\_off'
@@ -0,0 +1,82 @@
+from pathlib import Path
+
+import pytest
+from services.scraper.parsers import parse_ag_grid_rows, parse_detail_page, parse_listing_table
+
+FIXTURES = Path(__file__).resolve().parent.parent / 'fixtures'
+SEARCH_URL = 'https://salesweb.civilview.com/Sales/SalesSearch?countyId={}'
+COUNTY_PAGES = {'morris': 9, 'bergen': 7, 'essex': 2, 'union': 15, 'hudson': 10}
+
+def read_fixture(*parts):
+    return FIXTURES.joinpath(*parts).read_text()
+
+@pytest.mark.unit
+@pytest.mark.parametrize('county', sorted(COUNTY_PAGES))
+def test_listing_engines_agree(county):
+    """Test the lxml and strained BeautifulSoup parsers return the same rows"""
+    html = read_fixture('civilview', f'{county}_listing.html')
+    url = SEARCH_URL.format(COUNTY_PAGES[county])
+
+    rows = parse_listing_table(html, url, engine='lxml')
+
+    assert rows
+    assert rows == parse_listing_table(html, url, engine='soup')
+    assert all(row['county'] == f'{county.title()} County' for row in rows)
+    assert all(isinstance(row['price'], int) for row in rows)
+
+@pytest.mark.unit
+@pytest.mark.parametrize('engine', ['lxml', 'soup'])
+def test_hudson_column_order(engine):
+    """Test Hudson listings read the address before the parties"""
+    rows = parse_listing_table(read_fixture('civilview', 'hudson_listing.html'), SEARCH_URL.format(10), engine)
+
+    assert rows[0]['property_id'] == '1000501'
+    assert rows[0]['address'] == '301 Palisade Avenue Jersey City NJ 07307'
+    assert rows[0]['plaintiff'] == 'DEUTSCHE BANK NATIONAL TRUST COMPANY'
+    assert rows[0]['defendant'] == 'KEVIN PATEL'
+    assert rows[0]['status_date'] == '2026-10-30'
+    assert rows[0]['price'] == 312000
+
+@pytest.mark.unit
+@pytest.mark.parametrize('engine', ['lxml', 'soup'])
+def test_page_without_listing_table(engine):
+    """Test a page without the listing table yields None"""
+    assert parse_listing_table(read_fixture('civilview', 'no_table.html'), SEARCH_URL.format(9), engine) is None
+    assert parse_listing_table('', SEARCH_URL.format(9), engine) is None
+
+@pytest.mark.unit
+def test_ag_grid_rows():
+    """Test grid rows are read by colid and rows without cells are skipped"""
+    html = read_fixture('morris_clerk', 'search_results.html')
+
+    rows = parse_ag_grid_rows(html, engine='lxml')
+
+    assert len(rows) == 2
+    assert rows == parse_ag_grid_rows(html, engine='soup')
+    assert all(row for row in rows)
+
+@pytest.mark.unit
+@pytest.mark.parametrize('engine', ['lxml', 'soup'])
+def test_detail_page_fields(engine):
+    """Test the SaleDetails label table is read into the auctions columns"""
+    details = parse_detail_page(read_fixture('civilview', 'sale_details.html'), engine)
+
+    assert details == {
+        'court_case': 'F-004512-23',
+        'sale_date': '2026-11-06',
+        'description': 'Block 1402 Lot 17, approx. 25 x 100 feet, nearest cross street Franklin Street',
+        'upset_amount': '$312,456.78',
+        'attorney': 'KML LAW GROUP, P.C.'
+    }
+    assert parse_detail_page(read_fixture('civilview', 'no_table.html'), engine) is None
+
+@pytest.mark.unit
+@pytest.mark.parametrize('engine', ['lxml', 'soup'])
+def test_engines_agree_on_odd_input(engine):
+    """Test whitespace-only pages and str pages with an XML declaration parse like BeautifulSoup does"""
+    assert parse_listing_table(' \n', SEARCH_URL.format(9), engine) is None
+    assert parse_detail_page(' \n', engine) is None
+    assert parse_ag_grid_rows(' \n', engine) == []
+
+    declared = '<?xml version="1.0" encoding="utf-8"?>\n' + read_fixture('civilview', 'sale_details.html')
+    assert parse_detail_page(declared, engine)['court_case'] == 'F-004512-23'
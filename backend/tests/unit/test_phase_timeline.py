@@ -0,0 +1,80 @@
+import pytest
+import pandas as pd
+from datetime import date
+from services.phase_timeline import PHASE_COLUMNS, phase_schedule, _property_summaries
+
+AS_OF = date(2024, 6, 1)
+
+def frame(rows):
+    return pd.DataFrame(rows, columns=PHASE_COLUMNS)
+
+@pytest.fixture
+def schedule():
+    return phase_schedule(frame([
+        (1, 1, '1 Rehab Rd', 'Closing', date(2024, 1, 1), date(2024, 1, 1), date(2024, 2, 11), date(2024, 2, 1)),
+        (2, 1, '1 Rehab Rd', 'Renovation', date(2024, 2, 15), date(2024, 2, 1), None, date(2024, 7, 1)),
+        (3, 1, '1 Rehab Rd', 'Sale', None, date(2024, 7, 1), None, date(2024, 8, 1)),
+        (4, 2, '2 Done Ave', 'Closing', date(2024, 1, 1), date(2024, 1, 1), date(2024, 3, 1), date(2024, 3, 1))
+    ]), AS_OF).set_index('id')
+
+@pytest.mark.unit
+def test_phase_status_and_slip(schedule):
+    """Test status, start/finish slip and projected end for each phase"""
+    assert schedule['status'].tolist() == ['completed', 'in_progress', 'not_started', 'completed']
+    assert schedule.loc[1, 'finishSlipDays'] == 10
+    assert schedule.loc[2, 'startSlipDays'] == 14
+    # In progress: planned 151 days from the actual start
+    assert schedule.loc[2, 'projectedEndDate'] == pd.Timestamp(2024, 7, 15)
+    assert schedule.loc[2, 'percentComplete'] == pytest.approx(107 / 151 * 100)
+    # Not started: pushed back by the largest delay on the property
+    assert schedule.loc[3, 'projectedEndDate'] == pd.Timestamp(2024, 8, 15)
+    assert pd.isna(schedule.loc[3, 'startSlipDays'])
+    assert schedule.loc[4, 'finishSlipDays'] == 0
+
+@pytest.mark.unit
+def test_in_progress_phase_never_ends_before_today():
+    """Test an overdue running phase is projected to end no earlier than today"""
+    schedule = phase_schedule(frame([
+        (1, 1, 'A', 'Rehab', date(2024, 1, 1), date(2024, 1, 1), None, date(2024, 3, 1))
+    ]), AS_OF)
+    assert schedule.loc[0, 'projectedEndDate'] == pd.Timestamp(AS_OF)
+    assert schedule.loc[0, 'finishSlipDays'] == 92
+
+@pytest.mark.unit
+def test_undated_in_progress_phase_has_no_percent_complete():
+    """Test a running phase without expected or end dates is not reported as done"""
+    schedule = phase_schedule(frame([
+        (1, 1, 'A', 'Rehab', date(2024, 1, 1), None, None, None)
+    ]), AS_OF)
+    assert schedule.loc[0, 'status'] == 'in_progress'
+    assert pd.isna(schedule.loc[0, 'percentComplete'])
+    assert _property_summaries(schedule)[0]['percentComplete'] is None
+
+@pytest.mark.unit
+def test_overdue_start_slips_unstarted_phase():
+    """Test a phase that should already have started slips by the days it is late"""
+    schedule = phase_schedule(frame([
+        (1, 1, 'A', 'Permits', None, date(2024, 5, 1), None, date(2024, 5, 20))
+    ]), AS_OF)
+    assert schedule.loc[0, 'startSlipDays'] == 31
+    assert schedule.loc[0, 'projectedEndDate'] == pd.Timestamp(2024, 6, 20)
+
+@pytest.mark.unit
+def test_property_summaries(schedule):
+    """Test per-property completion, slip and critical phase"""
+    rehab, done = _property_summaries(schedule.reset_index())
+
+    assert rehab['propertyId'] == 1
+    assert (rehab['phaseCount'], rehab['completedPhases'], rehab['inProgressPhases']) == (3, 1, 1)
+    assert rehab['latePhases'] == 3
+    assert rehab['slipDays'] == 14
+    assert rehab['plannedCompletion'] == '2024-08-01'
+    assert rehab['projectedCompletion'] == '2024-08-15'
+    assert rehab['criticalPhase']['name'] == 'Sale'
+    assert rehab['scheduleVariance'] < 0
+    assert rehab['isComplete'] is False
+
+    assert done['slipDays'] == 0
+    assert done['percentComplete'] == 100.0
+    assert done['criticalPhase'] is None
+    assert done['isComplete'] is True
@@ -0,0 +1,201 @@
+import pytest
+from services.scraper import jobs
+from services.scraper.jobs import JobQueue, job_to_dict, run_next_job
+
+def report(counties, error=None):
+    entries = {county: {'records': 0 if error else 10, 'seconds': 1.5, 'error': error, 'changes': None}
+               for county in counties}
+    return {'success': error is None, 'records': sum(entry['records'] for entry in entries.values()),
+            'seconds': 2.0, 'counties': entries}
+
+def fake_scrape(error=None):
+    calls = []
+    def scrape(counties, progress=None):
+        calls.append(counties)
+        result = report(counties, error)
+        for county, entry in result['counties'].items():
+            progress(county, entry)
+        return result
+    scrape.calls = calls
+    return scrape
+
+@pytest.fixture
+def queue(tmp_path):
+    with JobQueue(str(tmp_path / 'jobs.db')) as store:
+        yield store
+
+@pytest.mark.unit
+def test_enqueue_coalesces_active_county(queue):
+    """Test a second submission for a county joins the queued job"""
+    first, created = queue.enqueue('Morris', requested_by='a@example.com')
+    again, coalesced = queue.enqueue('Morris')
+    other, _ = queue.enqueue('Bergen')
+
+    assert created and not coalesced
+    assert again['id'] == first['id']
+    assert again['submissions'] == 2
+    assert other['id'] != first['id']
+
+@pytest.mark.unit
+def test_running_job_coalesces_but_finished_job_does_not(queue):
+    """Test only queued and running jobs absorb duplicates"""
+    job, _ = queue.enqueue('Morris')
+    queue.claim()
+    assert queue.enqueue('Morris')[0]['id'] == job['id']
+
+    queue.finish(job['id'], report(['Morris']))
+    new_job, created = queue.enqueue('Morris')
+
+    assert created and new_job['id'] != job['id']
+
+@pytest.mark.unit
+def test_claim_takes_oldest_queued_job(queue):
+    """Test jobs run in submission order, each once"""
+    morris, _ = queue.enqueue('Morris')
+    queue.enqueue('Bergen')
+
+    claimed = queue.claim('host:1:abc')
+
+    assert claimed['id'] == morris['id']
+    assert claimed['status'] == jobs.RUNNING
+    assert claimed['attempts'] == 1
+    assert queue.claim()['county'] == 'Bergen'
+    assert queue.claim() is None
+
+@pytest.mark.unit
+def test_run_next_job_records_progress_counts_and_timings(queue):
+    """Test a job is run through the scraper and its report stored"""
+    job, _ = queue.enqueue('all')
+    scrape = fake_scrape()
+
+    finished = run_next_job(queue, scrape=scrape)
+    payload = job_to_dict(finished)
+
+    assert scrape.calls == [list(jobs.COUNTY_URLS)]
+    assert payload['status'] == jobs.SUCCEEDED
+    assert payload['progress'] == {'countiesDone': len(jobs.COUNTY_URLS), 'countiesTotal': len(jobs.COUNTY_URLS),
+                                   'percent': 100}
+    assert payload['records'] == 10 * len(jobs.COUNTY_URLS)
+    assert payload['counties']['Morris']['seconds'] == 1.5
+    assert payload['startedAt'] and payload['finishedAt']
+    assert payload['runSeconds'] >= 0
+    assert run_next_job(queue, scrape=scrape) is None
+
+@pytest.mark.unit
+def test_failed_counties_fail_the_job(queue):
+    """Test county errors are reported on the job"""
+    queue.enqueue('Essex')
+
+    finished = run_next_job(queue, scrape=fake_scrape(error='timed out'))
+
+    assert finished['status'] == jobs.FAILED
+    assert finished['error'] == 'Essex: timed out'
+
+@pytest.mark.unit
+def test_scraper_exception_fails_the_job(queue):
+    """Test an exception from the scraper closes the job instead of leaving it running"""
+    queue.enqueue('Union')
+    def scrape(counties, progress=None):
+        raise RuntimeError('no browser')
+
+    finished = run_next_job(queue, scrape=scrape)
+
+    assert finished['status'] == jobs.FAILED
+    assert finished['error'] == 'no browser'
+
+@pytest.mark.unit
+def test_requeue_interrupted_jobs(queue, monkeypatch):
+    """Test jobs whose worker died go back on the queue until they run out of attempts"""
+    monkeypatch.setattr(jobs, '_interrupted', lambda worker: worker != 'live')
+    stale, _ = queue.enqueue('Morris')
+    queue.claim('gone')
+    live, _ = queue.enqueue('Bergen')
+    queue.claim('live')
+
+    assert queue.requeue_interrupted() == 1
+    assert queue.get(stale['id'])['status'] == jobs.QUEUED
+    assert queue.get(live['id'])['status'] == jobs.RUNNING
+
+    for _ in range(jobs.MAX_ATTEMPTS - 1):
+        queue.claim('gone')
+        queue.requeue_interrupted()
+    failed = queue.get(stale['id'])
+
+    assert failed['status'] == jobs.FAILED
+    assert failed['attempts'] == jobs.MAX_ATTEMPTS
+
+@pytest.mark.unit
+def test_interrupted_detects_restarted_process():
+    """Test a job claimed by an earlier process with this pid counts as interrupted"""
+    host, pid, _ = jobs.WORKER_ID.split(':')
+
+    assert not jobs._interrupted(jobs.WORKER_ID)
+    assert jobs._interrupted(f'{host}:{pid}:00000000')
+    assert not jobs._interrupted(f'other-host:{pid}:00000000')
+    assert jobs._interrupted(None)
+
+@pytest.mark.unit
+def test_queue_survives_reopen(tmp_path):
+    """Test queued jobs are still there after the queue is reopened"""
+    path = str(tmp_path / 'jobs.db')
+    with JobQueue(path) as queue:
+        job, _ = queue.enqueue('Hudson')
+
+    with JobQueue(path) as queue:
+        assert queue.claim()['id'] == job['id']
+
+@pytest.mark.unit
+def test_county_joins_pending_all_job(queue):
+    """Test a county submission rides on an 'all' job that has not scraped it yet"""
+    every, _ = queue.enqueue('all')
+    job, created = queue.enqueue('Morris')
+
+    assert not created and job['id'] == every['id']
+    assert job['submissions'] == 2
+
+    queue.claim()
+    queue.progress(every['id'], 'Morris', report(['Morris'])['counties']['Morris'])
+    rescrape, created = queue.enqueue('Morris')
+    bergen, _ = queue.enqueue('Bergen')
+
+    assert created and rescrape['id'] != every['id']
+    assert bergen['id'] == every['id']
+
+@pytest.mark.unit
+def test_all_job_takes_over_queued_counties(queue):
+    """Test queued county jobs are folded into a new 'all' job, running ones are left alone"""
+    running, _ = queue.enqueue('Essex')
+    queue.claim()
+    morris, _ = queue.enqueue('Morris')
+    queue.enqueue('Morris')
+    bergen, _ = queue.enqueue('Bergen')
+
+    every, created = queue.enqueue('all')
+
+    assert created and every['submissions'] == 4
+    for job in (queue.get(morris['id']), queue.get(bergen['id'])):
+        assert job['status'] == jobs.COALESCED
+        assert job_to_dict(job)['mergedInto'] == every['id']
+    assert queue.get(running['id'])['status'] == jobs.RUNNING
+    assert queue.claim()['id'] == every['id']
+    assert queue.claim() is None
+
+@pytest.mark.unit
+def test_one_worker_per_host(tmp_path, monkeypatch):
+    """Test a process does not start a worker while another holds the host lock"""
+    fcntl = pytest.importorskip('fcntl')
+    path = str(tmp_path / 'jobs.db')
+    monkeypatch.setattr(jobs, '_worker', None)
+    monkeypatch.setattr(jobs, '_host_lock', None)
+    with open(path + '.lock', 'a') as other:
+        fcntl.flock(other, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        assert jobs.start_worker(path) is None
+
+    worker = jobs.start_worker(path)
+    try:
+        assert worker.is_alive()
+        assert jobs.start_worker(path) is worker
+    finally:
+        worker.stop()
+        worker.join(timeout=5)
+        jobs._host_lock.close()
@@ -0,0 +1,63 @@
+import pytest
+from services.scraper.scrape_state import ScrapeState, listing_hash
+
+def listing(property_id, **fields):
+    row = {'property_id': property_id, 'detail_link': f'/Sales/SaleDetails?PropertyId={property_id}',
+           'sheriff_number': f'F-{property_id}', 'status_date': '2026-11-01', 'address': f'{property_id} Main St',
+           'price': 100000}
+    row.update(fields)
+    return row
+
+@pytest.fixture
+def state(tmp_path):
+    with ScrapeState(str(tmp_path / 'state.db')) as store:
+        yield store
+
+@pytest.mark.unit
+def test_listing_hash_ignores_untracked_fields():
+    """Test the hash covers the listing content only"""
+    assert listing_hash(listing('1')) == listing_hash(listing('1', county='Morris', **{'Zillow URL': 'x'}))
+    assert listing_hash(listing('1')) != listing_hash(listing('1', status_date='2026-12-01'))
+
+@pytest.mark.unit
+def test_diff_reports_added_updated_removed(state):
+    """Test a rescrape is split into added, updated, unchanged and removed listings"""
+    first = state.diff('Morris', [listing('1'), listing('2'), listing('3')])
+    assert len(first['added']) == 3
+    state.record(first)
+
+    second = state.diff('Morris', [listing('1'), listing('2', price=90000), listing('4')])
+
+    assert [row['property_id'] for row in second['added']] == ['4']
+    assert [row['property_id'] for row in second['updated']] == ['2']
+    assert second['removed'] == ['3']
+    assert second['unchanged'] == 1
+
+@pytest.mark.unit
+def test_diff_is_not_stored_until_recorded(state):
+    """Test an unrecorded diff (e.g. a failed merge) is reported again next run"""
+    state.diff('Morris', [listing('1')])
+
+    assert len(state.diff('Morris', [listing('1')])['added']) == 1
+
+@pytest.mark.unit
+def test_record_tracks_status_date_and_reappearance(state):
+    """Test status dates are kept and a removed listing that returns is listed again"""
+    state.record(state.diff('Morris', [listing('1')]))
+    state.record(state.diff('Morris', []))
+
+    returned = state.diff('Morris', [listing('1', status_date='2026-12-15')])
+    state.record(returned)
+
+    assert [row['property_id'] for row in returned['updated']] == ['1']
+    assert state.conn.execute(
+        'SELECT status_date, removed_at FROM listing_state WHERE property_id = ?', ('1',)
+    ).fetchone() == ('2026-12-15', None)
+    assert state.conn.execute('SELECT COUNT(*) FROM scrape_runs').fetchone() == (3,)
+
+@pytest.mark.unit
+def test_counties_are_diffed_separately(state):
+    """Test listings of another county are not reported as removed"""
+    state.record(state.diff('Morris', [listing('1')]))
+
+    assert state.diff('Bergen', [listing('2')])['removed'] == []
@@ -0,0 +1,134 @@
+import os
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+from services.scraper.scrape_store import ScrapeStore, listing_key
+
+def listing(property_id, **fields):
+    row = {'property_id': property_id,
+           'detail_link': f'https://salesweb.civilview.com/Sales/SaleDetails?PropertyId={property_id}',
+           'sheriff_number': f'F-{property_id}', 'status_date': '2026-11-01', 'address': f'{property_id} Main St',
+           'price': 100000, 'county': 'Morris'}
+    row.update(fields)
+    return row
+
+@pytest.fixture
+def store(tmp_path):
+    with ScrapeStore(str(tmp_path / 'store.db')) as scrape_store:
+        yield scrape_store
+
+@pytest.mark.unit
+def test_store_uses_wal(store):
+    """Test readers are not blocked by a writing run"""
+    assert store.conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+
+@pytest.mark.unit
+def test_upsert_overwrites_listing_and_keeps_enrichment(store):
+    """Test a rescrape updates listing columns without wiping Zillow URLs or details"""
+    store.upsert([listing('1', **{'Zillow URL': 'https://zillow.test/1', 'court_case': 'F-1-26'}), listing('2')])
+
+    store.upsert([listing('1', price=90000)])
+
+    rows = {row['property_id']: row for row in store.listings()}
+    assert rows['1']['price'] == 90000
+    assert rows['1']['Zillow URL'] == 'https://zillow.test/1'
+    assert rows['1']['court_case'] == 'F-1-26'
+    assert store.count() == 2
+
+@pytest.mark.unit
+def test_upsert_keys_on_property_id(store):
+    """Test rows are keyed by property_id, read from the detail link if needed"""
+    row = listing('7')
+    del row['property_id']
+
+    assert store.upsert([row, {'address': 'No key St'}]) == 1
+    assert store.listings()[0]['property_id'] == '7'
+
+@pytest.mark.unit
+def test_listing_key_normalises_csv_values():
+    """Test pandas floats and NaN are read as ids, and the detail link wins"""
+    assert listing_key({'property_id': 12.0}) == '12'
+    assert listing_key({'property_id': float('nan')}) is None
+    assert listing_key({'property_id': float('nan'), 'detail_link': float('nan')}) is None
+    assert listing_key(dict(listing('7'), property_id=7.0)) == '7'
+    assert listing_key(dict(listing('7'), property_id='70')) == '7'
+
+@pytest.mark.unit
+def test_detail_link_clash_does_not_abort_upsert(store):
+    """Test a detail link stored under another key moves to the new row instead of failing the batch"""
+    stale = listing('5', detail_link='https://salesweb.civilview.com/Sales/SaleDetails?Id=5')
+    store.upsert([stale])
+
+    written = store.upsert([listing('55', detail_link=stale['detail_link']), listing('6')])
+
+    rows = {row['property_id']: row for row in store.listings()}
+    assert written == 2
+    assert rows['55']['detail_link'] == stale['detail_link']
+    assert rows['5']['detail_link'] is None
+    assert '6' in rows
+
+@pytest.mark.unit
+def test_removed_listings_are_hidden_until_listed_again(store):
+    """Test removed listings drop out of reads and come back when rescraped"""
+    store.upsert([listing('1'), listing('2')])
+
+    assert store.mark_removed(['1']) == 1
+    assert [row['property_id'] for row in store.listings()] == ['2']
+    assert len(store.listings(include_removed=True)) == 2
+
+    store.upsert([listing('1')])
+    assert len(store.listings()) == 2
+
+@pytest.mark.unit
+def test_update_details_and_county_filter(store):
+    """Test manual detail edits and reading one county"""
+    store.upsert([listing('1'), listing('2', county='Bergen')])
+
+    assert store.update_details(listing('1')['detail_link'], {'attorney': 'KML LAW GROUP, P.C.'})
+    assert [row['attorney'] for row in store.listings(county='Morris')] == ['KML LAW GROUP, P.C.']
+
+@pytest.mark.unit
+def test_csv_is_export_and_import_only(store, tmp_path):
+    """Test the CSV export round-trips into a fresh store"""
+    store.upsert([listing('1', **{'Zillow URL': 'https://zillow.test/1'}), listing('2')])
+    path = store.export_csv(str(tmp_path / 'merged_data.csv'))
+
+    assert list(pd.read_csv(path)['property_id']) == [1, 2]
+    with ScrapeStore(str(tmp_path / 'copy.db')) as copy:
+        assert copy.import_csv(path) == 2
+        assert copy.listings()[0]['Zillow URL'] == 'https://zillow.test/1'
+
+@pytest.mark.unit
+def test_only_legacy_csv_is_imported(tmp_path):
+    """Test an empty store imports merged_data.csv but never its own export"""
+    path = str(tmp_path / 'scrape_store.db')
+    legacy = tmp_path / 'merged_data.csv'
+    with patch('services.scraper.scrape_store.STORE_FILE', path), \
+         patch('services.scraper.scrape_store.CSV_EXPORT', str(tmp_path / 'scraped_listings.csv')), \
+         patch('services.scraper.scrape_store.LEGACY_CSV', str(legacy)):
+        with ScrapeStore(str(tmp_path / 'other.db')) as other:
+            other.upsert([listing('1')])
+            other.export_csv()
+        with ScrapeStore(path) as store:
+            assert store.count() == 0
+
+        pd.DataFrame([listing('2')]).to_csv(legacy, index=False)
+        os.remove(path)
+        with ScrapeStore(path) as store:
+            assert [row['property_id'] for row in store.listings()] == ['2']
+
+@pytest.mark.unit
+def test_parquet_snapshot_is_optional(store, tmp_path):
+    """Test the snapshot is skipped rather than failing without a Parquet engine"""
+    store.upsert([listing('1')])
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        try:
+            import fastparquet  # noqa: F401
+        except ImportError:
+            assert store.snapshot_parquet(str(tmp_path / 'listings.parquet')) is None
+            return
+    path = store.snapshot_parquet(str(tmp_path / 'listings.parquet'))
+    assert len(pd.read_parquet(path)) == 1
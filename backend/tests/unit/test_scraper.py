@@ -2,7 +2,7 @@ import pytest
 import os
 import pandas as pd
 from unittest.mock import patch, MagicMock
-from services.scraper.main import main, ScraperException, DatabaseException
+from services.scraper.main import main, main_all, ScraperException, DatabaseException
 import logging
 
 @pytest.fixture
@@ -12,6 +12,21 @@ def mock_downloads_folder(tmp_path):
     downloads.mkdir()
     return downloads
 
+@pytest.fixture(autouse=True)
+def scrape_state_file(tmp_path):
+    """Keep the incremental scrape state and the scrape store out of the real downloads folder"""
+    path = str(tmp_path / "scrape_state.db")
+    with patch('services.scraper.scrape_state.STATE_FILE', path), \
+         patch('services.scraper.scrape_store.STORE_FILE', str(tmp_path / "scrape_store.db")), \
+         patch('services.scraper.scrape_store.LEGACY_CSV', str(tmp_path / "merged_data.csv")):
+        yield path
+
+@pytest.fixture(autouse=True)
+def listing_pages():
+    """Stand in for main_all's shared HTTP fetch of the listing pages"""
+    with patch('services.scraper.main.fetch_pages', return_value={}) as fetch:
+        yield fetch
+
 @pytest.fixture
 def mock_data():
     """Sample scraped data for testing"""
@@ -22,7 +37,7 @@ def mock_data():
 
 def test_main_success(mock_downloads_folder, mock_data):
     """Test successful execution of main scraper function"""
-    with patch('services.scraper.main.parse_page_selenium', return_value=mock_data), \
+    with patch('services.scraper.main.parse_page', return_value=mock_data), \
          patch('services.scraper.main.connect_db'), \
          patch('services.scraper.main.create_table'), \
          patch('services.scraper.main.insert_data'), \
@@ -33,19 +48,19 @@ def test_main_success(mock_downloads_folder, mock_data):
 
 def test_main_scraper_failure():
     """Test handling of scraper failure"""
-    with patch('services.scraper.main.parse_page_selenium', return_value=None):
+    with patch('services.scraper.main.parse_page', return_value=None):
         assert main() is False
 
 def test_main_database_failure(mock_data):
     """Test handling of database failure"""
-    with patch('services.scraper.main.parse_page_selenium', return_value=mock_data), \
+    with patch('services.scraper.main.parse_page', return_value=mock_data), \
          patch('services.scraper.main.connect_db', side_effect=DatabaseException("Connection failed")):
         
         assert main() is False
 
 def test_zillow_url_generation(mock_downloads_folder, mock_data):
     """Test Zillow URL generation for addresses"""
-    with patch('services.scraper.main.parse_page_selenium', return_value=mock_data), \
+    with patch('services.scraper.main.parse_page', return_value=mock_data), \
          patch('services.scraper.main.connect_db'), \
          patch('services.scraper.main.create_table'), \
          patch('services.scraper.main.insert_data'), \
@@ -56,4 +71,141 @@ def test_zillow_url_generation(mock_downloads_folder, mock_data):
         
         assert mock_format_zillow.call_count == 2
         mock_format_zillow.assert_any_call('123 Test St')
-        mock_format_zillow.assert_any_call('456 Sample Ave') 
\ No newline at end of file
+        mock_format_zillow.assert_any_call('456 Sample Ave')
+
+
+def test_main_all_merges_once_with_timings():
+    """Test every county is scraped and the results are merged in one write"""
+    def scrape(url, pool=None, pages=None):
+        if 'countyId=2' in url:
+            return None  # Essex returns nothing
+        return [{'address': f'{url[-2:]} Main St', 'price': '1'}]
+
+    with patch('services.scraper.main.parse_page', side_effect=scrape), \
+         patch('services.scraper.main.merge_results') as mock_merge:
+        report = main_all(max_browsers=2)
+
+    mock_merge.assert_called_once()
+    assert len(mock_merge.call_args[0][0]) == 4
+    assert {item['county'] for item in mock_merge.call_args[0][0]} == {'Morris', 'Bergen', 'Union', 'Hudson'}
+    assert report['records'] == 4
+    assert report['success'] is False
+    assert report['counties']['Essex']['error']
+    assert report['counties']['Morris']['error'] is None
+    assert report['counties']['Morris']['seconds'] >= 0
+
+def test_main_all_fetches_listing_pages_once(listing_pages):
+    """Test every county's listing page is fetched in one batch and handed to its parser"""
+    from services.scraper.main import COUNTY_URLS
+    listing_pages.return_value = {info['url']: f'<html>{county}</html>' for county, info in COUNTY_URLS.items()}
+    seen = {}
+
+    def scrape(url, pool=None, pages=None):
+        seen[url] = pages[url]
+        return [{'address': url, 'price': '1'}]
+
+    with patch('services.scraper.main.parse_page', side_effect=scrape), \
+         patch('services.scraper.main.merge_results'):
+        report = main_all(max_browsers=2)
+
+    listing_pages.assert_called_once()
+    assert sorted(listing_pages.call_args[0][0]) == sorted(info['url'] for info in COUNTY_URLS.values())
+    assert seen[COUNTY_URLS['Union']['url']] == '<html>Union</html>'
+    assert report['fetch_seconds'] >= 0
+
+def test_main_all_runs_counties_concurrently():
+    """Test counties overlap in time up to the browser bound"""
+    import threading
+    import time
+    running, peak, lock = [0], [0], threading.Lock()
+
+    def scrape(url, pool=None, pages=None):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.05)
+        with lock:
+            running[0] -= 1
+        return [{'address': url, 'price': '1'}]
+
+    with patch('services.scraper.main.parse_page', side_effect=scrape), \
+         patch('services.scraper.main.merge_results'):
+        report = main_all(max_browsers=3)
+
+    assert report['success'] is True
+    assert peak[0] == 3
+
+def test_main_all_merges_only_changed_listings():
+    """Test a second run merges only new and changed listings and reports removals"""
+    listings = {
+        'countyId=9': [
+            {'property_id': '1', 'address': '1 Main St', 'price': 100, 'status_date': '2026-11-01'},
+            {'property_id': '2', 'address': '2 Main St', 'price': 200, 'status_date': '2026-11-01'}
+        ]
+    }
+
+    def scrape(url, pool=None, pages=None):
+        return [dict(row) for row in listings.get(url.split('?')[-1], [])]
+
+    with patch('services.scraper.main.parse_page', side_effect=scrape), \
+         patch('services.scraper.main.merge_results') as mock_merge:
+        first = main_all(counties=['Morris'], max_browsers=1)
+        listings['countyId=9'] = [
+            {'property_id': '2', 'address': '2 Main St', 'price': 200, 'status_date': '2026-12-01'},
+            {'property_id': '3', 'address': '3 Main St', 'price': 300, 'status_date': '2026-11-01'}
+        ]
+        second = main_all(counties=['Morris'], max_browsers=1)
+        third = main_all(counties=['Morris'], max_browsers=1)
+
+    assert first['counties']['Morris']['changes'] == {'added': 2, 'updated': 0, 'removed': 0, 'unchanged': 0}
+    assert second['counties']['Morris']['changes'] == {'added': 1, 'updated': 1, 'removed': 1, 'unchanged': 0}
+    assert third['counties']['Morris']['changes'] == {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 2}
+    assert mock_merge.call_count == 2  # Nothing to merge on the third run
+    assert sorted(row['property_id'] for row in mock_merge.call_args_list[1][0][0]) == ['2', '3']
+    assert third['success'] is True
+
+def test_main_all_merges_listings_that_gained_details(scrape_state_file):
+    """Test an unchanged listing is merged again once its detail page is scraped"""
+    from services.scraper.scrape_state import ScrapeState
+    row = {'property_id': '1', 'detail_link': 'https://example.test/Sales/SaleDetails?PropertyId=1',
+           'address': '1 Main St', 'price': 100}
+
+    def scrape(url, pool=None, pages=None):
+        return [dict(row)] if 'countyId=9' in url else None
+
+    def details(rows, state):
+        fields = {'court_case': 'F-1-26', 'sale_date': None, 'description': None,
+                  'upset_amount': '$1', 'attorney': None}
+        state.record_details({'1': fields}, {'1': 'hash'})
+        return {'1': fields}
+
+    with patch('services.scraper.main.parse_page', side_effect=scrape), \
+         patch('services.scraper.main.merge_results') as mock_merge:
+        with patch('services.scraper.main.scrape_details', return_value={}):
+            main_all(counties=['Morris'], max_browsers=1)
+        with patch('services.scraper.main.scrape_details', side_effect=details):
+            report = main_all(counties=['Morris'], max_browsers=1)
+
+    assert report['counties']['Morris']['changes']['unchanged'] == 1
+    merged = mock_merge.call_args_list[1][0][0]
+    assert merged[0]['court_case'] == 'F-1-26'
+    with ScrapeState(scrape_state_file) as state:
+        assert state.details(['1'])['1']['upset_amount'] == '$1'
+
+def test_main_upserts_changed_listings_into_store(tmp_path):
+    """Test a run writes to the scrape store and marks listings that disappeared"""
+    from services.scraper.scrape_store import ScrapeStore
+    pages = [[{'property_id': '1', 'address': '1 Main St', 'price': 100},
+              {'property_id': '2', 'address': '2 Main St', 'price': 200}],
+             [{'property_id': '2', 'address': '2 Main St', 'price': 150}]]
+
+    with patch('services.scraper.main.scrape_details', return_value={}):
+        for page in pages:
+            with patch('services.scraper.main.parse_page', return_value=page):
+                assert main('Morris') is True
+
+    with ScrapeStore(str(tmp_path / "scrape_store.db")) as store:
+        listings = store.listings()
+        assert [(row['property_id'], row['price']) for row in listings] == [('2', 150)]
+        assert listings[0]['Zillow URL'] == 'https://www.zillow.com/homes/2-main-st_rb/'
+        assert len(store.listings(include_removed=True)) == 2
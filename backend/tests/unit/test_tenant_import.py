@@ -0,0 +1,84 @@
+import pytest
+import pandas as pd
+from datetime import date
+from services.tenant_import import read_tenant_file, validate_tenant_frame
+
+def frame(*rows):
+    base = {'firstName': 'Ann', 'lastName': "O'Neil", 'email': 'ann@example.com', 'dateOfBirth': '1990-01-01'}
+    return pd.DataFrame([dict(base, **row) for row in rows])
+
+@pytest.mark.unit
+def test_valid_row_is_converted():
+    """Test valid rows come back typed and ready to insert"""
+    rows, errors = validate_tenant_frame(frame({
+        'phoneNumber': ' (555) 123-4567 ', 'creditScoreAtInitialApplication': '700',
+        'petsAllowed': 'Yes', 'occupation': ''
+    }))
+    assert errors == {}
+    assert rows[0]['dateOfBirth'] == date(1990, 1, 1)
+    assert rows[0]['creditScoreAtInitialApplication'] == 700
+    assert rows[0]['creditScoreAtLeaseRenewal'] is None
+    assert rows[0]['phoneNumber'] == '(555) 123-4567'
+    assert rows[0]['occupation'] is None
+    assert rows[0]['petsAllowed'] is True
+
+@pytest.mark.unit
+def test_column_checks_report_each_row():
+    """Test every rule reports against the offending row only"""
+    rows, errors = validate_tenant_frame(frame(
+        {},
+        {'email': 'ann@example.com'},
+        {'email': 'b@example.com', 'phoneNumber': '12345'},
+        {'email': 'c@example.com', 'creditScoreAtLeaseRenewal': '851'},
+        {'email': 'd@example.com', 'creditScoreAtInitialApplication': 'high'},
+        {'email': 'e@example.com', 'dateOfBirth': '01/02/1990'},
+        {'email': 'f@example.com', 'firstName': 'R2D2'},
+        {'email': 'g@example.com', 'petsAllowed': 'maybe'},
+        {'email': 'h@example', 'lastName': ''}
+    ))
+    assert [row['row'] for row in rows] == [0]
+    assert errors == {
+        1: ['Duplicate email in import'],
+        2: ['Phone number must be 10-11 digits'],
+        3: ['Credit score must be between 300 and 850'],
+        4: ['Invalid value for creditScoreAtInitialApplication. Must be an integer'],
+        5: ['Invalid date format for dateOfBirth. Expected YYYY-MM-DD'],
+        6: ['Names can only contain letters, spaces, hyphens and apostrophes'],
+        7: ['Invalid value for petsAllowed. Must be true or false'],
+        8: ['Missing required fields: lastName', 'Invalid email format']
+    }
+
+@pytest.mark.unit
+def test_unrepresentable_scores_are_row_errors():
+    """Test huge and fractional scores fail their own row instead of the import"""
+    rows, errors = validate_tenant_frame(frame(
+        {'email': 'a@example.com', 'creditScoreAtInitialApplication': '1e20'},
+        {'email': 'b@example.com', 'creditScoreAtLeaseRenewal': '700.5'},
+        {'email': 'c@example.com', 'creditScoreAtInitialApplication': '720'}
+    ))
+    assert [(row['row'], row['creditScoreAtInitialApplication']) for row in rows] == [(2, 720)]
+    assert errors == {
+        0: ['Credit score must be between 300 and 850'],
+        1: ['Invalid value for creditScoreAtLeaseRenewal. Must be an integer']
+    }
+
+@pytest.mark.unit
+def test_existing_emails_and_age_cutoff():
+    """Test stored emails are rejected and the 18th birthday is inclusive"""
+    today = date(2024, 6, 15)
+    rows, errors = validate_tenant_frame(frame(
+        {'email': 'taken@example.com'},
+        {'email': 'eighteen@example.com', 'dateOfBirth': '2006-06-15'},
+        {'email': 'minor@example.com', 'dateOfBirth': '2006-06-16'}
+    ), existing_emails={'taken@example.com'}, today=today)
+    assert [row['email'] for row in rows] == ['eighteen@example.com']
+    assert errors == {0: ['Email already exists'], 2: ['Tenant must be at least 18 years old']}
+
+@pytest.mark.unit
+def test_read_tenant_file():
+    """Test CSV and JSON uploads load into frames and other types are rejected"""
+    csv = b'firstName,lastName,email,dateOfBirth\nAnn,Lee,ann@example.com,1990-01-01\n'
+    assert read_tenant_file(csv, 'book.csv').loc[0, 'email'] == 'ann@example.com'
+    assert len(read_tenant_file(b'{"tenants": [{"firstName": "Ann"}]}', 'book.json')) == 1
+    with pytest.raises(ValueError):
+        read_tenant_file(b'', 'book.xlsx')
@@ -0,0 +1,232 @@
+import pytest
+import numpy as np
+from datetime import date, datetime
+from types import SimpleNamespace
+from services.underwriting import (
+    build_cash_flows,
+    npv,
+    irr,
+    equity_multiple,
+    annualize,
+    underwrite_properties,
+    sensitivity_grid,
+    encode_array
+)
+import base64
+import time
+
+# Test data for parametrized tests
+IRR_TEST_DATA = [
+    {'cash_flows': [-100, 110], 'expected': 0.10},
+    {'cash_flows': [-1000, 0, 1210], 'expected': 0.10},
+    {'cash_flows': [-1000, 300, 400, 500], 'expected': 0.0889633947},
+    {'cash_flows': [-500, 100, 100, 100, 100, 100], 'expected': 0.0}
+]
+
+@pytest.mark.unit
+@pytest.mark.parametrize("case", IRR_TEST_DATA)
+def test_irr_known_values(case):
+    """Test IRR matches known closed-form values"""
+    result = irr([case['cash_flows']])
+    assert result[0] == pytest.approx(case['expected'], abs=1e-8)
+
+@pytest.mark.unit
+def test_irr_solves_batch_of_mixed_rows():
+    """Test one call solves many rows, with NaN for rows that have no IRR"""
+    flows = np.array([
+        [-100, 110, 0],
+        [-1000, 0, 1210],
+        [100, 100, 100],      # No outflow
+        [-100, -100, -100],   # No inflow
+        [-100, 0, 400]
+    ], dtype=float)
+
+    result = irr(flows)
+
+    assert result[0] == pytest.approx(0.10)
+    assert result[1] == pytest.approx(0.10)
+    assert np.isnan(result[2])
+    assert np.isnan(result[3])
+    assert result[4] == pytest.approx(1.0)
+
+@pytest.mark.unit
+def test_irr_falls_back_to_bisection():
+    """Test rows where Newton diverges from the initial guess are still solved"""
+    flows = np.array([[-1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 5000]], dtype=float)
+    result = irr(flows, max_iter=1)
+    assert npv(flows, result)[0] == pytest.approx(0.0, abs=1e-6)
+
+@pytest.mark.unit
+def test_npv_at_irr_is_zero():
+    """Test NPV is zero at the solved IRR for every row"""
+    rng = np.random.default_rng(42)
+    flows = np.hstack([-rng.uniform(1e5, 5e5, (200, 1)), rng.uniform(0, 1e5, (200, 12))])
+    rates = irr(flows)
+    assert np.allclose(npv(flows, rates), 0.0, atol=1e-4)
+
+@pytest.mark.unit
+def test_npv_scalar_rate():
+    """Test NPV with a scalar discount rate"""
+    result = npv([[-100, 110]], 0.10)
+    assert result[0] == pytest.approx(0.0)
+
+@pytest.mark.unit
+def test_equity_multiple():
+    """Test equity multiple is distributions over invested equity"""
+    result = equity_multiple([[-100, 50, 150], [10, 20, 30]])
+    assert result[0] == pytest.approx(2.0)
+    assert np.isnan(result[1])
+
+@pytest.mark.unit
+def test_annualize():
+    """Test monthly rates compound to annual"""
+    assert annualize(0.01) == pytest.approx(1.01 ** 12 - 1)
+
+@pytest.mark.unit
+def test_build_cash_flows_from_property_fields():
+    """Test purchase, rent, draws and net sale land in the right months"""
+    prop = SimpleNamespace(
+        id=1,
+        created_at=datetime(2024, 1, 15),
+        purchaseCost=200000,
+        purchase_price=200000,
+        cash2closeFromPurchase=None,
+        totalRehabCost=50000,
+        expectedYearlyRent=12000,
+        arvSalePrice=400000,
+        realtorFees=20000,
+        payOffStatement=150000,
+        propTaxtillEndOfYear=None,
+        attorneyFees=2000,
+        miscFees=None,
+        utilities=None
+    )
+    draws = {1: [SimpleNamespace(release_date=date(2024, 3, 1), amount=25000)]}
+
+    flows = build_cash_flows([prop], draws, hold_months=6)
+
+    assert flows.shape == (1, 7)
+    assert flows[0, 0] == pytest.approx(-250000)
+    assert flows[0, 1] == pytest.approx(1000)
+    assert flows[0, 2] == pytest.approx(1000 + 25000)
+    assert flows[0, 6] == pytest.approx(1000 + 400000 - 20000 - 150000 - 2000)
+
+@pytest.mark.unit
+def test_build_cash_flows_prefers_cash_to_close():
+    """Test cash to close replaces the purchase cost as the equity outflow"""
+    flows = build_cash_flows([{'id': 1, 'purchaseCost': 200000, 'cash2closeFromPurchase': 40000}],
+                             hold_months=1)
+    assert flows[0, 0] == pytest.approx(-40000)
+
+@pytest.mark.unit
+def test_build_cash_flows_rejects_invalid_hold():
+    """Test a hold period under one month is rejected"""
+    with pytest.raises(ValueError):
+        build_cash_flows([{'id': 1}], hold_months=0)
+
+@pytest.mark.unit
+def test_underwrite_properties_results():
+    """Test batch underwriting returns one result per property in order"""
+    properties = [
+        {'id': 1, 'purchaseCost': 100000, 'arvSalePrice': 110000},
+        {'id': 2, 'purchaseCost': 100000, 'arvSalePrice': 150000},
+        {'id': 3}
+    ]
+
+    results = underwrite_properties(properties, hold_months=12, discount_rate=0.0)
+
+    assert [r['property_id'] for r in results] == [1, 2, 3]
+    assert results[0]['irr'] == pytest.approx(0.10, abs=1e-6)
+    assert results[1]['npv'] == pytest.approx(50000)
+    assert results[1]['equity_multiple'] == pytest.approx(1.5)
+    assert results[2]['irr'] is None
+    assert len(results[0]['cash_flows']) == 13
+
+SENSITIVITY_PROPERTY = {
+    'id': 1,
+    'purchaseCost': 200000,
+    'totalRehabCost': 50000,
+    'arvSalePrice': 400000,
+    'realtorFees': 20000,
+    'financeAmount': 150000,
+    'loanInterestRate': 12,
+    'attorneyFees': 2000,
+    'yearlyPropertyTaxes': 6000,
+    'homeownersInsurance': 1200
+}
+
+@pytest.mark.unit
+def test_sensitivity_grid_defaults_to_stored_values():
+    """Test omitted axes collapse to the property's own values"""
+    grid = sensitivity_grid(SENSITIVITY_PROPERTY, {'hold_months': [6]})
+
+    assert grid['net_profit'].shape == (1, 1, 1, 1)
+    # 400k * 0.95 - 200k - 50k - 2k - 150k * 1% * 6 - 600 * 6
+    expected = 380000 - 200000 - 50000 - 2000 - 9000 - 3600
+    assert grid['net_profit'][0, 0, 0, 0] == pytest.approx(expected)
+    assert grid['cash_on_cash'][0, 0, 0, 0] == pytest.approx(expected / 102000)
+
+@pytest.mark.unit
+def test_sensitivity_grid_broadcasts_axes():
+    """Test each axis moves the result along its own dimension only"""
+    grid = sensitivity_grid(SENSITIVITY_PROPERTY, {
+        'arv': [300000, 400000],
+        'rehab_cost': {'start': 40000, 'stop': 60000, 'num': 3},
+        'interest_rate': [10, 12],
+        'hold_months': [6, 12]
+    })
+    profit = grid['net_profit']
+
+    assert profit.shape == (2, 3, 2, 2)
+    assert profit[1, 0, 0, 0] - profit[0, 0, 0, 0] == pytest.approx(95000)
+    assert profit[0, 0, 0, 0] - profit[0, 1, 0, 0] == pytest.approx(10000)
+    assert profit[0, 0, 0, 0] > profit[0, 0, 1, 0]
+
+@pytest.mark.unit
+def test_sensitivity_grid_rejects_bad_axes():
+    """Test unknown axes and oversized grids are rejected"""
+    with pytest.raises(ValueError):
+        sensitivity_grid(SENSITIVITY_PROPERTY, {'vacancy': [1, 2]})
+    with pytest.raises(ValueError):
+        sensitivity_grid(SENSITIVITY_PROPERTY, {'arv': {'start': 1, 'stop': 2, 'num': 5000},
+                                                'rehab_cost': {'start': 1, 'stop': 2, 'num': 5000}})
+
+@pytest.mark.unit
+def test_sensitivity_grid_rejects_bad_ranges():
+    """Test range sizes are checked before allocating and axes must be an object"""
+    for num in (0, -1, 10**12):
+        with pytest.raises(ValueError):
+            sensitivity_grid(SENSITIVITY_PROPERTY, {'arv': {'start': 1, 'stop': 2, 'num': num}})
+    with pytest.raises(ValueError):
+        sensitivity_grid(SENSITIVITY_PROPERTY, [1, 2])
+
+@pytest.mark.unit
+@pytest.mark.slow
+def test_sensitivity_grid_performance():
+    """Test a 50x50x20x12 grid computes well under a second"""
+    axes = {
+        'arv': {'start': 300000, 'stop': 500000, 'num': 50},
+        'rehab_cost': {'start': 20000, 'stop': 80000, 'num': 50},
+        'interest_rate': {'start': 6, 'stop': 14, 'num': 20},
+        'hold_months': list(range(1, 13))
+    }
+    start = time.perf_counter()
+    grid = sensitivity_grid(SENSITIVITY_PROPERTY, axes)
+    encode_array(grid['net_profit'], 'base64')
+    assert time.perf_counter() - start < 1.0
+    assert grid['cash_on_cash'].shape == (50, 50, 20, 12)
+
+@pytest.mark.unit
+def test_encode_array_round_trip():
+    """Test base64 and JSON encodings preserve shape and values"""
+    values = np.array([[1.5, np.nan], [3.0, 4.25]])
+
+    packed = encode_array(values, 'base64')
+    decoded = np.frombuffer(base64.b64decode(packed['data']), dtype='<f4').reshape(packed['shape'])
+    assert np.allclose(decoded, values, equal_nan=True)
+
+    plain = encode_array(values)
+    assert plain['data'] == [[1.5, None], [3.0, 4.25]]
+
+    with pytest.raises(ValueError):
+        encode_array(values, 'msgpack')
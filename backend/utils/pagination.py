@@ -0,0 +1,103 @@
+import base64
+import json
+from datetime import date, datetime
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+def encode_cursor(values: dict) -> str:
+    """
+    Encode the sort-key values of the last row on a page into an opaque cursor.
+
+    Args:
+        values: Mapping of sort column name to value for the last row returned
+
+    Returns:
+        str: URL-safe base64 cursor
+    """
+    payload = {
+        key: value.isoformat() if isinstance(value, (date, datetime)) else value
+        for key, value in values.items()
+    }
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor: str | None) -> dict | None:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, TypeError):
+        raise ValueError('Invalid cursor')
+    if not isinstance(values, dict):
+        raise ValueError('Invalid cursor')
+    return values
+
+def parse_limit(value, default: int = DEFAULT_PAGE_SIZE, maximum: int = MAX_PAGE_SIZE) -> int:
+    """
+    Parse a `limit` query parameter, clamped to [1, maximum].
+
+    Raises:
+        ValueError: If the value is not an integer
+    """
+    if value in (None, ''):
+        return default
+    try:
+        limit = int(value)
+    except (ValueError, TypeError):
+        raise ValueError('limit must be an integer')
+    return max(1, min(limit, maximum))
+
+def parse_int(value, name: str) -> int | None:
+    """
+    Parse an optional integer query parameter.
+
+    Raises:
+        ValueError: If the value is not an integer
+    """
+    if value in (None, ''):
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        raise ValueError(f'{name} must be an integer')
+
+def parse_fields(value, allowed: list, required: list) -> list:
+    """
+    Parse a comma separated `fields=` projection against a whitelist.
+
+    The required columns (primary key and sort keys) are always included so
+    the cursor can be built from the projected rows.
+
+    Raises:
+        ValueError: If an unknown field is requested
+    """
+    if not value:
+        return list(allowed)
+    requested = [field.strip() for field in value.split(',') if field.strip()]
+    unknown = [field for field in requested if field not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return [field for field in allowed if field in requested or field in required]
+
+def parse_bool(value) -> bool | None:
+    """Parse true/false style query values; None when the parameter is absent."""
+    if value in (None, ''):
+        return None
+    lowered = str(value).lower()
+    if lowered in ('true', '1', 'yes'):
+        return True
+    if lowered in ('false', '0', 'no'):
+        return False
+    raise ValueError(f'Invalid boolean value: {value}')
+
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards so user input is matched literally (use escape='\\')."""
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
@@ -163,35 +163,47 @@ const AddProperty = () => {
 
   const fetchScrapedData = async () => {
     try {
-      const response = await fetch(
-        "http://localhost:5000/api/scraped-properties",
-        {
-          headers: {
-            Authorization: `Bearer ${localStorage.getItem("accessToken")}`,
-            "Content-Type": "application/json",
-          },
+      // The endpoint is paged; follow X-Next-Cursor until every listing is loaded
+      const data = [];
+      let cursor = null;
+      do {
+        const params = new URLSearchParams({ limit: "500" });
+        if (cursor) {
+          params.set("cursor", cursor);
         }
-      );
+        const response = await fetch(
+          `http://localhost:5000/api/scraped-properties?${params}`,
+          {
+            headers: {
+              Authorization: `Bearer ${localStorage.getItem("accessToken")}`,
+              "Content-Type": "application/json",
+            },
+          }
+        );
 
-      const data = await response.json();
+        const page = await response.json();
 
-      if (response.status === 404) {
-        console.log("No scraped data found:", data.message);
-        toast.info(
-          data.message ||
-            "No Scraped Data found. Run Foreclosure Scraper First."
-        );
-        setScrapedProperties([]);
-        return;
-      }
+        if (response.status === 404) {
+          console.log("No scraped data found:", page.message);
+          toast.info(
+            page.message ||
+              "No Scraped Data found. Run Foreclosure Scraper First."
+          );
+          setScrapedProperties([]);
+          return;
+        }
 
-      if (!response.ok) {
-        throw new Error(
-          data.error || data.message || `HTTP Error! Status: ${response.status}`
-        );
-      }
+        if (!response.ok) {
+          throw new Error(
+            page.error || page.message || `HTTP Error! Status: ${response.status}`
+          );
+        }
+
+        data.push(...page);
+        cursor = response.headers.get("X-Next-Cursor");
+      } while (cursor);
 
-      if (!Array.isArray(data) || data.length === 0) {
+      if (data.length === 0) {
         toast.info("No properties found in scraped data.");
         setScrapedProperties([]);
         return;
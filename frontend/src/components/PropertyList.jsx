@@ -173,7 +173,29 @@ const PropertyList = () => {
         );
       }
 
-      console.log("✅ Scraper Completed Successfully:", data);
+      // The scrape runs as a background job; poll it until it finishes
+      let job = data.job;
+      while (job.status === "queued" || job.status === "running") {
+        await new Promise((resolve) => setTimeout(resolve, 3000));
+        const jobResponse = await fetch(
+          `http://localhost:5000/api/scraper/jobs/${job.id}`,
+          {
+            headers: {
+              Authorization: `Bearer ${localStorage.getItem("accessToken")}`,
+            },
+          }
+        );
+        job = await jobResponse.json();
+        if (!jobResponse.ok) {
+          throw new Error(job.error || "Failed to Check Scraper Status");
+        }
+      }
+
+      if (job.status === "failed") {
+        throw new Error(job.error || "Scraper Job Failed");
+      }
+
+      console.log("✅ Scraper Completed Successfully:", job);
       toast.success(
         `🏠 Foreclosure List for ${selectedCounty} County Scraped Successfully!`
       );
@@ -191,7 +213,7 @@ const PropertyList = () => {
   const fetchScrapedProperties = async (county) => {
     try {
       const response = await fetch(
-        `http://localhost:5000/api/scraped-properties?county=${county}`,
+        `http://localhost:5000/api/scraped-properties?county=${encodeURIComponent(county)}&limit=1`,
         {
           headers: {
             Authorization: `Bearer ${localStorage.getItem("accessToken")}`,
@@ -203,10 +225,9 @@ const PropertyList = () => {
         throw new Error("Failed to fetch scraped properties");
       }
 
-      const scrapedData = await response.json();
-      toast.info(
-        `📊 Found ${scrapedData.length} properties in ${county} County`
-      );
+      // Only the count is needed; the endpoint reports it in X-Total-Count
+      const total = Number(response.headers.get("X-Total-Count") ?? 0);
+      toast.info(`📊 Found ${total} properties in ${county} County`);
     } catch (error) {
       console.error("🚫 Error fetching scraped properties:", error);
       toast.error("❌ Failed to fetch scraped properties: " + error.message);